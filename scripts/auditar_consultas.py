@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Audita los planes de consulta (EXPLAIN QUERY PLAN) de la SQL de la aplicación
+y propone índices, con tiempos antes y después de crearlos.
+
+Las sentencias se recogen en tiempo de ejecución con la telemetría de
+consultas de los DAOs:
+
+- Con --telemetria se usan las de una sesión real (el JSON que la aplicación
+  guarda al cerrarse), incluida la SQL de los controladores. El archivo no
+  guarda los valores de los parámetros: los planes se obtienen con NULL.
+- Sin --telemetria se ejecuta una carga de trabajo sobre los DAOs y las
+  consultas de los controladores de actividades y estudiantes.
+
+Los planes se obtienen sobre una copia de --db o, si no se indica, sobre una
+base generada con --escala actividades. La base original nunca se modifica.
+
+Uso:
+    python scripts/auditar_consultas.py [--db ruta.sqlite] [--telemetria ruta.json]
+                                        [--escala 20000] [--repeticiones 5] [--sin-evaluar]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+# Agregar src al path para las importaciones
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from modelos.daos.actividad_dao import ActividadDAO
+from modelos.daos.asignatura_dao import AsignaturaDAO
+from modelos.daos.busqueda_dao import BusquedaDAO
+from modelos.daos.calendario_evento_dao import CalendarioEventoDAO
+from modelos.daos.carrera_dao import CarreraDAO
+from modelos.daos.conexion_sqlite import ConexionSQLite
+from modelos.daos.consulta_dao import ConsultaDAO, EventosUnificadosDAO
+from modelos.daos.eje_tematico_dao import EjeTematicoDAO
+from modelos.daos.estudiante_actividad_dao import EstudianteActividadDAO
+from modelos.daos.estudiante_asignatura_dao import EstudianteAsignaturaDAO
+from modelos.daos.estudiante_carrera_dao import EstudianteCarreraDAO
+from modelos.daos.estudiante_dao import EstudianteDAO
+from modelos.daos.telemetria_consultas import TelemetriaConsultas, obtener_telemetria
+from modelos.daos.tipo_actividad_dao import TipoActividadDAO
+from modelos.dtos.actividad_dto import ActividadDTO
+from modelos.dtos.asignatura_dto import AsignaturaDTO
+from modelos.dtos.calendario_evento_dto import CalendarioEventoDTO
+from modelos.dtos.carrera_dto import CarreraDTO
+from modelos.dtos.eje_tematico_dto import EjeTematicoDTO
+from modelos.dtos.estudiante_actividad_dto import EstudianteActividadDTO
+from modelos.dtos.estudiante_asignatura_dto import EstudianteAsignaturaDTO
+from modelos.dtos.estudiante_carrera_dto import EstudianteCarreraDTO
+from modelos.dtos.estudiante_dto import EstudianteDTO
+from modelos.dtos.tipo_actividad_dto import TipoActividadDTO
+from scripts.auditor_consultas import auditar, indices_sin_uso
+from scripts.crear_indices import crear_todos_los_indices, nombres_indices
+from scripts.crear_views import crear_todas_las_views
+
+INICIO = date(2024, 1, 1)
+
+# Consultas de ControlarAdministrarActividad._obtener_actividades y de los _cargar_estudiantes
+# (los controladores necesitan la interfaz; con --telemetria se auditan las reales)
+SQL_CONTROLADORES = [
+    ("ControlarAdministrarActividad", "SELECT * FROM actividad ORDER BY fecha_inicio DESC", ()),
+    (
+        "ControlarAdministrarActividad",
+        """
+        SELECT a.*
+        FROM actividad a
+        INNER JOIN eje_tematico et ON a.id_eje = et.id_eje
+        INNER JOIN asignatura asig ON et.id_asignatura = asig.id_asignatura
+        WHERE asig.id_carrera = ? AND asig.id_asignatura = ?
+        ORDER BY a.fecha_inicio DESC
+        """,
+        (1, 1),
+    ),
+    (
+        "ControlarAdministrarActividad",
+        """
+        SELECT a.*
+        FROM actividad a
+        INNER JOIN eje_tematico et ON a.id_eje = et.id_eje
+        INNER JOIN asignatura asig ON et.id_asignatura = asig.id_asignatura
+        WHERE asig.id_carrera = ?
+        ORDER BY a.fecha_inicio DESC
+        """,
+        (1,),
+    ),
+    ("ControladorActividades", "SELECT id_estudiante, nombre, correo FROM estudiante ORDER BY nombre", ()),
+]
+
+
+def print_header(titulo):
+    """Imprime encabezado formateado"""
+    print(f"\n{'='*75}")
+    print(f"  {titulo}")
+    print(f"{'='*75}\n")
+
+
+def poblar_base_datos(ruta_db: str, n_actividades: int, generador: random.Random) -> None:
+    """
+    Crea 4 carreras con 10 asignaturas y 4 ejes cada una, `n_actividades`
+    actividades, un estudiante cada 100 actividades (inscrito a una carrera,
+    a sus asignaturas y a parte de sus actividades) y eventos de calendario.
+    """
+    crear_todos_los_indices(ruta_db)
+    crear_todas_las_views(ruta_db)
+
+    ids_tipos = TipoActividadDAO(ruta_db).insertar_lote(
+        TipoActividadDTO(nombre=nombre, siglas=nombre[:3].upper(), prioridad=i)
+        for i, nombre in enumerate(("Tarea", "Examen", "Proyecto", "Lectura"), start=1)
+    )
+    ids_carreras = CarreraDAO(ruta_db).insertar_lote(
+        CarreraDTO(nombre=f"Carrera {c}", plan="2024", modalidad="Presencial") for c in range(4)
+    )
+    asignaturas_por_carrera = {
+        id_carrera: AsignaturaDAO(ruta_db).insertar_lote(
+            AsignaturaDTO(codigo=f"C{id_carrera}A{a}", nombre=f"Asignatura {id_carrera}-{a}",
+                          creditos=4, tipo="obligatoria", id_carrera=id_carrera)
+            for a in range(10)
+        )
+        for id_carrera in ids_carreras
+    }
+    ids_ejes = EjeTematicoDAO(ruta_db).insertar_lote(
+        EjeTematicoDTO(nombre=f"Eje {id_asig}-{e}", orden=e, id_asignatura=id_asig)
+        for ids in asignaturas_por_carrera.values()
+        for id_asig in ids
+        for e in range(4)
+    )
+
+    def intervalo(duracion_maxima: int) -> tuple:
+        inicio = INICIO + timedelta(days=generador.randrange(730))
+        return str(inicio), str(inicio + timedelta(days=generador.randrange(duracion_maxima + 1)))
+
+    ids_actividades = ActividadDAO(ruta_db).insertar_lote(
+        ActividadDTO(titulo=f"Actividad {i}", fecha_inicio=inicio, fecha_fin=fin,
+                     id_eje=generador.choice(ids_ejes), id_tipo_actividad=generador.choice(ids_tipos))
+        for i, (inicio, fin) in enumerate(intervalo(14) for _ in range(n_actividades))
+    )
+    CalendarioEventoDAO(ruta_db).insertar_lote(
+        CalendarioEventoDTO(titulo=f"Evento {i}", tipo="Feriado", fecha_inicio=inicio, fecha_fin=fin)
+        for i, (inicio, fin) in enumerate(intervalo(3) for _ in range(max(1, n_actividades // 10)))
+    )
+
+    ids_estudiantes = EstudianteDAO(ruta_db).insertar_lote(
+        EstudianteDTO(nombre=f"Estudiante {e}", correo=f"e{e}@facen.edu")
+        for e in range(max(1, n_actividades // 100))
+    )
+    carrera_de = {id_est: generador.choice(ids_carreras) for id_est in ids_estudiantes}
+    EstudianteCarreraDAO(ruta_db).insertar_lote(
+        EstudianteCarreraDTO(id_estudiante=id_est, id_carrera=id_carrera, fecha_inscripcion=str(INICIO))
+        for id_est, id_carrera in carrera_de.items()
+    )
+    EstudianteAsignaturaDAO(ruta_db).insertar_lote(
+        EstudianteAsignaturaDTO(id_estudiante=id_est, id_asignatura=id_asig,
+                                estado=generador.choice(("cursando", "aprobada", "reprobada")),
+                                nota_final=generador.randrange(1, 6), periodo="2024")
+        for id_est, id_carrera in carrera_de.items()
+        for id_asig in asignaturas_por_carrera[id_carrera]
+    )
+    EstudianteActividadDAO(ruta_db).insertar_lote(
+        EstudianteActividadDTO(id_estudiante=id_est, id_actividad=id_act,
+                               estado=generador.choice(("pendiente", "en_progreso", "entregada", "vencida")))
+        for id_est in ids_estudiantes
+        for id_act in generador.sample(ids_actividades, min(len(ids_actividades), 50))
+    )
+
+    # Estadísticas para el planificador, como en una base ya en uso
+    with ConexionSQLite(ruta_db=ruta_db).obtener_conexion() as con:
+        con.execute("ANALYZE")
+
+
+def copiar_base_datos(origen: str, destino: str) -> None:
+    """
+    Copia `origen` con la API de backup de SQLite: incluye lo que aún está en
+    el archivo -wal, que una copia del archivo principal perdería.
+    """
+    # Solo lectura: una ruta inexistente falla en lugar de crear una base vacía
+    con_origen = sqlite3.connect(f"{Path(origen).resolve().as_uri()}?mode=ro", uri=True)
+    con_destino = sqlite3.connect(destino)
+    try:
+        con_origen.backup(con_destino)
+    finally:
+        con_destino.close()
+        con_origen.close()
+
+
+def ejecutar_carga(ruta_db: str) -> list:
+    """
+    Ejecuta las lecturas habituales de la aplicación con la telemetría activa
+    y retorna las sentencias (origen, sql, params) que se ejecutaron.
+    """
+    telemetria = obtener_telemetria()
+    telemetria.activa = True
+    telemetria.reiniciar()
+
+    eventos = EventosUnificadosDAO(ruta_db)
+    eventos.obtener_por_mes(2024, 6)
+    eventos.obtener_por_rango_fechas("2024-06-01", "2024-06-30")
+    eventos.obtener_por_solapamiento("2024-06-01", "2024-06-07")
+    eventos.obtener_por_tipo_actividad("Examen")
+    eventos.obtener_por_id(1, "actividad")
+
+    consulta = ConsultaDAO(ruta_db)
+    for id_estudiante in (1, 2):
+        consulta.obtener_actividades_detalladas(id_estudiante, fecha_referencia=INICIO)
+        consulta.obtener_actividades_detalladas(id_estudiante, 1, 1, 1, fecha_referencia=INICIO)
+        consulta.obtener_estadisticas_actividades(id_estudiante, fecha_referencia=INICIO)
+
+    EjeTematicoDAO(ruta_db).obtener_nombres_carrera()
+    EstudianteAsignaturaDAO(ruta_db).obtener_notas_finales()
+    EstudianteCarreraDAO(ruta_db).obtener_carrera_principal(1)
+    ActividadDAO(ruta_db).obtener_por_ids(range(1, 200))
+    BusquedaDAO(ruta_db).buscar("actividad", "Actividad 1")
+    for origen, sql, params in SQL_CONTROLADORES:
+        ActividadDAO(ruta_db).ejecutar_consulta(sql, params)
+
+    ejemplos = telemetria.ejemplos()
+    # El origen de las consultas copiadas de los controladores es el controlador
+    origenes = {" ".join(sql.split()): origen for origen, sql, _ in SQL_CONTROLADORES}
+    return [(origenes.get(" ".join(sql.split()), clase), sql, params) for clase, sql, params in ejemplos]
+
+
+def imprimir_resultados(resultados: list) -> None:
+    problemas = [r for r in resultados if r.error or (r.plan and r.plan.tiene_problemas)]
+    print(f"Sentencias auditadas: {len(resultados)} | Con recorridos completos u ordenamientos temporales: "
+          f"{len(problemas)}\n")
+
+    for resultado in problemas:
+        sql = " ".join(resultado.sql.split())
+        print(f"[{resultado.origen}] {sql[:150]}{'...' if len(sql) > 150 else ''}")
+        if resultado.error:
+            print(f"   Error: {resultado.error}\n")
+            continue
+        for posicion, detalle in enumerate(resultado.plan.detalles):
+            marca = "!!" if posicion in resultado.plan.filas_marcadas else "  "
+            print(f"   {marca} {detalle}")
+        for evaluacion in resultado.sugerencias:
+            sugerencia = evaluacion.sugerencia
+            tipo = ", ".join(t for t, si in (("cubriente", sugerencia.cubriente), ("parcial", sugerencia.condicion)) if si)
+            print(f"   -> {sugerencia.sql}{f'  ({tipo})' if tipo else ''}")
+            if evaluacion.antes_ms is not None:
+                # Sin mejora si alguna medición redondeó a 0 ms
+                mejora = f" ({evaluacion.mejora:.1f}x)" if evaluacion.mejora is not None else ""
+                print(f"      {'usado' if evaluacion.usado else 'NO usado'} por el planificador | "
+                      f"antes {evaluacion.antes_ms:.2f} ms, después {evaluacion.despues_ms:.2f} ms{mejora}")
+            elif evaluacion.plan_despues.detalles:
+                print(f"      {'usado' if evaluacion.usado else 'NO usado'} por el planificador (escritura: sin medir)")
+        print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", help="Base de datos a auditar (se usa una copia)")
+    parser.add_argument("--telemetria", help="JSON de telemetría de una sesión (TELEMETRIA_ARCHIVO)")
+    parser.add_argument("--escala", type=int, default=20_000, help="Actividades de la base generada")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--sin-evaluar", action="store_true", help="No crear ni medir los índices sugeridos")
+    parser.add_argument("--semilla", type=int, default=7)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_db = os.path.join(directorio, "auditoria.sqlite")
+        if args.db:
+            copiar_base_datos(args.db, ruta_db)
+            crear_todos_los_indices(ruta_db)
+            crear_todas_las_views(ruta_db)
+        else:
+            poblar_base_datos(ruta_db, args.escala, random.Random(args.semilla))
+
+        if args.telemetria:
+            sentencias = TelemetriaConsultas.cargar(args.telemetria).ejemplos()
+        else:
+            sentencias = ejecutar_carga(ruta_db)
+        ConexionSQLite.cerrar_todas()
+
+        print_header("AUDITORÍA DE PLANES DE CONSULTA")
+        print(f"Base: {args.db or f'generada ({args.escala:,} actividades)'}")
+        print(f"Sentencias: {args.telemetria or 'carga de trabajo de DAOs y controladores'}\n")
+        resultados = auditar(ruta_db, sentencias, evaluar=not args.sin_evaluar, repeticiones=args.repeticiones)
+        imprimir_resultados(resultados)
+
+        sin_uso = indices_sin_uso(resultados, nombres_indices())
+        print_header("ÍNDICES DE crear_indices.py QUE NINGÚN PLAN USÓ")
+        print("\n".join(f"   {nombre}" for nombre in sin_uso) or "   (ninguno)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Benchmark de carga de la grilla de actividades.
+
+Reproduce la carga de datos de ControlarAdministrarActividad._actualizar_tabla_actividad
+(sin la parte de Tkinter) y cuenta las sentencias SQL ejecutadas:
+
+1. Antes: por cada fila, eje -> asignatura -> carrera con obtener_por_id
+2. Después: actividades + mapa eje -> carrera con una consulta (obtener_nombres_carrera)
+
+Uso:
+    python scripts/benchmark_grilla_actividades.py [--filas 100 1000 5000]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+# Agregar src al path para las importaciones
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from modelos.daos.actividad_dao import ActividadDAO
+from modelos.daos.asignatura_dao import AsignaturaDAO
+from modelos.daos.carrera_dao import CarreraDAO
+from modelos.daos.conexion_sqlite import ConexionSQLite
+from modelos.daos.eje_tematico_dao import EjeTematicoDAO
+from modelos.daos.tipo_actividad_dao import TipoActividadDAO
+from modelos.dtos.actividad_dto import ActividadDTO
+from modelos.dtos.asignatura_dto import AsignaturaDTO
+from modelos.dtos.carrera_dto import CarreraDTO
+from modelos.dtos.eje_tematico_dto import EjeTematicoDTO
+from modelos.dtos.tipo_actividad_dto import TipoActividadDTO
+
+SQL_ACTIVIDADES = "SELECT * FROM actividad ORDER BY fecha_inicio DESC"
+
+
+class ContadorSentencias:
+    """Cuenta las sentencias ejecutadas en las conexiones del pool."""
+
+    def __init__(self):
+        self.total = 0
+        self._crear_conexion_original = ConexionSQLite._crear_conexion
+
+    def instalar(self) -> None:
+        contador = self
+        original = self._crear_conexion_original
+
+        def crear_conexion(instancia):
+            conexion = original(instancia)
+            conexion.set_trace_callback(contador._registrar)
+            return conexion
+
+        ConexionSQLite._crear_conexion = crear_conexion
+
+    def _registrar(self, _sentencia: str) -> None:
+        self.total += 1
+
+
+def print_header(titulo):
+    """Imprime encabezado formateado"""
+    print(f"\n{'='*75}")
+    print(f"  {titulo}")
+    print(f"{'='*75}\n")
+
+
+def poblar_base_datos(ruta_db: str, n_actividades: int) -> None:
+    """Crea 4 carreras con 5 asignaturas y 4 ejes cada una, y las actividades."""
+    id_tipo = TipoActividadDAO(ruta_db).insertar(
+        TipoActividadDTO(nombre="Tarea", siglas="TAR", prioridad=1)
+    )
+    ids_ejes = []
+    for c in range(4):
+        id_carrera = CarreraDAO(ruta_db).insertar(
+            CarreraDTO(nombre=f"Carrera {c}", plan="2024", modalidad="Presencial")
+        )
+        ids_asignaturas = AsignaturaDAO(ruta_db).insertar_lote(
+            AsignaturaDTO(
+                codigo=f"C{c}A{a}",
+                nombre=f"Asignatura {c}-{a}",
+                creditos=4,
+                tipo="obligatoria",
+                id_carrera=id_carrera,
+            )
+            for a in range(5)
+        )
+        ids_ejes += EjeTematicoDAO(ruta_db).insertar_lote(
+            EjeTematicoDTO(nombre=f"Eje {id_asig}-{e}", orden=e, id_asignatura=id_asig)
+            for id_asig in ids_asignaturas
+            for e in range(4)
+        )
+
+    ActividadDAO(ruta_db).insertar_lote(
+        ActividadDTO(
+            titulo=f"Actividad {i}",
+            fecha_inicio=f"2025-{i % 12 + 1:02d}-01",
+            fecha_fin=f"2025-{i % 12 + 1:02d}-15",
+            id_eje=ids_ejes[i % len(ids_ejes)],
+            id_tipo_actividad=id_tipo,
+        )
+        for i in range(n_actividades)
+    )
+
+
+def cargar_antes(ruta_db: str) -> list:
+    """Camino anterior: tres obtener_por_id (y tres DAOs) por fila."""
+    actividades = ActividadDAO(ruta_db).consultar_dtos(SQL_ACTIVIDADES, (), ActividadDTO)
+    filas = []
+    for actividad in actividades:
+        nombre_carrera = "N/A"
+        eje = EjeTematicoDAO(ruta_db).obtener_por_id(actividad.id_eje)
+        if eje:
+            asignatura = AsignaturaDAO(ruta_db).obtener_por_id(eje.id_asignatura)
+            if asignatura:
+                carrera = CarreraDAO(ruta_db).obtener_por_id(asignatura.id_carrera)
+                if carrera:
+                    nombre_carrera = carrera.nombre
+        filas.append((actividad.id_actividad, actividad.titulo, nombre_carrera))
+    return filas
+
+
+def cargar_despues(ruta_db: str) -> list:
+    """Camino actual: actividades + mapa eje -> carrera."""
+    actividades = ActividadDAO(ruta_db).consultar_dtos(SQL_ACTIVIDADES, (), ActividadDTO)
+    nombres_carrera = EjeTematicoDAO(ruta_db).obtener_nombres_carrera()
+    return [
+        (a.id_actividad, a.titulo, nombres_carrera.get(a.id_eje, "N/A")) for a in actividades
+    ]
+
+
+def medir(contador: ContadorSentencias, funcion, ruta_db: str) -> tuple:
+    """Retorna (filas, sentencias, segundos)."""
+    antes = contador.total
+    inicio = time.perf_counter()
+    filas = funcion(ruta_db)
+    return filas, contador.total - antes, time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, nargs="+", default=[100, 1000, 5000])
+    args = parser.parse_args()
+
+    # Los logs por consulta distorsionarían las mediciones
+    logging.disable(logging.INFO)
+    contador = ContadorSentencias()
+    contador.instalar()
+
+    print_header("BENCHMARK DE CARGA DE LA GRILLA DE ACTIVIDADES")
+    print(f"{'Filas':>8} | {'SQL antes':>10} {'ms antes':>10} | {'SQL después':>12} {'ms después':>11}")
+    print("-" * 62)
+
+    for n in args.filas:
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta_db = os.path.join(directorio, "benchmark.sqlite")
+            poblar_base_datos(ruta_db, n)
+
+            filas_antes, sql_antes, t_antes = medir(contador, cargar_antes, ruta_db)
+            filas_despues, sql_despues, t_despues = medir(contador, cargar_despues, ruta_db)
+            assert filas_antes == filas_despues
+
+            print(
+                f"{n:>8,} | {sql_antes:>10,} {t_antes * 1000:>10.1f} | "
+                f"{sql_despues:>12,} {t_despues * 1000:>11.1f}"
+            )
+            ConexionSQLite.resetear()
+
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Benchmark de hidratación de DTOs.
+
+Compara filas por segundo entre el camino anterior
+(sqlite3.Row → dict(row) → DTO.set_data) y la hidratación directa desde
+la tupla (DAO.consultar_dtos) para:
+
+1. La tabla actividad (ActividadDTO)
+2. La vista vw_estudiante_actividades_detalladas (ActividadDetalladaDTO)
+
+Uso:
+    python scripts/benchmark_hidratacion.py [--actividades 5000] [--estudiantes 20] [--repeticiones 5]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+# Agregar src al path para las importaciones
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from modelos.daos.actividad_dao import ActividadDAO
+from modelos.daos.asignatura_dao import AsignaturaDAO
+from modelos.daos.carrera_dao import CarreraDAO
+from modelos.daos.conexion_sqlite import ConexionSQLite
+from modelos.daos.consulta_dao import ConsultaDAO
+from modelos.daos.eje_tematico_dao import EjeTematicoDAO
+from modelos.daos.estudiante_actividad_dao import EstudianteActividadDAO
+from modelos.daos.estudiante_dao import EstudianteDAO
+from modelos.daos.tipo_actividad_dao import TipoActividadDAO
+from modelos.dtos.actividad_dto import ActividadDTO
+from modelos.dtos.asignatura_dto import AsignaturaDTO
+from modelos.dtos.carrera_dto import CarreraDTO
+from modelos.dtos.consulta_dto import ActividadDetalladaDTO
+from modelos.dtos.eje_tematico_dto import EjeTematicoDTO
+from modelos.dtos.estudiante_actividad_dto import EstudianteActividadDTO
+from modelos.dtos.estudiante_dto import EstudianteDTO
+from modelos.dtos.tipo_actividad_dto import TipoActividadDTO
+from scripts.crear_indices import crear_todos_los_indices
+from scripts.crear_views import crear_todas_las_views
+
+SQL_ACTIVIDAD = "SELECT * FROM actividad ORDER BY fecha_inicio DESC"
+SQL_DETALLADAS = "SELECT * FROM vw_estudiante_actividades_detalladas"
+
+
+def print_header(titulo):
+    """Imprime encabezado formateado"""
+    print(f"\n{'='*75}")
+    print(f"  {titulo}")
+    print(f"{'='*75}\n")
+
+
+def poblar_base_datos(ruta_db: str, n_actividades: int, n_estudiantes: int) -> None:
+    """Crea el esquema y carga datos sintéticos."""
+    crear_todos_los_indices(ruta_db)
+    crear_todas_las_views(ruta_db)
+
+    id_carrera = CarreraDAO(ruta_db).insertar(
+        CarreraDTO(nombre="Carrera Benchmark", plan="2024", modalidad="Presencial")
+    )
+    id_asignatura = AsignaturaDAO(ruta_db).insertar(
+        AsignaturaDTO(
+            codigo="BEN",
+            nombre="Asignatura Benchmark",
+            creditos=4,
+            tipo="obligatoria",
+            id_carrera=id_carrera,
+        )
+    )
+    id_eje = EjeTematicoDAO(ruta_db).insertar(
+        EjeTematicoDTO(nombre="Eje Benchmark", orden=1, id_asignatura=id_asignatura)
+    )
+    id_tipo = TipoActividadDAO(ruta_db).insertar(
+        TipoActividadDTO(nombre="Tarea", siglas="TAR", prioridad=1)
+    )
+
+    ids_actividades = ActividadDAO(ruta_db).insertar_lote(
+        ActividadDTO(
+            titulo=f"Actividad {i}",
+            descripcion="Descripción de la actividad de benchmark",
+            fecha_inicio=f"2025-{i % 12 + 1:02d}-01",
+            fecha_fin=f"2025-{i % 12 + 1:02d}-15",
+            id_eje=id_eje,
+            id_tipo_actividad=id_tipo,
+            nota=i % 10,
+        )
+        for i in range(n_actividades)
+    )
+    ids_estudiantes = EstudianteDAO(ruta_db).insertar_lote(
+        EstudianteDTO(nombre=f"Estudiante {i}", correo=f"estudiante{i}@benchmark.edu")
+        for i in range(n_estudiantes)
+    )
+    EstudianteActividadDAO(ruta_db).insertar_lote(
+        EstudianteActividadDTO(id_estudiante=id_est, id_actividad=id_act, estado="pendiente")
+        for id_est in ids_estudiantes
+        for id_act in ids_actividades
+    )
+
+
+def medir(funcion, repeticiones: int) -> tuple:
+    """Ejecuta `funcion` varias veces y retorna (filas, mejor_tiempo)."""
+    mejor = float("inf")
+    filas = 0
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        filas = len(funcion())
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return filas, mejor
+
+
+def actividades_antes(dao: ActividadDAO) -> list:
+    """Camino anterior: dict por fila y set_data."""
+    resultado = []
+    for data in dao.ejecutar_consulta(SQL_ACTIVIDAD):
+        dto = ActividadDTO()
+        dto.set_data(data=data)
+        resultado.append(dto)
+    return resultado
+
+
+def detalladas_antes(dao: ConsultaDAO) -> list:
+    """Camino anterior: dict por fila y DTO construido desde el dict."""
+    return [ActividadDetalladaDTO(**data) for data in dao.ejecutar_consulta(SQL_DETALLADAS)]
+
+
+def reportar(nombre: str, antes: tuple, despues: tuple) -> None:
+    filas, t_antes = antes
+    _, t_despues = despues
+    print(f"{nombre}")
+    print(f"   Filas:              {filas:>12,}")
+    print(f"   Antes  (dict+set):  {filas / t_antes:>12,.0f} filas/s  ({t_antes * 1000:.1f} ms)")
+    print(f"   Después (directo):  {filas / t_despues:>12,.0f} filas/s  ({t_despues * 1000:.1f} ms)")
+    print(f"   Mejora:             {t_antes / t_despues:>12.2f}x\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--actividades", type=int, default=5000)
+    parser.add_argument("--estudiantes", type=int, default=20)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    # Los logs por consulta distorsionarían las mediciones
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_db = os.path.join(directorio, "benchmark.sqlite")
+
+        print_header("BENCHMARK DE HIDRATACIÓN DE DTOs")
+        print(f"Actividades: {args.actividades:,} | Estudiantes: {args.estudiantes:,}")
+        poblar_base_datos(ruta_db, args.actividades, args.estudiantes)
+
+        actividad_dao = ActividadDAO(ruta_db)
+        consulta_dao = ConsultaDAO(ruta_db)
+
+        reportar(
+            "actividad → ActividadDTO",
+            medir(lambda: actividades_antes(actividad_dao), args.repeticiones),
+            medir(lambda: actividad_dao.consultar_dtos(SQL_ACTIVIDAD, (), ActividadDTO), args.repeticiones),
+        )
+        reportar(
+            "vw_estudiante_actividades_detalladas → ActividadDetalladaDTO",
+            medir(lambda: detalladas_antes(consulta_dao), args.repeticiones),
+            medir(
+                lambda: consulta_dao.consultar_dtos(SQL_DETALLADAS, (), ActividadDetalladaDTO),
+                args.repeticiones,
+            ),
+        )
+
+        ConexionSQLite.cerrar_todas()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark de memoria de DTOs.
+
+Compara, para N instancias de EventosUnificadosDTO y ActividadDTO, la versión
+con __slots__ contra una dataclass equivalente con __dict__ por instancia
+(la definición anterior):
+
+1. Memoria asignada (tracemalloc)
+2. Tiempo de una recolección completa del GC con las instancias vivas
+3. Tiempo de to_dict superficial frente a dataclasses.asdict
+
+Uso:
+    python scripts/benchmark_memoria_dtos.py [--instancias 100000]
+"""
+
+import argparse
+import dataclasses
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+# Agregar src al path para las importaciones
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from modelos.dtos.actividad_dto import ActividadDTO
+from modelos.dtos.consulta_dto import EventosUnificadosDTO
+
+
+def print_header(titulo):
+    """Imprime encabezado formateado"""
+    print(f"\n{'='*75}")
+    print(f"  {titulo}")
+    print(f"{'='*75}\n")
+
+
+def clase_con_dict(clase_dto):
+    """Crea una dataclass con los mismos campos pero sin __slots__."""
+    campos = [
+        (campo.name, campo.type, campo)
+        for campo in dataclasses.fields(clase_dto)
+    ]
+    return dataclasses.make_dataclass(f"{clase_dto.__name__}ConDict", campos)
+
+
+def crear_eventos(clase, n: int) -> list:
+    return [
+        clase(
+            tipo_evento='Actividad' if i % 2 else 'Evento Calendario',
+            id_evento=i,
+            titulo=f"Evento {i}",
+            fecha_inicio='2025-03-01',
+            fecha_fin='2025-03-15',
+            tipo_actividad='Tarea',
+            descripcion='Descripción del evento',
+            carrera='Ingeniería',
+            id_carrera=1,
+            asignatura='Algoritmos',
+            id_asignatura=i % 40,
+        )
+        for i in range(n)
+    ]
+
+
+def crear_actividades(clase, n: int) -> list:
+    return [
+        clase(
+            id_actividad=i,
+            titulo=f"Actividad {i}",
+            descripcion='Descripción de la actividad',
+            fecha_inicio='2025-03-01',
+            fecha_fin='2025-03-15',
+            id_eje=i % 200,
+            id_tipo_actividad=i % 5,
+            nota=i % 10,
+        )
+        for i in range(n)
+    ]
+
+
+def medir_memoria(fabrica, clase, n: int) -> tuple:
+    """Retorna (instancias, bytes asignados, segundos de gc.collect)."""
+    gc.collect()
+    tracemalloc.start()
+    instancias = fabrica(clase, n)
+    asignado, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    inicio = time.perf_counter()
+    gc.collect()
+    tiempo_gc = time.perf_counter() - inicio
+    return instancias, asignado, tiempo_gc
+
+
+def medir(funcion) -> float:
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+
+def reportar(nombre: str, fabrica, clase_dto, n: int) -> None:
+    clase_antes = clase_con_dict(clase_dto)
+    antes, mem_antes, gc_antes = medir_memoria(fabrica, clase_antes, n)
+    del antes
+    despues, mem_despues, gc_despues = medir_memoria(fabrica, clase_dto, n)
+
+    print(f"{nombre} ({n:,} instancias)")
+    print(f"   Memoria con __dict__:   {mem_antes / 2**20:>10.1f} MiB ({mem_antes / n:.0f} B/instancia)")
+    print(f"   Memoria con __slots__:  {mem_despues / 2**20:>10.1f} MiB ({mem_despues / n:.0f} B/instancia)")
+    print(f"   Reducción:              {1 - mem_despues / mem_antes:>10.1%}")
+    print(f"   gc.collect con __dict__:  {gc_antes * 1000:>8.1f} ms")
+    print(f"   gc.collect con __slots__: {gc_despues * 1000:>8.1f} ms")
+
+    if hasattr(clase_dto, 'to_dict'):
+        t_asdict = medir(lambda: [dataclasses.asdict(dto) for dto in despues])
+        t_to_dict = medir(lambda: [dto.to_dict() for dto in despues])
+        print(f"   dataclasses.asdict:     {t_asdict * 1000:>10.1f} ms")
+        print(f"   to_dict superficial:    {t_to_dict * 1000:>10.1f} ms ({t_asdict / t_to_dict:.1f}x)")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--instancias", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print_header("BENCHMARK DE MEMORIA DE DTOs")
+    reportar("EventosUnificadosDTO", crear_eventos, EventosUnificadosDTO, args.instancias)
+    reportar("ActividadDTO", crear_actividades, ActividadDTO, args.instancias)
+
+
+if __name__ == "__main__":
+    main()
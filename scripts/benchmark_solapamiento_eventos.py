@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Benchmark de consultas por rango de fechas sobre los eventos unificados.
+
+Compara, para ventanas aleatorias de distinto ancho:
+
+1. Contención sobre la vista (obtener_por_rango_fechas, el criterio anterior):
+   `fecha_inicio >= ? AND fecha_fin <= ?`, que omite los eventos que solo se solapan.
+2. Solapamiento recorriendo la vista: `fecha_inicio <= ? AND fecha_fin >= ?`.
+3. Solapamiento con los R*Tree de intervalos (la consulta de obtener_por_solapamiento).
+
+Verifica que 2 y 3 devuelven los mismos eventos.
+
+Uso:
+    python scripts/benchmark_solapamiento_eventos.py [--eventos 200000] [--consultas 50]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+# Agregar src al path para las importaciones
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from modelos.daos.actividad_dao import ActividadDAO
+from modelos.daos.asignatura_dao import AsignaturaDAO
+from modelos.daos.calendario_evento_dao import CalendarioEventoDAO
+from modelos.daos.carrera_dao import CarreraDAO
+from modelos.daos.conexion_sqlite import ConexionSQLite
+from modelos.daos.consulta_dao import EventosUnificadosDAO, _SQL_SOLAPAMIENTO
+from modelos.daos.eje_tematico_dao import EjeTematicoDAO
+from modelos.daos.tipo_actividad_dao import TipoActividadDAO
+from modelos.dtos.actividad_dto import ActividadDTO
+from modelos.dtos.asignatura_dto import AsignaturaDTO
+from modelos.dtos.calendario_evento_dto import CalendarioEventoDTO
+from modelos.dtos.carrera_dto import CarreraDTO
+from modelos.dtos.consulta_dto import EventosUnificadosDTO
+from modelos.dtos.eje_tematico_dto import EjeTematicoDTO
+from modelos.dtos.tipo_actividad_dto import TipoActividadDTO
+from scripts.crear_indices import crear_todos_los_indices
+from scripts.crear_views import crear_todas_las_views
+
+INICIO = date(2020, 1, 1)
+DIAS = 10 * 365
+
+SQL_SOLAPAMIENTO_VISTA = """
+SELECT tipo_evento, id_evento, titulo, descripcion,
+       fecha_inicio, fecha_fin, tipo_actividad, observaciones,
+       carrera, id_carrera, asignatura, id_asignatura
+FROM vw_eventos_unificados
+WHERE fecha_inicio <= ? AND fecha_fin >= ?
+ORDER BY fecha_inicio ASC;
+"""
+
+
+def print_header(titulo):
+    """Imprime encabezado formateado"""
+    print(f"\n{'='*75}")
+    print(f"  {titulo}")
+    print(f"{'='*75}\n")
+
+
+def intervalo(generador: random.Random, duracion_maxima: int) -> tuple:
+    inicio = INICIO + timedelta(days=generador.randrange(DIAS))
+    return str(inicio), str(inicio + timedelta(days=generador.randrange(duracion_maxima + 1)))
+
+
+def poblar_base_datos(ruta_db: str, n_eventos: int, generador: random.Random) -> None:
+    """Crea el esquema y carga la mitad de los eventos como actividades y la otra mitad como calendario."""
+    crear_todos_los_indices(ruta_db)
+    crear_todas_las_views(ruta_db)
+
+    id_carrera = CarreraDAO(ruta_db).insertar(
+        CarreraDTO(nombre="Carrera Benchmark", plan="2024", modalidad="Presencial")
+    )
+    id_asignatura = AsignaturaDAO(ruta_db).insertar(
+        AsignaturaDTO(codigo="BEN", nombre="Asignatura Benchmark", creditos=4, tipo="obligatoria", id_carrera=id_carrera)
+    )
+    id_eje = EjeTematicoDAO(ruta_db).insertar(
+        EjeTematicoDTO(nombre="Eje Benchmark", orden=1, id_asignatura=id_asignatura)
+    )
+    id_tipo = TipoActividadDAO(ruta_db).insertar(TipoActividadDTO(nombre="Tarea", siglas="TAR", prioridad=1))
+
+    mitad = n_eventos // 2
+    ActividadDAO(ruta_db).insertar_lote(
+        ActividadDTO(
+            titulo=f"Actividad {i}",
+            fecha_inicio=inicio,
+            fecha_fin=fin,
+            id_eje=id_eje,
+            id_tipo_actividad=id_tipo,
+        )
+        for i, (inicio, fin) in enumerate(intervalo(generador, 14) for _ in range(mitad))
+    )
+    CalendarioEventoDAO(ruta_db).insertar_lote(
+        CalendarioEventoDTO(titulo=f"Evento {i}", tipo="Feriado", fecha_inicio=inicio, fecha_fin=fin)
+        for i, (inicio, fin) in enumerate(intervalo(generador, 7) for _ in range(n_eventos - mitad))
+    )
+
+
+def medir(funcion, ventanas: list) -> tuple:
+    """Ejecuta `funcion(desde, hasta)` para cada ventana; retorna (resultados, ms por consulta)."""
+    resultados = []
+    inicio = time.perf_counter()
+    for desde, hasta in ventanas:
+        resultados.append(funcion(desde, hasta))
+    return resultados, (time.perf_counter() - inicio) * 1000 / len(ventanas)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--eventos", type=int, default=200_000)
+    parser.add_argument("--consultas", type=int, default=50)
+    parser.add_argument("--semilla", type=int, default=7)
+    args = parser.parse_args()
+
+    # Los logs por consulta distorsionarían las mediciones
+    logging.disable(logging.INFO)
+    generador = random.Random(args.semilla)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_db = os.path.join(directorio, "benchmark.sqlite")
+
+        print_header("BENCHMARK DE CONSULTAS POR SOLAPAMIENTO DE FECHAS")
+        print(f"Eventos: {args.eventos:,} | Consultas por ventana: {args.consultas}")
+        inicio = time.perf_counter()
+        poblar_base_datos(ruta_db, args.eventos, generador)
+        print(f"Carga (con triggers de los R*Tree): {time.perf_counter() - inicio:.1f} s\n")
+
+        dao = EventosUnificadosDAO(ruta_db)
+        # Las tres variantes hidratan DTOs sin pasar por la caché de consultas
+        recorrer = lambda desde, hasta: dao.consultar_dtos(
+            SQL_SOLAPAMIENTO_VISTA, (hasta, desde), EventosUnificadosDTO
+        )
+        con_rtree = lambda desde, hasta: dao.consultar_dtos(
+            _SQL_SOLAPAMIENTO, (hasta, desde, hasta, desde), EventosUnificadosDTO
+        )
+        for ancho in (1, 7, 30):
+            ventanas = [intervalo(generador, 0) for _ in range(args.consultas)]
+            ventanas = [
+                (desde, str(date.fromisoformat(desde) + timedelta(days=ancho - 1))) for desde, _ in ventanas
+            ]
+
+            contenidos, t_contencion = medir(dao.obtener_por_rango_fechas, ventanas)
+            recorridos, t_recorrido = medir(recorrer, ventanas)
+            solapados, t_rtree = medir(con_rtree, ventanas)
+
+            claves = lambda eventos: sorted((e.tipo_evento, e.id_evento) for e in eventos)
+            for esperado, obtenido in zip(recorridos, solapados):
+                assert claves(esperado) == claves(obtenido), "El R*Tree no devolvió los mismos eventos"
+
+            promedio = lambda listas: sum(len(x) for x in listas) / len(listas)
+            print(f"Ventana de {ancho} día(s)")
+            print(f"   Contención (vista):     {t_contencion:>9.2f} ms  ({promedio(contenidos):,.0f} eventos)")
+            print(f"   Solapamiento (vista):   {t_recorrido:>9.2f} ms  ({promedio(recorridos):,.0f} eventos)")
+            print(f"   Solapamiento (R*Tree):  {t_rtree:>9.2f} ms  ({promedio(solapados):,.0f} eventos)")
+            print(f"   Mejora vs. recorrido:   {t_recorrido / t_rtree:>9.1f}x\n")
+
+        ConexionSQLite.cerrar_todas()
+
+
+if __name__ == "__main__":
+    main()
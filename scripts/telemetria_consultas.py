@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Muestra la telemetría de consultas guardada por la aplicación al cerrarse.
+
+Lista las sentencias (o clases DAO) que más tiempo consumieron, con llamadas,
+tiempo total, promedio, p50/p95/máximo, filas y ejecuciones lentas. Las
+ejecuciones lentas completas están en logs/consultas_lentas.log.
+
+Uso:
+    python scripts/telemetria_consultas.py [--archivo ruta.json] [--por clase]
+                                           [--ordenar p95_ms] [--limite 20]
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Agregar src al path para las importaciones
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from modelos.daos.telemetria_consultas import AGRUPACIONES, ORDENES, TelemetriaConsultas
+from utilidades.config import TELEMETRIA_ARCHIVO
+
+
+def print_header(titulo):
+    """Imprime encabezado formateado"""
+    print(f"\n{'='*75}")
+    print(f"  {titulo}")
+    print(f"{'='*75}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--archivo", default=TELEMETRIA_ARCHIVO, help="JSON guardado por la aplicación")
+    parser.add_argument("--por", choices=AGRUPACIONES, default="sentencia")
+    parser.add_argument("--ordenar", choices=ORDENES, default="total_ms")
+    parser.add_argument("--limite", type=int, default=20)
+    parser.add_argument("--ancho", type=int, default=90, help="Caracteres de sentencia a mostrar")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    try:
+        telemetria = TelemetriaConsultas.cargar(args.archivo)
+    except (OSError, ValueError) as ex:
+        print(f"No se pudo leer la telemetría de {args.archivo}: {ex}", file=sys.stderr)
+        return 1
+
+    estadisticas = telemetria.resumen(agrupar=args.por, ordenar=args.ordenar)
+    total_ms = sum(e.total_ms for e in estadisticas)
+    llamadas = sum(e.llamadas for e in estadisticas)
+
+    print_header(f"TELEMETRÍA DE CONSULTAS POR {args.por.upper()}")
+    print(f"Archivo: {args.archivo}")
+    print(f"Llamadas: {llamadas:,} | Tiempo total: {total_ms:,.1f} ms | "
+          f"Umbral de consulta lenta: {telemetria.umbral_lenta_ms} ms\n")
+    print(TelemetriaConsultas.formatear(estadisticas[: args.limite], ancho_clave=args.ancho))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,19 @@
 from ttkbootstrap import Combobox, StringVar, Frame, Label, Labelframe, Button
 from ttkbootstrap.scrolled import ScrolledFrame
 from ttkbootstrap.constants import *
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from tkinter.messagebox import showwarning
-from datetime import datetime
+from datetime import date, datetime
 from modelos.daos.estudiante_dao import EstudianteDAO
-from modelos.daos.carrera_dao import CarreraDAO
-from modelos.daos.asignatura_dao import AsignaturaDAO
-from modelos.daos.actividad_dao import ActividadDAO
-from modelos.daos.tipo_actividad_dao import TipoActividadDAO
+from modelos.daos.estudiante_asignatura_dao import EstudianteAsignaturaDAO
+from modelos.daos.consulta_dao import ConsultaDAO
+from modelos.dtos.consulta_dto import EstadisticasActividadesDTO
+from modelos.dtos.cohorte_dto import PosicionCohorteDTO
 from modelos.services.estudiante_carrera_service import EstudianteCarreraService
 from modelos.services.estudiante_asignatura_service import EstudianteAsignaturaService
 from modelos.services.carrera_service import CarreraService
+from modelos.services.cohorte_service import CohorteService
+from modelos.services.catalogo_service import CatalogoService
 from scripts.logging_config import obtener_logger_modulo
 
 logger = obtener_logger_modulo(__name__)
@@ -40,6 +42,13 @@ class ControlarActividades:
 
         # Lista de las actividades detalladas
         self.lista_actividades_detalladas: List[Dict[str, Any]] = []
+        # Filtros aplicados (id_estudiante, id_carrera, id_asignatura, id_tipo_actividad)
+        # y las estadísticas calculadas para ellos, que comparten todas las vistas
+        self.filtros_actividades: Optional[Tuple[int, ...]] = None
+        self.estadisticas_actividades: Optional[EstadisticasActividadesDTO] = None
+        self.fecha_referencia: date = date.today()
+        # Notas finales por asignatura y carrera para la comparativa
+        self.cohortes = CohorteService()
 
         # IDs actuales
         self.id_estudiante_actual: int = 0
@@ -116,6 +125,8 @@ class ControlarActividades:
         try:
             # Limpiar la lista
             self.lista_actividades_detalladas.clear()
+            self.filtros_actividades = None
+            self.estadisticas_actividades = None
 
             # Obtener valores seleccionados
             nombre_estudiante = self.var_estudiante.get()
@@ -134,37 +145,31 @@ class ControlarActividades:
                 logger.warning(f"Estudiante no encontrado: {nombre_estudiante}")
                 return
 
-            # Construir la consulta SQL dinámicamente
-            dao = ActividadDAO(ruta_db=None)
-            sql = "SELECT * FROM vw_estudiante_actividades_detalladas WHERE id_estudiante = ?"
-            params = [id_estudiante]
+            id_carrera = id_asignatura = id_tipo_actividad = 0
 
-            # Agregar filtro por carrera si no es "Todos"
+            # Filtro por carrera si no es "Todos"
             if nombre_carrera and nombre_carrera != "Todos":
                 id_carrera = self.dict_carreras_inv.get(nombre_carrera, 0)
-                if id_carrera:
-                    sql += " AND carrera_id = ?"
-                    params.append(id_carrera)
 
-            # Agregar filtro por asignatura si está seleccionada
+            # Filtro por asignatura si está seleccionada
             if nombre_asignatura and nombre_asignatura != "Todos":
                 id_asignatura = self.dict_asignaturas_inv.get(nombre_asignatura, 0)
-                if id_asignatura:
-                    sql += " AND id_asignatura = ?"
-                    params.append(id_asignatura)
 
-            # Agregar filtro por tipo de actividad si no es "Todos"
+            # Filtro por tipo de actividad si no es "Todos"
             if nombre_tipo_actividad and nombre_tipo_actividad != "Todos":
                 id_tipo_actividad = self.dict_tipos_actividad_inv.get(nombre_tipo_actividad, 0)
-                if id_tipo_actividad:
-                    sql += " AND tipo_actividad_id = ?"
-                    params.append(id_tipo_actividad)
 
-            # Agregar orden
-            sql += " ORDER BY fecha_fin DESC, titulo"
+            self.filtros_actividades = (id_estudiante, id_carrera, id_asignatura, id_tipo_actividad)
+            # Lista y estadísticas calculan dias_desde_fin contra la misma fecha
+            self.fecha_referencia = date.today()
 
-            # Ejecutar consulta
-            resultado = dao.ejecutar_consulta(sql=sql, params=tuple(params))
+            # Ejecutar consulta (ordenada por fecha de fin descendente)
+            resultado = [
+                actividad.to_dict()
+                for actividad in ConsultaDAO(ruta_db=None).obtener_actividades_detalladas(
+                    *self.filtros_actividades, fecha_referencia=self.fecha_referencia
+                )
+            ]
 
             if resultado:
                 self.lista_actividades_detalladas = resultado
@@ -433,20 +438,22 @@ class ControlarActividades:
                 self.cbx_carreras.current(0)
                 return
 
-            # Consultar carreras del estudiante
-            sql = """SELECT ec.id_carrera, ec.estado, c.nombre 
-                     FROM estudiante_carrera ec
-                     JOIN carrera c ON ec.id_carrera = c.id_carrera
-                     WHERE ec.id_estudiante = ?
-                     ORDER BY ec.es_carrera_principal DESC, c.nombre"""
-            params = (id_estudiante,)
-            dao_carrera = CarreraDAO(ruta_db=None)
-            consulta = dao_carrera.ejecutar_consulta(sql=sql, params=params)
+            # Inscripciones del estudiante; los nombres salen del catálogo en memoria
+            catalogo = CatalogoService(ruta_db=None)
+            inscripciones = EstudianteCarreraService(ruta_db=None).obtener_carreras_estudiante(
+                id_estudiante
+            )
+            consulta = []
+            for dato in inscripciones:
+                carrera = catalogo.carrera(dato['id_carrera'])
+                if carrera is not None:
+                    consulta.append((dato, carrera))
+            consulta.sort(key=lambda par: (not par[0]['es_carrera_principal'], par[1].nombre))
 
             if consulta:
-                for dato in consulta:
+                for dato, carrera in consulta:
                     id_carrera = dato['id_carrera']
-                    nombre_carrera = dato['nombre']
+                    nombre_carrera = carrera.nombre
                     estado = dato['estado']
 
                     # Obtener ícono del estado
@@ -551,13 +558,15 @@ class ControlarActividades:
         return estados_icon.get(estado, '✗')
 
     def _cargar_asignaturas(self, nombre_carrera: str) -> None:
-        """Carga las asignaturas basadas en la carrera seleccionada usando vw_estudiante_asignatura_carrera.
+        """Carga las asignaturas de la carrera seleccionada con el estado del estudiante actual.
 
         Args:
             nombre_carrera (str): Nombre de la carrera en formato "Nombre (estado)"
 
-        Si se selecciona "Todos", carga todas las asignaturas de todas las carreras.
+        Si se selecciona "Todos", carga las asignaturas de todas las carreras del
+        estudiante (o de todas las carreras si no tiene ninguna).
         Si se selecciona una carrera específica, carga solo sus asignaturas.
+        Las asignaturas salen del catálogo en memoria (CatalogoService).
 
         El formato mostrado es: "🔵 Nombre Asignatura (Carrera)"
         Ejemplo: "🟢 Cálculo I (Ingeniería en Sistemas)"
@@ -572,21 +581,15 @@ class ControlarActividades:
                 self.cbx_asignaturas.config(values=lista_aux)
                 return
 
-            asignatura_dao = AsignaturaDAO(ruta_db=None)
+            catalogo = CatalogoService(ruta_db=None)
 
             if nombre_carrera == "Todos":
-                # Mostrar todas las asignaturas de todas las carreras
-                sql = """
-                SELECT DISTINCT 
-                    id_asignatura,
-                    nombre_asignatura,
-                    nombre_carrera,
-                    id_carrera,
-                    estado
-                FROM vw_estudiante_asignatura_carrera
-                ORDER BY nombre_carrera, nombre_asignatura
-                """
-                params = ()
+                # Asignaturas de las carreras del estudiante, por carrera y nombre
+                ids_carreras = [
+                    carrera.id_carrera
+                    for carrera in catalogo.carreras()
+                    if not self.dict_carreras or carrera.id_carrera in self.dict_carreras
+                ]
             else:
                 # Obtener id_carrera del nombre
                 id_carrera = self.dict_carreras_inv.get(nombre_carrera)
@@ -594,29 +597,25 @@ class ControlarActividades:
                     logger.warning(f"Carrera no encontrada: {nombre_carrera}")
                     self.cbx_asignaturas.config(values=lista_aux)
                     return
+                ids_carreras = [id_carrera]
 
-                # Mostrar solo asignaturas de la carrera seleccionada
-                sql = """
-                SELECT DISTINCT 
-                    id_asignatura,
-                    nombre_asignatura,
-                    nombre_carrera,
-                    id_carrera,
-                    estado
-                FROM vw_estudiante_asignatura_carrera
-                WHERE id_carrera = ?
-                ORDER BY nombre_asignatura
-                """
-                params = (id_carrera,)
-
-            consulta = asignatura_dao.ejecutar_consulta(sql=sql, params=params)
+            estados = {}
+            if self.id_estudiante_actual:
+                estados = EstudianteAsignaturaDAO(ruta_db=None).obtener_estados_por_estudiante(
+                    self.id_estudiante_actual
+                )
+            consulta = [
+                (asignatura, catalogo.carrera(id_carrera))
+                for id_carrera in ids_carreras
+                for asignatura in catalogo.asignaturas(id_carrera)
+            ]
 
             if consulta:
-                for dato in consulta:
-                    id_asignatura = dato['id_asignatura']
-                    nombre_asignatura = dato['nombre_asignatura']
-                    nombre_carrera_resultado = dato['nombre_carrera']
-                    estado = dato['estado'] if dato['estado'] else 'no_cursada'
+                for asignatura, carrera in consulta:
+                    id_asignatura = asignatura.id_asignatura
+                    nombre_asignatura = asignatura.nombre
+                    nombre_carrera_resultado = carrera.nombre
+                    estado = estados.get(id_asignatura) or 'no_cursada'
 
                     # Obtener ícono del estado
                     icon_estado = self._obtener_icono_estado_asignatura(estado)
@@ -663,19 +662,18 @@ class ControlarActividades:
             self.dict_tipos_actividad_inv.clear()
             lista = ["Todos"]
 
-            tipo_actividad_dao = TipoActividadDAO(ruta_db=None)
-            sql = """SELECT id_tipo_actividad, nombre, siglas, prioridad 
-                     FROM tipo_actividad 
-                     ORDER BY prioridad DESC, nombre"""
-            params = ()
-            consulta = tipo_actividad_dao.ejecutar_consulta(sql=sql, params=params)
+            # Del catálogo en memoria, por prioridad descendente y nombre
+            consulta = sorted(
+                CatalogoService(ruta_db=None).tipos_actividad(),
+                key=lambda tipo: (-(tipo.prioridad or 0), tipo.nombre),
+            )
 
             if consulta:
-                for dato in consulta:
-                    id_tipo = dato['id_tipo_actividad']
-                    nombre = dato['nombre']
-                    siglas = dato['siglas']
-                    prioridad = dato['prioridad'] if dato['prioridad'] is not None else 0
+                for tipo in consulta:
+                    id_tipo = tipo.id_tipo_actividad
+                    nombre = tipo.nombre
+                    siglas = tipo.siglas
+                    prioridad = tipo.prioridad if tipo.prioridad is not None else 0
 
                     # Obtener ícono y nombre de la prioridad
                     icon_prioridad = self._obtener_icono_prioridad(prioridad)
@@ -876,53 +874,34 @@ class ControlarActividades:
         except Exception as e:
             logger.error(f"Error al mostrar estadísticas: {e}", exc_info=True)
 
+    def _obtener_estadisticas(self) -> EstadisticasActividadesDTO:
+        """
+        Retorna las métricas de las actividades filtradas, calculadas con una
+        sola consulta agregada la primera vez que una vista las pide.
+        """
+        if self.filtros_actividades is None:
+            return EstadisticasActividadesDTO()
+        if self.estadisticas_actividades is None:
+            self.estadisticas_actividades = ConsultaDAO(
+                ruta_db=None
+            ).obtener_estadisticas_actividades(
+                *self.filtros_actividades, fecha_referencia=self.fecha_referencia
+            )
+        return self.estadisticas_actividades
+
     def _calcular_estadisticas_estudiante(self) -> Dict[str, Any]:
         """Calcula las estadísticas generales del estudiante actual."""
-        stats = {
-            'total': 0,
-            'entregadas': 0,
-            'pendientes': 0,
-            'en_progreso': 0,
-            'vencidas': 0,
-            'tasa_entrega': 0.0,
-            'promedio_nota': 0.0,
+        estadisticas = self._obtener_estadisticas()
+        return {
+            'total': estadisticas.total,
+            'entregadas': estadisticas.entregadas,
+            'pendientes': estadisticas.pendientes,
+            'en_progreso': estadisticas.en_progreso,
+            'vencidas': estadisticas.vencidas,
+            'tasa_entrega': estadisticas.tasa_entrega,
+            'promedio_nota': estadisticas.promedio_nota,
         }
 
-        if not self.lista_actividades_detalladas:
-            return stats
-
-        actividades = self.lista_actividades_detalladas
-        stats['total'] = len(actividades)
-
-        notas_validas = []
-
-        for act in actividades:
-            estado = act.get('actividad_estado', 'pendiente')
-            if estado == 'entregada':
-                stats['entregadas'] += 1
-            elif estado == 'pendiente':
-                stats['pendientes'] += 1
-            elif estado == 'en_progreso':
-                stats['en_progreso'] += 1
-            elif estado == 'vencida':
-                stats['vencidas'] += 1
-
-            # Recopilar notas válidas
-            nota = act.get('nota')
-            if nota is not None:
-                try:
-                    notas_validas.append(float(nota))
-                except (ValueError, TypeError):
-                    pass
-
-        if stats['total'] > 0:
-            stats['tasa_entrega'] = round((stats['entregadas'] / stats['total']) * 100, 1)
-
-        if notas_validas:
-            stats['promedio_nota'] = round(sum(notas_validas) / len(notas_validas), 2)
-
-        return stats
-
     def _mostrar_resumen_general(self) -> None:
         """Muestra un resumen general de actividades del estudiante."""
         try:
@@ -1095,6 +1074,7 @@ class ControlarActividades:
 
             # Actividades próximas a vencer
             proximas = self._obtener_actividades_proximas_vencer()
+            total_proximas = self._obtener_estadisticas().proximas_vencer
             duracion_promedio = self._calcular_duracion_promedio()
 
             # Columna 1: Próximas a vencer (máximo 2)
@@ -1103,7 +1083,7 @@ class ControlarActividades:
 
             lbl_proximas = Label(
                 frame_col1,
-                text=f"⏰ Próximas: {len(proximas)}",
+                text=f"⏰ Próximas: {total_proximas}",
                 font=("Helvetica", 9, "bold"),
                 bootstyle="warning",
             )
@@ -1150,7 +1130,12 @@ class ControlarActividades:
 
             stats = self._calcular_estadisticas_estudiante()
             promedio_clase = self._obtener_promedio_clase()
-            diferencia = stats['promedio_nota'] - promedio_clase
+            # Se compara la nota final del estudiante en la cohorte; sin ella, su promedio de actividades
+            posicion_estudiante = self._obtener_posicion_clase()
+            nota_estudiante = (
+                posicion_estudiante.nota if posicion_estudiante else stats['promedio_nota']
+            )
+            diferencia = nota_estudiante - promedio_clase
 
             # Columna 1: Notas
             frame_col1 = Frame(frame_comparativa)
@@ -1158,7 +1143,7 @@ class ControlarActividades:
 
             lbl_tu_nota = Label(
                 frame_col1,
-                text=f"📊 Tu Nota: {stats['promedio_nota']}",
+                text=f"📊 Tu Nota: {nota_estudiante}",
                 font=("Helvetica", 9),
             )
             lbl_tu_nota.pack(fill=X, pady=1)
@@ -1201,7 +1186,7 @@ class ControlarActividades:
             frame_col3 = Frame(frame_comparativa)
             frame_col3.pack(side=LEFT, fill=BOTH, expand=True)
 
-            posicion = self._estimar_posicion_clase(stats['promedio_nota'])
+            posicion = self._estimar_posicion_clase(nota_estudiante)
             lbl_posicion = Label(
                 frame_col3,
                 text=f"🎯 {posicion}",
@@ -1214,65 +1199,24 @@ class ControlarActividades:
 
     def _calcular_velocidad_promedio(self) -> float:
         """Calcula la velocidad promedio de entrega en días."""
-        try:
-            entregadas = [
-                a
-                for a in self.lista_actividades_detalladas
-                if a.get('actividad_estado') == 'entregada'
-            ]
-
-            if not entregadas:
-                return 0.0
-
-            velocidades = []
-            for act in entregadas:
-                dias = act.get('dias_desde_fin', 0)
-                velocidades.append(dias)
-
-            return round(sum(velocidades) / len(velocidades), 1) if velocidades else 0.0
-        except Exception as e:
-            logger.error(f"Error al calcular velocidad promedio: {e}", exc_info=True)
-            return 0.0
+        return self._obtener_estadisticas().velocidad_promedio
 
     def _calcular_duracion_promedio(self) -> float:
         """Calcula la duración promedio de las actividades."""
-        try:
-            duraciones = []
-            for act in self.lista_actividades_detalladas:
-                dias = act.get('dias_duracion', 0)
-                if dias:
-                    duraciones.append(dias)
-
-            return round(sum(duraciones) / len(duraciones), 1) if duraciones else 0.0
-        except Exception as e:
-            logger.error(f"Error al calcular duración promedio: {e}", exc_info=True)
-            return 0.0
+        return self._obtener_estadisticas().duracion_promedio
 
     def _contar_por_prioridad(self) -> Dict[str, int]:
         """Cuenta actividades por nivel de prioridad."""
-        conteos = {'Alta': 0, 'Media': 0, 'Baja': 0}
-
-        for act in self.lista_actividades_detalladas:
-            prioridad = act.get('prioridad', 0)
-            if prioridad == 2:
-                conteos['Alta'] += 1
-            elif prioridad == 1:
-                conteos['Media'] += 1
-            else:
-                conteos['Baja'] += 1
-
-        return conteos
-
-    def _obtener_actividades_proximas_vencer(self, limite_dias: int = 7) -> List[Dict[str, Any]]:
-        """Obtiene actividades próximas a vencer (dentro de X días)."""
-        proximas = []
-
-        for act in self.lista_actividades_detalladas:
-            dias = act.get('dias_desde_fin', 0)
-            if 0 <= dias <= limite_dias:
-                proximas.append(act)
+        estadisticas = self._obtener_estadisticas()
+        return {
+            'Alta': estadisticas.prioridad_alta,
+            'Media': estadisticas.prioridad_media,
+            'Baja': estadisticas.prioridad_baja,
+        }
 
-        return sorted(proximas, key=lambda x: x.get('dias_desde_fin', 0))
+    def _obtener_actividades_proximas_vencer(self) -> List[Dict[str, Any]]:
+        """Obtiene las primeras actividades próximas a vencer, por días desde el fin."""
+        return [actividad.to_dict() for actividad in self._obtener_estadisticas().proximas]
 
     def _obtener_clasificacion_desempeño(self, stats: Dict[str, Any]) -> str:
         """Obtiene la clasificación de desempeño del estudiante."""
@@ -1287,25 +1231,55 @@ class ControlarActividades:
         else:
             return "Necesita Mejorar 📚"
 
+    def _filtro_cohorte(self) -> Optional[Dict[str, int]]:
+        """Cohorte con la que se compara: la asignatura elegida o, si no hay, la carrera."""
+        if self.id_asignatura_actual:
+            return {'id_asignatura': self.id_asignatura_actual}
+        if self.id_carrera_actual:
+            return {'id_carrera': self.id_carrera_actual}
+        return None
+
+    def _obtener_posicion_clase(self) -> Optional[PosicionCohorteDTO]:
+        """Obtiene el puesto del estudiante actual en la cohorte, si tiene nota final."""
+        filtro = self._filtro_cohorte()
+        if filtro is None or not self.id_estudiante_actual:
+            return None
+        try:
+            return self.cohortes.posicion(self.id_estudiante_actual, **filtro)
+        except Exception as e:
+            logger.error(f"Error al obtener posición en la clase: {e}", exc_info=True)
+            return None
+
     def _obtener_promedio_clase(self) -> float:
-        """Obtiene el promedio aproximado de la clase (simulado)."""
+        """Obtiene el promedio de notas finales de la asignatura (o carrera) seleccionada."""
+        filtro = self._filtro_cohorte()
+        if filtro is None:
+            return 0.0
         try:
-            # Aquí se podría hacer una consulta a la BD para obtener el promedio real
-            # Por ahora retorna un valor simulado
-            return 7.5
+            return self.cohortes.resumen(**filtro).media
         except Exception as e:
             logger.error(f"Error al obtener promedio de clase: {e}", exc_info=True)
-            return 7.5
+            return 0.0
 
     def _estimar_posicion_clase(self, nota_estudiante: float) -> str:
-        """Estima la posición del estudiante en la clase."""
-        promedio_clase = self._obtener_promedio_clase()
-
-        if nota_estudiante > promedio_clase + 1:
-            return "Top 25% 🏆"
-        elif nota_estudiante > promedio_clase:
-            return "Top 50% 📈"
-        elif nota_estudiante == promedio_clase:
-            return "Promedio 📊"
+        """Ubica la nota del estudiante en la cohorte por su puesto."""
+        filtro = self._filtro_cohorte()
+        if filtro is None:
+            return "Sin clase 📊"
+        try:
+            posicion = self._obtener_posicion_clase() or self.cohortes.ubicar(nota_estudiante, **filtro)
+        except Exception as e:
+            logger.error(f"Error al estimar posición en la clase: {e}", exc_info=True)
+            return "Sin datos 📊"
+        if not posicion.total:
+            return "Sin datos 📊"
+
+        puesto = f"{posicion.puesto}/{posicion.total}"
+        if posicion.puesto <= posicion.total * 0.25:
+            return f"Top 25% 🏆 ({puesto})"
+        elif posicion.puesto <= posicion.total * 0.5:
+            return f"Top 50% 📈 ({puesto})"
+        elif nota_estudiante >= posicion.media:
+            return f"Promedio 📊 ({puesto})"
         else:
-            return "Bajo promedio 📚"
+            return f"Bajo promedio 📚 ({puesto})"
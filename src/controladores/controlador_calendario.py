@@ -1,5 +1,4 @@
 import calendar
-import csv
 from typing import Dict, Any, List
 from tkinter import filedialog
 from ttkbootstrap import Frame, Label, Button, StringVar, Separator
@@ -8,6 +7,7 @@ from ttkbootstrap.constants import *
 from datetime import datetime
 from pathlib import Path
 from modelos.services.consulta_service import EventosUnificadosService
+from modelos.services.eventos_mes_service import EventosMesService
 from modelos.dtos.consulta_dto import EventosUnificadosDTO
 from scripts.logging_config import obtener_logger_modulo
 
@@ -30,6 +30,8 @@ class ControladorCalendario:
         self.eventos_del_mes: List[EventosUnificadosService] = []
         self.eventos_por_dia: Dict[int, List] = {}  # Almacenar eventos por día
         self.eventos_filtrados: List[EventosUnificadosDTO] = []  # Almacenar eventos filtrados
+        # Eventos por mes en memoria, con el mes anterior y el siguiente precargados
+        self.eventos_mes = EventosMesService(ruta_db=None)
 
         # cargar los widgets y variables
         self._cargar_widgets()
@@ -197,10 +199,7 @@ class ControladorCalendario:
             )
 
             # Obtener todos los eventos del mes
-            eventos_service = EventosUnificadosService(ruta_db=None)
-            lista_eventos = eventos_service.obtener_por_mes(
-                ano=self.año_actual, mes=self.mes_actual
-            )
+            lista_eventos = self.eventos_mes.obtener_mes(ano=self.año_actual, mes=self.mes_actual)
 
             if not lista_eventos:
                 logger.warning(f"⚠️ No hay eventos para {self.año_actual}-{self.mes_actual:02d}")
@@ -466,6 +465,8 @@ class ControladorCalendario:
         self._cargar_eventos_agenda()
         # actualizamos las estadísticas
         self._actualizar_estadisticas()
+        # dejamos listos el mes anterior y el siguiente
+        self.eventos_mes.precargar_en_segundo_plano(self.año_actual, self.mes_actual)
 
     # ┌────────────────────────────────────────────────────────────┐
     # │ Cargar Calendario
@@ -651,10 +652,7 @@ class ControladorCalendario:
     def _obtener_eventos_por_mes(self):
         """Obtiene eventos del mes actual desde la base de datos."""
         try:
-            eventos_service = EventosUnificadosService(ruta_db=None)
-            self.eventos_del_mes.clear()
-
-            self.eventos_del_mes = eventos_service.obtener_por_mes(
+            self.eventos_del_mes = self.eventos_mes.obtener_mes(
                 ano=self.año_actual, mes=self.mes_actual
             )
 
@@ -676,12 +674,8 @@ class ControladorCalendario:
     def _cargar_eventos_agenda(self):
         """Carga eventos en el frame_agenda para cada día del mes."""
         try:
-            eventos_service = EventosUnificadosService(ruta_db=None)
-
             # Obtener todos los eventos del mes
-            lista_eventos = eventos_service.obtener_por_mes(
-                ano=self.año_actual, mes=self.mes_actual
-            )
+            lista_eventos = self.eventos_mes.obtener_mes(ano=self.año_actual, mes=self.mes_actual)
 
             # Guardar los eventos del mes
             self.eventos_del_mes = lista_eventos
@@ -963,36 +957,7 @@ class ControladorCalendario:
 
             filename = Path(filename)
 
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f, quoting=csv.QUOTE_ALL)
-                # Encabezados
-                writer.writerow(
-                    [
-                        'Título',
-                        'Tipo Evento',
-                        'Carrera',
-                        'Asignatura',
-                        'Tipo Actividad',
-                        'Fecha Inicio',
-                        'Fecha Fin',
-                        'Descripción',
-                    ]
-                )
-
-                # Datos
-                for evento in eventos:
-                    writer.writerow(
-                        [
-                            evento.titulo,
-                            evento.tipo_evento,
-                            evento.carrera or '-',
-                            evento.asignatura or '-',
-                            evento.tipo_actividad or '-',
-                            evento.fecha_inicio,
-                            evento.fecha_fin,
-                            evento.descripcion or '-',
-                        ]
-                    )
+            EventosUnificadosService(ruta_db=None).exportar_csv(str(filename), eventos)
 
             logger.info(f"✅ Exportados {len(eventos)} eventos a CSV: {filename}")
 
@@ -5,8 +5,9 @@ from ttkbootstrap.constants import *
 from ttkbootstrap.tableview import Tableview
 from modelos.daos.actividad_dao import ActividadDAO
 from modelos.daos.eje_tematico_dao import EjeTematicoDAO
-from modelos.daos.tipo_actividad_dao import TipoActividadDAO
 from modelos.services.actividad_service import ActividadService
+from modelos.services.catalogo_service import CatalogoService
+from modelos.dtos.actividad_dto import ActividadDTO
 from scripts.logging_config import obtener_logger_modulo
 
 logger = obtener_logger_modulo(__name__)
@@ -27,7 +28,7 @@ class ControlarAdministrarActividad:
 
         # Creamos una lista vacia
         # para almacenar las actividades
-        self.lista_actividades: List[ActividadService] = []
+        self.lista_actividades: List[ActividadDTO] = []
 
         # Índice de la actividad actual en la navegación
         self.indice_actual: int = -1
@@ -129,7 +130,7 @@ class ControlarAdministrarActividad:
         actividad.nota = nota
         return actividad
 
-    def _cargar_formulario(self, actividad: ActividadService):
+    def _cargar_formulario(self, actividad: ActividadDTO):
         if actividad:
             self.var_id_actividad.set(actividad.id_actividad)
             self.var_titulo.set(actividad.titulo)
@@ -162,16 +163,13 @@ class ControlarAdministrarActividad:
         self.var_nombre_tipo_actividad.set("")
         self.text_descripcion.delete("1.0", END)
 
-    def _insertar_fila(self, actividad: ActividadService):
+    def _insertar_fila(self, actividad: ActividadDTO, nombre_carrera: str = "N/A"):
         if actividad:
             # Convertir ids a labels para mostrar en tabla
             label_eje = self.dict_ejes.get(actividad.id_eje, "N/A")
             # Usar siglas en lugar del nombre completo para tipo
             siglas_tipo = self.dict_tipos_siglas.get(actividad.id_tipo_actividad, "N/A")
 
-            # Obtener nombre de carrera desde eje -> asignatura -> carrera
-            nombre_carrera = self._obtener_nombre_carrera(actividad.id_eje)
-
             self.tabla_actividad.insert_row(
                 index=END,
                 values=(
@@ -185,52 +183,19 @@ class ControlarAdministrarActividad:
                 ),
             )
 
-    def _obtener_nombre_carrera(self, id_eje: int) -> str:
-        """
-        Obtiene el nombre de la carrera a partir del ID del eje temático.
-        Eje -> Asignatura -> Carrera
-        """
-        try:
-            from modelos.daos.eje_tematico_dao import EjeTematicoDAO
-            from modelos.daos.asignatura_dao import AsignaturaDAO
-            from modelos.daos.carrera_dao import CarreraDAO
-
-            # Obtener asignatura del eje
-            dao_eje = EjeTematicoDAO(ruta_db=None)
-            eje = dao_eje.obtener_por_id(id_eje)
-            if not eje:
-                return "N/A"
-
-            id_asignatura = eje.id_asignatura
-
-            # Obtener carrera de la asignatura
-            dao_asig = AsignaturaDAO(ruta_db=None)
-            asignatura = dao_asig.obtener_por_id(id_asignatura)
-            if not asignatura:
-                return "N/A"
-
-            id_carrera = asignatura.id_carrera
-
-            # Obtener nombre de la carrera
-            dao_carrera = CarreraDAO(ruta_db=None)
-            carrera = dao_carrera.obtener_por_id(id_carrera)
-            if not carrera:
-                return "N/A"
-
-            return carrera.nombre
-
-        except Exception as e:
-            logger.error(f"Error al obtener nombre de carrera: {e}")
-            return "N/A"
-
     def _actualizar_tabla_actividad(self):
         # obtenemos la lista de actividades
         self._obtener_actividades()
         if self.lista_actividades:
             # limpiamos la tabla
             self.tabla_actividad.delete_rows()
+            # Eje -> carrera en una sola consulta; la etiqueta del eje sale de dict_ejes
+            nombres_carrera = EjeTematicoDAO(ruta_db=None).obtener_nombres_carrera()
             for actividad in self.lista_actividades:
-                self._insertar_fila(actividad=actividad)
+                self._insertar_fila(
+                    actividad=actividad,
+                    nombre_carrera=nombres_carrera.get(actividad.id_eje, "N/A"),
+                )
 
             # ajustamos las columnas
             self.tabla_actividad.autofit_columns()
@@ -288,12 +253,7 @@ class ControlarAdministrarActividad:
             sql = "SELECT * FROM actividad ORDER BY fecha_inicio DESC"
             params = ()
 
-        lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
-        if lista_aux:
-            for data in lista_aux:
-                actividad = ActividadService(ruta_db=None)
-                actividad.set_data(data=data)
-                self.lista_actividades.append(actividad)
+        self.lista_actividades.extend(dao.consultar_dtos(sql, params, ActividadDTO))
 
     def _cargar_vars(self):
         self.var_id_actividad: IntVar = self.map_vars['var_id_actividad']
@@ -349,18 +309,15 @@ class ControlarAdministrarActividad:
             self.dict_ejes.clear()
             self.dict_ejes_inv.clear()
 
-            # Obtener ejes temáticos de la BD
-            dao = EjeTematicoDAO(ruta_db=None)
-            sql = "SELECT id_eje, nombre FROM eje_tematico ORDER BY orden, nombre"
-            params = ()
-            lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
+            # Obtener ejes temáticos del catálogo en memoria
+            lista_aux = CatalogoService(ruta_db=None).ejes_tematicos()
 
             if lista_aux:
                 # Construir diccionarios y lista de nombres para el combobox
                 nombres_ejes = []
-                for data in lista_aux:
-                    id_eje = data.get('id_eje')
-                    nombre_eje = data.get('nombre')
+                for eje in lista_aux:
+                    id_eje = eje.id_eje
+                    nombre_eje = eje.nombre
                     # Agregar a diccionarios bidireccionales
                     self.dict_ejes[id_eje] = nombre_eje
                     self.dict_ejes_inv[nombre_eje] = id_eje
@@ -390,32 +347,21 @@ class ControlarAdministrarActividad:
             self.dict_ejes.clear()
             self.dict_ejes_inv.clear()
 
-            dao = EjeTematicoDAO(ruta_db=None)
-
             if id_asignatura and id_asignatura > 0:
-                # Cargar ejes temáticos de la asignatura específica
-                sql = """
-                SELECT DISTINCT et.id_eje, et.nombre 
-                FROM eje_tematico et
-                WHERE et.id_asignatura = ?
-                ORDER BY et.orden, et.nombre
-                """
-                params = (id_asignatura,)
                 logger.debug(f"Cargando ejes temáticos para asignatura ID: {id_asignatura}")
             else:
                 # Sin filtro: todas los ejes temáticos
-                sql = "SELECT id_eje, nombre FROM eje_tematico ORDER BY orden, nombre"
-                params = ()
+                id_asignatura = None
                 logger.debug("Cargando todos los ejes temáticos")
 
-            lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
+            lista_aux = CatalogoService(ruta_db=None).ejes_tematicos(id_asignatura)
 
             if lista_aux:
                 # Construir diccionarios y lista de nombres para el combobox
                 nombres_ejes = []
-                for data in lista_aux:
-                    id_eje = data.get('id_eje')
-                    nombre_eje = data.get('nombre')
+                for eje in lista_aux:
+                    id_eje = eje.id_eje
+                    nombre_eje = eje.nombre
                     # Agregar a diccionarios bidireccionales
                     self.dict_ejes[id_eje] = nombre_eje
                     self.dict_ejes_inv[nombre_eje] = id_eje
@@ -448,11 +394,8 @@ class ControlarAdministrarActividad:
             self.dict_tipos.clear()
             self.dict_tipos_inv.clear()
 
-            # Obtener tipos de actividad de la BD
-            dao = TipoActividadDAO(ruta_db=None)
-            sql = "SELECT id_tipo_actividad, nombre, siglas FROM tipo_actividad ORDER BY nombre"
-            params = ()
-            lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
+            # Obtener tipos de actividad del catálogo en memoria
+            lista_aux = CatalogoService(ruta_db=None).tipos_actividad()
 
             if lista_aux:
                 # Construir diccionarios y lista de labels para el combobox
@@ -460,10 +403,10 @@ class ControlarAdministrarActividad:
                 # Diccionario adicional para mapear id -> siglas
                 self.dict_tipos_siglas = {}
 
-                for data in lista_aux:
-                    id_tipo = data.get('id_tipo_actividad')
-                    nombre_tipo = data.get('nombre')
-                    siglas_tipo = data.get('siglas')
+                for tipo in lista_aux:
+                    id_tipo = tipo.id_tipo_actividad
+                    nombre_tipo = tipo.nombre
+                    siglas_tipo = tipo.siglas
                     # Crear label con formato: "Nombre - SIGLAS"
                     label_tipo = f"{nombre_tipo} - {siglas_tipo}"
                     # Agregar a diccionarios bidireccionales (label completo para combobox)
@@ -490,17 +433,12 @@ class ControlarAdministrarActividad:
         Incluye opción "Todas las carreras" para mostrar sin filtrar.
         """
         try:
-            from modelos.daos.carrera_dao import CarreraDAO
-
             # Limpiar diccionarios previos
             self.dict_carreras.clear()
             self.dict_carreras_inv.clear()
 
-            # Obtener carreras de la BD
-            dao = CarreraDAO(ruta_db=None)
-            sql = "SELECT id_carrera, nombre FROM carrera ORDER BY nombre"
-            params = ()
-            lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
+            # Obtener carreras del catálogo en memoria
+            lista_aux = CatalogoService(ruta_db=None).carreras()
 
             if lista_aux:
                 # Construir diccionarios y lista de labels
@@ -508,9 +446,9 @@ class ControlarAdministrarActividad:
                 self.dict_carreras[0] = "📚 Todas las carreras"
                 self.dict_carreras_inv["📚 Todas las carreras"] = 0
 
-                for data in lista_aux:
-                    id_carrera = data.get('id_carrera')
-                    nombre_carrera = data.get('nombre')
+                for carrera in lista_aux:
+                    id_carrera = carrera.id_carrera
+                    nombre_carrera = carrera.nombre
                     label_carrera = f"🎓 {nombre_carrera}"
 
                     # Agregar a diccionarios
@@ -542,8 +480,6 @@ class ControlarAdministrarActividad:
         Si hay una carrera seleccionada, carga solo las asignaturas de esa carrera.
         """
         try:
-            from modelos.daos.asignatura_dao import AsignaturaDAO
-
             # Limpiar diccionarios previos
             self.dict_asignaturas.clear()
             self.dict_asignaturas_inv.clear()
@@ -551,19 +487,10 @@ class ControlarAdministrarActividad:
             # Obtener ID de carrera del filtro
             id_carrera_filtro = self.map_vars.get('var_id_carrera_filtro', IntVar(value=0)).get()
 
-            # Obtener asignaturas de la BD
-            dao = AsignaturaDAO(ruta_db=None)
-
-            if id_carrera_filtro and id_carrera_filtro > 0:
-                # Si hay carrera seleccionada, traer solo asignaturas de esa carrera
-                sql = "SELECT id_asignatura, nombre FROM asignatura WHERE id_carrera = ? ORDER BY nombre"
-                params = (id_carrera_filtro,)
-            else:
-                # Sin filtro de carrera: todas las asignaturas
-                sql = "SELECT id_asignatura, nombre FROM asignatura ORDER BY nombre"
-                params = ()
-
-            lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
+            # Si hay carrera seleccionada, solo las asignaturas de esa carrera
+            lista_aux = CatalogoService(ruta_db=None).asignaturas(
+                id_carrera_filtro if id_carrera_filtro and id_carrera_filtro > 0 else None
+            )
 
             if lista_aux:
                 # Construir diccionarios y lista de labels
@@ -571,9 +498,9 @@ class ControlarAdministrarActividad:
                 self.dict_asignaturas[0] = "📕 Todas las asignaturas"
                 self.dict_asignaturas_inv["📕 Todas las asignaturas"] = 0
 
-                for data in lista_aux:
-                    id_asignatura = data.get('id_asignatura')
-                    nombre_asignatura = data.get('nombre')
+                for asignatura in lista_aux:
+                    id_asignatura = asignatura.id_asignatura
+                    nombre_asignatura = asignatura.nombre
                     label_asignatura = f"📖 {nombre_asignatura}"
 
                     # Agregar a diccionarios
@@ -4,8 +4,9 @@ from ttkbootstrap import Button, Entry, StringVar, Combobox, IntVar, Label
 from ttkbootstrap.constants import *
 from ttkbootstrap.tableview import Tableview
 from modelos.daos.asignatura_dao import AsignaturaDAO
-from modelos.daos.carrera_dao import CarreraDAO
 from modelos.services.asignatura_service import AsignaturaService
+from modelos.services.catalogo_service import CatalogoService
+from modelos.dtos.asignatura_dto import AsignaturaDTO
 from scripts.logging_config import obtener_logger_modulo
 
 logger = obtener_logger_modulo(__name__)
@@ -26,7 +27,7 @@ class ControlarAdministrarAsignatura:
 
         # Creamos una lista vacia
         # para almacenar las asignaturas
-        self.lista_asignaturas: List[AsignaturaService] = []
+        self.lista_asignaturas: List[AsignaturaDTO] = []
 
         # Índice de la asignatura actual en la navegación
         self.indice_actual: int = -1
@@ -95,7 +96,7 @@ class ControlarAdministrarAsignatura:
         asignatura.id_carrera = id_carrera
         return asignatura
 
-    def _cargar_formulario(self, asignatura: AsignaturaService):
+    def _cargar_formulario(self, asignatura: AsignaturaDTO):
         if asignatura:
             self.var_id.set(asignatura.id_asignatura)
             self.var_codigo.set(asignatura.codigo)
@@ -120,7 +121,7 @@ class ControlarAdministrarAsignatura:
         self.var_semestre.set(0)
         self.var_carrera.set("")
 
-    def _insertar_fila(self, asignatura: AsignaturaService):
+    def _insertar_fila(self, asignatura: AsignaturaDTO):
         if asignatura:
             # Convertir id_carrera a nombre - plan para mostrar en tabla
             label_carrera = self.dict_carreras.get(asignatura.id_carrera, "N/A")
@@ -158,12 +159,7 @@ class ControlarAdministrarAsignatura:
         dao = AsignaturaDAO(ruta_db=None)
         sql = "SELECT * FROM Asignatura"
         params = ()
-        lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
-        if lista_aux:
-            for data in lista_aux:
-                asignatura = AsignaturaService(ruta_db=None)
-                asignatura.set_data(data=data)
-                self.lista_asignaturas.append(asignatura)
+        self.lista_asignaturas.extend(dao.consultar_dtos(sql, params, AsignaturaDTO))
 
     def _cargar_vars(self):
         self.var_id: IntVar = self.map_vars['var_id']
@@ -211,19 +207,16 @@ class ControlarAdministrarAsignatura:
             self.dict_carreras.clear()
             self.dict_carreras_inv.clear()
 
-            # Obtener carreras de la BD con nombre y plan
-            dao = CarreraDAO(ruta_db=None)
-            sql = "SELECT id_carrera, nombre, plan FROM Carrera ORDER BY nombre"
-            params = ()
-            lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
+            # Obtener carreras del catálogo en memoria
+            lista_aux = CatalogoService(ruta_db=None).carreras()
 
             if lista_aux:
                 # Construir diccionarios y lista de nombres para el combobox
                 nombres_carreras = []
-                for data in lista_aux:
-                    id_carrera = data.get('id_carrera')
-                    nombre_carrera = data.get('nombre')
-                    plan_carrera = data.get('plan')
+                for carrera in lista_aux:
+                    id_carrera = carrera.id_carrera
+                    nombre_carrera = carrera.nombre
+                    plan_carrera = carrera.plan
                     # Construir label en formato "Nombre - Plan"
                     label_carrera = f"{nombre_carrera} - {plan_carrera}"
                     # Agregar a diccionarios bidireccionales
@@ -5,7 +5,9 @@ from ttkbootstrap import Button, Entry, StringVar, IntVar, Label, Combobox, Chec
 from ttkbootstrap.constants import *
 from ttkbootstrap.tableview import Tableview
 from modelos.daos.calendario_evento_dao import CalendarioEventoDAO
+from modelos.daos.conexion_sqlite import transaccion
 from modelos.services.calendario_evento_service import CalendarioEventoService
+from modelos.dtos.calendario_evento_dto import CalendarioEventoDTO
 from scripts.logging_config import obtener_logger_modulo
 import csv
 
@@ -27,7 +29,7 @@ class ControlarAdministrarCalendario:
 
         # Creamos una lista vacia
         # para almacenar los eventos
-        self.lista_eventos: List[CalendarioEventoService] = []
+        self.lista_eventos: List[CalendarioEventoDTO] = []
 
         # Índice del evento actual en la navegación
         self.indice_actual: int = -1
@@ -82,7 +84,7 @@ class ControlarAdministrarCalendario:
         evento.afecta_actividades = afecta_actividades
         return evento
 
-    def _cargar_formulario(self, evento: CalendarioEventoService):
+    def _cargar_formulario(self, evento: CalendarioEventoDTO):
         if evento:
             self.var_id_evento.set(evento.id_evento)
             self.var_titulo.set(evento.titulo)
@@ -101,7 +103,7 @@ class ControlarAdministrarCalendario:
         # self.var_fecha_fin.set("")
         self.var_afecta_actividades.set(0)
 
-    def _insertar_fila(self, evento: CalendarioEventoService):
+    def _insertar_fila(self, evento: CalendarioEventoDTO):
         if evento:
             # Mostrar Sí/No para afecta_actividades
             afecta_texto = "Sí" if evento.afecta_actividades == 1 else "No"
@@ -137,12 +139,7 @@ class ControlarAdministrarCalendario:
         dao = CalendarioEventoDAO(ruta_db=None)
         sql = "SELECT * FROM calendario_evento ORDER BY fecha_inicio DESC"
         params = ()
-        lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
-        if lista_aux:
-            for data in lista_aux:
-                evento = CalendarioEventoService(ruta_db=None)
-                evento.set_data(data=data)
-                self.lista_eventos.append(evento)
+        self.lista_eventos.extend(dao.consultar_dtos(sql, params, CalendarioEventoDTO))
 
     def _cargar_vars(self):
         self.var_id_evento: IntVar = self.map_vars['var_id_evento']
@@ -391,7 +388,8 @@ class ControlarAdministrarCalendario:
             contador_insertados = 0
             contador_errores = 0
 
-            with open(archivo, 'r', encoding='utf-8') as csvfile:
+            # Toda la importación se confirma una sola vez al final
+            with open(archivo, 'r', encoding='utf-8') as csvfile, transaccion():
                 reader = csv.DictReader(csvfile)
 
                 # Validar que el archivo tenga las columnas esperadas
@@ -442,8 +440,9 @@ class ControlarAdministrarCalendario:
                             contador_errores += 1
                             continue
 
-                        # Insertar el evento
-                        id_evento = evento.insertar()
+                        # Insertar el evento (si falla se revierte solo esta fila)
+                        with transaccion():
+                            id_evento = evento.insertar()
                         if id_evento and id_evento != 0:
                             contador_insertados += 1
                             logger.info(f"Evento insertado: {evento.titulo}")
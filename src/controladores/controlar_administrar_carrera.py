@@ -5,6 +5,7 @@ from ttkbootstrap.constants import *
 from ttkbootstrap.tableview import Tableview
 from modelos.daos.carrera_dao import CarreraDAO
 from modelos.services.carrera_service import CarreraService
+from modelos.dtos.carrera_dto import CarreraDTO
 from scripts.logging_config import obtener_logger_modulo
 
 logger = obtener_logger_modulo(__name__)
@@ -25,7 +26,7 @@ class ControlarAdministrarCarrera:
 
         # Creamos una lista vacia
         # para almacenar las carreras
-        self.lista_carreras: List[CarreraService] = []
+        self.lista_carreras: List[CarreraDTO] = []
 
         # Índice de la carrera actual en la navegación
         self.indice_actual: int = -1
@@ -81,7 +82,7 @@ class ControlarAdministrarCarrera:
         carrera.creditos_totales = credito
         return carrera
 
-    def _cargar_formulario(self, carrera: CarreraService):
+    def _cargar_formulario(self, carrera: CarreraDTO):
         if carrera:
             self.var_id.set(carrera.id_carrera)
             self.var_codigo.set(carrera.codigo)
@@ -98,7 +99,7 @@ class ControlarAdministrarCarrera:
         self.var_nombre.set("")
         self.var_credito.set(0)
 
-    def _insertar_fila(self, carrera: CarreraService):
+    def _insertar_fila(self, carrera: CarreraDTO):
         if carrera:
 
             self.tabla_carrera.insert_row(
@@ -132,12 +133,7 @@ class ControlarAdministrarCarrera:
         dao = CarreraDAO(ruta_db=None)
         sql = "SELECT * FROM Carrera"
         params = ()
-        lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
-        if lista_aux:
-            for data in lista_aux:
-                carrera = CarreraService(ruta_db=None)
-                carrera.set_data(data=data)
-                self.lista_carreras.append(carrera)
+        self.lista_carreras.extend(dao.consultar_dtos(sql, params, CarreraDTO))
 
     def _cargar_vars(self):
         self.var_id: IntVar = self.map_vars['var_id']
@@ -4,9 +4,9 @@ from ttkbootstrap import Button, Entry, StringVar, Combobox, IntVar, Label
 from ttkbootstrap.constants import *
 from ttkbootstrap.tableview import Tableview
 from modelos.daos.eje_tematico_dao import EjeTematicoDAO
-from modelos.daos.asignatura_dao import AsignaturaDAO
-from modelos.daos.carrera_dao import CarreraDAO
 from modelos.services.eje_tematico_service import EjeTematicoService
+from modelos.services.catalogo_service import CatalogoService
+from modelos.dtos.eje_tematico_dto import EjeTematicoDTO
 from scripts.logging_config import obtener_logger_modulo
 
 logger = obtener_logger_modulo(__name__)
@@ -27,7 +27,7 @@ class ControlarAdministrarEjeTematico:
 
         # Creamos una lista vacia
         # para almacenar los ejes temáticos
-        self.lista_ejes_tematicos: List[EjeTematicoService] = []
+        self.lista_ejes_tematicos: List[EjeTematicoDTO] = []
 
         # Índice del eje temático actual en la navegación
         self.indice_actual: int = -1
@@ -110,7 +110,7 @@ class ControlarAdministrarEjeTematico:
         eje_tematico.id_asignatura = id_asignatura
         return eje_tematico
 
-    def _cargar_formulario(self, eje_tematico: EjeTematicoService):
+    def _cargar_formulario(self, eje_tematico: EjeTematicoDTO):
         if eje_tematico:
             self.var_id_eje.set(eje_tematico.id_eje)
             self.var_nombre.set(eje_tematico.nombre)
@@ -129,7 +129,7 @@ class ControlarAdministrarEjeTematico:
         self.var_id_asignatura.set(0)
         self.var_nombre_asignatura.set("")
 
-    def _insertar_fila(self, eje_tematico: EjeTematicoService):
+    def _insertar_fila(self, eje_tematico: EjeTematicoDTO):
         if eje_tematico:
             # Convertir id_asignatura a label para mostrar en tabla
             label_asignatura = self.dict_asignaturas.get(eje_tematico.id_asignatura, "N/A")
@@ -168,12 +168,7 @@ class ControlarAdministrarEjeTematico:
         dao = EjeTematicoDAO(ruta_db=None)
         sql = "SELECT * FROM eje_tematico ORDER BY id_asignatura, orden"
         params = ()
-        lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
-        if lista_aux:
-            for data in lista_aux:
-                eje_tematico = EjeTematicoService(ruta_db=None)
-                eje_tematico.set_data(data=data)
-                self.lista_ejes_tematicos.append(eje_tematico)
+        self.lista_ejes_tematicos.extend(dao.consultar_dtos(sql, params, EjeTematicoDTO))
 
     def _obtener_ejes_tematicos_filtrados(self):
         """
@@ -209,12 +204,7 @@ class ControlarAdministrarEjeTematico:
 
         sql += " ORDER BY a.id_carrera, et.id_asignatura, et.orden"
 
-        lista_aux = dao.ejecutar_consulta(sql=sql, params=tuple(params))
-        if lista_aux:
-            for data in lista_aux:
-                eje_tematico = EjeTematicoService(ruta_db=None)
-                eje_tematico.set_data(data=data)
-                self.lista_ejes_tematicos.append(eje_tematico)
+        self.lista_ejes_tematicos.extend(dao.consultar_dtos(sql, tuple(params), EjeTematicoDTO))
 
     def _cargar_vars(self):
         self.var_id_eje: IntVar = self.map_vars['var_id_eje']
@@ -264,19 +254,16 @@ class ControlarAdministrarEjeTematico:
             self.dict_asignaturas.clear()
             self.dict_asignaturas_inv.clear()
 
-            # Obtener asignaturas de la BD con nombre y código
-            dao = AsignaturaDAO(ruta_db=None)
-            sql = "SELECT id_asignatura, nombre, codigo FROM Asignatura ORDER BY nombre"
-            params = ()
-            lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
+            # Obtener asignaturas del catálogo en memoria
+            lista_aux = CatalogoService(ruta_db=None).asignaturas()
 
             if lista_aux:
                 # Construir diccionarios y lista de nombres para el combobox
                 nombres_asignaturas = []
-                for data in lista_aux:
-                    id_asignatura = data.get('id_asignatura')
-                    nombre_asignatura = data.get('nombre')
-                    codigo_asignatura = data.get('codigo')
+                for asignatura in lista_aux:
+                    id_asignatura = asignatura.id_asignatura
+                    nombre_asignatura = asignatura.nombre
+                    codigo_asignatura = asignatura.codigo
                     # Construir label en formato "Nombre - Código"
                     label_asignatura = f"{nombre_asignatura} - {codigo_asignatura}"
                     # Agregar a diccionarios bidireccionales
@@ -305,17 +292,14 @@ class ControlarAdministrarEjeTematico:
             self.dict_carreras.clear()
             self.dict_carreras_inv.clear()
 
-            # Obtener carreras de la BD
-            dao = CarreraDAO(ruta_db=None)
-            sql = "SELECT id_carrera, nombre FROM carrera ORDER BY nombre"
-            params = ()
-            lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
+            # Obtener carreras del catálogo en memoria
+            lista_aux = CatalogoService(ruta_db=None).carreras()
 
             if lista_aux:
                 nombres_carreras = []
-                for data in lista_aux:
-                    id_carrera = data.get('id_carrera')
-                    nombre_carrera = data.get('nombre')
+                for carrera in lista_aux:
+                    id_carrera = carrera.id_carrera
+                    nombre_carrera = carrera.nombre
                     # Agregar a diccionarios bidireccionales
                     self.dict_carreras[id_carrera] = nombre_carrera
                     self.dict_carreras_inv[nombre_carrera] = id_carrera
@@ -461,17 +445,14 @@ class ControlarAdministrarEjeTematico:
                 return
 
             # Obtener asignaturas de la carrera
-            dao = AsignaturaDAO(ruta_db=None)
-            sql = "SELECT id_asignatura, nombre, codigo FROM asignatura WHERE id_carrera = ? ORDER BY nombre"
-            params = (id_carrera,)
-            lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
+            lista_aux = CatalogoService(ruta_db=None).asignaturas(id_carrera)
 
             nombres_asignaturas = []
             if lista_aux:
-                for data in lista_aux:
-                    id_asignatura = data.get('id_asignatura')
-                    nombre_asignatura = data.get('nombre')
-                    codigo_asignatura = data.get('codigo')
+                for asignatura in lista_aux:
+                    id_asignatura = asignatura.id_asignatura
+                    nombre_asignatura = asignatura.nombre
+                    codigo_asignatura = asignatura.codigo
                     label_asignatura = f"{nombre_asignatura} - {codigo_asignatura}"
                     nombres_asignaturas.append(label_asignatura)
 
@@ -499,10 +480,7 @@ class ControlarAdministrarEjeTematico:
                 return
 
             # Obtener asignaturas de la carrera
-            dao = AsignaturaDAO(ruta_db=None)
-            sql = "SELECT id_asignatura, nombre, codigo FROM asignatura WHERE id_carrera = ? ORDER BY nombre"
-            params = (id_carrera,)
-            lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
+            lista_aux = CatalogoService(ruta_db=None).asignaturas(id_carrera)
 
             # Limpiar diccionarios y reconstruir solo con asignaturas de esta carrera
             self.dict_asignaturas.clear()
@@ -510,10 +488,10 @@ class ControlarAdministrarEjeTematico:
 
             nombres_asignaturas = []
             if lista_aux:
-                for data in lista_aux:
-                    id_asignatura = data.get('id_asignatura')
-                    nombre_asignatura = data.get('nombre')
-                    codigo_asignatura = data.get('codigo')
+                for asignatura in lista_aux:
+                    id_asignatura = asignatura.id_asignatura
+                    nombre_asignatura = asignatura.nombre
+                    codigo_asignatura = asignatura.codigo
                     label_asignatura = f"{nombre_asignatura} - {codigo_asignatura}"
 
                     # Reconstruir diccionarios
@@ -5,6 +5,7 @@ from ttkbootstrap.constants import *
 from ttkbootstrap.tableview import Tableview
 from modelos.daos.estudiante_dao import EstudianteDAO
 from modelos.services.estudiante_service import EstudianteService
+from modelos.dtos.estudiante_dto import EstudianteDTO
 from modelos.services.estudiante_carrera_service import EstudianteCarreraService
 from scripts.logging_config import obtener_logger_modulo
 
@@ -26,7 +27,7 @@ class ControlarAdministrarEstudiante:
 
         # Creamos una lista vacia
         # para almacenar los estudiantes
-        self.lista_estudiantes: List[EstudianteService] = []
+        self.lista_estudiantes: List[EstudianteDTO] = []
 
         # Índice del estudiante actual en la navegación
         self.indice_actual: int = -1
@@ -79,7 +80,7 @@ class ControlarAdministrarEstudiante:
         estudiante.correo = correo
         return estudiante
 
-    def _cargar_formulario(self, estudiante: EstudianteService):
+    def _cargar_formulario(self, estudiante: EstudianteDTO):
         if estudiante:
             self.var_id.set(estudiante.id_estudiante)
             self.var_nombre.set(estudiante.nombre)
@@ -98,7 +99,7 @@ class ControlarAdministrarEstudiante:
         self.lbl_info_carreras.config(text="Seleccione un estudiante para ver sus carreras")
         self.btn_gestionar_carreras.config(state=DISABLED)
 
-    def _insertar_fila(self, estudiante: EstudianteService):
+    def _insertar_fila(self, estudiante: EstudianteDTO):
         if estudiante:
             # Obtener carreras activas del estudiante
             carreras_activas = self.ec_service.obtener_carreras_estudiante(
@@ -141,12 +142,7 @@ class ControlarAdministrarEstudiante:
         dao = EstudianteDAO(ruta_db=None)
         sql = "SELECT * FROM Estudiante"
         params = ()
-        lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
-        if lista_aux:
-            for data in lista_aux:
-                estudiante = EstudianteService(ruta_db=None)
-                estudiante.set_data(data=data)
-                self.lista_estudiantes.append(estudiante)
+        self.lista_estudiantes.extend(dao.consultar_dtos(sql, params, EstudianteDTO))
 
     def _cargar_vars(self):
         self.var_id: IntVar = self.map_vars['var_id']
@@ -4,6 +4,10 @@ from scripts.logging_config import obtener_logger_modulo
 from modelos.daos.estudiante_dao import EstudianteDAO
 from modelos.daos.actividad_dao import ActividadDAO
 from modelos.services.estudiante_actividad_service import EstudianteActividadService
+from modelos.services.estudiante_carrera_service import EstudianteCarreraService
+from modelos.services.catalogo_service import CatalogoService
+from modelos.services.busqueda_service import BusquedaService
+from modelos.dtos.estudiante_actividad_dto import EstudianteActividadDTO
 from ttkbootstrap.dialogs import DatePickerDialog
 from datetime import datetime
 
@@ -49,6 +53,9 @@ class ControlarAdministrarEstudianteActividad:
         }
         self.estados_display_inv = {v: k for k, v in self.estados_display.items()}
 
+        # Servicio de búsqueda (se reutiliza en cada filtrado de la tabla)
+        self.busqueda_service = BusquedaService(ruta_db=None)
+
         # Obtener widgets
         self.cbx_estudiante = self.map_widgets.get('cbx_estudiante')
         self.btn_cargar_estudiante = self.map_widgets.get('btn_cargar_estudiante')
@@ -299,18 +306,12 @@ class ControlarAdministrarEstudianteActividad:
                      FROM estudiante_actividad 
                      WHERE id_estudiante = ?"""
             params = (id_estudiante,)
-            lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
+            self.lista_registros_estudiante.extend(
+                dao.consultar_dtos(sql, params, EstudianteActividadDTO)
+            )
 
-            if lista_aux:
-                for data in lista_aux:
-                    registro = EstudianteActividadService(ruta_db=None)
-                    registro.id_estudiante = data.get('id_estudiante')
-                    registro.id_actividad = data.get('id_actividad')
-                    registro.estado = data.get('estado')
-                    registro.fecha_entrega = data.get('fecha_entrega')
-                    self.lista_registros_estudiante.append(registro)
-
-                logger.info(f"Se cargaron {len(lista_aux)} registros")
+            if self.lista_registros_estudiante:
+                logger.info(f"Se cargaron {len(self.lista_registros_estudiante)} registros")
             else:
                 logger.info("No hay registros para este estudiante")
 
@@ -323,24 +324,24 @@ class ControlarAdministrarEstudianteActividad:
             self.dict_carreras_estudiante.clear()
             self.dict_carreras_estudiante_inv.clear()
 
-            dao = EstudianteDAO(ruta_db=None)
-
-            sql = """
-            SELECT DISTINCT ec.id_carrera, c.nombre, ec.estado
-            FROM estudiante_carrera ec
-            INNER JOIN carrera c ON ec.id_carrera = c.id_carrera
-            WHERE ec.id_estudiante = ?
-            ORDER BY ec.es_carrera_principal DESC, c.nombre
-            """
-            params = (id_estudiante,)
-            lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
+            # Inscripciones del estudiante; los nombres salen del catálogo en memoria
+            catalogo = CatalogoService(ruta_db=None)
+            inscripciones = EstudianteCarreraService(ruta_db=None).obtener_carreras_estudiante(
+                id_estudiante
+            )
+            lista_aux = []
+            for data in inscripciones:
+                carrera = catalogo.carrera(data['id_carrera'])
+                if carrera is not None:
+                    lista_aux.append((data, carrera))
+            lista_aux.sort(key=lambda par: (not par[0]['es_carrera_principal'], par[1].nombre))
 
             if lista_aux:
                 carreras_labels = []
-                for data in lista_aux:
-                    id_carrera = data.get('id_carrera')
-                    nombre_carrera = data.get('nombre')
-                    estado = data.get('estado')
+                for data, carrera in lista_aux:
+                    id_carrera = data['id_carrera']
+                    nombre_carrera = carrera.nombre
+                    estado = data['estado']
 
                     # Agregar indicador de estado
                     label_carrera = nombre_carrera
@@ -399,11 +400,24 @@ class ControlarAdministrarEstudianteActividad:
             # Fecha actual para calcular días
             fecha_actual = datetime.now().date()
 
+            # Actividades que coinciden por título, descripción o asignatura, en
+            # el orden de relevancia de la búsqueda; sin búsqueda, por fecha de fin
+            ids_busqueda = self.busqueda_service.buscar_actividades(filtro_busqueda)
+            if ids_busqueda is None:
+                ids_ordenados = sorted(
+                    self.dict_actividades,
+                    key=lambda i: (
+                        self.dict_actividades[i]['fecha_fin'] or '9999-99-99',
+                        self.dict_actividades[i]['titulo'],
+                    ),
+                )
+            else:
+                ids_ordenados = [i for i in ids_busqueda if i in self.dict_actividades]
+
             # Agregar filas a la tabla
-            for id_act, datos in sorted(
-                self.dict_actividades.items(),
-                key=lambda x: (x[1]['fecha_fin'] or '9999-99-99', x[1]['titulo']),
-            ):
+            for id_act in ids_ordenados:
+                datos = self.dict_actividades[id_act]
+
                 # Obtener registro del estudiante (si existe)
                 registro = dict_registros.get(id_act)
 
@@ -412,14 +426,6 @@ class ControlarAdministrarEstudianteActividad:
                     registro.fecha_entrega if registro and registro.fecha_entrega else '-'
                 )
 
-                # Aplicar filtro de búsqueda
-                if filtro_busqueda:
-                    texto_busqueda = (
-                        f"{datos['titulo']} {datos.get('nombre_asignatura', '')}".lower()
-                    )
-                    if filtro_busqueda.lower() not in texto_busqueda:
-                        continue
-
                 # Aplicar filtro de estado
                 estado_display = self.estados_display.get(estado_bd, '⏳ Pendiente')
                 if filtro_estado != "Todos":
@@ -5,8 +5,10 @@ from ttkbootstrap.constants import *
 from ttkbootstrap.tableview import Tableview
 from modelos.daos.estudiante_asignatura_dao import EstudianteAsignaturaDAO
 from modelos.daos.estudiante_dao import EstudianteDAO
-from modelos.daos.asignatura_dao import AsignaturaDAO
+from modelos.services.catalogo_service import CatalogoService
 from modelos.services.estudiante_asignatura_service import EstudianteAsignaturaService
+from modelos.services.busqueda_service import BusquedaService
+from modelos.dtos.estudiante_asignatura_dto import EstudianteAsignaturaDTO
 from scripts.logging_config import obtener_logger_modulo
 
 logger = obtener_logger_modulo(__name__)
@@ -33,7 +35,7 @@ class ControlarAdministrarEstudianteAsignatura:
         self.dict_asignaturas: Dict[int, Dict[str, Any]] = {}  # id -> {codigo, nombre, creditos}
 
         # Lista de registros del estudiante actual
-        self.lista_registros_estudiante: List[EstudianteAsignaturaService] = []
+        self.lista_registros_estudiante: List[EstudianteAsignaturaDTO] = []
 
         # ID del estudiante seleccionado actualmente
         self.id_estudiante_actual: int = 0
@@ -53,6 +55,9 @@ class ControlarAdministrarEstudianteAsignatura:
         }
         self.estados_display_inv = {v: k for k, v in self.estados_display.items()}
 
+        # Búsqueda de texto completo sobre asignaturas
+        self.busqueda_service = BusquedaService(ruta_db=None)
+
         # cargar widgets
         self._cargar_widgets()
 
@@ -215,32 +220,19 @@ class ControlarAdministrarEstudianteAsignatura:
         try:
             self.dict_asignaturas.clear()
 
-            dao = AsignaturaDAO(ruta_db=None)
-
-            if id_carrera:
-                # Cargar solo asignaturas de la carrera del estudiante
-                sql = """SELECT id_asignatura, codigo, nombre, creditos, id_carrera 
-                         FROM asignatura 
-                         WHERE id_carrera = ?
-                         ORDER BY codigo"""
-                params = (id_carrera,)
-            else:
-                # Cargar todas las asignaturas
-                sql = """SELECT id_asignatura, codigo, nombre, creditos, id_carrera 
-                         FROM asignatura 
-                         ORDER BY codigo"""
-                params = ()
-
-            lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
+            # Del catálogo en memoria: las de la carrera del estudiante o todas
+            lista_aux = sorted(
+                CatalogoService(ruta_db=None).asignaturas(id_carrera),
+                key=lambda asignatura: asignatura.codigo or "",
+            )
 
             if lista_aux:
-                for data in lista_aux:
-                    id_asignatura = data.get('id_asignatura')
-                    self.dict_asignaturas[id_asignatura] = {
-                        'codigo': data.get('codigo'),
-                        'nombre': data.get('nombre'),
-                        'creditos': data.get('creditos'),
-                        'id_carrera': data.get('id_carrera'),
+                for asignatura in lista_aux:
+                    self.dict_asignaturas[asignatura.id_asignatura] = {
+                        'codigo': asignatura.codigo,
+                        'nombre': asignatura.nombre,
+                        'creditos': asignatura.creditos,
+                        'id_carrera': asignatura.id_carrera,
                     }
                 logger.info(
                     f"Se cargaron {len(self.dict_asignaturas)} asignaturas"
@@ -265,14 +257,11 @@ class ControlarAdministrarEstudianteAsignatura:
                      WHERE id_estudiante = ?
                      ORDER BY id_asignatura"""
             params = (id_estudiante,)
-            lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
-
-            if lista_aux:
-                for data in lista_aux:
-                    registro = EstudianteAsignaturaService(ruta_db=None)
-                    registro.set_data(data=data)
-                    self.lista_registros_estudiante.append(registro)
+            self.lista_registros_estudiante.extend(
+                dao.consultar_dtos(sql, params, EstudianteAsignaturaDTO)
+            )
 
+            if self.lista_registros_estudiante:
                 logger.info(f"Se cargaron {len(self.lista_registros_estudiante)} registros")
 
         except Exception as e:
@@ -294,10 +283,20 @@ class ControlarAdministrarEstudianteAsignatura:
             for registro in self.lista_registros_estudiante:
                 dict_registros[registro.id_asignatura] = registro
 
+            # Asignaturas que coinciden con el texto (índice de texto completo), en
+            # el orden de relevancia de la búsqueda; sin búsqueda, por código
+            ids_busqueda = self.busqueda_service.buscar_asignaturas(filtro_busqueda)
+            if ids_busqueda is None:
+                ids_ordenados = sorted(
+                    self.dict_asignaturas, key=lambda i: self.dict_asignaturas[i]['codigo']
+                )
+            else:
+                ids_ordenados = [i for i in ids_busqueda if i in self.dict_asignaturas]
+
             # Agregar filas a la tabla
-            for id_asig, datos in sorted(
-                self.dict_asignaturas.items(), key=lambda x: x[1]['codigo']
-            ):
+            for id_asig in ids_ordenados:
+                datos = self.dict_asignaturas[id_asig]
+
                 # Obtener registro del estudiante (si existe)
                 registro = dict_registros.get(id_asig)
 
@@ -305,12 +304,6 @@ class ControlarAdministrarEstudianteAsignatura:
                 nota = registro.nota_final if registro and registro.nota_final else 0.0
                 periodo = registro.periodo if registro and registro.periodo else '-'
 
-                # Aplicar filtro de búsqueda
-                if filtro_busqueda:
-                    texto_busqueda = f"{datos['codigo']} {datos['nombre']}".lower()
-                    if filtro_busqueda.lower() not in texto_busqueda:
-                        continue
-
                 # Aplicar filtro de estado
                 estado_display = self.estados_display.get(estado_bd, '🔵 No cursada')
                 if filtro_estado != "Todos":
@@ -7,7 +7,7 @@ from ttkbootstrap.tableview import Tableview
 from modelos.services.estudiante_carrera_service import EstudianteCarreraService
 from modelos.dtos.estudiante_carrera_dto import EstudianteCarreraDTO
 from modelos.daos.estudiante_dao import EstudianteDAO
-from modelos.daos.carrera_dao import CarreraDAO
+from modelos.services.catalogo_service import CatalogoService
 from scripts.logging_config import obtener_logger_modulo
 
 logger = obtener_logger_modulo(__name__)
@@ -156,16 +156,15 @@ class ControlarAdministrarEstudianteCarrera:
             self.dict_carreras.clear()
             self.dict_carreras_inv.clear()
 
-            dao = CarreraDAO()
-            sql = "SELECT id_carrera, nombre, plan FROM carrera ORDER BY nombre"
-            carreras = dao.ejecutar_consulta(sql, ())
+            # Obtener carreras del catálogo en memoria
+            carreras = CatalogoService(ruta_db=None).carreras()
 
             if carreras:
                 lista_labels = []
                 for carr in carreras:
-                    id_carr = carr['id_carrera']
-                    nombre = carr['nombre']
-                    plan = carr['plan']
+                    id_carr = carr.id_carrera
+                    nombre = carr.nombre
+                    plan = carr.plan
                     label = f"{nombre} - {plan}"
 
                     self.dict_carreras[id_carr] = label
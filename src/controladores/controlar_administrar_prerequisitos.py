@@ -5,9 +5,9 @@ from ttkbootstrap import Button, Entry, StringVar, IntVar, Label, Combobox
 from ttkbootstrap.constants import *
 from ttkbootstrap.tableview import Tableview
 from modelos.daos.prerequisito_dao import PrerrequisitoDAO
-from modelos.daos.asignatura_dao import AsignaturaDAO
-from modelos.daos.carrera_dao import CarreraDAO
 from modelos.services.prerequisito_service import PrerrequisitoService
+from modelos.services.catalogo_service import CatalogoService
+from modelos.services.busqueda_service import BusquedaService
 from scripts.logging_config import obtener_logger_modulo
 
 logger = obtener_logger_modulo(__name__)
@@ -37,6 +37,9 @@ class ControlarAdministrarPrerequisitos:
         # ID de la asignatura seleccionada actualmente
         self.id_asignatura_actual: int = 0
 
+        # Servicio de búsqueda de asignaturas
+        self.busqueda_service = BusquedaService(ruta_db=None)
+
         # cargar widgets
         self._cargar_widgets()
 
@@ -107,20 +110,18 @@ class ControlarAdministrarPrerequisitos:
             self.dict_carreras.clear()
             self.dict_carreras_inv.clear()
 
-            dao = CarreraDAO(ruta_db=None)
-            sql = "SELECT id_carrera, codigo, nombre FROM carrera ORDER BY codigo"
-            params = ()
-            lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
+            # El catálogo ordena por nombre; este filtro se muestra por código
+            lista_aux = sorted(CatalogoService(ruta_db=None).carreras(), key=lambda c: c.codigo or "")
 
             if lista_aux:
                 labels_carreras = ["Todas las Carreras"]
                 self.dict_carreras[0] = "Todas las Carreras"
                 self.dict_carreras_inv["Todas las Carreras"] = 0
 
-                for data in lista_aux:
-                    id_carrera = data.get('id_carrera')
-                    codigo = data.get('codigo')
-                    nombre = data.get('nombre')
+                for carrera in lista_aux:
+                    id_carrera = carrera.id_carrera
+                    codigo = carrera.codigo
+                    nombre = carrera.nombre
                     label_carrera = f"{codigo} - {nombre}"
                     self.dict_carreras[id_carrera] = label_carrera
                     self.dict_carreras_inv[label_carrera] = id_carrera
@@ -142,20 +143,14 @@ class ControlarAdministrarPrerequisitos:
         try:
             self.dict_asignaturas.clear()
 
-            dao = AsignaturaDAO(ruta_db=None)
-            sql = """SELECT id_asignatura, codigo, nombre, id_carrera 
-                     FROM asignatura 
-                     ORDER BY codigo"""
-            params = ()
-            lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
+            lista_aux = sorted(CatalogoService(ruta_db=None).asignaturas(), key=lambda a: a.codigo or "")
 
             if lista_aux:
-                for data in lista_aux:
-                    id_asignatura = data.get('id_asignatura')
-                    self.dict_asignaturas[id_asignatura] = {
-                        'codigo': data.get('codigo'),
-                        'nombre': data.get('nombre'),
-                        'id_carrera': data.get('id_carrera'),
+                for asignatura in lista_aux:
+                    self.dict_asignaturas[asignatura.id_asignatura] = {
+                        'codigo': asignatura.codigo,
+                        'nombre': asignatura.nombre,
+                        'id_carrera': asignatura.id_carrera,
                     }
                 logger.info(f"Se cargaron {len(self.dict_asignaturas)} asignaturas")
 
@@ -177,20 +172,24 @@ class ControlarAdministrarPrerequisitos:
             # Obtener filtro de carrera
             id_carrera_filtro = self.var_id_carrera_filtro.get()
 
+            # Con texto, las asignaturas que coinciden ordenadas por relevancia;
+            # sin texto, todas por código
+            ids_busqueda = self.busqueda_service.buscar_asignaturas(filtro_texto)
+            if ids_busqueda is None:
+                ids_ordenados = sorted(
+                    self.dict_asignaturas, key=lambda i: self.dict_asignaturas[i]['codigo']
+                )
+            else:
+                ids_ordenados = [i for i in ids_busqueda if i in self.dict_asignaturas]
+
             # Filtrar y agregar asignaturas
-            for id_asig, datos in sorted(
-                self.dict_asignaturas.items(), key=lambda x: x[1]['codigo']
-            ):
+            for id_asig in ids_ordenados:
+                datos = self.dict_asignaturas[id_asig]
+
                 # Filtro por carrera
                 if id_carrera_filtro != 0 and datos['id_carrera'] != id_carrera_filtro:
                     continue
 
-                # Filtro por texto de búsqueda
-                if filtro_texto:
-                    texto_busqueda = f"{datos['codigo']} {datos['nombre']}".lower()
-                    if filtro_texto.lower() not in texto_busqueda:
-                        continue
-
                 # Agregar al listbox
                 label = f"{datos['codigo']:8s} - {datos['nombre']}"
                 self.listbox_asignaturas.insert(TK_END, label)
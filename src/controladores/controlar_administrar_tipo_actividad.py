@@ -5,6 +5,7 @@ from ttkbootstrap.constants import *
 from ttkbootstrap.tableview import Tableview
 from modelos.daos.tipo_actividad_dao import TipoActividadDAO
 from modelos.services.tipo_actividad_service import TipoActividadService
+from modelos.dtos.tipo_actividad_dto import TipoActividadDTO
 from scripts.logging_config import obtener_logger_modulo
 
 logger = obtener_logger_modulo(__name__)
@@ -25,7 +26,7 @@ class ControlarAdministrarTipoActividad:
 
         # Creamos una lista vacia
         # para almacenar los tipos de actividad
-        self.lista_tipos_actividad: List[TipoActividadService] = []
+        self.lista_tipos_actividad: List[TipoActividadDTO] = []
 
         # Índice del tipo de actividad actual en la navegación
         self.indice_actual: int = -1
@@ -84,7 +85,7 @@ class ControlarAdministrarTipoActividad:
         tipo_actividad.prioridad = prioridad
         return tipo_actividad
 
-    def _cargar_formulario(self, tipo_actividad: TipoActividadService):
+    def _cargar_formulario(self, tipo_actividad: TipoActividadDTO):
         if tipo_actividad:
             self.var_id_tipo_actividad.set(tipo_actividad.id_tipo_actividad)
             self.var_nombre.set(tipo_actividad.nombre)
@@ -110,7 +111,7 @@ class ControlarAdministrarTipoActividad:
         self.text_descripcion.delete("1.0", END)
         self.var_prioridad.set("0 - Baja")
 
-    def _insertar_fila(self, tipo_actividad: TipoActividadService):
+    def _insertar_fila(self, tipo_actividad: TipoActividadDTO):
         if tipo_actividad:
             # Truncar descripción si es muy larga para la tabla
             descripcion_corta = tipo_actividad.descripcion or ""
@@ -146,12 +147,7 @@ class ControlarAdministrarTipoActividad:
         dao = TipoActividadDAO(ruta_db=None)
         sql = "SELECT * FROM tipo_actividad ORDER BY nombre"
         params = ()
-        lista_aux = dao.ejecutar_consulta(sql=sql, params=params)
-        if lista_aux:
-            for data in lista_aux:
-                tipo_actividad = TipoActividadService(ruta_db=None)
-                tipo_actividad.set_data(data=data)
-                self.lista_tipos_actividad.append(tipo_actividad)
+        self.lista_tipos_actividad.extend(dao.consultar_dtos(sql, params, TipoActividadDTO))
 
     def _cargar_vars(self):
         self.var_id_tipo_actividad: IntVar = self.map_vars['var_id_tipo_actividad']
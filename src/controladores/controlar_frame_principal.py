@@ -1,27 +1,27 @@
 from ttkbootstrap import Button, Frame, Panedwindow
 from typing import Optional, Dict, Any
-from ui.ttk.dialogos.dialogo_administrar_carrera import DialogoAdministrarCarrera
-from ui.ttk.dialogos.dialogo_administrar_estudiante import DialogoAdministrarEstudiante
-from ui.ttk.dialogos.dialogo_administrar_estudiante_carrera import (
-    DialogoAdministrarEstudianteCarrera,
-)
-from ui.ttk.dialogos.dialogo_administrar_asignatura import DialogoAdministrarAsignatura
-from ui.ttk.dialogos.dialogo_administrar_eje_tematico import DialogoAdministrarEjeTemático
-from ui.ttk.dialogos.dialogo_administrar_tipo_actividad import DialogoAdministrarTipoActividad
-from ui.ttk.dialogos.dialogo_administrar_actividad import DialogoAdministrarActividad
-from ui.ttk.dialogos.dialogo_administrar_calendario import DialogoAdministrarCalendario
-from ui.ttk.dialogos.dialogo_administrar_prerequisitos import DialogoAdministrarPrerequisitos
-from ui.ttk.dialogos.dialogo_administrar_estudiante_asignatura import (
-    DialogoAdministrarEstudianteAsignatura,
-)
-from ui.ttk.dialogos.dialogo_administrar_estudiante_actividad import (
-    DialogoAdministrarEstudianteActividad,
-)
-from ui.ttk.dialogos.dialogo_acerca_de import DialogoAcercaDe
 from scripts.logging_config import obtener_logger_modulo
 
 logger = obtener_logger_modulo(__name__)
 
+# Los diálogos (y sus frames, controladores y DAOs) se importan al abrirlos por
+# primera vez, no al iniciar la aplicación. FramePrincipal usa esta lista para
+# precargarlos cuando la ventana queda inactiva.
+MODULOS_DIALOGOS = (
+    'ui.ttk.dialogos.dialogo_administrar_carrera',
+    'ui.ttk.dialogos.dialogo_administrar_estudiante',
+    'ui.ttk.dialogos.dialogo_administrar_asignatura',
+    'ui.ttk.dialogos.dialogo_administrar_eje_tematico',
+    'ui.ttk.dialogos.dialogo_administrar_tipo_actividad',
+    'ui.ttk.dialogos.dialogo_administrar_actividad',
+    'ui.ttk.dialogos.dialogo_administrar_calendario',
+    'ui.ttk.dialogos.dialogo_administrar_prerequisitos',
+    'ui.ttk.dialogos.dialogo_administrar_estudiante_asignatura',
+    'ui.ttk.dialogos.dialogo_administrar_estudiante_actividad',
+    'ui.ttk.dialogos.dialogo_administrar_estudiante_carrera',
+    'ui.ttk.dialogos.dialogo_acerca_de',
+)
+
 
 class ControlarFramePrincipal:
     def __init__(self, master: None, map_widgets: Dict[str, Any]):
@@ -138,6 +138,8 @@ class ControlarFramePrincipal:
 
     def on_administrar_carrera(self):
         try:
+            from ui.ttk.dialogos.dialogo_administrar_carrera import DialogoAdministrarCarrera
+
             # Obtener la ventana raíz
             ventana_raiz = self.master.winfo_toplevel()
 
@@ -150,6 +152,8 @@ class ControlarFramePrincipal:
 
     def on_administrar_eje_tematico(self):
         try:
+            from ui.ttk.dialogos.dialogo_administrar_eje_tematico import DialogoAdministrarEjeTemático
+
             # Obtener la ventana raíz
             ventana_raiz = self.master.winfo_toplevel()
 
@@ -161,6 +165,8 @@ class ControlarFramePrincipal:
 
     def on_administrar_tipo_actividad(self):
         try:
+            from ui.ttk.dialogos.dialogo_administrar_tipo_actividad import DialogoAdministrarTipoActividad
+
             # Obtener la ventana raíz
             ventana_raiz = self.master.winfo_toplevel()
 
@@ -172,6 +178,8 @@ class ControlarFramePrincipal:
 
     def on_administrar_actividad(self):
         try:
+            from ui.ttk.dialogos.dialogo_administrar_actividad import DialogoAdministrarActividad
+
             # Obtener la ventana raíz
             ventana_raiz = self.master.winfo_toplevel()
 
@@ -183,6 +191,8 @@ class ControlarFramePrincipal:
 
     def on_administrar_estudiante(self):
         try:
+            from ui.ttk.dialogos.dialogo_administrar_estudiante import DialogoAdministrarEstudiante
+
             # Obtener la ventana raíz
             ventana_raiz = self.master.winfo_toplevel()
 
@@ -194,6 +204,8 @@ class ControlarFramePrincipal:
 
     def on_administrar_asignatura(self):
         try:
+            from ui.ttk.dialogos.dialogo_administrar_asignatura import DialogoAdministrarAsignatura
+
             # Obtener la ventana raíz
             ventana_raiz = self.master.winfo_toplevel()
 
@@ -205,6 +217,8 @@ class ControlarFramePrincipal:
 
     def on_administrar_calendario(self):
         try:
+            from ui.ttk.dialogos.dialogo_administrar_calendario import DialogoAdministrarCalendario
+
             # Obtener la ventana raíz
             ventana_raiz = self.master.winfo_toplevel()
 
@@ -222,6 +236,8 @@ class ControlarFramePrincipal:
         'Acerca de' del menú superior.
         """
         try:
+            from ui.ttk.dialogos.dialogo_acerca_de import DialogoAcercaDe
+
             logger.info("Abriendo diálogo de acerca de")
 
             # Obtener la ventana raíz
@@ -238,6 +254,8 @@ class ControlarFramePrincipal:
 
     def on_administrar_prerequisitos(self):
         try:
+            from ui.ttk.dialogos.dialogo_administrar_prerequisitos import DialogoAdministrarPrerequisitos
+
             # Obtener la ventana raíz
             ventana_raiz = self.master.winfo_toplevel()
 
@@ -249,6 +267,8 @@ class ControlarFramePrincipal:
 
     def on_administrar_estudiante_asignatura(self):
         try:
+            from ui.ttk.dialogos.dialogo_administrar_estudiante_asignatura import DialogoAdministrarEstudianteAsignatura
+
             # Obtener la ventana raíz
             ventana_raiz = self.master.winfo_toplevel()
 
@@ -260,6 +280,8 @@ class ControlarFramePrincipal:
 
     def on_administrar_estudiante_actividad(self):
         try:
+            from ui.ttk.dialogos.dialogo_administrar_estudiante_actividad import DialogoAdministrarEstudianteActividad
+
             # Obtener la ventana raíz
             ventana_raiz = self.master.winfo_toplevel()
 
@@ -271,6 +293,8 @@ class ControlarFramePrincipal:
 
     def on_administrar_estudiante_carrera(self):
         try:
+            from ui.ttk.dialogos.dialogo_administrar_estudiante_carrera import DialogoAdministrarEstudianteCarrera
+
             # Obtener la ventana raíz
             ventana_raiz = self.master.winfo_toplevel()
 
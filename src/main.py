@@ -4,27 +4,46 @@ import os
 # Agregar el directorio src al path para importaciones relativas
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from utilidades.config import inicializar_directorios
-from scripts.crear_indices import crear_todos_los_indices
-from scripts.crear_views import crear_todas_las_views
-from ui.ttk.appTTK import AppTTK
+from utilidades.tiempos_arranque import TiemposArranque
+
+# El reloj del arranque empieza antes de importar la interfaz
+tiempos = TiemposArranque()
+
+with tiempos.fase("importaciones"):
+    from utilidades.config import inicializar_directorios, TELEMETRIA_CONSULTAS, TELEMETRIA_ARCHIVO
+    from scripts.logging_config import obtener_logger_modulo
+    from scripts.crear_indices import crear_todos_los_indices
+    from scripts.crear_views import crear_todas_las_views
+    from modelos.daos.telemetria_consultas import obtener_telemetria
+    from ui.ttk.appTTK import AppTTK
+
+logger = obtener_logger_modulo(__name__)
 
 
 def main():
     """Función principal del programa."""
     # inicializamos los directorios de configuraciones
-    inicializar_directorios()
+    with tiempos.fase("directorios"):
+        inicializar_directorios()
 
-    # creamos los índices recomendados en la base de datos
-    crear_todos_los_indices()
+    # creamos las tablas y los índices recomendados (se omite si la huella no cambió)
+    with tiempos.fase("tablas e índices"):
+        crear_todos_los_indices()
 
-    # creamos las VIEWS recomendadas en la base de datos
-    crear_todas_las_views()
+    # creamos las VIEWS recomendadas (se omite si la huella no cambió)
+    with tiempos.fase("views"):
+        crear_todas_las_views()
 
     # lazamos la ventana de la aplicacion
-    app_ttk = AppTTK()
+    with tiempos.fase("ventana"):
+        app_ttk = AppTTK()
+    logger.info(tiempos.reporte())
     app_ttk.mainloop()
 
+    # guardamos la telemetría de consultas de la sesión (ver scripts/telemetria_consultas.py)
+    if TELEMETRIA_CONSULTAS:
+        obtener_telemetria().volcar(TELEMETRIA_ARCHIVO)
+
 
 if __name__ == "__main__":
     main()
@@ -3,25 +3,44 @@ Módulo de Data Access Objects (DAOs) para acceso a la base de datos.
 
 Contiene clases DAO para cada tabla del modelo de datos, proporcionando
 operaciones CRUD y consultas específicas de negocio.
+
+Los DAOs de cada tabla se importan bajo demanda (PEP 562), al usarse por
+primera vez.
 """
 
-from .conexion_sqlite import ConexionSQLite
+import importlib
+from .conexion_sqlite import ConexionSQLite, TransaccionRevertida, transaccion
+from .pool_conexiones import PoolConexiones, EstadisticasPool
 from .base_dao import DAO
 
-__all__ = ["ConexionSQLite", "DAO"]
+_MODULOS = {
+    "CarreraDAO": ".carrera_dao",
+    "AsignaturaDAO": ".asignatura_dao",
+    "PrerrequisitoDAO": ".prerequisito_dao",
+    "EjeTematicoDAO": ".eje_tematico_dao",
+    "TipoActividadDAO": ".tipo_actividad_dao",
+    "ActividadDAO": ".actividad_dao",
+    "CalendarioEventoDAO": ".calendario_evento_dao",
+    "EstudianteDAO": ".estudiante_dao",
+    "EstudianteCarreraDAO": ".estudiante_carrera_dao",
+    "EstudianteAsignaturaDAO": ".estudiante_asignatura_dao",
+    "EstudianteActividadDAO": ".estudiante_actividad_dao",
+}
 
 __all__ = [
     "ConexionSQLite",
-    "DAOBase",
-    "SchemaDAO",
-    "CarreraDAO",
-    "AsignaturaDAO",
-    "PrerrequisiteDAO",
-    "EjeTematicoDAO",
-    "TipoActividadDAO",
-    "ActividadDAO",
-    "CalendarioEventoDAO",
-    "EstudianteDAO",
-    "EstudianteAsignaturaDAO",
-    "EstudianteActividadDAO",
+    "TransaccionRevertida",
+    "transaccion",
+    "PoolConexiones",
+    "EstadisticasPool",
+    "DAO",
+    *_MODULOS,
 ]
+
+
+def __getattr__(nombre):
+    if nombre not in _MODULOS:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    clase = getattr(importlib.import_module(_MODULOS[nombre], __name__), nombre)
+    globals()[nombre] = clase
+    return clase
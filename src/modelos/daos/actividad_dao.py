@@ -1,5 +1,6 @@
 from modelos.dtos.actividad_dto import ActividadDTO
 from modelos.daos.base_dao import DAO
+from modelos.daos.esquema import inicializar_esquema
 from typing import Optional, List, Dict, Any
 from sqlite3 import Error
 from scripts.logging_config import obtener_logger_modulo
@@ -8,11 +9,22 @@ logger = obtener_logger_modulo(__name__)
 
 
 class ActividadDAO(DAO):
+    _TABLA = "actividad"
+    _CLAVE = ("id_actividad",)
+    _CLASE_DTO = ActividadDTO
+    _SQL_INSERTAR = """INSERT INTO actividad (titulo, descripcion, fecha_inicio, fecha_fin, id_eje, id_tipo_actividad, nota)
+                 VALUES (?, ?, ?, ?, ?, ?, ?)"""
+    _SQL_ACTUALIZAR = """UPDATE actividad 
+                 SET titulo = ?, descripcion = ?, fecha_inicio = ?, fecha_fin = ?, 
+                     id_eje = ?, id_tipo_actividad = ?, nota = ?
+                 WHERE id_actividad = ?"""
+    _SQL_ELIMINAR = "DELETE FROM actividad WHERE id_actividad = ?"
+
     def __init__(self, ruta_db=None):
         super().__init__(ruta_db)
 
-        # creamos la tabla
-        self.crear_tabla()
+        # las tablas se crean una sola vez por base de datos
+        inicializar_esquema(ruta_db)
 
     def crear_tabla(self, sql: Optional[str] = None) -> bool:
         """
@@ -54,19 +66,7 @@ class ActividadDAO(DAO):
         Returns:
             Optional[int]: ID del registro insertado o None si hay error.
         """
-        sql = """INSERT INTO actividad (titulo, descripcion, fecha_inicio, fecha_fin, id_eje, id_tipo_actividad, nota)
-                 VALUES (?, ?, ?, ?, ?, ?, ?)"""
-        params = (
-            dto.titulo,
-            dto.descripcion,
-            dto.fecha_inicio,
-            dto.fecha_fin,
-            dto.id_eje,
-            dto.id_tipo_actividad,
-            dto.nota if dto.nota is not None else 0,
-        )
-
-        return self.ejecutar_insertar(sql, params)
+        return self.ejecutar_insertar(self._SQL_INSERTAR, self._params_insertar(dto))
 
     def eliminar(self, dto: ActividadDTO) -> bool:
         """
@@ -78,10 +78,7 @@ class ActividadDAO(DAO):
         Returns:
             bool: True si se eliminó correctamente, False en caso contrario.
         """
-        sql = "DELETE FROM actividad WHERE id_actividad = ?"
-        params = (dto.id_actividad,)
-
-        return self.ejecutar_actualizacion(sql, params)
+        return self.ejecutar_actualizacion(self._SQL_ELIMINAR, self._params_eliminar(dto))
 
     def actualizar(self, dto: ActividadDTO) -> bool:
         """
@@ -93,11 +90,10 @@ class ActividadDAO(DAO):
         Returns:
             bool: True si se actualizó correctamente, False en caso contrario.
         """
-        sql = """UPDATE actividad 
-                 SET titulo = ?, descripcion = ?, fecha_inicio = ?, fecha_fin = ?, 
-                     id_eje = ?, id_tipo_actividad = ?, nota = ?
-                 WHERE id_actividad = ?"""
-        params = (
+        return self.ejecutar_actualizacion(self._SQL_ACTUALIZAR, self._params_actualizar(dto))
+
+    def _params_insertar(self, dto: ActividadDTO) -> tuple:
+        return (
             dto.titulo,
             dto.descripcion,
             dto.fecha_inicio,
@@ -105,10 +101,13 @@ class ActividadDAO(DAO):
             dto.id_eje,
             dto.id_tipo_actividad,
             dto.nota if dto.nota is not None else 0,
-            dto.id_actividad,
         )
 
-        return self.ejecutar_actualizacion(sql, params)
+    def _params_actualizar(self, dto: ActividadDTO) -> tuple:
+        return self._params_insertar(dto) + (dto.id_actividad,)
+
+    def _params_eliminar(self, dto: ActividadDTO) -> tuple:
+        return (dto.id_actividad,)
 
     def instanciar(self, dto: ActividadDTO) -> bool:
         """
@@ -123,12 +122,7 @@ class ActividadDAO(DAO):
         if dto.id_actividad != 0 and dto.id_actividad is not None:
             sql = "SELECT * FROM actividad WHERE id_actividad = ?"
             params = (dto.id_actividad,)
-            lista_data = self.ejecutar_consulta(sql, params)
-            if lista_data:
-                data = lista_data[0]
-                dto.set_data(data=data)
-                return True
-            return False
+            return self.consultar_en_dto(sql, params, dto)
         else:
             logger.warning("ID de actividad no válido para instanciar")
             return False
@@ -156,3 +150,13 @@ class ActividadDAO(DAO):
         else:
             logger.warning("ID de actividad no válido para verificar existencia")
             return False
+
+    def obtener_todos(self) -> List[ActividadDTO]:
+        """
+        Obtiene todas las actividades ordenadas por fecha de inicio descendente.
+
+        Returns:
+            List[ActividadDTO]: Lista de actividades.
+        """
+        sql = "SELECT * FROM actividad ORDER BY fecha_inicio DESC"
+        return self.consultar_dtos(sql, (), ActividadDTO)
@@ -0,0 +1,257 @@
+from modelos.daos.base_dao import DAOMantenidoPorTriggers
+from modelos.daos.conexion_sqlite import ConexionSQLite
+from typing import Optional, Dict
+from sqlite3 import Error
+from scripts.logging_config import obtener_logger_modulo
+
+logger = obtener_logger_modulo(__name__)
+
+TABLA = "estudiante_actividad_detallada"
+
+# Columnas de vw_estudiante_actividades_detalladas (todas deterministas)
+COLUMNAS = (
+    "id_estudiante",
+    "carrera_id",
+    "id_asignatura",
+    "actividad_id",
+    "eje_id",
+    "tipo_actividad_id",
+    "eje_nombre",
+    "eje_orden",
+    "nombre_asignatura",
+    "titulo",
+    "descripcion",
+    "fecha_inicio",
+    "fecha_fin",
+    "actividad_nombre",
+    "siglas",
+    "prioridad",
+    "actividad_estado",
+    "fecha_entrega",
+    "dias_duracion",
+)
+
+# La consulta de siete tablas que define la vista; WHERE se agrega en cada uso
+_SQL_ORIGEN = """
+    SELECT
+        estudiante.id_estudiante,
+        carrera.id_carrera,
+        asignatura.id_asignatura,
+        actividad.id_actividad,
+        actividad.id_eje,
+        tipo_actividad.id_tipo_actividad,
+        eje_tematico.nombre,
+        eje_tematico.orden,
+        asignatura.nombre,
+        actividad.titulo,
+        actividad.descripcion,
+        actividad.fecha_inicio,
+        actividad.fecha_fin,
+        tipo_actividad.nombre,
+        tipo_actividad.siglas,
+        tipo_actividad.prioridad,
+        estudiante_actividad.estado,
+        estudiante_actividad.fecha_entrega,
+        CAST((julianday(actividad.fecha_fin) - julianday(actividad.fecha_inicio)) AS INTEGER)
+    FROM
+        actividad
+        INNER JOIN eje_tematico ON actividad.id_eje = eje_tematico.id_eje
+        INNER JOIN asignatura ON asignatura.id_asignatura = eje_tematico.id_asignatura
+        INNER JOIN carrera ON asignatura.id_carrera = carrera.id_carrera
+        INNER JOIN tipo_actividad ON actividad.id_tipo_actividad = tipo_actividad.id_tipo_actividad
+        INNER JOIN estudiante_actividad ON actividad.id_actividad = estudiante_actividad.id_actividad
+        INNER JOIN estudiante ON estudiante_actividad.id_estudiante = estudiante.id_estudiante"""
+
+_SQL_TABLA = f"""CREATE TABLE IF NOT EXISTS {TABLA} (
+    id_estudiante INTEGER NOT NULL,
+    carrera_id INTEGER,
+    id_asignatura INTEGER,
+    actividad_id INTEGER NOT NULL,
+    eje_id INTEGER,
+    tipo_actividad_id INTEGER,
+    eje_nombre TEXT,
+    eje_orden INTEGER,
+    nombre_asignatura TEXT,
+    titulo TEXT,
+    descripcion TEXT,
+    fecha_inicio TEXT,
+    fecha_fin TEXT,
+    actividad_nombre TEXT,
+    siglas TEXT,
+    prioridad INTEGER,
+    actividad_estado TEXT,
+    fecha_entrega TEXT,
+    dias_duracion INTEGER,
+    PRIMARY KEY (id_estudiante, actividad_id)
+) WITHOUT ROWID"""
+
+# La clave primaria agrupa las filas por estudiante; los índices cubren los
+# filtros del panel de actividades (carrera, asignatura y tipo) y la
+# actualización por actividad que hacen los triggers
+_SQL_INDICES = (
+    f"CREATE INDEX IF NOT EXISTS idx_ead_estudiante_fin ON {TABLA} (id_estudiante, fecha_fin)",
+    f"CREATE INDEX IF NOT EXISTS idx_ead_estudiante_carrera ON {TABLA} (id_estudiante, carrera_id, fecha_fin)",
+    f"CREATE INDEX IF NOT EXISTS idx_ead_estudiante_asignatura ON {TABLA} (id_estudiante, id_asignatura, fecha_fin)",
+    f"CREATE INDEX IF NOT EXISTS idx_ead_estudiante_tipo ON {TABLA} (id_estudiante, tipo_actividad_id, fecha_fin)",
+    f"CREATE INDEX IF NOT EXISTS idx_ead_actividad ON {TABLA} (actividad_id)",
+)
+
+
+def _insertar_desde_origen(condicion: str) -> str:
+    return f"INSERT OR REPLACE INTO {TABLA} ({', '.join(COLUMNAS)}){_SQL_ORIGEN}\n    WHERE {condicion};"
+
+
+def _refrescar_actividades(condicion: str) -> str:
+    """
+    Cuerpo de trigger que vuelve a materializar las actividades que cumplen
+    `condicion` (sobre actividad / eje_tematico).
+    """
+    return f"""
+    DELETE FROM {TABLA} WHERE actividad_id IN (
+        SELECT actividad.id_actividad
+        FROM actividad INNER JOIN eje_tematico ON actividad.id_eje = eje_tematico.id_eje
+        WHERE {condicion}
+    );
+    {_insertar_desde_origen(condicion)}"""
+
+
+# Los borrados de estudiante, carrera, asignatura, eje y tipo llegan a
+# estudiante_actividad por ON DELETE CASCADE, que dispara sus triggers
+_SQL_TRIGGERS = (
+    f"""CREATE TRIGGER IF NOT EXISTS trg_ead_estudiante_actividad_insertar
+    AFTER INSERT ON estudiante_actividad
+    BEGIN
+    {_insertar_desde_origen(
+        "estudiante_actividad.id_estudiante = NEW.id_estudiante "
+        "AND estudiante_actividad.id_actividad = NEW.id_actividad"
+    )}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_ead_estudiante_actividad_estado
+    AFTER UPDATE ON estudiante_actividad
+    WHEN NEW.id_estudiante = OLD.id_estudiante AND NEW.id_actividad = OLD.id_actividad
+    BEGIN
+    UPDATE {TABLA}
+    SET actividad_estado = NEW.estado, fecha_entrega = NEW.fecha_entrega
+    WHERE id_estudiante = NEW.id_estudiante AND actividad_id = NEW.id_actividad;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_ead_estudiante_actividad_clave
+    AFTER UPDATE ON estudiante_actividad
+    WHEN NEW.id_estudiante <> OLD.id_estudiante OR NEW.id_actividad <> OLD.id_actividad
+    BEGIN
+    DELETE FROM {TABLA} WHERE id_estudiante = OLD.id_estudiante AND actividad_id = OLD.id_actividad;
+    {_insertar_desde_origen(
+        "estudiante_actividad.id_estudiante = NEW.id_estudiante "
+        "AND estudiante_actividad.id_actividad = NEW.id_actividad"
+    )}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_ead_estudiante_actividad_eliminar
+    AFTER DELETE ON estudiante_actividad
+    BEGIN
+    DELETE FROM {TABLA} WHERE id_estudiante = OLD.id_estudiante AND actividad_id = OLD.id_actividad;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_ead_actividad_actualizar
+    AFTER UPDATE OF id_actividad, titulo, descripcion, fecha_inicio, fecha_fin,
+        id_eje, id_tipo_actividad ON actividad
+    BEGIN
+    DELETE FROM {TABLA} WHERE actividad_id = OLD.id_actividad;
+    {_insertar_desde_origen("actividad.id_actividad = NEW.id_actividad")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_ead_actividad_eliminar
+    AFTER DELETE ON actividad
+    BEGIN
+    DELETE FROM {TABLA} WHERE actividad_id = OLD.id_actividad;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_ead_eje_tematico_actualizar
+    AFTER UPDATE OF nombre, orden, id_asignatura ON eje_tematico
+    BEGIN{_refrescar_actividades("actividad.id_eje = NEW.id_eje")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_ead_asignatura_actualizar
+    AFTER UPDATE OF nombre, id_carrera ON asignatura
+    BEGIN{_refrescar_actividades("eje_tematico.id_asignatura = NEW.id_asignatura")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_ead_tipo_actividad_actualizar
+    AFTER UPDATE OF nombre, siglas, prioridad ON tipo_actividad
+    BEGIN{_refrescar_actividades("actividad.id_tipo_actividad = NEW.id_tipo_actividad")}
+    END""",
+)
+
+
+class ActividadDetalladaDAO(DAOMantenidoPorTriggers):
+    """
+    DAO de `estudiante_actividad_detallada`, la versión materializada de
+    vw_estudiante_actividades_detalladas.
+
+    La tabla guarda una fila por (estudiante, actividad) con las columnas ya
+    unidas de las siete tablas de la vista; los triggers sobre actividad,
+    estudiante_actividad, eje_tematico, asignatura y tipo_actividad la
+    mantienen al día en la misma transacción que la escritura. La vista se
+    define sobre esta tabla con las mismas columnas.
+
+    Si la tabla se desincroniza (por ejemplo, escrituras con las claves
+    foráneas desactivadas), `verificar_consistencia` lo detecta y
+    `reconstruir` la vuelve a generar desde las tablas de origen.
+    """
+
+    def crear_tabla(self, sql: Optional[str] = None) -> bool:
+        """
+        Crea la tabla materializada con sus índices y triggers y la llena
+        desde las tablas de origen.
+
+        Se ejecuta desde el bootstrap del esquema, después de crear las
+        tablas de origen.
+
+        Returns:
+            bool: True si se creó correctamente, False en caso de error.
+        """
+        try:
+            with ConexionSQLite(self.ruta_db).transaccion() as con:
+                con.execute(sql or _SQL_TABLA)
+                for sentencia in (*_SQL_INDICES, *_SQL_TRIGGERS):
+                    con.execute(sentencia)
+                con.execute(f"DELETE FROM {TABLA}")
+                con.execute(_insertar_desde_origen("1"))
+            return True
+        except Error as ex:
+            logger.error(f"Error al crear la tabla {TABLA}: {ex}", exc_info=True)
+            return False
+
+    def reconstruir(self) -> Optional[int]:
+        """
+        Vuelve a generar todas las filas desde las tablas de origen en una transacción.
+
+        Returns:
+            Optional[int]: Cantidad de filas materializadas, o None si hubo un error.
+        """
+        try:
+            with ConexionSQLite(self.ruta_db).transaccion() as con:
+                con.execute(f"DELETE FROM {TABLA}")
+                con.execute(_insertar_desde_origen("1"))
+                total = con.execute(f"SELECT COUNT(*) FROM {TABLA}").fetchone()[0]
+            logger.info(f"{TABLA} reconstruida: {total} filas")
+            return total
+        except Error as ex:
+            logger.error(f"Error al reconstruir {TABLA}: {ex}", exc_info=True)
+            return None
+
+    def verificar_consistencia(self) -> Dict[str, int]:
+        """
+        Compara la tabla con la consulta de origen.
+
+        Returns:
+            Dict[str, int]: 'faltantes' (filas de origen que no están o
+                difieren en la tabla) y 'sobrantes' (filas de la tabla que no
+                están o difieren en el origen). Ambos en 0 si está al día.
+        """
+        columnas = ", ".join(COLUMNAS)
+        sql = f"""
+            SELECT
+                (SELECT COUNT(*) FROM ({_SQL_ORIGEN} EXCEPT SELECT {columnas} FROM {TABLA})) AS faltantes,
+                (SELECT COUNT(*) FROM (SELECT {columnas} FROM {TABLA} EXCEPT {_SQL_ORIGEN})) AS sobrantes
+        """
+        filas = self.ejecutar_consulta(sql)
+        if not filas:
+            return {'faltantes': -1, 'sobrantes': -1}
+        resultado = {'faltantes': filas[0]['faltantes'], 'sobrantes': filas[0]['sobrantes']}
+        if resultado['faltantes'] or resultado['sobrantes']:
+            logger.warning(f"{TABLA} desincronizada: {resultado}")
+        return resultado
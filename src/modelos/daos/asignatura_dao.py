@@ -1,5 +1,6 @@
 from modelos.dtos.asignatura_dto import AsignaturaDTO
 from modelos.daos.base_dao import DAO
+from modelos.daos.esquema import inicializar_esquema
 from typing import Optional, List, Dict, Any
 from sqlite3 import Error
 from scripts.logging_config import obtener_logger_modulo
@@ -8,11 +9,21 @@ logger = obtener_logger_modulo(__name__)
 
 
 class AsignaturaDAO(DAO):
+    _TABLA = "asignatura"
+    _CLAVE = ("id_asignatura",)
+    _CLASE_DTO = AsignaturaDTO
+    _SQL_INSERTAR = """INSERT INTO asignatura (codigo, nombre, creditos, horas_semanales, tipo, semestre, id_carrera)
+                 VALUES (?, ?, ?, ?, ?, ?, ?)"""
+    _SQL_ACTUALIZAR = """UPDATE asignatura 
+                 SET codigo = ?, nombre = ?, creditos = ?, horas_semanales = ?, tipo = ?, semestre = ?, id_carrera = ?
+                 WHERE id_asignatura = ?"""
+    _SQL_ELIMINAR = "DELETE FROM asignatura WHERE id_asignatura = ?"
+
     def __init__(self, ruta_db=None):
         super().__init__(ruta_db)
 
-        # creamos la tabla
-        self.crear_tabla()
+        # las tablas se crean una sola vez por base de datos
+        inicializar_esquema(ruta_db)
 
     def crear_tabla(self, sql: Optional[str] = None) -> bool:
         """
@@ -52,19 +63,7 @@ class AsignaturaDAO(DAO):
         Returns:
             Optional[int]: ID del registro insertado o None si hay error.
         """
-        sql = """INSERT INTO asignatura (codigo, nombre, creditos, horas_semanales, tipo, semestre, id_carrera)
-                 VALUES (?, ?, ?, ?, ?, ?, ?)"""
-        params = (
-            dto.codigo,
-            dto.nombre,
-            dto.creditos,
-            dto.horas_semanales,
-            dto.tipo,
-            dto.semestre,
-            dto.id_carrera,
-        )
-
-        return self.ejecutar_insertar(sql, params)
+        return self.ejecutar_insertar(self._SQL_INSERTAR, self._params_insertar(dto))
 
     def actualizar(self, dto: AsignaturaDTO) -> bool:
         """
@@ -77,21 +76,7 @@ class AsignaturaDAO(DAO):
         Returns:
             bool: True si se actualizó correctamente, False en caso contrario.
         """
-        sql = """UPDATE asignatura 
-                 SET codigo = ?, nombre = ?, creditos = ?, horas_semanales = ?, tipo = ?, semestre = ?, id_carrera = ?
-                 WHERE id_asignatura = ?"""
-        params = (
-            dto.codigo,
-            dto.nombre,
-            dto.creditos,
-            dto.horas_semanales,
-            dto.tipo,
-            dto.semestre,
-            dto.id_carrera,
-            dto.id_asignatura,
-        )
-
-        return self.ejecutar_actualizacion(sql, params)
+        return self.ejecutar_actualizacion(self._SQL_ACTUALIZAR, self._params_actualizar(dto))
 
     def eliminar(self, dto: AsignaturaDTO) -> bool:
         """
@@ -103,10 +88,33 @@ class AsignaturaDAO(DAO):
         Returns:
             bool: True si se eliminó correctamente, False en caso contrario.
         """
-        sql = "DELETE FROM asignatura WHERE id_asignatura = ?"
-        params = (dto.id_asignatura,)
+        return self.ejecutar_actualizacion(self._SQL_ELIMINAR, self._params_eliminar(dto))
 
-        return self.ejecutar_actualizacion(sql, params)
+    def _params_insertar(self, dto: AsignaturaDTO) -> tuple:
+        return (
+            dto.codigo,
+            dto.nombre,
+            dto.creditos,
+            dto.horas_semanales,
+            dto.tipo,
+            dto.semestre,
+            dto.id_carrera,
+        )
+
+    def _params_actualizar(self, dto: AsignaturaDTO) -> tuple:
+        return (
+            dto.codigo,
+            dto.nombre,
+            dto.creditos,
+            dto.horas_semanales,
+            dto.tipo,
+            dto.semestre,
+            dto.id_carrera,
+            dto.id_asignatura,
+        )
+
+    def _params_eliminar(self, dto: AsignaturaDTO) -> tuple:
+        return (dto.id_asignatura,)
 
     def instanciar(self, dto: AsignaturaDTO) -> bool:
         """
@@ -121,12 +129,7 @@ class AsignaturaDAO(DAO):
         if dto.id_asignatura != 0 and dto.id_asignatura is not None:
             sql = "SELECT * FROM asignatura WHERE id_asignatura = ?"
             params = (dto.id_asignatura,)
-            lista_data = self.ejecutar_consulta(sql, params)
-            if lista_data:
-                data = lista_data[0]
-                dto.set_data(data=data)
-                return True
-            return False
+            return self.consultar_en_dto(sql, params, dto)
         else:
             logger.warning("ID de asignatura no válido para instanciar")
             return False
@@ -1,14 +1,52 @@
+import time
 from abc import ABC, abstractmethod
+from itertools import islice
+from operator import attrgetter
 from .conexion_sqlite import ConexionSQLite
-from typing import Optional, Dict, Any, List
+from .pool_conexiones import es_error_de_conexion
+from .hidratacion import hidratador_para, cargador_para
+from .cache_consultas import CacheConsultas, estimar_bytes
+from .esquema import inicializar_esquema
+from .telemetria_consultas import obtener_telemetria
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Sequence, Callable, Tuple, Type
 from sqlite3 import Error
 from contextlib import contextmanager
 from scripts.logging_config import obtener_logger_modulo, registrar_error_critico
+from utilidades.config import LOTE_TAMANO, CONSULTA_TAMANO_BLOQUE, CONSULTA_MAX_VARIABLES
 
 logger = obtener_logger_modulo(__name__)
 
 
+def _dividir_en_lotes(elementos: Iterable[Any], tamano: int) -> Iterator[List[Any]]:
+    """Recorre `elementos` en listas de hasta `tamano` elementos."""
+    iterador = iter(elementos)
+    while True:
+        lote = list(islice(iterador, tamano))
+        if not lote:
+            return
+        yield lote
+
+
 class DAO(ABC):
+    """
+    Clase base de los DAOs.
+
+    Las subclases que admiten escritura por lotes definen `_SQL_INSERTAR`,
+    `_SQL_ACTUALIZAR` y `_SQL_ELIMINAR` junto con los métodos
+    `_params_insertar`, `_params_actualizar` y `_params_eliminar`, que
+    transforman un DTO en los parámetros de cada sentencia.
+
+    Las que admiten búsqueda por lista de claves (`obtener_por_ids`) definen
+    `_TABLA`, `_CLAVE` (columnas de la clave primaria) y `_CLASE_DTO`.
+    """
+
+    _SQL_INSERTAR: Optional[str] = None
+    _SQL_ACTUALIZAR: Optional[str] = None
+    _SQL_ELIMINAR: Optional[str] = None
+
+    _TABLA: Optional[str] = None
+    _CLAVE: Tuple[str, ...] = ()
+    _CLASE_DTO: Optional[Type[Any]] = None
 
     def __init__(self, ruta_db: Optional[str] = None):
         self.ruta_db = ruta_db
@@ -16,17 +54,41 @@ class DAO(ABC):
     @contextmanager
     def get_conexion(self):
         db = ConexionSQLite(ruta_db=self.ruta_db)
-        con = db.obtener_conexion()
+        con = db.conexion_transaccion()
+        if con is not None:
+            # Dentro de transaccion(): se comparte la conexión y se confirma al final
+            try:
+                yield con
+            except Exception:
+                db.marcar_transaccion_fallida()
+                raise
+            return
+
+        con = db.adquirir_conexion()
+        con_error = False
+        descartar = False
+        cambios = con.total_changes
         try:
             yield con
             con.commit()
+            if con.total_changes != cambios:
+                # Invalida los resultados guardados en la caché de consultas
+                db.registrar_escritura()
         except Exception as ex:
+            if isinstance(ex, Error):
+                # Se verificará la conexión antes de volver a prestarla;
+                # si el error la invalidó, se reemplaza directamente
+                con_error = True
+                descartar = es_error_de_conexion(ex)
             try:
                 con.rollback()
             except Exception:
                 # Si la conexión está cerrada, ignorar el error en rollback
                 pass
             raise
+        finally:
+            # Devolvemos la conexión al pool para que otro thread pueda usarla
+            db.devolver_conexion(con, descartar=descartar, con_error=con_error)
 
     @abstractmethod
     def crear_tabla(self):
@@ -68,15 +130,18 @@ class DAO(ABC):
         Ejecuta una sentencia de inserción thread-safe.
         """
         try:
-            logger.debug(f"Insertando: {sql} | Parámetros: {params}")
+            logger.debug("Insertando: %s | Parámetros: %s", sql, params)
+            inicio = time.perf_counter()
             with self.get_conexion() as con:
                 cursor = con.cursor()
                 cursor.execute(sql, params)
                 id_generado = cursor.lastrowid
-                logger.info(f"Registro insertado exitosamente - ID: {id_generado}")
-                return id_generado
+            # La duración incluye el commit de la transacción
+            self._registrar_telemetria(sql, params, time.perf_counter() - inicio, cursor.rowcount)
+            logger.info("Registro insertado exitosamente - ID: %s", id_generado)
+            return id_generado
         except Error as ex:
-            logger.error(f"Error al ejecutar inserción: {ex}", exc_info=True)
+            logger.error("Error al ejecutar inserción: %s", ex, exc_info=True)
             registrar_error_critico(ex, f"Insertar en {self.__class__.__name__}")
             return None
 
@@ -85,35 +150,505 @@ class DAO(ABC):
         Ejecuta una consulta SELECT thread-safe.
         """
         try:
-            logger.debug(f"Consultando: {sql} | Parámetros: {params}")
+            logger.debug("Consultando: %s | Parámetros: %s", sql, params)
+            try:
+                return self._consultar(sql, params)
+            except Error as ex:
+                if not es_error_de_conexion(ex):
+                    raise
+                # La conexión ya fue descartada: reintentamos una vez con una nueva
+                logger.warning("Conexión inválida al consultar, reintentando: %s", ex)
+                return self._consultar(sql, params)
+        except Error as ex:
+            logger.error("Error al ejecutar consulta: %s", ex, exc_info=True)
+            registrar_error_critico(ex, f"Consultar en {self.__class__.__name__}")
+            return []
+
+    def iterar_consulta(
+        self,
+        sql: str,
+        params: tuple = (),
+        tamano_bloque: Optional[int] = None,
+        fabrica: Optional[Callable[[Any], Any]] = None,
+        clase_dto: Optional[Type[Any]] = None,
+    ) -> Iterator[Any]:
+        """
+        Ejecuta una consulta SELECT y entrega los resultados de a uno, leyendo
+        con `fetchmany` bloques de `tamano_bloque` filas.
+
+        La memoria usada no depende del tamaño del resultado. La conexión queda
+        prestada mientras se recorre el generador; se devuelve al agotarlo o al
+        cerrarlo (por ejemplo al salir de un `for` con `break`).
+
+        Args:
+            sql (str): Consulta SELECT.
+            params (tuple): Parámetros de la consulta.
+            tamano_bloque (Optional[int]): Filas por fetchmany. Por defecto CONSULTA_TAMANO_BLOQUE.
+            fabrica (Optional[Callable]): Convierte cada fila (sqlite3.Row) en el
+                objeto a entregar, por ejemplo `EventosUnificadosDTO.from_row`.
+                Si es None se entrega un diccionario por fila.
+            clase_dto (Optional[Type]): Clase DTO a construir directamente desde
+                cada fila (ver `consultar_dtos`). Tiene prioridad sobre `fabrica`.
+
+        Yields:
+            Any: Diccionario por fila, DTO, o el resultado de `fabrica(fila)`.
+
+        Raises:
+            sqlite3.Error: Si la consulta falla, también a mitad del recorrido:
+                a diferencia de `ejecutar_consulta` no hay un valor de error
+                posible, y terminar el generador entregaría un resultado truncado.
+        """
+        tamano_bloque = tamano_bloque or CONSULTA_TAMANO_BLOQUE
+        convertir = fabrica if fabrica is not None else dict
+        total = 0
+        # Solo se mide el tiempo en SQLite, no el que el llamador pasa procesando cada fila
+        segundos = 0.0
+        try:
+            logger.debug("Consultando (iterador): %s | Parámetros: %s", sql, params)
             with self.get_conexion() as con:
+                inicio = time.perf_counter()
                 cursor = con.cursor()
                 cursor.execute(sql, params)
-                rows = cursor.fetchall()
-                resultado = [dict(row) for row in rows]
-                logger.info(f"Consulta exitosa - Registros retornados: {len(resultado)}")
+                if clase_dto is not None:
+                    convertir = hidratador_para(clase_dto, cursor.description)
+                segundos += time.perf_counter() - inicio
+                while True:
+                    inicio = time.perf_counter()
+                    rows = cursor.fetchmany(tamano_bloque)
+                    segundos += time.perf_counter() - inicio
+                    if not rows:
+                        break
+                    total += len(rows)
+                    for row in rows:
+                        yield convertir(row)
+            self._registrar_telemetria(sql, params, segundos, total)
+            logger.debug("Consulta iterada exitosa - Registros retornados: %s", total)
+        except Error as ex:
+            logger.error("Error al iterar consulta: %s", ex, exc_info=True)
+            registrar_error_critico(ex, f"Iterar consulta en {self.__class__.__name__}")
+            raise
+
+    def consultar_dtos(self, sql: str, params: tuple, clase_dto: Type[Any]) -> List[Any]:
+        """
+        Ejecuta una consulta SELECT y construye un DTO por fila sin pasar por
+        diccionarios intermedios.
+
+        Cada campo del DTO se lee de la columna con el mismo nombre; la
+        correspondencia se compila una vez por consulta y clase.
+
+        Es la forma de cargar las listas de los controladores: un DTO plano por
+        fila, sin crear un servicio (con su propio DAO) por cada registro.
+
+        Args:
+            sql (str): Consulta SELECT.
+            params (tuple): Parámetros de la consulta.
+            clase_dto (Type): Clase dataclass del DTO.
+
+        Returns:
+            List[Any]: DTOs construidos, o lista vacía si hay error.
+        """
+        try:
+            logger.debug("Consultando DTOs: %s | Parámetros: %s", sql, params)
+            inicio = time.perf_counter()
+            with self.get_conexion() as con:
+                cursor = con.cursor()
+                cursor.execute(sql, params)
+                hidratar = hidratador_para(clase_dto, cursor.description)
+                resultado = [hidratar(row) for row in cursor.fetchall()]
+                self._registrar_telemetria(sql, params, time.perf_counter() - inicio, len(resultado))
+                logger.debug("Consulta exitosa - Registros retornados: %s", len(resultado))
                 return resultado
         except Error as ex:
-            logger.error(f"Error al ejecutar consulta: {ex}", exc_info=True)
+            logger.error("Error al consultar DTOs: %s", ex, exc_info=True)
+            registrar_error_critico(ex, f"Consultar DTOs en {self.__class__.__name__}")
+            return []
+
+    def consultar_en_dto(self, sql: str, params: tuple, dto: Any) -> bool:
+        """
+        Ejecuta una consulta SELECT y carga la primera fila directamente en `dto`.
+
+        Equivale a `dto.set_data(self.ejecutar_consulta(sql, params)[0])` sin
+        crear la lista ni el diccionario intermedio.
+
+        Args:
+            sql (str): Consulta SELECT.
+            params (tuple): Parámetros de la consulta.
+            dto (Any): DTO (o servicio que hereda de un DTO) a completar.
+
+        Returns:
+            bool: True si se encontró una fila, False si no hubo resultados o hubo error.
+        """
+        try:
+            logger.debug("Consultando en DTO: %s | Parámetros: %s", sql, params)
+            inicio = time.perf_counter()
+            with self.get_conexion() as con:
+                cursor = con.cursor()
+                cursor.execute(sql, params)
+                row = cursor.fetchone()
+                self._registrar_telemetria(sql, params, time.perf_counter() - inicio, 0 if row is None else 1)
+                if row is None:
+                    return False
+                cargador_para(type(dto), cursor.description)(dto, row)
+                return True
+        except Error as ex:
+            logger.error("Error al consultar en DTO: %s", ex, exc_info=True)
             registrar_error_critico(ex, f"Consultar en {self.__class__.__name__}")
+            return False
+
+    def consultar_cacheado(
+        self, sql: str, params: tuple = (), clase_dto: Optional[Type[Any]] = None
+    ) -> List[Any]:
+        """
+        Ejecuta una consulta SELECT guardando el resultado en la caché de
+        consultas de la base de datos.
+
+        Mientras no se confirmen cambios en la base (desde este proceso o desde
+        otro, ver `ConexionSQLite.version_datos`) las llamadas con la misma SQL
+        y parámetros no vuelven a consultar. Los elementos retornados se
+        comparten entre llamadas y no deben modificarse. Dentro de
+        `transaccion()` se consulta siempre sin caché.
+
+        Args:
+            sql (str): Consulta SELECT.
+            params (tuple): Parámetros de la consulta.
+            clase_dto (Optional[Type]): Clase DTO a construir por fila (como
+                `consultar_dtos`). Si es None se retorna un diccionario por fila.
+
+        Returns:
+            List[Any]: DTOs o diccionarios, o lista vacía si hay error.
+        """
+        db = ConexionSQLite(ruta_db=self.ruta_db)
+        clave = CacheConsultas.clave(sql, params, clase_dto)
+        if clave is None or db.conexion_transaccion() is not None:
+            if clase_dto is not None:
+                return self.consultar_dtos(sql, params, clase_dto)
+            return self.ejecutar_consulta(sql, params)
+
+        try:
+            cache = db.cache_consultas()
+            version = db.version_datos()
+            resultado = cache.obtener(clave, version)
+            if resultado is not None:
+                logger.debug("Consulta servida desde caché: %s | Parámetros: %s", sql, params)
+                return resultado
+
+            logger.debug("Consultando (caché): %s | Parámetros: %s", sql, params)
+            inicio = time.perf_counter()
+            with self.get_conexion() as con:
+                cursor = con.cursor()
+                cursor.execute(sql, params)
+                rows = cursor.fetchall()
+                convertir = dict if clase_dto is None else hidratador_para(clase_dto, cursor.description)
+                resultado = [convertir(row) for row in rows]
+                self._registrar_telemetria(sql, params, time.perf_counter() - inicio, len(resultado))
+            cache.guardar(clave, version, resultado, estimar_bytes(rows))
+            logger.debug("Consulta exitosa - Registros retornados: %s", len(resultado))
+            return resultado
+        except Error as ex:
+            logger.error("Error al consultar con caché: %s", ex, exc_info=True)
+            registrar_error_critico(ex, f"Consultar con caché en {self.__class__.__name__}")
             return []
 
+    def obtener_por_ids(
+        self, ids: Iterable[Any], tamano_bloque: Optional[int] = None
+    ) -> Dict[Any, Any]:
+        """
+        Obtiene varios registros por clave primaria con una consulta por bloque.
+
+        Los ids repetidos o None se descartan y la lista se divide en bloques
+        que no superan el límite de variables de SQLite. En tablas con clave
+        compuesta cada id es una tupla con los valores de `_CLAVE`.
+
+        Args:
+            ids (Iterable[Any]): Ids a buscar.
+            tamano_bloque (Optional[int]): Ids por consulta. Si es None se usa
+                CONSULTA_MAX_VARIABLES dividido por el número de columnas de la clave.
+
+        Returns:
+            Dict[Any, Any]: DTOs indexados por id. Los ids inexistentes no aparecen.
+        """
+        if self._TABLA is None or not self._CLAVE or self._CLASE_DTO is None:
+            logger.warning("%s no admite obtener_por_ids", type(self).__name__)
+            return {}
+
+        unicos = [id_ for id_ in dict.fromkeys(ids) if id_ is not None]
+        if not unicos:
+            return {}
+        if tamano_bloque is None:
+            tamano_bloque = max(1, CONSULTA_MAX_VARIABLES // len(self._CLAVE))
+
+        clave_de = attrgetter(*self._CLAVE)
+        compuesta = len(self._CLAVE) > 1
+        resultado: Dict[Any, Any] = {}
+
+        for lote in _dividir_en_lotes(unicos, tamano_bloque):
+            if compuesta:
+                # Row values: (a, b) IN (VALUES (?, ?), (?, ?), ...)
+                fila = "(" + ", ".join("?" * len(self._CLAVE)) + ")"
+                sql = (
+                    f"SELECT * FROM {self._TABLA} WHERE ({', '.join(self._CLAVE)}) "
+                    f"IN (VALUES {', '.join([fila] * len(lote))})"
+                )
+                params = tuple(valor for clave in lote for valor in clave)
+            else:
+                sql = (
+                    f"SELECT * FROM {self._TABLA} "
+                    f"WHERE {self._CLAVE[0]} IN ({', '.join('?' * len(lote))})"
+                )
+                params = tuple(lote)
+
+            for dto in self.consultar_dtos(sql, params, self._CLASE_DTO):
+                resultado[clave_de(dto)] = dto
+
+        return resultado
+
+    def _registrar_telemetria(
+        self, sql: str, params: Any, segundos: float, filas: int, tamano_lote: Optional[int] = None
+    ) -> None:
+        """
+        Registra en la telemetría de consultas una ejecución que duró `segundos`.
+        En los lotes, `params` son los de la primera fila y `tamano_lote` la cantidad de filas.
+        """
+        telemetria = obtener_telemetria()
+        if telemetria.activa:
+            telemetria.registrar(type(self).__name__, sql, params, segundos * 1000, filas, tamano_lote)
+
+    def _consultar(self, sql: str, params: tuple) -> List[Dict[str, Any]]:
+        inicio = time.perf_counter()
+        with self.get_conexion() as con:
+            cursor = con.cursor()
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+            resultado = [dict(row) for row in rows]
+            self._registrar_telemetria(sql, params, time.perf_counter() - inicio, len(resultado))
+            logger.debug("Consulta exitosa - Registros retornados: %s", len(resultado))
+            return resultado
+
     def ejecutar_actualizacion(self, sql: str, params: tuple = ()) -> bool:
         """
         Ejecuta una actualización o eliminación thread-safe.
         """
         try:
-            logger.debug(f"Actualizando/Eliminando: {sql} | Parámetros: {params}")
+            logger.debug("Actualizando/Eliminando: %s | Parámetros: %s", sql, params)
+            inicio = time.perf_counter()
             with self.get_conexion() as con:
                 cursor = con.cursor()
                 cursor.execute(sql, params)
                 filas_afectadas = cursor.rowcount
-                if filas_afectadas > 0:
-                    logger.info(f"Operación exitosa - Filas afectadas: {filas_afectadas}")
-                else:
-                    logger.debug(f"No se afectaron registros en la operación")
-                return filas_afectadas > 0
+            self._registrar_telemetria(sql, params, time.perf_counter() - inicio, filas_afectadas)
+            if filas_afectadas > 0:
+                logger.info("Operación exitosa - Filas afectadas: %s", filas_afectadas)
+            else:
+                logger.debug("No se afectaron registros en la operación")
+            return filas_afectadas > 0
         except Error as ex:
-            logger.error(f"Error al ejecutar actualización: {ex}", exc_info=True)
+            logger.error("Error al ejecutar actualización: %s", ex, exc_info=True)
             registrar_error_critico(ex, f"Actualización/Eliminación en {self.__class__.__name__}")
             return False
+
+    # ┌────────────────────────────────────────────────────────────┐
+    # │ Operaciones por lotes
+    # └────────────────────────────────────────────────────────────┘
+
+    def ejecutar_insertar_lote(
+        self, sql: str, lista_params: Iterable[Sequence[Any]], tamano_lote: Optional[int] = None
+    ) -> Optional[List[Optional[int]]]:
+        """
+        Ejecuta una inserción para muchas filas, confirmando una transacción
+        por cada lote de `tamano_lote` filas.
+
+        Cada fila se ejecuta por separado dentro del lote para leer su
+        `lastrowid`: los rowid de un lote no tienen por qué ser consecutivos
+        (INSERT OR IGNORE, triggers, rowid reutilizados).
+
+        Si un lote falla se revierte solo ese lote, se detiene el proceso y se
+        retorna None; los lotes anteriores quedan confirmados (para que todo sea
+        atómico, llamar dentro de `transaccion()`).
+
+        Args:
+            sql (str): Sentencia INSERT con parámetros posicionales.
+            lista_params (Iterable[Sequence[Any]]): Parámetros de cada fila.
+            tamano_lote (Optional[int]): Filas por transacción. Por defecto LOTE_TAMANO.
+
+        Returns:
+            Optional[List[Optional[int]]]: ID generado por cada fila, en orden
+            (None si la sentencia no insertó esa fila), o None si un lote falló.
+        """
+        tamano_lote = tamano_lote or LOTE_TAMANO
+        ids: List[Optional[int]] = []
+        try:
+            for lote in _dividir_en_lotes(lista_params, tamano_lote):
+                inicio = time.perf_counter()
+                with self.get_conexion() as con:
+                    cursor = con.cursor()
+                    ids_lote = []
+                    for params in lote:
+                        cursor.execute(sql, params)
+                        ids_lote.append(cursor.lastrowid if cursor.rowcount > 0 else None)
+                self._registrar_telemetria(sql, lote[0], time.perf_counter() - inicio, len(lote), len(lote))
+                ids.extend(ids_lote)
+            logger.info("Inserción por lotes exitosa - Registros: %s", len(ids))
+            return ids
+        except Error as ex:
+            logger.error(
+                "Error al ejecutar inserción por lotes (%s filas ya confirmadas): %s",
+                len(ids), ex, exc_info=True,
+            )
+            registrar_error_critico(ex, f"Insertar lote en {self.__class__.__name__}")
+            return None
+
+    def ejecutar_actualizacion_lote(
+        self, sql: str, lista_params: Iterable[Sequence[Any]], tamano_lote: Optional[int] = None
+    ) -> Optional[int]:
+        """
+        Ejecuta una actualización o eliminación para muchas filas con `executemany`,
+        confirmando una transacción por cada lote de `tamano_lote` filas.
+
+        Si un lote falla se revierte solo ese lote, se detiene el proceso y se
+        retorna None; los lotes anteriores quedan confirmados (para que todo sea
+        atómico, llamar dentro de `transaccion()`).
+
+        Args:
+            sql (str): Sentencia UPDATE o DELETE con parámetros posicionales.
+            lista_params (Iterable[Sequence[Any]]): Parámetros de cada fila.
+            tamano_lote (Optional[int]): Filas por transacción. Por defecto LOTE_TAMANO.
+
+        Returns:
+            Optional[int]: Total de filas afectadas, o None si un lote falló.
+        """
+        tamano_lote = tamano_lote or LOTE_TAMANO
+        filas_afectadas = 0
+        try:
+            for lote in _dividir_en_lotes(lista_params, tamano_lote):
+                inicio = time.perf_counter()
+                with self.get_conexion() as con:
+                    cursor = con.cursor()
+                    cursor.executemany(sql, lote)
+                    afectadas_lote = cursor.rowcount
+                self._registrar_telemetria(
+                    sql, lote[0], time.perf_counter() - inicio, afectadas_lote, len(lote)
+                )
+                filas_afectadas += afectadas_lote
+            logger.info("Operación por lotes exitosa - Filas afectadas: %s", filas_afectadas)
+            return filas_afectadas
+        except Error as ex:
+            logger.error(
+                "Error al ejecutar actualización por lotes (%s filas ya confirmadas): %s",
+                filas_afectadas, ex, exc_info=True,
+            )
+            registrar_error_critico(
+                ex, f"Actualización/Eliminación por lote en {self.__class__.__name__}"
+            )
+            return None
+
+    def insertar_lote(
+        self, dtos: Iterable[Any], tamano_lote: Optional[int] = None
+    ) -> Optional[List[Optional[int]]]:
+        """
+        Inserta muchos DTOs usando una transacción por lote.
+
+        Args:
+            dtos (Iterable[Any]): DTOs a insertar.
+            tamano_lote (Optional[int]): Filas por transacción. Por defecto LOTE_TAMANO.
+
+        Returns:
+            Optional[List[Optional[int]]]: IDs generados, en el mismo orden que
+            los DTOs, o None si un lote falló (ver ejecutar_insertar_lote).
+        """
+        if self._SQL_INSERTAR is None:
+            logger.warning("%s no soporta inserciones por lote", self.__class__.__name__)
+            return []
+        lista_params = (self._params_insertar(dto) for dto in dtos)
+        return self.ejecutar_insertar_lote(self._SQL_INSERTAR, lista_params, tamano_lote)
+
+    def actualizar_lote(self, dtos: Iterable[Any], tamano_lote: Optional[int] = None) -> Optional[int]:
+        """
+        Actualiza muchos DTOs usando una transacción por lote.
+
+        Args:
+            dtos (Iterable[Any]): DTOs con los datos a actualizar.
+            tamano_lote (Optional[int]): Filas por transacción. Por defecto LOTE_TAMANO.
+
+        Returns:
+            Optional[int]: Total de filas actualizadas, o None si un lote
+            falló (ver ejecutar_actualizacion_lote).
+        """
+        if self._SQL_ACTUALIZAR is None:
+            logger.warning("%s no soporta actualizaciones por lote", self.__class__.__name__)
+            return 0
+        lista_params = (self._params_actualizar(dto) for dto in dtos)
+        return self.ejecutar_actualizacion_lote(self._SQL_ACTUALIZAR, lista_params, tamano_lote)
+
+    def eliminar_lote(self, dtos: Iterable[Any], tamano_lote: Optional[int] = None) -> Optional[int]:
+        """
+        Elimina muchos DTOs usando una transacción por lote.
+
+        Args:
+            dtos (Iterable[Any]): DTOs con la clave de cada registro a eliminar.
+            tamano_lote (Optional[int]): Filas por transacción. Por defecto LOTE_TAMANO.
+
+        Returns:
+            Optional[int]: Total de filas eliminadas, o None si un lote
+            falló (ver ejecutar_actualizacion_lote).
+        """
+        if self._SQL_ELIMINAR is None:
+            logger.warning("%s no soporta eliminaciones por lote", self.__class__.__name__)
+            return 0
+        lista_params = (self._params_eliminar(dto) for dto in dtos)
+        return self.ejecutar_actualizacion_lote(self._SQL_ELIMINAR, lista_params, tamano_lote)
+
+
+class DAOMantenidoPorTriggers(DAO):
+    """
+    Clase base de los DAOs de tablas derivadas (tablas materializadas e
+    índices FTS5 o R*Tree) que los triggers mantienen al día.
+
+    Las subclases implementan `crear_tabla` y sus consultas; las escrituras
+    y la instanciación por DTO no aplican.
+    """
+
+    def __init__(self, ruta_db: Optional[str] = None):
+        super().__init__(ruta_db)
+
+        # las tablas se crean una sola vez por base de datos
+        inicializar_esquema(ruta_db)
+
+    def insertar(self, dto=None) -> Optional[int]:
+        """
+        No aplica: la tabla la mantienen los triggers.
+
+        Returns:
+            None: Siempre retorna None.
+        """
+        logger.warning("%s no soporta inserciones (la mantienen los triggers)", self.__class__.__name__)
+        return None
+
+    def eliminar(self, dto=None) -> bool:
+        """
+        No aplica: la tabla la mantienen los triggers.
+
+        Returns:
+            bool: Siempre retorna False.
+        """
+        logger.warning("%s no soporta eliminaciones (la mantienen los triggers)", self.__class__.__name__)
+        return False
+
+    def instanciar(self, dto=None) -> bool:
+        """
+        No aplica: la tabla no corresponde a un DTO.
+
+        Returns:
+            bool: Siempre retorna False.
+        """
+        logger.warning("%s no soporta instanciación directa", self.__class__.__name__)
+        return False
+
+    def existe(self, dto=None) -> bool:
+        """
+        No aplica: la tabla no corresponde a un DTO.
+
+        Returns:
+            bool: Siempre retorna False.
+        """
+        logger.warning("%s no soporta verificación de existencia", self.__class__.__name__)
+        return False
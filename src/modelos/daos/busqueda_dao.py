@@ -0,0 +1,226 @@
+import dataclasses
+import re
+from modelos.daos.base_dao import DAOMantenidoPorTriggers
+from modelos.daos.conexion_sqlite import ConexionSQLite
+from typing import Optional, List, Dict, Tuple
+from sqlite3 import Error
+from scripts.logging_config import obtener_logger_modulo
+
+logger = obtener_logger_modulo(__name__)
+
+ACTIVIDAD = 'actividad'
+ASIGNATURA = 'asignatura'
+ESTUDIANTE = 'estudiante'
+
+# Mismos separadores que el tokenizador unicode61: letras y dígitos forman palabras
+_PATRON_PALABRA = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclasses.dataclass(frozen=True)
+class _DefinicionIndice:
+    """Tabla de origen de un índice FTS5 y el peso (bm25) de cada columna."""
+
+    tabla: str
+    campo_id: str
+    columnas: Tuple[str, ...]
+    pesos: Tuple[float, ...]
+
+    @property
+    def tabla_fts(self) -> str:
+        return f"{self.tabla}_fts"
+
+
+_INDICES: Dict[str, _DefinicionIndice] = {
+    ACTIVIDAD: _DefinicionIndice('actividad', 'id_actividad', ('titulo', 'descripcion'), (10.0, 1.0)),
+    ASIGNATURA: _DefinicionIndice('asignatura', 'id_asignatura', ('codigo', 'nombre'), (10.0, 5.0)),
+    ESTUDIANTE: _DefinicionIndice('estudiante', 'id_estudiante', ('nombre', 'correo'), (5.0, 1.0)),
+}
+
+
+def expresion_busqueda(texto: str) -> Optional[str]:
+    """
+    Convierte el texto de una caja de búsqueda en una expresión MATCH de FTS5:
+    cada palabra se busca como prefijo y todas deben aparecer.
+
+    Las palabras se citan, por lo que los operadores de FTS5 (AND, NEAR, ",
+    *, :) escritos por el usuario se buscan como texto.
+
+    Returns:
+        Optional[str]: La expresión, o None si el texto no tiene palabras.
+
+    Example:
+        >>> expresion_busqueda("SIS-1 progra")
+        '"SIS"* "1"* "progra"*'
+    """
+    palabras = _PATRON_PALABRA.findall(texto or "")
+    if not palabras:
+        return None
+    return " ".join(f'"{palabra}"*' for palabra in palabras)
+
+
+def _sql_indice(definicion: _DefinicionIndice) -> List[str]:
+    """DDL de la tabla FTS5 (de contenido externo) y de sus triggers de sincronización."""
+    fts = definicion.tabla_fts
+    columnas = ", ".join(definicion.columnas)
+    nuevos = ", ".join(f"NEW.{c}" for c in definicion.columnas)
+    viejos = ", ".join(f"OLD.{c}" for c in definicion.columnas)
+    insertar = f"INSERT INTO {fts} (rowid, {columnas}) VALUES (NEW.{definicion.campo_id}, {nuevos});"
+    borrar = (
+        f"INSERT INTO {fts} ({fts}, rowid, {columnas}) "
+        f"VALUES ('delete', OLD.{definicion.campo_id}, {viejos});"
+    )
+    return [
+        f"""CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+            {columnas},
+            content='{definicion.tabla}',
+            content_rowid='{definicion.campo_id}',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        )""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_{fts}_insertar AFTER INSERT ON {definicion.tabla}
+        BEGIN
+            {insertar}
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_{fts}_eliminar AFTER DELETE ON {definicion.tabla}
+        BEGIN
+            {borrar}
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_{fts}_actualizar
+        AFTER UPDATE OF {definicion.campo_id}, {columnas} ON {definicion.tabla}
+        BEGIN
+            {borrar}
+            {insertar}
+        END""",
+        # Indexa las filas que ya existían
+        f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')",
+    ]
+
+
+class BusquedaDAO(DAOMantenidoPorTriggers):
+    """
+    DAO de los índices de texto completo (FTS5) de actividades, asignaturas
+    y estudiantes.
+
+    Cada índice es una tabla FTS5 de contenido externo (no duplica el texto)
+    que los triggers sobre la tabla de origen mantienen al día. Si el SQLite
+    instalado no tiene FTS5, las búsquedas usan LIKE sobre las tablas de origen.
+    """
+
+    def __init__(self, ruta_db=None):
+        super().__init__(ruta_db)
+        self._fts_disponible: Optional[bool] = None
+
+    def crear_tabla(self, sql: Optional[str] = None) -> bool:
+        """
+        Crea las tablas FTS5 con sus triggers e indexa las filas existentes.
+
+        Se ejecuta desde el bootstrap del esquema, después de crear las tablas de origen.
+
+        Returns:
+            bool: True si se crearon, False si hubo un error (por ejemplo, SQLite sin FTS5).
+        """
+        try:
+            with ConexionSQLite(self.ruta_db).transaccion() as con:
+                for definicion in _INDICES.values():
+                    for sentencia in _sql_indice(definicion):
+                        con.execute(sentencia)
+            return True
+        except Error as ex:
+            logger.warning(f"Índices de texto completo no disponibles, se usará LIKE: {ex}")
+            return False
+
+    def fts_disponible(self) -> bool:
+        """Indica si los índices FTS5 existen en la base de datos (se consulta una vez)."""
+        if self._fts_disponible is None:
+            filas = self.ejecutar_consulta(
+                "SELECT COUNT(*) AS n FROM sqlite_master WHERE type = 'table' AND name IN (?, ?, ?)",
+                tuple(d.tabla_fts for d in _INDICES.values()),
+            )
+            self._fts_disponible = bool(filas) and filas[0]['n'] == len(_INDICES)
+        return self._fts_disponible
+
+    def reconstruir(self) -> bool:
+        """Vuelve a indexar todas las filas de origen (tras escrituras sin triggers)."""
+        try:
+            with ConexionSQLite(self.ruta_db).transaccion() as con:
+                for definicion in _INDICES.values():
+                    con.execute(
+                        f"INSERT INTO {definicion.tabla_fts} ({definicion.tabla_fts}) VALUES ('rebuild')"
+                    )
+            return True
+        except Error as ex:
+            logger.error(f"Error al reconstruir los índices de texto completo: {ex}", exc_info=True)
+            return False
+
+    def buscar(self, entidad: str, texto: str, limite: Optional[int] = None) -> Optional[List[int]]:
+        """
+        Busca `texto` en los índices de `entidad` (prefijo de cada palabra).
+
+        Args:
+            entidad (str): ACTIVIDAD, ASIGNATURA o ESTUDIANTE.
+            texto (str): Texto escrito por el usuario.
+            limite (Optional[int]): Máximo de resultados.
+
+        Returns:
+            Optional[List[int]]: IDs ordenados por relevancia (bm25, la columna
+                principal pesa más), o None si `texto` no tiene palabras: no
+                hay nada que buscar y quien filtra no debe descartar filas.
+        """
+        if expresion_busqueda(texto) is None:
+            return None
+        sql, params = self._sql_coincidencias(_INDICES[entidad], texto)
+        sql += " ORDER BY rango"
+        if limite is not None:
+            sql += " LIMIT ?"
+            params += (limite,)
+        return [fila['id'] for fila in self.ejecutar_consulta(sql, params)]
+
+    def buscar_actividades_por_asignatura(self, texto: str) -> Optional[List[int]]:
+        """
+        IDs de las actividades cuya asignatura coincide con `texto`, ordenados
+        por la relevancia de la asignatura (None si `texto` no tiene palabras).
+        """
+        if expresion_busqueda(texto) is None:
+            return None
+        coincidencias, params = self._sql_coincidencias(_INDICES[ASIGNATURA], texto)
+        sql = f"""
+            SELECT a.id_actividad AS id
+            FROM ({coincidencias}) c
+            INNER JOIN eje_tematico e ON e.id_asignatura = c.id
+            INNER JOIN actividad a ON a.id_eje = e.id_eje
+            ORDER BY c.rango
+        """
+        return [fila['id'] for fila in self.ejecutar_consulta(sql, params)]
+
+    def _sql_coincidencias(self, definicion: _DefinicionIndice, texto: str) -> Tuple[str, tuple]:
+        """
+        Subconsulta con las filas de `definicion.tabla` que coinciden con
+        `texto`: columnas `id` y `rango` (menor es más relevante).
+        """
+        if self.fts_disponible():
+            pesos = ", ".join(str(p) for p in definicion.pesos)
+            sql = f"""
+                SELECT rowid AS id, bm25({definicion.tabla_fts}, {pesos}) AS rango
+                FROM {definicion.tabla_fts}
+                WHERE {definicion.tabla_fts} MATCH ?
+            """
+            return sql, (expresion_busqueda(texto),)
+        return self._sql_like(definicion, texto)
+
+    @staticmethod
+    def _sql_like(definicion: _DefinicionIndice, texto: str) -> Tuple[str, tuple]:
+        """Búsqueda equivalente sin FTS5: cada palabra debe aparecer en alguna columna."""
+        condiciones = []
+        params = []
+        for palabra in _PATRON_PALABRA.findall(texto):
+            condiciones.append(
+                "(" + " OR ".join(f"{c} LIKE ? ESCAPE '\\'" for c in definicion.columnas) + ")"
+            )
+            patron = "%" + palabra.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            params.extend([patron] * len(definicion.columnas))
+        sql = f"""
+            SELECT {definicion.campo_id} AS id, {definicion.columnas[0]} AS rango
+            FROM {definicion.tabla}
+            WHERE {' AND '.join(condiciones)}
+        """
+        return sql, tuple(params)
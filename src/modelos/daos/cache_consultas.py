@@ -0,0 +1,168 @@
+import dataclasses
+import re
+import sys
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Hashable, List, Optional, Sequence
+from scripts.logging_config import obtener_logger_modulo
+
+logger = obtener_logger_modulo(__name__)
+
+# Literales de texto e identificadores entre comillas: su contenido no se normaliza
+_PATRON_LITERAL = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*")""")
+_PATRON_ESPACIOS = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=512)
+def normalizar_sql(sql: str) -> str:
+    """
+    Colapsa los espacios en blanco de una sentencia fuera de los literales
+    y quita el `;` final, de modo que la misma consulta escrita con otra
+    indentación comparta la entrada de la caché.
+    """
+    partes = _PATRON_LITERAL.split(sql)
+    # Las posiciones impares son los literales capturados por el patrón
+    partes[::2] = [_PATRON_ESPACIOS.sub(" ", parte) for parte in partes[::2]]
+    return "".join(partes).strip().rstrip(";").strip()
+
+
+def estimar_bytes(filas: Sequence[Sequence[Any]]) -> int:
+    """
+    Estimación del tamaño en memoria de un resultado a partir de sus filas crudas.
+
+    No es exacta (los DTOs o diccionarios construidos ocupan algo más), pero
+    es proporcional al resultado y sirve para acotar la caché.
+    """
+    total = sys.getsizeof(filas)
+    for fila in filas:
+        total += sys.getsizeof(fila)
+        for valor in fila:
+            total += sys.getsizeof(valor)
+    return total
+
+
+@dataclasses.dataclass
+class EstadisticasCache:
+    """
+    Contadores de uso de una CacheConsultas.
+
+    Attributes:
+        aciertos (int): Lecturas servidas desde la caché.
+        fallos (int): Lecturas que tuvieron que ir a la base de datos.
+        invalidaciones (int): Veces que la caché se vació porque la base cambió.
+        desalojos (int): Entradas descartadas por superar los límites (LRU).
+        rechazadas (int): Resultados no guardados por ser mayores que el límite de bytes.
+        entradas (int): Entradas guardadas en este momento.
+        bytes (int): Tamaño estimado de las entradas guardadas.
+    """
+
+    aciertos: int = 0
+    fallos: int = 0
+    invalidaciones: int = 0
+    desalojos: int = 0
+    rechazadas: int = 0
+    entradas: int = 0
+    bytes: int = 0
+
+
+class CacheConsultas:
+    """
+    Caché LRU de resultados de consultas de una base de datos.
+
+    Cada entrada se indexa por (SQL normalizada, parámetros, clase DTO) y se
+    acota por cantidad de entradas y por bytes estimados. Todas las entradas
+    pertenecen a una versión de los datos (ver `ConexionSQLite.version_datos`):
+    al consultar con una versión distinta la caché se vacía por completo.
+    """
+
+    def __init__(self, max_entradas: int, max_bytes: int):
+        """
+        Args:
+            max_entradas (int): Número máximo de resultados guardados.
+            max_bytes (int): Tamaño estimado máximo de todos los resultados.
+        """
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        # clave -> (filas, tamaño estimado en bytes)
+        self._entradas: OrderedDict = OrderedDict()
+        self._version: Optional[Hashable] = None
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._estadisticas = EstadisticasCache()
+
+    @staticmethod
+    def clave(sql: str, params: Sequence[Any], clase_dto: Optional[type] = None) -> Optional[Hashable]:
+        """
+        Retorna la clave de una consulta, o None si sus parámetros no son hashables.
+        """
+        clave = (normalizar_sql(sql), tuple(params), clase_dto)
+        try:
+            hash(clave)
+        except TypeError:
+            return None
+        return clave
+
+    def _sincronizar_version(self, version: Hashable) -> None:
+        if version != self._version:
+            if self._entradas:
+                self._estadisticas.invalidaciones += 1
+                logger.debug("Caché de consultas invalidada (%s entradas)", len(self._entradas))
+            self._entradas.clear()
+            self._bytes = 0
+            self._version = version
+
+    def obtener(self, clave: Hashable, version: Hashable) -> Optional[List[Any]]:
+        """
+        Retorna una copia de la lista guardada para `clave`, o None si no está
+        o si los datos cambiaron desde que se guardó.
+        """
+        with self._lock:
+            self._sincronizar_version(version)
+            entrada = self._entradas.get(clave)
+            if entrada is None:
+                self._estadisticas.fallos += 1
+                return None
+            self._entradas.move_to_end(clave)
+            self._estadisticas.aciertos += 1
+            return list(entrada[0])
+
+    def guardar(self, clave: Hashable, version: Hashable, resultado: List[Any], tamano: int) -> None:
+        """
+        Guarda `resultado` para `clave` si `version` sigue siendo la actual,
+        desalojando las entradas menos usadas hasta respetar los límites.
+        """
+        with self._lock:
+            if version != self._version:
+                # Los datos cambiaron mientras se ejecutaba la consulta
+                return
+            if tamano > self.max_bytes:
+                self._estadisticas.rechazadas += 1
+                return
+
+            anterior = self._entradas.pop(clave, None)
+            if anterior is not None:
+                self._bytes -= anterior[1]
+            self._entradas[clave] = (list(resultado), tamano)
+            self._bytes += tamano
+
+            while len(self._entradas) > self.max_entradas or self._bytes > self.max_bytes:
+                _, (_, tamano_desalojado) = self._entradas.popitem(last=False)
+                self._bytes -= tamano_desalojado
+                self._estadisticas.desalojos += 1
+
+    def limpiar(self) -> None:
+        """Descarta todas las entradas."""
+        with self._lock:
+            self._entradas.clear()
+            self._bytes = 0
+            self._version = None
+
+    def obtener_estadisticas(self) -> EstadisticasCache:
+        """
+        Retorna una copia de los contadores de la caché.
+        """
+        with self._lock:
+            return dataclasses.replace(
+                self._estadisticas, entradas=len(self._entradas), bytes=self._bytes
+            )
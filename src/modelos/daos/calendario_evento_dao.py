@@ -1,5 +1,6 @@
 from modelos.dtos.calendario_evento_dto import CalendarioEventoDTO
 from modelos.daos.base_dao import DAO
+from modelos.daos.esquema import inicializar_esquema
 from typing import Optional, List, Dict, Any
 from sqlite3 import Error
 from scripts.logging_config import obtener_logger_modulo
@@ -8,11 +9,21 @@ logger = obtener_logger_modulo(__name__)
 
 
 class CalendarioEventoDAO(DAO):
+    _TABLA = "calendario_evento"
+    _CLAVE = ("id_evento",)
+    _CLASE_DTO = CalendarioEventoDTO
+    _SQL_INSERTAR = """INSERT INTO calendario_evento (titulo, tipo, fecha_inicio, fecha_fin, afecta_actividades)
+                 VALUES (?, ?, ?, ?, ?)"""
+    _SQL_ACTUALIZAR = """UPDATE calendario_evento 
+                 SET titulo = ?, tipo = ?, fecha_inicio = ?, fecha_fin = ?, afecta_actividades = ?
+                 WHERE id_evento = ?"""
+    _SQL_ELIMINAR = "DELETE FROM calendario_evento WHERE id_evento = ?"
+
     def __init__(self, ruta_db=None):
         super().__init__(ruta_db)
 
-        # creamos la tabla
-        self.crear_tabla()
+        # las tablas se crean una sola vez por base de datos
+        inicializar_esquema(ruta_db)
 
     def crear_tabla(self, sql: Optional[str] = None) -> bool:
         """
@@ -47,17 +58,7 @@ class CalendarioEventoDAO(DAO):
         Returns:
             Optional[int]: ID del registro insertado o None si hay error.
         """
-        sql = """INSERT INTO calendario_evento (titulo, tipo, fecha_inicio, fecha_fin, afecta_actividades)
-                 VALUES (?, ?, ?, ?, ?)"""
-        params = (
-            dto.titulo,
-            dto.tipo,
-            dto.fecha_inicio,
-            dto.fecha_fin,
-            dto.afecta_actividades,
-        )
-
-        return self.ejecutar_insertar(sql, params)
+        return self.ejecutar_insertar(self._SQL_INSERTAR, self._params_insertar(dto))
 
     def actualizar(self, dto: CalendarioEventoDTO) -> bool:
         """
@@ -69,19 +70,7 @@ class CalendarioEventoDAO(DAO):
         Returns:
             bool: True si se actualizó correctamente, False en caso contrario.
         """
-        sql = """UPDATE calendario_evento 
-                 SET titulo = ?, tipo = ?, fecha_inicio = ?, fecha_fin = ?, afecta_actividades = ?
-                 WHERE id_evento = ?"""
-        params = (
-            dto.titulo,
-            dto.tipo,
-            dto.fecha_inicio,
-            dto.fecha_fin,
-            dto.afecta_actividades,
-            dto.id_evento,
-        )
-
-        return self.ejecutar_actualizacion(sql, params)
+        return self.ejecutar_actualizacion(self._SQL_ACTUALIZAR, self._params_actualizar(dto))
 
     def eliminar(self, dto: CalendarioEventoDTO) -> bool:
         """
@@ -93,10 +82,29 @@ class CalendarioEventoDAO(DAO):
         Returns:
             bool: True si se eliminó correctamente, False en caso contrario.
         """
-        sql = "DELETE FROM calendario_evento WHERE id_evento = ?"
-        params = (dto.id_evento,)
+        return self.ejecutar_actualizacion(self._SQL_ELIMINAR, self._params_eliminar(dto))
 
-        return self.ejecutar_actualizacion(sql, params)
+    def _params_insertar(self, dto: CalendarioEventoDTO) -> tuple:
+        return (
+            dto.titulo,
+            dto.tipo,
+            dto.fecha_inicio,
+            dto.fecha_fin,
+            dto.afecta_actividades,
+        )
+
+    def _params_actualizar(self, dto: CalendarioEventoDTO) -> tuple:
+        return (
+            dto.titulo,
+            dto.tipo,
+            dto.fecha_inicio,
+            dto.fecha_fin,
+            dto.afecta_actividades,
+            dto.id_evento,
+        )
+
+    def _params_eliminar(self, dto: CalendarioEventoDTO) -> tuple:
+        return (dto.id_evento,)
 
     def instanciar(self, dto: CalendarioEventoDTO) -> bool:
         """
@@ -111,12 +119,7 @@ class CalendarioEventoDAO(DAO):
         if dto.id_evento != 0 and dto.id_evento is not None:
             sql = "SELECT * FROM calendario_evento WHERE id_evento = ?"
             params = (dto.id_evento,)
-            lista_data = self.ejecutar_consulta(sql, params)
-            if lista_data:
-                data = lista_data[0]
-                dto.set_data(data=data)
-                return True
-            return False
+            return self.consultar_en_dto(sql, params, dto)
         else:
             logger.warning("ID de evento no válido para instanciar")
             return False
@@ -1,5 +1,6 @@
 from modelos.dtos.carrera_dto import CarreraDTO
 from modelos.daos.base_dao import DAO
+from modelos.daos.esquema import inicializar_esquema
 from typing import Optional, List, Dict, Any
 from sqlite3 import Error
 from scripts.logging_config import obtener_logger_modulo
@@ -8,11 +9,21 @@ logger = obtener_logger_modulo(__name__)
 
 
 class CarreraDAO(DAO):
+    _TABLA = "carrera"
+    _CLAVE = ("id_carrera",)
+    _CLASE_DTO = CarreraDTO
+    _SQL_INSERTAR = """INSERT INTO carrera (codigo, nombre, plan, modalidad, creditos_totales)
+                 VALUES (?, ?, ?, ?, ?)"""
+    _SQL_ACTUALIZAR = """UPDATE carrera 
+                 SET codigo = ?, nombre = ?, plan = ?, modalidad = ?, creditos_totales = ?
+                 WHERE id_carrera = ?"""
+    _SQL_ELIMINAR = "DELETE FROM carrera WHERE id_carrera = ?"
+
     def __init__(self, ruta_db=None):
         super().__init__(ruta_db)
 
-        # creamos la tabla
-        self.crear_tabla()
+        # las tablas se crean una sola vez por base de datos
+        inicializar_esquema(ruta_db)
 
     def crear_tabla(self, sql: Optional[str] = None) -> bool:
         """
@@ -47,11 +58,7 @@ class CarreraDAO(DAO):
         Returns:
             Optional[int]: ID del registro insertado o None si hay error.
         """
-        sql = """INSERT INTO carrera (codigo, nombre, plan, modalidad, creditos_totales)
-                 VALUES (?, ?, ?, ?, ?)"""
-        params = (dto.codigo, dto.nombre, dto.plan, dto.modalidad, dto.creditos_totales)
-
-        return self.ejecutar_insertar(sql, params)
+        return self.ejecutar_insertar(self._SQL_INSERTAR, self._params_insertar(dto))
 
     def actualizar(self, dto: CarreraDTO) -> bool:
         """
@@ -63,19 +70,7 @@ class CarreraDAO(DAO):
         Returns:
             bool: True si se actualizó correctamente, False en caso contrario.
         """
-        sql = """UPDATE carrera 
-                 SET codigo = ?, nombre = ?, plan = ?, modalidad = ?, creditos_totales = ?
-                 WHERE id_carrera = ?"""
-        params = (
-            dto.codigo,
-            dto.nombre,
-            dto.plan,
-            dto.modalidad,
-            dto.creditos_totales,
-            dto.id_carrera,
-        )
-
-        return self.ejecutar_actualizacion(sql, params)
+        return self.ejecutar_actualizacion(self._SQL_ACTUALIZAR, self._params_actualizar(dto))
 
     def eliminar(self, dto: CarreraDTO) -> bool:
         """
@@ -87,10 +82,23 @@ class CarreraDAO(DAO):
         Returns:
             bool: True si se eliminó correctamente, False en caso contrario.
         """
-        sql = "DELETE FROM carrera WHERE id_carrera = ?"
-        params = (dto.id_carrera,)
+        return self.ejecutar_actualizacion(self._SQL_ELIMINAR, self._params_eliminar(dto))
 
-        return self.ejecutar_actualizacion(sql, params)
+    def _params_insertar(self, dto: CarreraDTO) -> tuple:
+        return (dto.codigo, dto.nombre, dto.plan, dto.modalidad, dto.creditos_totales)
+
+    def _params_actualizar(self, dto: CarreraDTO) -> tuple:
+        return (
+            dto.codigo,
+            dto.nombre,
+            dto.plan,
+            dto.modalidad,
+            dto.creditos_totales,
+            dto.id_carrera,
+        )
+
+    def _params_eliminar(self, dto: CarreraDTO) -> tuple:
+        return (dto.id_carrera,)
 
     def instanciar(self, dto: CarreraDTO) -> bool:
         """
@@ -105,12 +113,7 @@ class CarreraDAO(DAO):
         if dto.id_carrera != 0 and dto.id_carrera is not None:
             sql = "SELECT * FROM carrera WHERE id_carrera = ?"
             params = (dto.id_carrera,)
-            lista_data = self.ejecutar_consulta(sql, params)
-            if lista_data:
-                data = lista_data[0]
-                dto.set_data(data=data)
-                return True
-            return False
+            return self.consultar_en_dto(sql, params, dto)
         else:
             logger.warning("ID de carrera no válido para instanciar")
             return False
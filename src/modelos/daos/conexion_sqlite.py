@@ -1,75 +1,195 @@
+import dataclasses
+import os
 import sqlite3
 import threading
+from contextlib import contextmanager
 from sqlite3 import Connection, Cursor
-from utilidades.config import RUTA_DB
-from os.path import join
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from scripts.logging_config import obtener_logger_modulo
+from utilidades.config import (
+    RUTA_DB,
+    POOL_TAMANO_MAXIMO,
+    POOL_TIEMPO_ESPERA,
+    POOL_TIEMPO_INACTIVIDAD,
+    POOL_POLITICA_VERIFICACION,
+    POOL_INTERVALO_VERIFICACION,
+    CACHE_CONSULTAS_MAX_ENTRADAS,
+    CACHE_CONSULTAS_MAX_BYTES,
+)
+from .cache_consultas import CacheConsultas
+from .pool_conexiones import (
+    PoolConexiones,
+    EstadisticasPool,
+    POLITICAS_VERIFICACION,
+    conexion_cerrada,
+)
+
+logger = obtener_logger_modulo(__name__)
+
+
+class TransaccionRevertida(sqlite3.Error):
+    """
+    Se lanza al salir de `transaccion()` cuando una operación dentro de ella
+    falló (aunque el DAO haya capturado el error) y los cambios se revirtieron.
+    """
+
+
+@dataclasses.dataclass
+class _NivelTransaccion:
+    """Un nivel de la pila de transacciones de un thread."""
+
+    conexion: Connection
+    savepoint: Optional[str] = None  # None en la transacción externa
+    fallida: bool = False
+    cambios_iniciales: int = 0  # total_changes de la conexión al abrir el nivel
+    al_confirmar: List[Callable[[], None]] = dataclasses.field(default_factory=list)
 
 
 class ConexionSQLite:
     """
-    Clase Singleton thread-safe para gestionar conexiones SQLite.
-    Cada thread obtiene su propia conexión.
+    Gestor thread-safe de conexiones SQLite con una instancia por base de datos.
+
+    Cada ruta de base de datos (normalizada) tiene su propia instancia y su propio
+    pool acotado de conexiones, de modo que varios archivos pueden usarse en el
+    mismo proceso. Las conexiones se prestan explícitamente con
+    `adquirir_conexion()` / `devolver_conexion()`; `obtener_conexion()` conserva
+    el comportamiento anterior asociando una conexión del pool al thread actual
+    hasta que se llame a `cerrar()`.
     """
 
-    _instancia = None
+    _instancias: Dict[str, 'ConexionSQLite'] = {}
     _lock = threading.Lock()
-    _local = threading.local()  # Almacenamiento local por thread
 
     def __new__(cls, ruta_db: str = None):
-        if cls._instancia is None:
+        clave = cls._normalizar_ruta(ruta_db)
+        instancia = cls._instancias.get(clave)
+        if instancia is None:
             with cls._lock:
-                if cls._instancia is None:
-                    cls._instancia = super().__new__(cls)
-                    cls._instancia._ruta_db = None
-        return cls._instancia
+                instancia = cls._instancias.get(clave)
+                if instancia is None:
+                    instancia = super().__new__(cls)
+                    instancia._inicializar(clave)
+                    cls._instancias[clave] = instancia
+        return instancia
 
     def __init__(self, ruta_db: str = None):
         """
-        Inicializa la ruta de la base de datos.
-        La conexión se crea por thread según sea necesario.
+        La inicialización real ocurre una sola vez por ruta en `_inicializar`.
         """
+
+    def _inicializar(self, ruta_db: str) -> None:
+        self._ruta_db = ruta_db
+        self._local = threading.local()  # Conexión asociada a cada thread
+        self._pool = PoolConexiones(
+            fabrica=self._crear_conexion,
+            tamano_maximo=POOL_TAMANO_MAXIMO,
+            tiempo_espera=POOL_TIEMPO_ESPERA,
+            tiempo_inactividad=POOL_TIEMPO_INACTIVIDAD,
+            politica_verificacion=POOL_POLITICA_VERIFICACION,
+            intervalo_verificacion=POOL_INTERVALO_VERIFICACION,
+        )
+        # Bootstrap del esquema: se verifica una sola vez por base de datos
+        # (ver modelos.daos.esquema.inicializar_esquema)
+        self.esquema_listo = False
+        self.lock_esquema = threading.RLock()
+        self.esquema_en_curso = False
+        # Versión de los datos para la caché de consultas (ver version_datos)
+        self._generacion = 0
+        self._conexion_version: Optional[Connection] = None
+        self._lock_version = threading.Lock()
+        self._cache_consultas: Optional[CacheConsultas] = None
+
+    @staticmethod
+    def _normalizar_ruta(ruta_db: Optional[str]) -> str:
         if ruta_db is None:
             ruta_db = RUTA_DB
+        ruta_db = str(ruta_db)
+        if ruta_db == ":memory:" or ruta_db.startswith("file:"):
+            return ruta_db
+        return os.path.abspath(os.path.expanduser(ruta_db))
+
+    def _conectar(self) -> Connection:
+        # Las rutas `file:` son URIs (p. ej. file:memdb?mode=memory&cache=shared)
+        return sqlite3.connect(
+            self._ruta_db,
+            check_same_thread=False,
+            timeout=10.0,  # Espera 10 segundos si hay lock
+            uri=self._ruta_db.startswith("file:"),
+        )
+
+    def _crear_conexion(self) -> Connection:
+        try:
+            conexion = self._conectar()
+            conexion.row_factory = sqlite3.Row
+
+            # Optimizaciones de rendimiento
+            conexion.execute("PRAGMA foreign_keys = ON")
+            conexion.execute("PRAGMA journal_mode = WAL")  # Write-Ahead Logging
+            conexion.execute("PRAGMA synchronous = NORMAL")
+            conexion.execute("PRAGMA cache_size = -64000")  # 64MB cache
+            conexion.execute("PRAGMA temp_store = MEMORY")
+            return conexion
+
+        except sqlite3.Error as err:
+            print(f"Error al conectar: {err}")
+            raise
+
+    # ┌────────────────────────────────────────────────────────────┐
+    # │ Préstamo explícito de conexiones
+    # └────────────────────────────────────────────────────────────┘
+
+    def adquirir_conexion(self) -> Connection:
+        """
+        Toma una conexión del pool. Debe devolverse con `devolver_conexion()`.
+        """
+        return self._pool.obtener()
+
+    def devolver_conexion(
+        self, conexion: Connection, descartar: bool = False, con_error: bool = False
+    ) -> None:
+        """
+        Devuelve al pool una conexión obtenida con `adquirir_conexion()`.
+
+        Args:
+            conexion (Connection): Conexión a devolver.
+            descartar (bool): Si es True la conexión se cierra en lugar de reutilizarse.
+            con_error (bool): Si es True la conexión se verificará antes del
+                siguiente préstamo.
+        """
+        self._pool.devolver(conexion, descartar=descartar, con_error=con_error)
+
+    @contextmanager
+    def conexion_prestada(self):
+        """
+        Context manager que presta una conexión del pool y la devuelve al salir.
+        """
+        conexion = self.adquirir_conexion()
+        try:
+            yield conexion
+        finally:
+            self.devolver_conexion(conexion)
 
-        # Guardamos la ruta para crear conexiones en cada thread
-        if self._ruta_db is None:
-            self._ruta_db = ruta_db
+    # ┌────────────────────────────────────────────────────────────┐
+    # │ Conexión asociada al thread actual
+    # └────────────────────────────────────────────────────────────┘
 
     def _obtener_conexion_thread(self) -> Connection:
-        if not hasattr(self._local, 'conexion') or self._local.conexion is None:
-            try:
-                self._local.conexion = sqlite3.connect(
-                    self._ruta_db,
-                    check_same_thread=False,
-                    timeout=10.0,  # Espera 10 segundos si hay lock
-                )
-                self._local.conexion.row_factory = sqlite3.Row
-
-                # Optimizaciones de rendimiento
-                self._local.conexion.execute("PRAGMA foreign_keys = ON")
-                self._local.conexion.execute("PRAGMA journal_mode = WAL")  # Write-Ahead Logging
-                self._local.conexion.execute("PRAGMA synchronous = NORMAL")
-                self._local.conexion.execute("PRAGMA cache_size = -64000")  # 64MB cache
-                self._local.conexion.execute("PRAGMA temp_store = MEMORY")
-
-            except sqlite3.Error as err:
-                print(f"Error al conectar: {err}")
-                self._local.conexion = None
-                raise
-        else:
-            # Verificar que la conexión sigue siendo válida
-            try:
-                self._local.conexion.execute("SELECT 1")
-            except sqlite3.Error:
-                # Si la conexión está cerrada, crear una nueva
-                self._local.conexion = None
-                return self._obtener_conexion_thread()
+        conexion = getattr(self._local, 'conexion', None)
+        if conexion is not None and not self._pool.verificar(conexion):
+            # Cerrada externamente o sin respuesta: la sacamos del pool
+            self._pool.devolver(conexion, descartar=True)
+            conexion = None
+
+        if conexion is None:
+            conexion = self._pool.obtener(propietario=threading.current_thread())
+            self._local.conexion = conexion
 
-        return self._local.conexion
+        return conexion
 
     def obtener_conexion(self) -> Connection:
         """
-        Retorna la conexión de la base de datos para el thread actual.
+        Retorna la conexión de la base de datos asociada al thread actual.
+        La conexión queda reservada para el thread hasta llamar a `cerrar()`.
         """
         conexion = self._obtener_conexion_thread()
         if conexion is None:
@@ -84,30 +204,275 @@ class ConexionSQLite:
 
     def cerrar(self):
         """
-        Cierra la conexión del thread actual.
+        Cierra la conexión del thread actual y libera su lugar en el pool.
         """
-        if hasattr(self._local, 'conexion') and self._local.conexion is not None:
-            self._local.conexion.close()
+        conexion = getattr(self._local, 'conexion', None)
+        if conexion is not None:
             self._local.conexion = None
+            self._pool.devolver(conexion, descartar=True)
+
+    # ┌────────────────────────────────────────────────────────────┐
+    # │ Transacciones (unidad de trabajo)
+    # └────────────────────────────────────────────────────────────┘
+
+    def _pila_transacciones(self) -> List[_NivelTransaccion]:
+        pila = getattr(self._local, 'transacciones', None)
+        if pila is None:
+            pila = []
+            self._local.transacciones = pila
+        return pila
+
+    def conexion_transaccion(self) -> Optional[Connection]:
+        """
+        Retorna la conexión de la transacción activa en el thread actual, o None.
+        """
+        pila = getattr(self._local, 'transacciones', None)
+        return pila[0].conexion if pila else None
+
+    def marcar_transaccion_fallida(self) -> None:
+        """
+        Marca el nivel de transacción actual para revertirse al salir de él.
+        """
+        pila = getattr(self._local, 'transacciones', None)
+        if pila:
+            pila[-1].fallida = True
+
+    def al_confirmar(self, accion: Callable[[], None]) -> None:
+        """
+        Ejecuta `accion` cuando se confirme la transacción activa del thread
+        actual, o en el momento si no hay ninguna (los DAOs ya confirmaron).
+
+        Si el nivel en el que se registró se revierte, `accion` no se ejecuta.
+        Sirve para invalidar cachés en memoria solo cuando los cambios ya son
+        visibles para las demás conexiones.
+        """
+        pila = getattr(self._local, 'transacciones', None)
+        if pila:
+            pila[-1].al_confirmar.append(accion)
+        else:
+            self._ejecutar_al_confirmar([accion])
+
+    @staticmethod
+    def _ejecutar_al_confirmar(acciones: List[Callable[[], None]]) -> None:
+        for accion in acciones:
+            try:
+                accion()
+            except Exception as ex:
+                # Los cambios ya están confirmados: un fallo aquí no debe ocultarlo
+                logger.error("Error en una acción posterior a la confirmación: %s", ex, exc_info=True)
+
+    @contextmanager
+    def transaccion(self) -> Iterator[Connection]:
+        """
+        Context manager que agrupa varias operaciones en una sola transacción.
+
+        Dentro del bloque todos los DAOs de esta base de datos (en el mismo thread)
+        comparten una conexión y no confirman por su cuenta; se confirma una única
+        vez al salir. Los bloques anidados usan SAVEPOINT y pueden revertirse sin
+        afectar al bloque externo.
+
+        Si el bloque lanza una excepción se revierte y la excepción se propaga.
+        Si una operación falló dentro del bloque pero el DAO capturó el error, se
+        revierte igualmente y se lanza `TransaccionRevertida`.
+        """
+        pila = self._pila_transacciones()
+        if pila:
+            conexion = pila[0].conexion
+            nivel = _NivelTransaccion(conexion, savepoint=f"sp_nivel_{len(pila)}")
+            conexion.execute(f"SAVEPOINT {nivel.savepoint}")
+        else:
+            conexion = self.adquirir_conexion()
+            nivel = _NivelTransaccion(conexion, cambios_iniciales=conexion.total_changes)
+            try:
+                conexion.execute("BEGIN")
+            except sqlite3.Error:
+                self.devolver_conexion(conexion, con_error=True)
+                raise
+
+        pila.append(nivel)
+        try:
+            yield conexion
+        except BaseException:
+            pila.pop()
+            self._revertir_nivel(nivel, pila)
+            raise
+
+        pila.pop()
+        if nivel.fallida:
+            self._revertir_nivel(nivel, pila)
+            raise TransaccionRevertida("Una operación falló dentro de la transacción; se revirtió")
+        self._confirmar_nivel(nivel, pila)
+
+    def _confirmar_nivel(self, nivel: _NivelTransaccion, pila: List[_NivelTransaccion]) -> None:
+        try:
+            if nivel.savepoint is not None:
+                nivel.conexion.execute(f"RELEASE {nivel.savepoint}")
+            else:
+                nivel.conexion.commit()
+        except sqlite3.Error:
+            self._revertir_nivel(nivel, pila)
+            raise
+        if nivel.savepoint is not None:
+            # El savepoint liberado pasa a depender de la confirmación del nivel externo
+            pila[-1].al_confirmar.extend(nivel.al_confirmar)
+            return
+        if nivel.conexion.total_changes != nivel.cambios_iniciales:
+            self.registrar_escritura()
+        self.devolver_conexion(nivel.conexion)
+        self._ejecutar_al_confirmar(nivel.al_confirmar)
+
+    def _revertir_nivel(self, nivel: _NivelTransaccion, pila: List[_NivelTransaccion]) -> None:
+        if nivel.savepoint is not None:
+            try:
+                nivel.conexion.execute(f"ROLLBACK TO {nivel.savepoint}")
+                nivel.conexion.execute(f"RELEASE {nivel.savepoint}")
+            except sqlite3.Error:
+                # Sin poder volver al savepoint, el nivel externo tampoco es confiable
+                if pila:
+                    pila[-1].fallida = True
+            return
+
+        con_error = False
+        try:
+            nivel.conexion.rollback()
+        except sqlite3.Error:
+            con_error = True
+        self.devolver_conexion(nivel.conexion, con_error=con_error)
+
+    # ┌────────────────────────────────────────────────────────────┐
+    # │ Versión de los datos y caché de consultas
+    # └────────────────────────────────────────────────────────────┘
+
+    def registrar_escritura(self) -> None:
+        """
+        Anota que este proceso confirmó cambios en la base de datos.
+        """
+        self._generacion += 1
+
+    def version_datos(self) -> Tuple[int, int]:
+        """
+        Retorna un valor que cambia cada vez que se confirman cambios en la base.
+
+        Combina las escrituras registradas por este proceso con
+        `PRAGMA data_version`, leído en una conexión propia fuera del pool:
+        SQLite lo incrementa cuando cualquier otra conexión (de este proceso
+        o de otro) confirma una transacción.
+        """
+        with self._lock_version:
+            if self._conexion_version is None or conexion_cerrada(self._conexion_version):
+                self._conexion_version = self._conectar()
+            data_version = self._conexion_version.execute("PRAGMA data_version").fetchone()[0]
+        return self._generacion, data_version
+
+    def cache_consultas(self) -> CacheConsultas:
+        """
+        Retorna la caché de resultados de esta base de datos (ver DAO.consultar_cacheado).
+        """
+        if self._cache_consultas is None:
+            with self._lock_version:
+                if self._cache_consultas is None:
+                    self._cache_consultas = CacheConsultas(
+                        CACHE_CONSULTAS_MAX_ENTRADAS, CACHE_CONSULTAS_MAX_BYTES
+                    )
+        return self._cache_consultas
+
+    def _cerrar_conexion_version(self) -> None:
+        with self._lock_version:
+            if self._conexion_version is not None:
+                try:
+                    self._conexion_version.close()
+                except sqlite3.Error:
+                    pass
+                self._conexion_version = None
+            if self._cache_consultas is not None:
+                self._cache_consultas.limpiar()
+
+    # ┌────────────────────────────────────────────────────────────┐
+    # │ Configuración y estadísticas del pool
+    # └────────────────────────────────────────────────────────────┘
+
+    def configurar_pool(
+        self,
+        tamano_maximo: Optional[int] = None,
+        tiempo_espera: Optional[float] = None,
+        tiempo_inactividad: Optional[float] = None,
+        politica_verificacion: Optional[str] = None,
+        intervalo_verificacion: Optional[float] = None,
+    ) -> None:
+        """
+        Ajusta los parámetros del pool de esta base de datos.
+
+        Args:
+            tamano_maximo (Optional[int]): Número máximo de conexiones abiertas.
+            tiempo_espera (Optional[float]): Segundos a esperar por una conexión libre.
+            tiempo_inactividad (Optional[float]): Segundos sin uso antes de cerrar
+                una conexión libre.
+            politica_verificacion (Optional[str]): "siempre", "nunca", "intervalo"
+                o "tras_error".
+            intervalo_verificacion (Optional[float]): Segundos entre verificaciones
+                con la política "intervalo".
+        """
+        if tamano_maximo is not None:
+            if tamano_maximo < 1:
+                raise ValueError("El tamaño máximo del pool debe ser al menos 1")
+            self._pool.tamano_maximo = tamano_maximo
+        if tiempo_espera is not None:
+            self._pool.tiempo_espera = tiempo_espera
+        if tiempo_inactividad is not None:
+            self._pool.tiempo_inactividad = tiempo_inactividad
+        if politica_verificacion is not None:
+            if politica_verificacion not in POLITICAS_VERIFICACION:
+                raise ValueError(f"Política de verificación desconocida: {politica_verificacion}")
+            self._pool.politica_verificacion = politica_verificacion
+        if intervalo_verificacion is not None:
+            self._pool.intervalo_verificacion = intervalo_verificacion
+
+    def obtener_estadisticas(self) -> EstadisticasPool:
+        """
+        Retorna las estadísticas del pool (esperas, reutilizaciones, sondeos...).
+        """
+        return self._pool.obtener_estadisticas()
+
+    def desalojar_inactivas(self) -> int:
+        """
+        Cierra las conexiones libres que superaron el tiempo de inactividad.
+        """
+        return self._pool.desalojar_inactivas()
 
     @classmethod
     def cerrar_todas(cls):
         """
-        Cierra todas las conexiones (útil al finalizar la aplicación).
-        Nota: Solo cierra la conexión del thread actual ya que no podemos
-        acceder a las conexiones de otros threads.
+        Cierra todas las conexiones de todas las bases de datos
+        (útil al finalizar la aplicación).
         """
-        if cls._instancia is not None:
-            cls._instancia.cerrar()
+        with cls._lock:
+            instancias = list(cls._instancias.values())
+        for instancia in instancias:
+            # Las conexiones quedan cerradas: también olvidamos las transacciones abiertas
+            instancia._local = threading.local()
+            instancia._pool.cerrar_todas()
+            instancia._cerrar_conexion_version()
 
     @classmethod
     def resetear(cls):
         """
-        Resetea el Singleton (útil principalmente para tests).
-        Cierra la conexión del thread actual y reinicia las variables de clase.
+        Resetea las instancias (útil principalmente para tests).
+        Cierra todas las conexiones y olvida las rutas registradas.
         """
-        if cls._instancia is not None:
-            cls._instancia.cerrar()
+        cls.cerrar_todas()
 
         with cls._lock:
-            cls._instancia = None
+            cls._instancias.clear()
+
+
+def transaccion(ruta_db: Optional[str] = None):
+    """
+    Abre una transacción sobre la base de datos indicada (por defecto RUTA_DB).
+
+    Equivale a `ConexionSQLite(ruta_db).transaccion()`:
+
+        with transaccion():
+            id_actividad = actividad_dao.insertar(actividad)
+            estudiante_actividad_dao.insertar_lote(relaciones)
+    """
+    return ConexionSQLite(ruta_db).transaccion()
@@ -1,14 +1,33 @@
+import dataclasses
+from datetime import date
 from modelos.daos.base_dao import DAO
+from modelos.daos.esquema import inicializar_esquema
+from modelos.daos.intervalo_evento_dao import ACTIVIDAD, CALENDARIO_EVENTO, sql_dia
 from modelos.dtos.consulta_dto import (
+    ActividadDetalladaDTO,
+    EstadisticasActividadesDTO,
     EventosUnificadosDTO,
 )
-from typing import Optional, List, Dict, Any
-from sqlite3 import Error
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from scripts.logging_config import obtener_logger_modulo
 
 logger = obtener_logger_modulo(__name__)
 
 
+# Los días desde la fecha de fin dependen del día en que se consulta. La vista
+# no los calcula (sus columnas son deterministas y se pueden cachear); aquí se
+# calculan con la fecha de referencia como parámetro, que forma parte de la
+# clave de la caché de consultas.
+def _sql_dias_desde_fin(columna: str = "fecha_fin") -> str:
+    """Expresión de dias_desde_fin; espera la fecha de referencia como parámetro."""
+    return f"CAST((julianday(?) - julianday({columna})) AS INTEGER)"
+
+
+def _fecha_referencia(fecha_referencia: Optional[date]) -> str:
+    """Fecha ISO contra la que se calcula dias_desde_fin (hoy si es None)."""
+    return (fecha_referencia or date.today()).isoformat()
+
+
 class ConsultaDAO(DAO):
     """
     DAO para ejecutar consultas complejas del MVP de Organización Académica.
@@ -71,6 +90,221 @@ class ConsultaDAO(DAO):
         return False
 
 
+    # ┌────────────────────────────────────────────────────────────┐
+    # │ Actividades detalladas por estudiante
+    # └────────────────────────────────────────────────────────────┘
+
+    def obtener_actividades_detalladas(
+        self,
+        id_estudiante: int,
+        id_carrera: Optional[int] = None,
+        id_asignatura: Optional[int] = None,
+        id_tipo_actividad: Optional[int] = None,
+        fecha_referencia: Optional[date] = None,
+    ) -> List[ActividadDetalladaDTO]:
+        """
+        Obtiene las actividades de un estudiante desde vw_estudiante_actividades_detalladas.
+
+        El resultado depende solo de los datos y de los parámetros, por lo que
+        se guarda en la caché de consultas. Los DTOs retornados son compartidos
+        y no deben modificarse.
+
+        Args:
+            id_estudiante (int): ID del estudiante.
+            id_carrera (Optional[int]): Filtra por carrera si se indica.
+            id_asignatura (Optional[int]): Filtra por asignatura si se indica.
+            id_tipo_actividad (Optional[int]): Filtra por tipo de actividad si se indica.
+            fecha_referencia (Optional[date]): Fecha contra la que se calcula
+                dias_desde_fin. Por defecto, hoy.
+
+        Returns:
+            List[ActividadDetalladaDTO]: Actividades ordenadas por fecha de fin descendente.
+        """
+        where, params = self._filtro_actividades_detalladas(
+            id_estudiante, id_carrera, id_asignatura, id_tipo_actividad
+        )
+        sql = f"""
+            SELECT *, {_sql_dias_desde_fin()} AS dias_desde_fin
+            FROM vw_estudiante_actividades_detalladas
+            WHERE {where}
+            ORDER BY fecha_fin DESC, titulo
+        """
+        return self.consultar_cacheado(
+            sql, (_fecha_referencia(fecha_referencia), *params), ActividadDetalladaDTO
+        )
+
+    def obtener_estadisticas_actividades(
+        self,
+        id_estudiante: int,
+        id_carrera: Optional[int] = None,
+        id_asignatura: Optional[int] = None,
+        id_tipo_actividad: Optional[int] = None,
+        limite_dias: int = 7,
+        max_proximas: int = 5,
+        fecha_referencia: Optional[date] = None,
+    ) -> EstadisticasActividadesDTO:
+        """
+        Calcula en SQL todas las métricas del panel de estadísticas de un
+        estudiante: conteos por estado y prioridad, promedios de nota, velocidad
+        de entrega y duración, y las actividades próximas a vencer.
+
+        Usa los mismos filtros que `obtener_actividades_detalladas`. Los
+        resultados se guardan en la caché de consultas, por lo que repetir la
+        llamada con los mismos filtros y la misma fecha de referencia no vuelve
+        a recorrer la vista mientras no cambien los datos.
+
+        Args:
+            id_estudiante (int): ID del estudiante.
+            id_carrera (Optional[int]): Filtra por carrera si se indica.
+            id_asignatura (Optional[int]): Filtra por asignatura si se indica.
+            id_tipo_actividad (Optional[int]): Filtra por tipo de actividad si se indica.
+            limite_dias (int): Máximo de dias_desde_fin para considerar una actividad próxima.
+            max_proximas (int): Cantidad de actividades próximas a retornar en `proximas`.
+            fecha_referencia (Optional[date]): Fecha contra la que se calcula
+                dias_desde_fin. Por defecto, hoy.
+
+        Returns:
+            EstadisticasActividadesDTO: Métricas agregadas (en cero si no hay actividades).
+        """
+        where, params = self._filtro_actividades_detalladas(
+            id_estudiante, id_carrera, id_asignatura, id_tipo_actividad
+        )
+        referencia = _fecha_referencia(fecha_referencia)
+        sql = f"""
+        SELECT
+            COUNT(*) AS total,
+            COALESCE(SUM(estado = 'entregada'), 0) AS entregadas,
+            COALESCE(SUM(estado = 'pendiente'), 0) AS pendientes,
+            COALESCE(SUM(estado = 'en_progreso'), 0) AS en_progreso,
+            COALESCE(SUM(estado = 'vencida'), 0) AS vencidas,
+            COALESCE(SUM(prioridad = 2), 0) AS prioridad_alta,
+            COALESCE(SUM(prioridad = 1), 0) AS prioridad_media,
+            COALESCE(SUM(prioridad IS NULL OR prioridad NOT IN (1, 2)), 0) AS prioridad_baja,
+            COALESCE(ROUND(AVG(nota), 2), 0.0) AS promedio_nota,
+            COALESCE(ROUND(AVG(CASE WHEN estado = 'entregada'
+                                    THEN COALESCE(dias_desde_fin, 0) END), 1), 0.0) AS velocidad_promedio,
+            COALESCE(ROUND(AVG(NULLIF(dias_duracion, 0)), 1), 0.0) AS duracion_promedio,
+            COALESCE(SUM(dias_desde_fin BETWEEN 0 AND ?), 0) AS proximas_vencer
+        FROM (
+            SELECT v.prioridad, v.dias_duracion, {_sql_dias_desde_fin('v.fecha_fin')} AS dias_desde_fin,
+                   COALESCE(v.actividad_estado, 'pendiente') AS estado,
+                   a.nota
+            FROM vw_estudiante_actividades_detalladas v
+            LEFT JOIN actividad a ON a.id_actividad = v.actividad_id
+            WHERE {where}
+        )
+        """
+        filas = self.consultar_cacheado(
+            sql, (limite_dias, referencia, *params), EstadisticasActividadesDTO
+        )
+        if not filas:
+            return EstadisticasActividadesDTO()
+
+        estadisticas = filas[0]
+        if estadisticas.proximas_vencer:
+            sql_proximas = f"""
+            SELECT * FROM (
+                SELECT *, {_sql_dias_desde_fin()} AS dias_desde_fin
+                FROM vw_estudiante_actividades_detalladas
+                WHERE {where}
+            )
+            WHERE dias_desde_fin BETWEEN 0 AND ?
+            ORDER BY dias_desde_fin, fecha_fin, titulo
+            LIMIT ?
+            """
+            proximas = self.consultar_cacheado(
+                sql_proximas,
+                (referencia, *params, limite_dias, max_proximas),
+                ActividadDetalladaDTO,
+            )
+            # El DTO de la caché es compartido: se retorna una copia con la lista
+            estadisticas = dataclasses.replace(estadisticas, proximas=proximas)
+        return estadisticas
+
+    @staticmethod
+    def _filtro_actividades_detalladas(
+        id_estudiante: int,
+        id_carrera: Optional[int],
+        id_asignatura: Optional[int],
+        id_tipo_actividad: Optional[int],
+    ) -> Tuple[str, tuple]:
+        """Condición WHERE (y sus parámetros) de los filtros del panel de actividades."""
+        condiciones = ["id_estudiante = ?"]
+        params = [id_estudiante]
+
+        if id_carrera:
+            condiciones.append("carrera_id = ?")
+            params.append(id_carrera)
+        if id_asignatura:
+            condiciones.append("id_asignatura = ?")
+            params.append(id_asignatura)
+        if id_tipo_actividad:
+            condiciones.append("tipo_actividad_id = ?")
+            params.append(id_tipo_actividad)
+
+        return " AND ".join(condiciones), tuple(params)
+
+
+# Ramas de vw_eventos_unificados: scripts/crear_views.py define la vista como
+# su UNION ALL y _SQL_SOLAPAMIENTO las reutiliza, de modo que las columnas se
+# escriben una sola vez.
+SQL_EVENTOS_ACTIVIDAD = """
+    SELECT
+        'Actividad' AS tipo_evento,
+        a.id_actividad AS id_evento,
+        a.titulo,
+        a.descripcion,
+        a.fecha_inicio,
+        a.fecha_fin,
+        ta.nombre AS tipo_actividad,
+        NULL AS observaciones,
+        car.nombre AS carrera,
+        car.id_carrera,
+        asig.nombre AS asignatura,
+        asig.id_asignatura
+    FROM actividad a
+    LEFT JOIN tipo_actividad ta ON a.id_tipo_actividad = ta.id_tipo_actividad
+    LEFT JOIN eje_tematico et ON a.id_eje = et.id_eje
+    LEFT JOIN asignatura asig ON et.id_asignatura = asig.id_asignatura
+    LEFT JOIN carrera car ON asig.id_carrera = car.id_carrera
+"""
+
+SQL_EVENTOS_CALENDARIO = """
+    SELECT
+        'Evento Calendario' AS tipo_evento,
+        c.id_evento AS id_evento,
+        c.titulo,
+        NULL AS descripcion,
+        c.fecha_inicio,
+        c.fecha_fin,
+        c.tipo AS tipo_actividad,
+        CASE WHEN c.afecta_actividades = 1 THEN 'Afecta actividades' ELSE NULL END AS observaciones,
+        NULL AS carrera,
+        NULL AS id_carrera,
+        NULL AS asignatura,
+        NULL AS id_asignatura
+    FROM calendario_evento c
+"""
+
+# Eventos que se solapan con [desde, hasta]: cada rama de la vista busca sus
+# filas por clave en el R*Tree de intervalos. SQLite no lleva el filtro dentro
+# de las ramas del UNION ALL de la vista (la recorrería entera), por eso el
+# filtro se agrega a cada rama. Parámetros: (hasta, desde) por rama.
+_SQL_SOLAPAMIENTO = f"""
+{SQL_EVENTOS_ACTIVIDAD}
+WHERE a.id_actividad IN (
+    SELECT r.id FROM {ACTIVIDAD.tabla_rtree} r WHERE r.inicio <= {sql_dia('?')} AND r.fin >= {sql_dia('?')}
+)
+
+UNION ALL
+{SQL_EVENTOS_CALENDARIO}
+WHERE c.id_evento IN (
+    SELECT r.id FROM {CALENDARIO_EVENTO.tabla_rtree} r WHERE r.inicio <= {sql_dia('?')} AND r.fin >= {sql_dia('?')}
+)
+ORDER BY fecha_inicio ASC
+"""
+
+
 class EventosUnificadosDAO(DAO):
     """
     DAO para consultar la vista vw_eventos_unificados.
@@ -82,6 +316,9 @@ class EventosUnificadosDAO(DAO):
     def __init__(self, ruta_db=None):
         super().__init__(ruta_db)
 
+        # las consultas por solapamiento usan los R*Tree creados con el esquema
+        inicializar_esquema(ruta_db)
+
     def crear_tabla(self, sql: Optional[str] = None) -> bool:
         """
         No aplica para EventosUnificadosDAO (solo consulta la vista, read-only).
@@ -140,34 +377,88 @@ class EventosUnificadosDAO(DAO):
         """
         Obtiene todos los eventos unificados ordenados por fecha.
 
+        El resultado se guarda en la caché de consultas hasta que cambien los datos.
+
         Returns:
             List[EventosUnificadosDTO]: Lista de eventos unificados.
         """
-        try:
-            with self.get_conexion() as con:
-                cursor = con.cursor()
-
-                sql = """
-                SELECT tipo_evento, id_evento, titulo, descripcion, 
-                       fecha_inicio, fecha_fin, tipo_actividad, observaciones,
-                       carrera, id_carrera, asignatura, id_asignatura
-                FROM vw_eventos_unificados
-                ORDER BY fecha_inicio ASC;
-                """
-
-                cursor.execute(sql)
-                rows = cursor.fetchall()
-
-                eventos = [EventosUnificadosDTO.from_row(row) for row in rows]
-                logger.debug(f"Obtenidos {len(eventos)} eventos unificados")
-                return eventos
-
-        except Error as ex:
-            logger.error(f"Error al obtener eventos unificados: {ex}")
-            return []
+        sql = """
+        SELECT tipo_evento, id_evento, titulo, descripcion,
+               fecha_inicio, fecha_fin, tipo_actividad, observaciones,
+               carrera, id_carrera, asignatura, id_asignatura
+        FROM vw_eventos_unificados
+        ORDER BY fecha_inicio ASC;
+        """
+        eventos = self.consultar_cacheado(sql, (), EventosUnificadosDTO)
+        logger.debug("Obtenidos %s eventos unificados", len(eventos))
+        return eventos
+
+    def iterar_todos(self, tamano_bloque: Optional[int] = None) -> Iterator[EventosUnificadosDTO]:
+        """
+        Recorre todos los eventos unificados ordenados por fecha sin cargarlos
+        todos en memoria.
+
+        Args:
+            tamano_bloque (Optional[int]): Filas leídas por bloque.
+
+        Yields:
+            EventosUnificadosDTO: Un evento por vez.
+        """
+        sql = """
+        SELECT tipo_evento, id_evento, titulo, descripcion,
+               fecha_inicio, fecha_fin, tipo_actividad, observaciones,
+               carrera, id_carrera, asignatura, id_asignatura
+        FROM vw_eventos_unificados
+        ORDER BY fecha_inicio ASC;
+        """
+        return self.iterar_consulta(
+            sql, tamano_bloque=tamano_bloque, fabrica=EventosUnificadosDTO.from_row
+        )
+
+    def iterar_por_rango_fechas(
+        self,
+        fecha_inicio: str,
+        fecha_fin: str,
+        tamano_bloque: Optional[int] = None,
+        solapamiento: bool = False,
+    ) -> Iterator[EventosUnificadosDTO]:
+        """
+        Recorre los eventos dentro de un rango de fechas sin cargarlos todos en memoria.
+
+        Args:
+            fecha_inicio (str): Fecha inicial en formato YYYY-MM-DD
+            fecha_fin (str): Fecha final en formato YYYY-MM-DD
+            tamano_bloque (Optional[int]): Filas leídas por bloque.
+            solapamiento (bool): Incluir también los eventos que solo se
+                solapan con el rango (ver `obtener_por_solapamiento`).
+
+        Yields:
+            EventosUnificadosDTO: Un evento por vez.
+        """
+        if solapamiento:
+            return self.iterar_consulta(
+                _SQL_SOLAPAMIENTO,
+                (fecha_fin, fecha_inicio, fecha_fin, fecha_inicio),
+                tamano_bloque=tamano_bloque,
+                fabrica=EventosUnificadosDTO.from_row,
+            )
+        sql = """
+        SELECT tipo_evento, id_evento, titulo, descripcion,
+               fecha_inicio, fecha_fin, tipo_actividad, observaciones,
+               carrera, id_carrera, asignatura, id_asignatura
+        FROM vw_eventos_unificados
+        WHERE fecha_inicio >= ? AND fecha_fin <= ?
+        ORDER BY fecha_inicio ASC;
+        """
+        return self.iterar_consulta(
+            sql,
+            (fecha_inicio, fecha_fin),
+            tamano_bloque=tamano_bloque,
+            fabrica=EventosUnificadosDTO.from_row,
+        )
 
     def obtener_por_rango_fechas(
-        self, fecha_inicio: str, fecha_fin: str
+        self, fecha_inicio: str, fecha_fin: str, solapamiento: bool = False
     ) -> List[EventosUnificadosDTO]:
         """
         Obtiene eventos dentro de un rango de fechas.
@@ -175,33 +466,54 @@ class EventosUnificadosDAO(DAO):
         Args:
             fecha_inicio (str): Fecha inicial en formato YYYY-MM-DD
             fecha_fin (str): Fecha final en formato YYYY-MM-DD
+            solapamiento (bool): Incluir también los eventos que solo se
+                solapan con el rango (ver `obtener_por_solapamiento`).
+                Por defecto solo los que están contenidos en él.
 
         Returns:
             List[EventosUnificadosDTO]: Lista de eventos en el rango.
         """
-        try:
-            with self.get_conexion() as con:
-                cursor = con.cursor()
-
-                sql = """
-                SELECT tipo_evento, id_evento, titulo, descripcion,
-                       fecha_inicio, fecha_fin, tipo_actividad, observaciones,
-                       carrera, id_carrera, asignatura, id_asignatura
-                FROM vw_eventos_unificados
-                WHERE fecha_inicio >= ? AND fecha_fin <= ?
-                ORDER BY fecha_inicio ASC;
-                """
-
-                cursor.execute(sql, (fecha_inicio, fecha_fin))
-                rows = cursor.fetchall()
-
-                eventos = [EventosUnificadosDTO.from_row(row) for row in rows]
-                logger.debug(f"Obtenidos {len(eventos)} eventos entre {fecha_inicio} y {fecha_fin}")
-                return eventos
-
-        except Error as ex:
-            logger.error(f"Error al obtener eventos por rango: {ex}")
-            return []
+        if solapamiento:
+            return self.obtener_por_solapamiento(fecha_inicio, fecha_fin)
+        sql = """
+        SELECT tipo_evento, id_evento, titulo, descripcion,
+               fecha_inicio, fecha_fin, tipo_actividad, observaciones,
+               carrera, id_carrera, asignatura, id_asignatura
+        FROM vw_eventos_unificados
+        WHERE fecha_inicio >= ? AND fecha_fin <= ?
+        ORDER BY fecha_inicio ASC;
+        """
+        eventos = self.consultar_dtos(sql, (fecha_inicio, fecha_fin), EventosUnificadosDTO)
+        logger.debug("Obtenidos %s eventos entre %s y %s", len(eventos), fecha_inicio, fecha_fin)
+        return eventos
+
+    def obtener_por_solapamiento(
+        self, fecha_desde: str, fecha_hasta: str
+    ) -> List[EventosUnificadosDTO]:
+        """
+        Obtiene los eventos cuyo intervalo [fecha_inicio, fecha_fin] se
+        solapa con [fecha_desde, fecha_hasta] (ambos extremos incluidos, por
+        días completos): los contenidos en el rango, los que lo contienen y
+        los que empiezan antes o terminan después.
+
+        La búsqueda usa los R*Tree de IntervaloEventoDAO, así que su costo
+        crece con el logaritmo del total de eventos más los encontrados.
+        El resultado se guarda en la caché de consultas hasta que cambien los datos.
+
+        Args:
+            fecha_desde (str): Primer día de la ventana (YYYY-MM-DD).
+            fecha_hasta (str): Último día de la ventana (YYYY-MM-DD).
+
+        Returns:
+            List[EventosUnificadosDTO]: Eventos ordenados por fecha de inicio.
+        """
+        eventos = self.consultar_cacheado(
+            _SQL_SOLAPAMIENTO,
+            (fecha_hasta, fecha_desde, fecha_hasta, fecha_desde),
+            EventosUnificadosDTO,
+        )
+        logger.debug("Obtenidos %s eventos que se solapan con %s..%s", len(eventos), fecha_desde, fecha_hasta)
+        return eventos
 
     def obtener_por_tipo(self, tipo_evento: str) -> List[EventosUnificadosDTO]:
         """
@@ -213,34 +525,24 @@ class EventosUnificadosDAO(DAO):
         Returns:
             List[EventosUnificadosDTO]: Lista de eventos del tipo especificado.
         """
-        try:
-            with self.get_conexion() as con:
-                cursor = con.cursor()
-
-                sql = """
-                SELECT tipo_evento, id_evento, titulo, descripcion,
-                       fecha_inicio, fecha_fin, tipo_actividad, observaciones,
-                       carrera, id_carrera, asignatura, id_asignatura
-                FROM vw_eventos_unificados
-                WHERE tipo_evento = ?
-                ORDER BY fecha_inicio ASC;
-                """
-
-                cursor.execute(sql, (tipo_evento,))
-                rows = cursor.fetchall()
-
-                eventos = [EventosUnificadosDTO.from_row(row) for row in rows]
-                logger.debug(f"Obtenidos {len(eventos)} eventos de tipo '{tipo_evento}'")
-                return eventos
-
-        except Error as ex:
-            logger.error(f"Error al obtener eventos por tipo: {ex}")
-            return []
+        sql = """
+        SELECT tipo_evento, id_evento, titulo, descripcion,
+               fecha_inicio, fecha_fin, tipo_actividad, observaciones,
+               carrera, id_carrera, asignatura, id_asignatura
+        FROM vw_eventos_unificados
+        WHERE tipo_evento = ?
+        ORDER BY fecha_inicio ASC;
+        """
+        eventos = self.consultar_dtos(sql, (tipo_evento,), EventosUnificadosDTO)
+        logger.debug("Obtenidos %s eventos de tipo '%s'", len(eventos), tipo_evento)
+        return eventos
 
     def obtener_por_mes(self, ano: int, mes: int) -> List[EventosUnificadosDTO]:
         """
         Obtiene eventos de un mes específico.
 
+        El resultado se guarda en la caché de consultas hasta que cambien los datos.
+
         Args:
             ano (int): Año (ej: 2026)
             mes (int): Mes (1-12)
@@ -248,36 +550,48 @@ class EventosUnificadosDAO(DAO):
         Returns:
             List[EventosUnificadosDTO]: Lista de eventos del mes.
         """
-        try:
-            with self.get_conexion() as con:
-                cursor = con.cursor()
-
-                # Construir fechas de inicio y fin del mes
-                fecha_inicio = f"{ano:04d}-{mes:02d}-01"
-                if mes == 12:
-                    fecha_fin = f"{ano + 1:04d}-01-01"
-                else:
-                    fecha_fin = f"{ano:04d}-{mes + 1:02d}-01"
-
-                sql = """
-                SELECT tipo_evento, id_evento, titulo, descripcion,
-                       fecha_inicio, fecha_fin, tipo_actividad, observaciones,
-                       carrera, id_carrera, asignatura, id_asignatura
-                FROM vw_eventos_unificados
-                WHERE fecha_inicio >= ? AND fecha_inicio < ?
-                ORDER BY fecha_inicio ASC;
-                """
-
-                cursor.execute(sql, (fecha_inicio, fecha_fin))
-                rows = cursor.fetchall()
-
-                eventos = [EventosUnificadosDTO.from_row(row) for row in rows]
-                logger.debug(f"Obtenidos {len(eventos)} eventos para {ano}-{mes:02d}")
-                return eventos
-
-        except Error as ex:
-            logger.error(f"Error al obtener eventos por mes: {ex}")
-            return []
+        # Construir fechas de inicio y fin del mes
+        fecha_inicio = f"{ano:04d}-{mes:02d}-01"
+        if mes == 12:
+            fecha_fin = f"{ano + 1:04d}-01-01"
+        else:
+            fecha_fin = f"{ano:04d}-{mes + 1:02d}-01"
+
+        sql = """
+        SELECT tipo_evento, id_evento, titulo, descripcion,
+               fecha_inicio, fecha_fin, tipo_actividad, observaciones,
+               carrera, id_carrera, asignatura, id_asignatura
+        FROM vw_eventos_unificados
+        WHERE fecha_inicio >= ? AND fecha_inicio < ?
+        ORDER BY fecha_inicio ASC;
+        """
+        eventos = self.consultar_cacheado(sql, (fecha_inicio, fecha_fin), EventosUnificadosDTO)
+        logger.debug("Obtenidos %s eventos para %s-%02d", len(eventos), ano, mes)
+        return eventos
+
+    def obtener_por_inicio_entre(
+        self, fecha_desde: str, fecha_hasta: str
+    ) -> List[EventosUnificadosDTO]:
+        """
+        Obtiene los eventos que comienzan en [fecha_desde, fecha_hasta), con el
+        mismo criterio que `obtener_por_mes` pero para varios meses a la vez.
+
+        Args:
+            fecha_desde (str): Primer día incluido (YYYY-MM-DD).
+            fecha_hasta (str): Primer día excluido (YYYY-MM-DD).
+
+        Returns:
+            List[EventosUnificadosDTO]: Eventos ordenados por fecha de inicio.
+        """
+        sql = """
+        SELECT tipo_evento, id_evento, titulo, descripcion,
+               fecha_inicio, fecha_fin, tipo_actividad, observaciones,
+               carrera, id_carrera, asignatura, id_asignatura
+        FROM vw_eventos_unificados
+        WHERE fecha_inicio >= ? AND fecha_inicio < ?
+        ORDER BY fecha_inicio ASC;
+        """
+        return self.consultar_dtos(sql, (fecha_desde, fecha_hasta), EventosUnificadosDTO)
 
     def obtener_actividades(self) -> List[EventosUnificadosDTO]:
         """
@@ -299,7 +613,8 @@ class EventosUnificadosDAO(DAO):
 
     def obtener_eventos_proximos(self, dias: int = 7) -> List[EventosUnificadosDTO]:
         """
-        Obtiene eventos de los próximos N días.
+        Obtiene eventos de los próximos N días, incluidos los que ya
+        empezaron y siguen en curso.
 
         Args:
             dias (int): Número de días a considerar. Por defecto 7.
@@ -313,9 +628,9 @@ class EventosUnificadosDAO(DAO):
             hoy = datetime.now().date()
             fin = hoy + timedelta(days=dias)
 
-            return self.obtener_por_rango_fechas(str(hoy), str(fin))
+            return self.obtener_por_solapamiento(str(hoy), str(fin))
         except Exception as ex:
-            logger.error(f"Error al obtener eventos próximos: {ex}")
+            logger.error("Error al obtener eventos próximos: %s", ex)
             return []
 
     def obtener_por_tipo_actividad(self, tipo_actividad: str) -> List[EventosUnificadosDTO]:
@@ -328,31 +643,17 @@ class EventosUnificadosDAO(DAO):
         Returns:
             List[EventosUnificadosDTO]: Lista de eventos del tipo especificado.
         """
-        try:
-            with self.get_conexion() as con:
-                cursor = con.cursor()
-
-                sql = """
-                SELECT tipo_evento, id_evento, titulo, descripcion,
-                       fecha_inicio, fecha_fin, tipo_actividad, observaciones,
-                       carrera, id_carrera, asignatura, id_asignatura
-                FROM vw_eventos_unificados
-                WHERE tipo_actividad = ?
-                ORDER BY fecha_inicio ASC;
-                """
-
-                cursor.execute(sql, (tipo_actividad,))
-                rows = cursor.fetchall()
-
-                eventos = [EventosUnificadosDTO.from_row(row) for row in rows]
-                logger.debug(
-                    f"Obtenidos {len(eventos)} eventos de tipo actividad '{tipo_actividad}'"
-                )
-                return eventos
-
-        except Error as ex:
-            logger.error(f"Error al obtener eventos por tipo de actividad: {ex}")
-            return []
+        sql = """
+        SELECT tipo_evento, id_evento, titulo, descripcion,
+               fecha_inicio, fecha_fin, tipo_actividad, observaciones,
+               carrera, id_carrera, asignatura, id_asignatura
+        FROM vw_eventos_unificados
+        WHERE tipo_actividad = ?
+        ORDER BY fecha_inicio ASC;
+        """
+        eventos = self.consultar_dtos(sql, (tipo_actividad,), EventosUnificadosDTO)
+        logger.debug("Obtenidos %s eventos de tipo actividad '%s'", len(eventos), tipo_actividad)
+        return eventos
 
     def obtener_por_id(self, id_evento: int, tipo: str) -> Optional[EventosUnificadosDTO]:
         """
@@ -365,27 +666,15 @@ class EventosUnificadosDAO(DAO):
         Returns:
             Optional[EventosUnificadosDTO]: El evento si existe, None en caso contrario.
         """
-        try:
-            with self.get_conexion() as con:
-                cursor = con.cursor()
-
-                sql = """
-                SELECT tipo_evento, id_evento, titulo, descripcion,
-                       fecha_inicio, fecha_fin, tipo_actividad, observaciones,
-                       carrera, id_carrera, asignatura, id_asignatura
-                FROM vw_eventos_unificados
-                WHERE id_evento = ? AND tipo_evento = ?;
-                """
-
-                cursor.execute(sql, (id_evento, tipo))
-                row = cursor.fetchone()
-
-                if row:
-                    return EventosUnificadosDTO.from_row(row)
-
-                logger.debug(f"Evento {tipo}:{id_evento} no encontrado")
-                return None
-
-        except Error as ex:
-            logger.error(f"Error al obtener evento por ID: {ex}")
-            return None
+        sql = """
+        SELECT tipo_evento, id_evento, titulo, descripcion,
+               fecha_inicio, fecha_fin, tipo_actividad, observaciones,
+               carrera, id_carrera, asignatura, id_asignatura
+        FROM vw_eventos_unificados
+        WHERE id_evento = ? AND tipo_evento = ?;
+        """
+        eventos = self.consultar_dtos(sql, (id_evento, tipo), EventosUnificadosDTO)
+        if eventos:
+            return eventos[0]
+        logger.debug("Evento %s:%s no encontrado", tipo, id_evento)
+        return None
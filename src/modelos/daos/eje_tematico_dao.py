@@ -1,5 +1,6 @@
 from modelos.dtos.eje_tematico_dto import EjeTematicoDTO
 from modelos.daos.base_dao import DAO
+from modelos.daos.esquema import inicializar_esquema
 from typing import Optional, List, Dict, Any
 from sqlite3 import Error
 from scripts.logging_config import obtener_logger_modulo
@@ -8,11 +9,21 @@ logger = obtener_logger_modulo(__name__)
 
 
 class EjeTematicoDAO(DAO):
+    _TABLA = "eje_tematico"
+    _CLAVE = ("id_eje",)
+    _CLASE_DTO = EjeTematicoDTO
+    _SQL_INSERTAR = """INSERT INTO eje_tematico (nombre, orden, id_asignatura)
+                 VALUES (?, ?, ?)"""
+    _SQL_ACTUALIZAR = """UPDATE eje_tematico 
+                 SET nombre = ?, orden = ?, id_asignatura = ?
+                 WHERE id_eje = ?"""
+    _SQL_ELIMINAR = "DELETE FROM eje_tematico WHERE id_eje = ?"
+
     def __init__(self, ruta_db=None):
         super().__init__(ruta_db)
 
-        # creamos la tabla
-        self.crear_tabla()
+        # las tablas se crean una sola vez por base de datos
+        inicializar_esquema(ruta_db)
 
     def crear_tabla(self, sql: Optional[str] = None) -> bool:
         """
@@ -48,11 +59,7 @@ class EjeTematicoDAO(DAO):
         Returns:
             Optional[int]: ID del registro insertado o None si hay error.
         """
-        sql = """INSERT INTO eje_tematico (nombre, orden, id_asignatura)
-                 VALUES (?, ?, ?)"""
-        params = (dto.nombre, dto.orden, dto.id_asignatura)
-
-        return self.ejecutar_insertar(sql, params)
+        return self.ejecutar_insertar(self._SQL_INSERTAR, self._params_insertar(dto))
 
     def actualizar(self, dto: EjeTematicoDTO) -> bool:
         """
@@ -64,12 +71,7 @@ class EjeTematicoDAO(DAO):
         Returns:
             bool: True si se actualizó correctamente, False en caso contrario.
         """
-        sql = """UPDATE eje_tematico 
-                 SET nombre = ?, orden = ?, id_asignatura = ?
-                 WHERE id_eje = ?"""
-        params = (dto.nombre, dto.orden, dto.id_asignatura, dto.id_eje)
-
-        return self.ejecutar_actualizacion(sql, params)
+        return self.ejecutar_actualizacion(self._SQL_ACTUALIZAR, self._params_actualizar(dto))
 
     def eliminar(self, dto: EjeTematicoDTO) -> bool:
         """
@@ -81,10 +83,16 @@ class EjeTematicoDAO(DAO):
         Returns:
             bool: True si se eliminó correctamente, False en caso contrario.
         """
-        sql = "DELETE FROM eje_tematico WHERE id_eje = ?"
-        params = (dto.id_eje,)
+        return self.ejecutar_actualizacion(self._SQL_ELIMINAR, self._params_eliminar(dto))
 
-        return self.ejecutar_actualizacion(sql, params)
+    def _params_insertar(self, dto: EjeTematicoDTO) -> tuple:
+        return (dto.nombre, dto.orden, dto.id_asignatura)
+
+    def _params_actualizar(self, dto: EjeTematicoDTO) -> tuple:
+        return (dto.nombre, dto.orden, dto.id_asignatura, dto.id_eje)
+
+    def _params_eliminar(self, dto: EjeTematicoDTO) -> tuple:
+        return (dto.id_eje,)
 
     def instanciar(self, dto: EjeTematicoDTO) -> bool:
         """
@@ -99,12 +107,7 @@ class EjeTematicoDAO(DAO):
         if dto.id_eje != 0 and dto.id_eje is not None:
             sql = "SELECT * FROM eje_tematico WHERE id_eje = ?"
             params = (dto.id_eje,)
-            lista_data = self.ejecutar_consulta(sql, params)
-            if lista_data:
-                data = lista_data[0]
-                dto.set_data(data=data)
-                return True
-            return False
+            return self.consultar_en_dto(sql, params, dto)
         else:
             logger.warning("ID de eje temático no válido para instanciar")
             return False
@@ -147,3 +150,20 @@ class EjeTematicoDAO(DAO):
         if self.instanciar(dto):
             return dto
         return None
+
+    def obtener_nombres_carrera(self) -> Dict[int, str]:
+        """
+        Obtiene el nombre de la carrera de cada eje temático
+        (eje -> asignatura -> carrera) en una sola consulta.
+
+        Returns:
+            Dict[int, str]: Nombre de la carrera indexado por id_eje.
+        """
+        sql = """
+            SELECT et.id_eje, c.nombre
+            FROM eje_tematico et
+            INNER JOIN asignatura a ON et.id_asignatura = a.id_asignatura
+            INNER JOIN carrera c ON a.id_carrera = c.id_carrera
+        """
+        filas = self.ejecutar_consulta(sql)
+        return {fila["id_eje"]: fila["nombre"] for fila in filas}
@@ -0,0 +1,116 @@
+import sqlite3
+from typing import Optional
+from modelos.daos.conexion_sqlite import ConexionSQLite
+from scripts.logging_config import obtener_logger_modulo
+
+logger = obtener_logger_modulo(__name__)
+
+# ┌────────────────────────────────────────────────────────────┐
+# │ Bootstrap del esquema
+# └────────────────────────────────────────────────────────────┘
+#
+# Las tablas se crean una sola vez por base de datos. La versión aplicada se
+# guarda en `PRAGMA user_version`; si coincide con VERSION_ESQUEMA no se ejecuta
+# ningún DDL. Dentro del proceso, una vez verificada la base de datos, construir
+# DAOs o servicios no ejecuta SQL.
+#
+# Al modificar el DDL de alguna tabla hay que incrementar VERSION_ESQUEMA.
+
+VERSION_ESQUEMA = 4
+
+
+def _clases_dao() -> list:
+    """
+    DAOs cuyas tablas forman el esquema, en orden de dependencias
+    (las tablas referenciadas por claves foráneas van primero).
+    """
+    # Importación diferida: los DAOs importan este módulo
+    from modelos.daos.carrera_dao import CarreraDAO
+    from modelos.daos.asignatura_dao import AsignaturaDAO
+    from modelos.daos.prerequisito_dao import PrerrequisitoDAO
+    from modelos.daos.eje_tematico_dao import EjeTematicoDAO
+    from modelos.daos.tipo_actividad_dao import TipoActividadDAO
+    from modelos.daos.actividad_dao import ActividadDAO
+    from modelos.daos.calendario_evento_dao import CalendarioEventoDAO
+    from modelos.daos.estudiante_dao import EstudianteDAO
+    from modelos.daos.estudiante_carrera_dao import EstudianteCarreraDAO
+    from modelos.daos.estudiante_asignatura_dao import EstudianteAsignaturaDAO
+    from modelos.daos.estudiante_actividad_dao import EstudianteActividadDAO
+    from modelos.daos.actividad_detallada_dao import ActividadDetalladaDAO
+    from modelos.daos.busqueda_dao import BusquedaDAO
+    from modelos.daos.intervalo_evento_dao import IntervaloEventoDAO
+
+    return [
+        CarreraDAO,
+        AsignaturaDAO,
+        PrerrequisitoDAO,
+        EjeTematicoDAO,
+        TipoActividadDAO,
+        ActividadDAO,
+        CalendarioEventoDAO,
+        EstudianteDAO,
+        EstudianteCarreraDAO,
+        EstudianteAsignaturaDAO,
+        EstudianteActividadDAO,
+        # Tabla materializada: sus triggers referencian a todas las anteriores
+        ActividadDetalladaDAO,
+        # Índices de texto completo de actividad, asignatura y estudiante
+        BusquedaDAO,
+        # R*Tree de los intervalos de fechas de actividad y calendario_evento
+        IntervaloEventoDAO,
+    ]
+
+
+def version_esquema(ruta_db: Optional[str] = None) -> int:
+    """
+    Retorna la versión de esquema registrada en la base de datos (0 si nunca se inicializó).
+    """
+    db = ConexionSQLite(ruta_db)
+    with db.conexion_prestada() as con:
+        return con.execute("PRAGMA user_version").fetchone()[0]
+
+
+def inicializar_esquema(ruta_db: Optional[str] = None, forzar: bool = False) -> bool:
+    """
+    Crea todas las tablas de la aplicación si la base de datos no está en
+    VERSION_ESQUEMA.
+
+    La primera llamada del proceso para cada base de datos lee `PRAGMA user_version`
+    y, solo si hace falta, ejecuta todos los CREATE TABLE en una única transacción.
+    Las llamadas siguientes retornan sin ejecutar SQL.
+
+    Args:
+        ruta_db (Optional[str]): Ruta a la base de datos. Si es None, usa RUTA_DB.
+        forzar (bool): Ejecuta el DDL aunque la versión ya esté al día.
+
+    Returns:
+        bool: True si el esquema está listo, False si hubo un error al crearlo.
+    """
+    db = ConexionSQLite(ruta_db)
+    if db.esquema_listo and not forzar:
+        return True
+
+    with db.lock_esquema:
+        # Los DAOs construidos durante el bootstrap vuelven a entrar aquí
+        if db.esquema_en_curso or (db.esquema_listo and not forzar):
+            return True
+
+        db.esquema_en_curso = True
+        try:
+            if not forzar and version_esquema(ruta_db) >= VERSION_ESQUEMA:
+                db.esquema_listo = True
+                return True
+
+            logger.info(f"Inicializando esquema v{VERSION_ESQUEMA}")
+            with db.transaccion() as con:
+                for clase_dao in _clases_dao():
+                    clase_dao(ruta_db=ruta_db).crear_tabla()
+                con.execute(f"PRAGMA user_version = {VERSION_ESQUEMA}")
+
+            db.esquema_listo = True
+            return True
+        except sqlite3.Error as ex:
+            logger.error(f"Error al inicializar el esquema: {ex}")
+            return False
+        finally:
+            db.esquema_en_curso = False
@@ -1,5 +1,6 @@
 from modelos.dtos.estudiante_actividad_dto import EstudianteActividadDTO
 from modelos.daos.base_dao import DAO
+from modelos.daos.esquema import inicializar_esquema
 from typing import Optional, List, Dict, Any
 from sqlite3 import Error
 from scripts.logging_config import obtener_logger_modulo
@@ -8,11 +9,21 @@ logger = obtener_logger_modulo(__name__)
 
 
 class EstudianteActividadDAO(DAO):
+    _TABLA = "estudiante_actividad"
+    _CLAVE = ("id_estudiante", "id_actividad")
+    _CLASE_DTO = EstudianteActividadDTO
+    _SQL_INSERTAR = """INSERT INTO estudiante_actividad (id_estudiante, id_actividad, estado, fecha_entrega)
+                 VALUES (?, ?, ?, ?)"""
+    _SQL_ACTUALIZAR = """UPDATE estudiante_actividad 
+                 SET estado = ?, fecha_entrega = ?
+                 WHERE id_estudiante = ? AND id_actividad = ?"""
+    _SQL_ELIMINAR = "DELETE FROM estudiante_actividad WHERE id_estudiante = ? AND id_actividad = ?"
+
     def __init__(self, ruta_db=None):
         super().__init__(ruta_db)
 
-        # creamos la tabla
-        self.crear_tabla()
+        # las tablas se crean una sola vez por base de datos
+        inicializar_esquema(ruta_db)
 
     def crear_tabla(self, sql: Optional[str] = None) -> bool:
         """
@@ -54,11 +65,7 @@ class EstudianteActividadDAO(DAO):
         Returns:
             bool: True si se insertó correctamente, False en caso de error.
         """
-        sql = """INSERT INTO estudiante_actividad (id_estudiante, id_actividad, estado, fecha_entrega)
-                 VALUES (?, ?, ?, ?)"""
-        params = (dto.id_estudiante, dto.id_actividad, dto.estado, dto.fecha_entrega)
-
-        resultado = self.ejecutar_insertar(sql, params)
+        resultado = self.ejecutar_insertar(self._SQL_INSERTAR, self._params_insertar(dto))
         return resultado is not None
 
     def eliminar(self, dto: EstudianteActividadDTO) -> bool:
@@ -71,10 +78,21 @@ class EstudianteActividadDAO(DAO):
         Returns:
             bool: True si se eliminó correctamente, False en caso contrario.
         """
-        sql = "DELETE FROM estudiante_actividad WHERE id_estudiante = ? AND id_actividad = ?"
-        params = (dto.id_estudiante, dto.id_actividad)
+        return self.ejecutar_actualizacion(self._SQL_ELIMINAR, self._params_eliminar(dto))
+
+    def _params_insertar(self, dto: EstudianteActividadDTO) -> tuple:
+        return (dto.id_estudiante, dto.id_actividad, dto.estado, dto.fecha_entrega)
+
+    def _params_actualizar(self, dto: EstudianteActividadDTO) -> tuple:
+        return (
+            dto.estado,
+            dto.fecha_entrega,
+            dto.id_estudiante,
+            dto.id_actividad,
+        )
 
-        return self.ejecutar_actualizacion(sql, params)
+    def _params_eliminar(self, dto: EstudianteActividadDTO) -> tuple:
+        return (dto.id_estudiante, dto.id_actividad)
 
     def instanciar(self, dto: EstudianteActividadDTO) -> bool:
         """
@@ -94,12 +112,7 @@ class EstudianteActividadDAO(DAO):
         ):
             sql = "SELECT * FROM estudiante_actividad WHERE id_estudiante = ? AND id_actividad = ?"
             params = (dto.id_estudiante, dto.id_actividad)
-            lista_data = self.ejecutar_consulta(sql, params)
-            if lista_data:
-                data = lista_data[0]
-                dto.set_data(data=data)
-                return True
-            return False
+            return self.consultar_en_dto(sql, params, dto)
         else:
             logger.warning("IDs de estudiante-actividad no válidos para instanciar")
             return False
@@ -143,14 +156,4 @@ class EstudianteActividadDAO(DAO):
         Returns:
             bool: True si se actualizó correctamente, False en caso contrario.
         """
-        sql = """UPDATE estudiante_actividad 
-                 SET estado = ?, fecha_entrega = ?
-                 WHERE id_estudiante = ? AND id_actividad = ?"""
-        params = (
-            dto.estado,
-            dto.fecha_entrega,
-            dto.id_estudiante,
-            dto.id_actividad,
-        )
-
-        return self.ejecutar_actualizacion(sql, params)
+        return self.ejecutar_actualizacion(self._SQL_ACTUALIZAR, self._params_actualizar(dto))
@@ -1,5 +1,6 @@
 from modelos.dtos.estudiante_asignatura_dto import EstudianteAsignaturaDTO
 from modelos.daos.base_dao import DAO
+from modelos.daos.esquema import inicializar_esquema
 from typing import Optional, List, Dict, Any
 from sqlite3 import Error
 from scripts.logging_config import obtener_logger_modulo
@@ -8,11 +9,21 @@ logger = obtener_logger_modulo(__name__)
 
 
 class EstudianteAsignaturaDAO(DAO):
+    _TABLA = "estudiante_asignatura"
+    _CLAVE = ("id_estudiante", "id_asignatura")
+    _CLASE_DTO = EstudianteAsignaturaDTO
+    _SQL_INSERTAR = """INSERT INTO estudiante_asignatura (id_estudiante, id_asignatura, estado, nota_final, periodo)
+                 VALUES (?, ?, ?, ?, ?)"""
+    _SQL_ACTUALIZAR = """UPDATE estudiante_asignatura 
+                 SET estado = ?, nota_final = ?, periodo = ?
+                 WHERE id_estudiante = ? AND id_asignatura = ?"""
+    _SQL_ELIMINAR = "DELETE FROM estudiante_asignatura WHERE id_estudiante = ? AND id_asignatura = ?"
+
     def __init__(self, ruta_db=None):
         super().__init__(ruta_db)
 
-        # creamos la tabla
-        self.crear_tabla()
+        # las tablas se crean una sola vez por base de datos
+        inicializar_esquema(ruta_db)
 
     def crear_tabla(self, sql: Optional[str] = None) -> bool:
         """
@@ -55,23 +66,14 @@ class EstudianteAsignaturaDAO(DAO):
         Returns:
             bool: True si se insertó correctamente, False en caso de error.
         """
-        sql = """INSERT INTO estudiante_asignatura (id_estudiante, id_asignatura, estado, nota_final, periodo)
-                 VALUES (?, ?, ?, ?, ?)"""
-        params = (
-            dto.id_estudiante,
-            dto.id_asignatura,
-            dto.estado,
-            dto.nota_final,
-            dto.periodo,
-        )
-
-        logger.info(f"DAO insertar - SQL: {sql}")
-        logger.info(f"DAO insertar - Params: {params}")
+        params = self._params_insertar(dto)
+        logger.debug("DAO insertar - SQL: %s", self._SQL_INSERTAR)
+        logger.debug("DAO insertar - Params: %s", params)
 
-        resultado = self.ejecutar_insertar(sql, params)
+        resultado = self.ejecutar_insertar(self._SQL_INSERTAR, params)
         resultado_bool = resultado is not None
 
-        logger.info(f"DAO insertar - Resultado: {resultado_bool}")
+        logger.info("DAO insertar - Resultado: %s", resultado_bool)
 
         return resultado_bool
 
@@ -85,10 +87,28 @@ class EstudianteAsignaturaDAO(DAO):
         Returns:
             bool: True si se eliminó correctamente, False en caso contrario.
         """
-        sql = "DELETE FROM estudiante_asignatura WHERE id_estudiante = ? AND id_asignatura = ?"
-        params = (dto.id_estudiante, dto.id_asignatura)
+        return self.ejecutar_actualizacion(self._SQL_ELIMINAR, self._params_eliminar(dto))
 
-        return self.ejecutar_actualizacion(sql, params)
+    def _params_insertar(self, dto: EstudianteAsignaturaDTO) -> tuple:
+        return (
+            dto.id_estudiante,
+            dto.id_asignatura,
+            dto.estado,
+            dto.nota_final,
+            dto.periodo,
+        )
+
+    def _params_actualizar(self, dto: EstudianteAsignaturaDTO) -> tuple:
+        return (
+            dto.estado,
+            dto.nota_final,
+            dto.periodo,
+            dto.id_estudiante,
+            dto.id_asignatura,
+        )
+
+    def _params_eliminar(self, dto: EstudianteAsignaturaDTO) -> tuple:
+        return (dto.id_estudiante, dto.id_asignatura)
 
     def instanciar(self, dto: EstudianteAsignaturaDTO) -> bool:
         """
@@ -110,12 +130,7 @@ class EstudianteAsignaturaDAO(DAO):
                 "SELECT * FROM estudiante_asignatura WHERE id_estudiante = ? AND id_asignatura = ?"
             )
             params = (dto.id_estudiante, dto.id_asignatura)
-            lista_data = self.ejecutar_consulta(sql, params)
-            if lista_data:
-                data = lista_data[0]
-                dto.set_data(data=data)
-                return True
-            return False
+            return self.consultar_en_dto(sql, params, dto)
         else:
             logger.warning("IDs de estudiante-asignatura no válidos para instanciar")
             return False
@@ -139,16 +154,16 @@ class EstudianteAsignaturaDAO(DAO):
             sql = "SELECT COUNT(*) as count FROM estudiante_asignatura WHERE id_estudiante = ? AND id_asignatura = ?"
             params = (dto.id_estudiante, dto.id_asignatura)
 
-            logger.info(f"DAO existe - SQL: {sql}")
-            logger.info(f"DAO existe - Params: {params}")
+            logger.debug("DAO existe - SQL: %s", sql)
+            logger.debug("DAO existe - Params: %s", params)
 
             try:
                 resultado = self.ejecutar_consulta(sql, params)
                 existe = len(resultado) > 0 and resultado[0].get('count', 0) > 0
-                logger.info(f"DAO existe - Resultado consulta: {resultado}, Existe: {existe}")
+                logger.debug("DAO existe - Resultado consulta: %s, Existe: %s", resultado, existe)
                 return existe
             except Error as ex:
-                logger.error(f"Error al verificar existencia: {ex}", exc_info=True)
+                logger.error("Error al verificar existencia: %s", ex, exc_info=True)
                 return False
         else:
             logger.warning("IDs de estudiante-asignatura no válidos para verificar existencia")
@@ -164,21 +179,41 @@ class EstudianteAsignaturaDAO(DAO):
         Returns:
             bool: True si se actualizó correctamente, False en caso contrario.
         """
-        sql = """UPDATE estudiante_asignatura 
-                 SET estado = ?, nota_final = ?, periodo = ?
-                 WHERE id_estudiante = ? AND id_asignatura = ?"""
-        params = (
-            dto.estado,
-            dto.nota_final,
-            dto.periodo,
-            dto.id_estudiante,
-            dto.id_asignatura,
-        )
-
-        logger.info(f"DAO actualizar - SQL: {sql}")
-        logger.info(f"DAO actualizar - Params: {params}")
+        params = self._params_actualizar(dto)
+        logger.debug("DAO actualizar - SQL: %s", self._SQL_ACTUALIZAR)
+        logger.debug("DAO actualizar - Params: %s", params)
 
-        resultado = self.ejecutar_actualizacion(sql, params)
-        logger.info(f"DAO actualizar - Resultado: {resultado}")
+        resultado = self.ejecutar_actualizacion(self._SQL_ACTUALIZAR, params)
+        logger.info("DAO actualizar - Resultado: %s", resultado)
 
         return resultado
+
+    def obtener_notas_finales(self) -> List[Dict[str, Any]]:
+        """
+        Obtiene todas las notas finales cargadas con la carrera de su asignatura.
+
+        Returns:
+            List[Dict[str, Any]]: Filas con id_estudiante, id_asignatura,
+                id_carrera y nota_final (solo las que tienen nota).
+        """
+        sql = """
+            SELECT ea.id_estudiante, ea.id_asignatura, a.id_carrera, ea.nota_final
+            FROM estudiante_asignatura ea
+            JOIN asignatura a ON a.id_asignatura = ea.id_asignatura
+            WHERE ea.nota_final IS NOT NULL
+        """
+        return self.ejecutar_consulta(sql)
+
+    def obtener_estados_por_estudiante(self, id_estudiante: int) -> Dict[int, str]:
+        """
+        Obtiene el estado de cada asignatura en la que está inscrito un estudiante.
+
+        Args:
+            id_estudiante (int): ID del estudiante.
+
+        Returns:
+            Dict[int, str]: Estado indexado por id_asignatura.
+        """
+        sql = "SELECT id_asignatura, estado FROM estudiante_asignatura WHERE id_estudiante = ?"
+        filas = self.ejecutar_consulta(sql, (id_estudiante,))
+        return {fila["id_asignatura"]: fila["estado"] for fila in filas}
@@ -1,5 +1,6 @@
 from modelos.dtos.estudiante_carrera_dto import EstudianteCarreraDTO
 from modelos.daos.base_dao import DAO
+from modelos.daos.esquema import inicializar_esquema
 from typing import Optional, List, Dict, Any
 from sqlite3 import Error
 from scripts.logging_config import obtener_logger_modulo
@@ -8,9 +9,24 @@ logger = obtener_logger_modulo(__name__)
 
 
 class EstudianteCarreraDAO(DAO):
+    _TABLA = "estudiante_carrera"
+    _CLAVE = ("id_estudiante", "id_carrera")
+    _CLASE_DTO = EstudianteCarreraDTO
+    _SQL_INSERTAR = """INSERT INTO estudiante_carrera 
+                 (id_estudiante, id_carrera, estado, fecha_inscripcion, fecha_inicio, 
+                  fecha_fin, es_carrera_principal, periodo_ingreso, observaciones)
+                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+    _SQL_ACTUALIZAR = """UPDATE estudiante_carrera 
+                 SET estado = ?, fecha_inscripcion = ?, fecha_inicio = ?, 
+                     fecha_fin = ?, es_carrera_principal = ?, periodo_ingreso = ?, 
+                     observaciones = ?
+                 WHERE id_estudiante = ? AND id_carrera = ?"""
+    _SQL_ELIMINAR = "DELETE FROM estudiante_carrera WHERE id_estudiante = ? AND id_carrera = ?"
+
     def __init__(self, ruta_db=None):
         super().__init__(ruta_db)
-        self.crear_tabla()
+        # las tablas se crean una sola vez por base de datos
+        inicializar_esquema(ruta_db)
 
     def crear_tabla(self, sql: Optional[str] = None) -> bool:
         """
@@ -57,23 +73,7 @@ class EstudianteCarreraDAO(DAO):
         Returns:
             Optional[int]: 1 si se insertó correctamente, None si hay error.
         """
-        sql = """INSERT INTO estudiante_carrera 
-                 (id_estudiante, id_carrera, estado, fecha_inscripcion, fecha_inicio, 
-                  fecha_fin, es_carrera_principal, periodo_ingreso, observaciones)
-                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
-        params = (
-            dto.id_estudiante,
-            dto.id_carrera,
-            dto.estado,
-            dto.fecha_inscripcion,
-            dto.fecha_inicio,
-            dto.fecha_fin,
-            dto.es_carrera_principal,
-            dto.periodo_ingreso,
-            dto.observaciones,
-        )
-
-        result = self.ejecutar_insertar(sql, params)
+        result = self.ejecutar_insertar(self._SQL_INSERTAR, self._params_insertar(dto))
         return result if result else None
 
     def actualizar(self, dto: EstudianteCarreraDTO) -> bool:
@@ -87,24 +87,7 @@ class EstudianteCarreraDAO(DAO):
         Returns:
             bool: True si se actualizó correctamente, False en caso contrario.
         """
-        sql = """UPDATE estudiante_carrera 
-                 SET estado = ?, fecha_inscripcion = ?, fecha_inicio = ?, 
-                     fecha_fin = ?, es_carrera_principal = ?, periodo_ingreso = ?, 
-                     observaciones = ?
-                 WHERE id_estudiante = ? AND id_carrera = ?"""
-        params = (
-            dto.estado,
-            dto.fecha_inscripcion,
-            dto.fecha_inicio,
-            dto.fecha_fin,
-            dto.es_carrera_principal,
-            dto.periodo_ingreso,
-            dto.observaciones,
-            dto.id_estudiante,
-            dto.id_carrera,
-        )
-
-        return self.ejecutar_actualizacion(sql, params)
+        return self.ejecutar_actualizacion(self._SQL_ACTUALIZAR, self._params_actualizar(dto))
 
     def eliminar(self, dto: EstudianteCarreraDTO) -> bool:
         """
@@ -116,10 +99,36 @@ class EstudianteCarreraDAO(DAO):
         Returns:
             bool: True si se eliminó correctamente, False en caso contrario.
         """
-        sql = "DELETE FROM estudiante_carrera WHERE id_estudiante = ? AND id_carrera = ?"
-        params = (dto.id_estudiante, dto.id_carrera)
+        return self.ejecutar_actualizacion(self._SQL_ELIMINAR, self._params_eliminar(dto))
+
+    def _params_insertar(self, dto: EstudianteCarreraDTO) -> tuple:
+        return (
+            dto.id_estudiante,
+            dto.id_carrera,
+            dto.estado,
+            dto.fecha_inscripcion,
+            dto.fecha_inicio,
+            dto.fecha_fin,
+            dto.es_carrera_principal,
+            dto.periodo_ingreso,
+            dto.observaciones,
+        )
 
-        return self.ejecutar_actualizacion(sql, params)
+    def _params_actualizar(self, dto: EstudianteCarreraDTO) -> tuple:
+        return (
+            dto.estado,
+            dto.fecha_inscripcion,
+            dto.fecha_inicio,
+            dto.fecha_fin,
+            dto.es_carrera_principal,
+            dto.periodo_ingreso,
+            dto.observaciones,
+            dto.id_estudiante,
+            dto.id_carrera,
+        )
+
+    def _params_eliminar(self, dto: EstudianteCarreraDTO) -> tuple:
+        return (dto.id_estudiante, dto.id_carrera)
 
     def instanciar(self, dto: EstudianteCarreraDTO) -> bool:
         """
@@ -135,12 +144,7 @@ class EstudianteCarreraDAO(DAO):
             sql = """SELECT * FROM estudiante_carrera 
                      WHERE id_estudiante = ? AND id_carrera = ?"""
             params = (dto.id_estudiante, dto.id_carrera)
-            lista_data = self.ejecutar_consulta(sql, params)
-            if lista_data:
-                data = lista_data[0]
-                dto.set_data(data=data)
-                return True
-            return False
+            return self.consultar_en_dto(sql, params, dto)
         else:
             logger.warning("IDs de estudiante y carrera requeridos para instanciar")
             return False
@@ -1,5 +1,6 @@
 from modelos.dtos.estudiante_dto import EstudianteDTO
 from modelos.daos.base_dao import DAO
+from modelos.daos.esquema import inicializar_esquema
 from typing import Optional, List, Dict, Any
 from sqlite3 import Error
 from scripts.logging_config import obtener_logger_modulo
@@ -8,11 +9,21 @@ logger = obtener_logger_modulo(__name__)
 
 
 class EstudianteDAO(DAO):
+    _TABLA = "estudiante"
+    _CLAVE = ("id_estudiante",)
+    _CLASE_DTO = EstudianteDTO
+    _SQL_INSERTAR = """INSERT INTO estudiante (nombre, correo)
+                 VALUES (?, ?)"""
+    _SQL_ACTUALIZAR = """UPDATE estudiante 
+                 SET nombre = ?, correo = ?
+                 WHERE id_estudiante = ?"""
+    _SQL_ELIMINAR = "DELETE FROM estudiante WHERE id_estudiante = ?"
+
     def __init__(self, ruta_db=None):
         super().__init__(ruta_db)
 
-        # creamos la tabla
-        self.crear_tabla()
+        # las tablas se crean una sola vez por base de datos
+        inicializar_esquema(ruta_db)
 
     def crear_tabla(self, sql: Optional[str] = None) -> bool:
         """
@@ -47,11 +58,7 @@ class EstudianteDAO(DAO):
         Note:
             Para asignar carreras al estudiante, usar EstudianteCarreraService después de insertar.
         """
-        sql = """INSERT INTO estudiante (nombre, correo)
-                 VALUES (?, ?)"""
-        params = (dto.nombre, dto.correo)
-
-        return self.ejecutar_insertar(sql, params)
+        return self.ejecutar_insertar(self._SQL_INSERTAR, self._params_insertar(dto))
 
     def actualizar(self, dto: EstudianteDTO) -> bool:
         """
@@ -67,12 +74,7 @@ class EstudianteDAO(DAO):
         Note:
             Para actualizar carreras, usar EstudianteCarreraService.
         """
-        sql = """UPDATE estudiante 
-                 SET nombre = ?, correo = ?
-                 WHERE id_estudiante = ?"""
-        params = (dto.nombre, dto.correo, dto.id_estudiante)
-
-        return self.ejecutar_actualizacion(sql, params)
+        return self.ejecutar_actualizacion(self._SQL_ACTUALIZAR, self._params_actualizar(dto))
 
     def eliminar(self, dto: EstudianteDTO) -> bool:
         """
@@ -84,10 +86,16 @@ class EstudianteDAO(DAO):
         Returns:
             bool: True si se eliminó correctamente, False en caso contrario.
         """
-        sql = "DELETE FROM estudiante WHERE id_estudiante = ?"
-        params = (dto.id_estudiante,)
+        return self.ejecutar_actualizacion(self._SQL_ELIMINAR, self._params_eliminar(dto))
 
-        return self.ejecutar_actualizacion(sql, params)
+    def _params_insertar(self, dto: EstudianteDTO) -> tuple:
+        return (dto.nombre, dto.correo)
+
+    def _params_actualizar(self, dto: EstudianteDTO) -> tuple:
+        return (dto.nombre, dto.correo, dto.id_estudiante)
+
+    def _params_eliminar(self, dto: EstudianteDTO) -> tuple:
+        return (dto.id_estudiante,)
 
     def instanciar(self, dto: EstudianteDTO) -> bool:
         """
@@ -102,12 +110,7 @@ class EstudianteDAO(DAO):
         if dto.id_estudiante != 0 and dto.id_estudiante is not None:
             sql = "SELECT * FROM estudiante WHERE id_estudiante = ?"
             params = (dto.id_estudiante,)
-            lista_data = self.ejecutar_consulta(sql, params)
-            if lista_data:
-                data = lista_data[0]
-                dto.set_data(data=data)
-                return True
-            return False
+            return self.consultar_en_dto(sql, params, dto)
         else:
             logger.warning("ID de estudiante no válido para instanciar")
             return False
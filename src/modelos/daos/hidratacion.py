@@ -0,0 +1,100 @@
+import dataclasses
+from functools import lru_cache
+from typing import Any, Callable, Optional, Sequence, Tuple, Type
+
+# ┌────────────────────────────────────────────────────────────┐
+# │ Hidratación directa de DTOs desde filas de sqlite3
+# └────────────────────────────────────────────────────────────┘
+#
+# Las funciones se generan una sola vez por combinación (clase DTO, columnas
+# de la consulta) y luego se reutilizan para cada fila. Así se evita crear un
+# diccionario intermedio por fila y la cadena de `data.get(...)` de `set_data`.
+
+
+def columnas_de(descripcion: Sequence[Sequence[Any]]) -> Tuple[str, ...]:
+    """
+    Extrae los nombres de columna de `cursor.description`.
+    """
+    return tuple(columna[0] for columna in descripcion)
+
+
+def _posiciones(clase_dto: Type[Any], columnas: Tuple[str, ...]) -> Tuple[Tuple[str, int], ...]:
+    """Empareja cada campo del DTO con la posición de la columna homónima."""
+    indice_columnas = {}
+    for posicion, nombre in enumerate(columnas):
+        # Ante columnas repetidas gana la primera, como en dict(row)
+        indice_columnas.setdefault(nombre, posicion)
+
+    return tuple(
+        (campo.name, indice_columnas[campo.name])
+        for campo in dataclasses.fields(clase_dto)
+        if campo.name in indice_columnas
+    )
+
+
+@lru_cache(maxsize=256)
+def compilar_hidratador(clase_dto: Type[Any], columnas: Tuple[str, ...]) -> Callable[[Sequence[Any]], Any]:
+    """
+    Retorna una función `fila -> DTO` que construye `clase_dto` leyendo cada
+    campo por posición.
+
+    Los campos del DTO sin columna en la consulta conservan su valor por defecto;
+    las columnas sin campo en el DTO se ignoran.
+
+    Args:
+        clase_dto (Type): Clase dataclass del DTO a construir.
+        columnas (Tuple[str, ...]): Nombres de columna de la consulta, en orden.
+
+    Returns:
+        Callable[[Sequence[Any]], Any]: Función que crea un DTO por fila.
+    """
+    argumentos = ", ".join(
+        f"{campo}=fila[{posicion}]" for campo, posicion in _posiciones(clase_dto, columnas)
+    )
+    codigo = f"def hidratar(fila):\n    return clase_dto({argumentos})\n"
+    espacio: dict = {}
+    exec(codigo, {"clase_dto": clase_dto}, espacio)
+    return espacio["hidratar"]
+
+
+@lru_cache(maxsize=256)
+def compilar_cargador(clase_dto: Type[Any], columnas: Tuple[str, ...]) -> Callable[[Any, Sequence[Any]], None]:
+    """
+    Retorna una función `(dto, fila) -> None` que asigna en un DTO existente
+    los campos presentes en la fila.
+
+    Equivale a `dto.set_data(dict(fila))` sin crear el diccionario.
+
+    Args:
+        clase_dto (Type): Clase del DTO (o de un servicio que hereda del DTO).
+        columnas (Tuple[str, ...]): Nombres de columna de la consulta, en orden.
+
+    Returns:
+        Callable[[Any, Sequence[Any]], None]: Función que carga una fila en un DTO.
+    """
+    asignaciones = [
+        f"    dto.{campo} = fila[{posicion}]\n"
+        for campo, posicion in _posiciones(clase_dto, columnas)
+    ]
+    codigo = "def cargar(dto, fila):\n" + ("".join(asignaciones) or "    pass\n")
+    espacio: dict = {}
+    exec(codigo, {}, espacio)
+    return espacio["cargar"]
+
+
+def hidratador_para(
+    clase_dto: Type[Any], descripcion: Optional[Sequence[Sequence[Any]]]
+) -> Callable[[Sequence[Any]], Any]:
+    """
+    Atajo de `compilar_hidratador` a partir de `cursor.description`.
+    """
+    return compilar_hidratador(clase_dto, columnas_de(descripcion or ()))
+
+
+def cargador_para(
+    clase_dto: Type[Any], descripcion: Optional[Sequence[Sequence[Any]]]
+) -> Callable[[Any, Sequence[Any]], None]:
+    """
+    Atajo de `compilar_cargador` a partir de `cursor.description`.
+    """
+    return compilar_cargador(clase_dto, columnas_de(descripcion or ()))
@@ -0,0 +1,132 @@
+import dataclasses
+from modelos.daos.base_dao import DAOMantenidoPorTriggers
+from modelos.daos.conexion_sqlite import ConexionSQLite
+from typing import Optional, List, Dict
+from sqlite3 import Error
+from scripts.logging_config import obtener_logger_modulo
+
+logger = obtener_logger_modulo(__name__)
+
+
+def sql_dia(expresion: str) -> str:
+    """
+    Número de día (juliano, entero) de una fecha SQL.
+
+    'start of day' hace que una fecha con hora caiga en el mismo día que la
+    fecha sola; así los intervalos se comparan por días completos.
+    """
+    return f"CAST(julianday({expresion}, 'start of day') AS INTEGER)"
+
+
+@dataclasses.dataclass(frozen=True)
+class _DefinicionIntervalo:
+    """Tabla con fecha_inicio / fecha_fin cuyo intervalo se indexa en un R*Tree."""
+
+    tabla: str
+    campo_id: str
+
+    @property
+    def tabla_rtree(self) -> str:
+        return f"{self.tabla}_intervalo"
+
+
+ACTIVIDAD = _DefinicionIntervalo('actividad', 'id_actividad')
+CALENDARIO_EVENTO = _DefinicionIntervalo('calendario_evento', 'id_evento')
+_INTERVALOS = (ACTIVIDAD, CALENDARIO_EVENTO)
+
+
+def _insertar_intervalo(definicion: _DefinicionIntervalo, fila: str, condicion: str = "1") -> str:
+    """
+    INSERT del intervalo de las filas de `definicion.tabla` (con alias `fila`).
+
+    Un R*Tree rechaza intervalos invertidos, por eso se ordenan los extremos;
+    las fechas que SQLite no puede interpretar no se indexan.
+    """
+    inicio = sql_dia(f"{fila}.fecha_inicio")
+    fin = sql_dia(f"{fila}.fecha_fin")
+    return f"""INSERT INTO {definicion.tabla_rtree} (id, inicio, fin)
+        SELECT id, MIN(inicio, fin), MAX(inicio, fin) FROM (
+            SELECT {fila}.{definicion.campo_id} AS id, {inicio} AS inicio, {fin} AS fin
+            FROM {definicion.tabla} {fila} WHERE {condicion}
+        )
+        WHERE inicio IS NOT NULL AND fin IS NOT NULL;"""
+
+
+def _sql_intervalo(definicion: _DefinicionIntervalo) -> List[str]:
+    """DDL del R*Tree de una tabla y de los triggers que lo sincronizan."""
+    rtree = definicion.tabla_rtree
+    tabla = definicion.tabla
+    campo_id = definicion.campo_id
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {rtree} USING rtree_i32(id, inicio, fin)",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_{rtree}_insertar AFTER INSERT ON {tabla}
+        BEGIN
+            {_insertar_intervalo(definicion, 'fila', f'fila.{campo_id} = NEW.{campo_id}')}
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_{rtree}_actualizar
+        AFTER UPDATE OF {campo_id}, fecha_inicio, fecha_fin ON {tabla}
+        BEGIN
+            DELETE FROM {rtree} WHERE id = OLD.{campo_id};
+            {_insertar_intervalo(definicion, 'fila', f'fila.{campo_id} = NEW.{campo_id}')}
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_{rtree}_eliminar AFTER DELETE ON {tabla}
+        BEGIN
+            DELETE FROM {rtree} WHERE id = OLD.{campo_id};
+        END""",
+    ]
+
+
+class IntervaloEventoDAO(DAOMantenidoPorTriggers):
+    """
+    DAO de los índices R*Tree sobre los intervalos [fecha_inicio, fecha_fin]
+    de actividad y calendario_evento.
+
+    Cada tabla tiene un R*Tree de una dimensión (`<tabla>_intervalo`) con el
+    intervalo en días julianos enteros; los triggers lo mantienen al día en la
+    misma transacción que la escritura. Con él, "eventos que se solapan con
+    una ventana" es una búsqueda logarítmica en lugar de recorrer las tablas
+    (ver EventosUnificadosDAO.obtener_por_solapamiento).
+    """
+
+    def crear_tabla(self, sql: Optional[str] = None) -> bool:
+        """
+        Crea los R*Tree con sus triggers y los llena desde las tablas de origen.
+
+        Se ejecuta desde el bootstrap del esquema, después de crear las tablas de origen.
+
+        Returns:
+            bool: True si se crearon correctamente, False en caso de error.
+        """
+        try:
+            with ConexionSQLite(self.ruta_db).transaccion() as con:
+                for definicion in _INTERVALOS:
+                    for sentencia in _sql_intervalo(definicion):
+                        con.execute(sentencia)
+                    con.execute(f"DELETE FROM {definicion.tabla_rtree}")
+                    con.execute(_insertar_intervalo(definicion, 'fila'))
+            return True
+        except Error as ex:
+            logger.error(f"Error al crear los índices de intervalos: {ex}", exc_info=True)
+            return False
+
+    def reconstruir(self) -> Optional[Dict[str, int]]:
+        """
+        Vuelve a generar los R*Tree desde las tablas de origen en una transacción.
+
+        Returns:
+            Optional[Dict[str, int]]: Intervalos indexados por tabla, o None si hubo un error.
+        """
+        try:
+            totales = {}
+            with ConexionSQLite(self.ruta_db).transaccion() as con:
+                for definicion in _INTERVALOS:
+                    con.execute(f"DELETE FROM {definicion.tabla_rtree}")
+                    con.execute(_insertar_intervalo(definicion, 'fila'))
+                    totales[definicion.tabla] = con.execute(
+                        f"SELECT COUNT(*) FROM {definicion.tabla_rtree}"
+                    ).fetchone()[0]
+            logger.info(f"Índices de intervalos reconstruidos: {totales}")
+            return totales
+        except Error as ex:
+            logger.error(f"Error al reconstruir los índices de intervalos: {ex}", exc_info=True)
+            return None
@@ -0,0 +1,413 @@
+import dataclasses
+import sqlite3
+import threading
+import time
+from sqlite3 import Connection
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from scripts.logging_config import obtener_logger_modulo
+
+logger = obtener_logger_modulo(__name__)
+
+# Políticas de verificación de salud de las conexiones prestadas
+VERIFICAR_SIEMPRE = "siempre"  # SELECT 1 en cada préstamo (comportamiento histórico)
+VERIFICAR_NUNCA = "nunca"  # Solo se detectan conexiones cerradas, sin ejecutar SQL
+VERIFICAR_INTERVALO = "intervalo"  # SELECT 1 si pasaron N segundos desde la última verificación
+VERIFICAR_TRAS_ERROR = "tras_error"  # SELECT 1 solo si la conexión falló en su último uso
+
+POLITICAS_VERIFICACION = (
+    VERIFICAR_SIEMPRE,
+    VERIFICAR_NUNCA,
+    VERIFICAR_INTERVALO,
+    VERIFICAR_TRAS_ERROR,
+)
+
+
+def conexion_cerrada(con: Connection) -> bool:
+    """
+    Indica si una conexión SQLite ya fue cerrada.
+
+    No ejecuta SQL: solo accede a un atributo que sqlite3 invalida al cerrar.
+    """
+    try:
+        con.total_changes
+        return False
+    except sqlite3.ProgrammingError:
+        return True
+
+
+def es_error_de_conexion(ex: BaseException) -> bool:
+    """
+    Indica si un error de sqlite3 invalida la conexión (y no solo la sentencia).
+
+    Una conexión que produjo uno de estos errores debe descartarse y
+    reemplazarse por una nueva en el siguiente préstamo.
+    """
+    if isinstance(ex, sqlite3.ProgrammingError):
+        return "closed" in str(ex).lower()
+    if isinstance(ex, (sqlite3.OperationalError, sqlite3.DatabaseError)):
+        mensaje = str(ex).lower()
+        return any(
+            fragmento in mensaje
+            for fragmento in ("disk i/o error", "unable to open", "malformed", "not a database")
+        )
+    return False
+
+
+@dataclasses.dataclass
+class EstadisticasPool:
+    """
+    Contadores de uso de un PoolConexiones.
+
+    Attributes:
+        creadas (int): Conexiones abiertas por el pool.
+        reutilizadas (int): Préstamos servidos con una conexión ya abierta.
+        esperas (int): Préstamos que tuvieron que esperar una conexión libre.
+        tiempo_espera_total (float): Segundos acumulados esperando conexiones.
+        agotamientos (int): Préstamos que fallaron por superar el tiempo de espera.
+        desalojadas (int): Conexiones cerradas por inactividad.
+        recuperadas (int): Conexiones reclamadas a threads que terminaron sin devolverlas.
+        descartadas (int): Conexiones cerradas explícitamente o por estar dañadas.
+        sondeos (int): Verificaciones de salud (SELECT 1) ejecutadas.
+        reconexiones (int): Conexiones reemplazadas porque fallaron una verificación.
+        en_uso (int): Conexiones prestadas en este momento.
+        disponibles (int): Conexiones libres en este momento.
+    """
+
+    creadas: int = 0
+    reutilizadas: int = 0
+    esperas: int = 0
+    tiempo_espera_total: float = 0.0
+    agotamientos: int = 0
+    desalojadas: int = 0
+    recuperadas: int = 0
+    descartadas: int = 0
+    sondeos: int = 0
+    reconexiones: int = 0
+    en_uso: int = 0
+    disponibles: int = 0
+
+
+class PoolConexiones:
+    """
+    Pool acotado de conexiones SQLite para un único archivo de base de datos.
+
+    Las conexiones se prestan con `obtener()` y se devuelven con `devolver()`.
+    Si el pool alcanzó su tamaño máximo, `obtener()` espera hasta que otra
+    conexión sea devuelta o hasta agotar `tiempo_espera`. Las conexiones libres
+    que superan `tiempo_inactividad` segundos sin usarse se cierran.
+
+    Antes de prestar una conexión reutilizada se aplica la política de
+    verificación configurada (ver `POLITICAS_VERIFICACION`); una conexión que
+    falla la verificación se descarta y se reemplaza por una nueva.
+    """
+
+    def __init__(
+        self,
+        fabrica: Callable[[], Connection],
+        tamano_maximo: int,
+        tiempo_espera: float,
+        tiempo_inactividad: float,
+        politica_verificacion: str = VERIFICAR_TRAS_ERROR,
+        intervalo_verificacion: float = 30.0,
+    ):
+        """
+        Args:
+            fabrica (Callable[[], Connection]): Función que abre y configura una conexión nueva.
+            tamano_maximo (int): Número máximo de conexiones abiertas a la vez.
+            tiempo_espera (float): Segundos a esperar por una conexión libre.
+            tiempo_inactividad (float): Segundos sin uso tras los cuales se cierra
+                una conexión libre.
+            politica_verificacion (str): Una de `POLITICAS_VERIFICACION`.
+            intervalo_verificacion (float): Segundos entre verificaciones con la
+                política `VERIFICAR_INTERVALO`.
+        """
+        if politica_verificacion not in POLITICAS_VERIFICACION:
+            raise ValueError(f"Política de verificación desconocida: {politica_verificacion}")
+        self._fabrica = fabrica
+        self.tamano_maximo = tamano_maximo
+        self.tiempo_espera = tiempo_espera
+        self.tiempo_inactividad = tiempo_inactividad
+        self.politica_verificacion = politica_verificacion
+        self.intervalo_verificacion = intervalo_verificacion
+
+        self._condicion = threading.Condition()
+        # Conexiones libres como (conexion, instante_ultimo_uso); la última es la más reciente
+        self._disponibles: List[Tuple[Connection, float]] = []
+        # Conexiones prestadas: id(conexion) -> (conexion, thread_propietario)
+        self._en_uso: Dict[int, Tuple[Connection, Optional[threading.Thread]]] = {}
+        # Conexiones abiertas o en proceso de apertura
+        self._total = 0
+        # Instante de la última verificación exitosa de cada conexión: id(conexion) -> instante
+        self._ultima_verificacion: Dict[int, float] = {}
+        # Conexiones que fallaron en su último uso y deben verificarse
+        self._sospechosas: Set[int] = set()
+        self._estadisticas = EstadisticasPool()
+
+    # ┌────────────────────────────────────────────────────────────┐
+    # │ Préstamo y devolución
+    # └────────────────────────────────────────────────────────────┘
+
+    def obtener(self, propietario: Optional[threading.Thread] = None) -> Connection:
+        """
+        Presta una conexión del pool, abriendo una nueva si hay capacidad.
+
+        Las conexiones reutilizadas pasan por la política de verificación; si
+        una falla se descarta y se presta otra.
+
+        Args:
+            propietario (Optional[threading.Thread]): Thread que retiene la conexión.
+                Si el thread termina sin devolverla, el pool puede recuperarla.
+
+        Returns:
+            Connection: Conexión lista para usar.
+
+        Raises:
+            sqlite3.OperationalError: Si no se libera ninguna conexión a tiempo.
+            sqlite3.Error: Si falla la apertura de una conexión nueva.
+        """
+        while True:
+            con, creada = self._prestar(propietario)
+            if creada or self.verificar(con):
+                return con
+            self.devolver(con, descartar=True)
+            with self._condicion:
+                self._estadisticas.reconexiones += 1
+
+    def _prestar(self, propietario: Optional[threading.Thread]) -> Tuple[Connection, bool]:
+        """Toma una conexión libre o abre una nueva. Retorna (conexion, fue_creada)."""
+        a_cerrar: List[Connection] = []
+        crear = False
+        con = None
+
+        with self._condicion:
+            a_cerrar.extend(self._extraer_inactivas(time.monotonic()))
+            inicio_espera = None
+
+            while True:
+                if self._disponibles:
+                    con, _ = self._disponibles.pop()
+                    self._estadisticas.reutilizadas += 1
+                    break
+                if self._total < self.tamano_maximo:
+                    # Reservamos el lugar y abrimos la conexión fuera del lock
+                    self._total += 1
+                    crear = True
+                    break
+                if self._recuperar_huerfanas():
+                    continue
+
+                ahora = time.monotonic()
+                if inicio_espera is None:
+                    inicio_espera = ahora
+                    self._estadisticas.esperas += 1
+                restante = self.tiempo_espera - (ahora - inicio_espera)
+                if restante <= 0:
+                    self._estadisticas.agotamientos += 1
+                    self._estadisticas.tiempo_espera_total += ahora - inicio_espera
+                    self._cerrar_conexiones(a_cerrar)
+                    raise sqlite3.OperationalError(
+                        f"Pool de conexiones agotado: {self.tamano_maximo} conexiones en uso"
+                    )
+                self._condicion.wait(restante)
+
+            if inicio_espera is not None:
+                self._estadisticas.tiempo_espera_total += time.monotonic() - inicio_espera
+
+            if not crear:
+                self._en_uso[id(con)] = (con, propietario)
+
+        self._cerrar_conexiones(a_cerrar)
+
+        if crear:
+            try:
+                con = self._fabrica()
+            except Exception:
+                with self._condicion:
+                    self._total -= 1
+                    self._condicion.notify()
+                raise
+            with self._condicion:
+                self._en_uso[id(con)] = (con, propietario)
+                self._ultima_verificacion[id(con)] = time.monotonic()
+                self._estadisticas.creadas += 1
+
+        return con, crear
+
+    def verificar(self, con: Connection) -> bool:
+        """
+        Aplica la política de verificación a una conexión prestada.
+
+        Returns:
+            bool: False si la conexión está cerrada o no responde a SELECT 1.
+        """
+        if conexion_cerrada(con):
+            return False
+
+        clave = id(con)
+        ahora = time.monotonic()
+        with self._condicion:
+            politica = self.politica_verificacion
+            if politica == VERIFICAR_SIEMPRE:
+                sondear = True
+            elif politica == VERIFICAR_INTERVALO:
+                ultima = self._ultima_verificacion.get(clave, 0.0)
+                sondear = ahora - ultima >= self.intervalo_verificacion
+            elif politica == VERIFICAR_TRAS_ERROR:
+                sondear = clave in self._sospechosas
+            else:
+                sondear = False
+            if not sondear:
+                return True
+            self._estadisticas.sondeos += 1
+
+        try:
+            con.execute("SELECT 1")
+        except sqlite3.Error:
+            logger.warning("Conexión SQLite no responde, se reemplazará")
+            return False
+
+        with self._condicion:
+            self._sospechosas.discard(clave)
+            self._ultima_verificacion[clave] = ahora
+        return True
+
+    def devolver(self, con: Connection, descartar: bool = False, con_error: bool = False) -> None:
+        """
+        Devuelve una conexión prestada al pool.
+
+        Args:
+            con (Connection): Conexión obtenida previamente con `obtener()`.
+            descartar (bool): Si es True la conexión se cierra en lugar de reutilizarse.
+                También se descarta si ya estaba cerrada.
+            con_error (bool): Indica que una sentencia falló con esta conexión;
+                se verificará antes de volver a prestarla.
+        """
+        a_cerrar: List[Connection] = []
+
+        with self._condicion:
+            if self._en_uso.pop(id(con), None) is None:
+                # Conexión ajena al pool (o ya cerrada por cerrar_todas)
+                return
+
+            if descartar or conexion_cerrada(con):
+                self._olvidar(con)
+                self._total -= 1
+                self._estadisticas.descartadas += 1
+                a_cerrar.append(con)
+            else:
+                if con_error:
+                    self._sospechosas.add(id(con))
+                if con.in_transaction:
+                    # No dejamos transacciones abiertas para el siguiente usuario
+                    try:
+                        con.rollback()
+                    except sqlite3.Error:
+                        pass
+                ahora = time.monotonic()
+                self._disponibles.append((con, ahora))
+                a_cerrar.extend(self._extraer_inactivas(ahora))
+
+            self._condicion.notify()
+
+        self._cerrar_conexiones(a_cerrar)
+
+    # ┌────────────────────────────────────────────────────────────┐
+    # │ Mantenimiento
+    # └────────────────────────────────────────────────────────────┘
+
+    def desalojar_inactivas(self) -> int:
+        """
+        Cierra las conexiones libres que superaron el tiempo de inactividad.
+
+        Returns:
+            int: Cantidad de conexiones cerradas.
+        """
+        with self._condicion:
+            a_cerrar = self._extraer_inactivas(time.monotonic())
+        self._cerrar_conexiones(a_cerrar)
+        return len(a_cerrar)
+
+    def cerrar_todas(self) -> None:
+        """
+        Cierra todas las conexiones del pool, libres y prestadas.
+
+        Pensado para el cierre de la aplicación o de los tests.
+        """
+        with self._condicion:
+            a_cerrar = [con for con, _ in self._disponibles]
+            a_cerrar.extend(con for con, _ in self._en_uso.values())
+            self._disponibles.clear()
+            self._en_uso.clear()
+            self._ultima_verificacion.clear()
+            self._sospechosas.clear()
+            self._total = 0
+            self._condicion.notify_all()
+        self._cerrar_conexiones(a_cerrar)
+
+    def obtener_estadisticas(self) -> EstadisticasPool:
+        """
+        Retorna una copia de las estadísticas actuales del pool.
+        """
+        with self._condicion:
+            estadisticas = dataclasses.replace(self._estadisticas)
+            estadisticas.en_uso = len(self._en_uso)
+            estadisticas.disponibles = len(self._disponibles)
+        return estadisticas
+
+    # ┌────────────────────────────────────────────────────────────┐
+    # │ Métodos Privados (requieren tener el lock)
+    # └────────────────────────────────────────────────────────────┘
+
+    def _extraer_inactivas(self, ahora: float) -> List[Connection]:
+        """Quita del pool las conexiones libres inactivas y las retorna para cerrarlas."""
+        if self.tiempo_inactividad is None or not self._disponibles:
+            return []
+        limite = ahora - self.tiempo_inactividad
+        inactivas = [con for con, ultimo_uso in self._disponibles if ultimo_uso < limite]
+        if inactivas:
+            for con in inactivas:
+                self._olvidar(con)
+            self._disponibles = [
+                (con, ultimo_uso) for con, ultimo_uso in self._disponibles if ultimo_uso >= limite
+            ]
+            self._total -= len(inactivas)
+            self._estadisticas.desalojadas += len(inactivas)
+        return inactivas
+
+    def _recuperar_huerfanas(self) -> bool:
+        """Devuelve a la lista de libres las conexiones de threads que ya terminaron."""
+        huerfanas = [
+            clave
+            for clave, (_, propietario) in self._en_uso.items()
+            if propietario is not None and not propietario.is_alive()
+        ]
+        for clave in huerfanas:
+            con, _ = self._en_uso.pop(clave)
+            self._estadisticas.recuperadas += 1
+            if conexion_cerrada(con):
+                self._olvidar(con)
+                self._total -= 1
+                continue
+            try:
+                if con.in_transaction:
+                    con.rollback()
+                self._disponibles.append((con, time.monotonic()))
+            except sqlite3.Error:
+                self._olvidar(con)
+                self._total -= 1
+        if huerfanas:
+            logger.debug("Recuperadas %s conexiones de threads finalizados", len(huerfanas))
+        return bool(huerfanas)
+
+    def _olvidar(self, con: Connection) -> None:
+        """Elimina el estado de verificación de una conexión que sale del pool."""
+        self._ultima_verificacion.pop(id(con), None)
+        self._sospechosas.discard(id(con))
+
+    @staticmethod
+    def _cerrar_conexiones(conexiones: List[Connection]) -> None:
+        for con in conexiones:
+            try:
+                con.close()
+            except sqlite3.Error:
+                pass
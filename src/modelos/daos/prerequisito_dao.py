@@ -1,5 +1,6 @@
 from modelos.dtos.prerequisito_dto import PrerrequisitoDTO
 from modelos.daos.base_dao import DAO
+from modelos.daos.esquema import inicializar_esquema
 from typing import Optional, List, Dict, Any
 from sqlite3 import Error
 from scripts.logging_config import obtener_logger_modulo
@@ -8,11 +9,20 @@ logger = obtener_logger_modulo(__name__)
 
 
 class PrerrequisitoDAO(DAO):
+    _TABLA = "prerrequisito"
+    _CLAVE = ("id_asignatura", "id_asignatura_prerrequisito")
+    _CLASE_DTO = PrerrequisitoDTO
+    _SQL_INSERTAR = """INSERT INTO prerrequisito (id_asignatura, id_asignatura_prerrequisito)
+                 VALUES (?, ?)"""
+    _SQL_ELIMINAR = (
+        "DELETE FROM prerrequisito WHERE id_asignatura = ? AND id_asignatura_prerrequisito = ?"
+    )
+
     def __init__(self, ruta_db=None):
         super().__init__(ruta_db)
 
-        # creamos la tabla
-        self.crear_tabla()
+        # las tablas se crean una sola vez por base de datos
+        inicializar_esquema(ruta_db)
 
     def crear_tabla(self, sql: Optional[str] = None) -> bool:
         """
@@ -51,11 +61,7 @@ class PrerrequisitoDAO(DAO):
         Returns:
             bool: True si se insertó correctamente, False en caso de error.
         """
-        sql = """INSERT INTO prerrequisito (id_asignatura, id_asignatura_prerrequisito)
-                 VALUES (?, ?)"""
-        params = (dto.id_asignatura, dto.id_asignatura_prerrequisito)
-
-        resultado = self.ejecutar_insertar(sql, params)
+        resultado = self.ejecutar_insertar(self._SQL_INSERTAR, self._params_insertar(dto))
         return resultado is not None
 
     def eliminar(self, dto: PrerrequisitoDTO) -> bool:
@@ -68,12 +74,13 @@ class PrerrequisitoDAO(DAO):
         Returns:
             bool: True si se eliminó correctamente, False en caso contrario.
         """
-        sql = (
-            "DELETE FROM prerrequisito WHERE id_asignatura = ? AND id_asignatura_prerrequisito = ?"
-        )
-        params = (dto.id_asignatura, dto.id_asignatura_prerrequisito)
+        return self.ejecutar_actualizacion(self._SQL_ELIMINAR, self._params_eliminar(dto))
+
+    def _params_insertar(self, dto: PrerrequisitoDTO) -> tuple:
+        return (dto.id_asignatura, dto.id_asignatura_prerrequisito)
 
-        return self.ejecutar_actualizacion(sql, params)
+    def _params_eliminar(self, dto: PrerrequisitoDTO) -> tuple:
+        return (dto.id_asignatura, dto.id_asignatura_prerrequisito)
 
     def instanciar(self, dto: PrerrequisitoDTO) -> bool:
         """
@@ -93,12 +100,7 @@ class PrerrequisitoDAO(DAO):
         ):
             sql = "SELECT * FROM prerrequisito WHERE id_asignatura = ? AND id_asignatura_prerrequisito = ?"
             params = (dto.id_asignatura, dto.id_asignatura_prerrequisito)
-            lista_data = self.ejecutar_consulta(sql, params)
-            if lista_data:
-                data = lista_data[0]
-                dto.set_data(data=data)
-                return True
-            return False
+            return self.consultar_en_dto(sql, params, dto)
         else:
             logger.warning("IDs de asignatura no válidos para instanciar")
             return False
@@ -0,0 +1,335 @@
+"""
+Telemetría de las consultas ejecutadas por los DAOs.
+
+Los métodos de `DAO` (ejecutar_consulta, consultar_dtos, ejecutar_insertar,
+ejecutar_actualizacion, ...) registran aquí la duración y las filas de cada
+sentencia. Se acumulan por (clase DAO, sentencia normalizada): llamadas,
+tiempo total, p50/p95/máximo y filas. Las sentencias que superan
+TELEMETRIA_UMBRAL_LENTA_MS se escriben además en el log de consultas lentas.
+
+Los valores de los parámetros pueden ser datos personales (nombres, correos):
+el log y el volcado a JSON solo guardan su cantidad y sus tipos.
+
+Uso:
+    >>> telemetria = obtener_telemetria()
+    >>> print(telemetria.formatear(telemetria.resumen(agrupar="clase")))
+    >>> telemetria.volcar(TELEMETRIA_ARCHIVO)  # leído por scripts/telemetria_consultas.py
+"""
+
+import dataclasses
+import json
+import math
+import re
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+from .cache_consultas import normalizar_sql
+from scripts.logging_config import obtener_logger_modulo, LOGGER_CONSULTAS_LENTAS
+from utilidades.config import TELEMETRIA_CONSULTAS, TELEMETRIA_UMBRAL_LENTA_MS, TELEMETRIA_MUESTRAS
+
+logger = obtener_logger_modulo(__name__)
+logger_lentas = obtener_logger_modulo(LOGGER_CONSULTAS_LENTAS)
+
+# Literales (texto entre comillas simples o números) que no forman parte de un identificador
+_PATRON_VALOR = re.compile(r"'(?:[^']|'')*'|(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])")
+# Listas de marcadores: IN (?, ?, ?) o VALUES (?, ?), (?, ?)
+_PATRON_LISTA = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_PATRON_FILAS = re.compile(r"\(\?, \.\.\.\)(?:\s*,\s*\(\?, \.\.\.\))+")
+
+AGRUPACIONES = ("sentencia", "clase")
+ORDENES = ("total_ms", "p95_ms", "max_ms", "llamadas", "filas")
+
+
+@lru_cache(maxsize=1024)
+def normalizar_sentencia(sql: str) -> str:
+    """
+    Forma canónica de una sentencia para agrupar la telemetría: espacios
+    colapsados, literales reemplazados por `?` y listas de marcadores de
+    cualquier largo reducidas a `(?, ...)`.
+
+    Así `WHERE id IN (?, ?)` y `WHERE id IN (?, ?, ?)` cuentan como la misma sentencia.
+    """
+    sql = _PATRON_VALOR.sub("?", normalizar_sql(sql))
+    sql = _PATRON_LISTA.sub("(?, ...)", sql)
+    return _PATRON_FILAS.sub("(?, ...)", sql)
+
+
+def firma_params(params: Any) -> str:
+    """
+    Cantidad y tipos de los parámetros, sin sus valores.
+
+    Example:
+        >>> firma_params(("Ana", 3, None))
+        '3 (str, int, NoneType)'
+    """
+    if isinstance(params, dict):
+        params = list(params.values())
+    if not isinstance(params, (list, tuple)):
+        return "0" if params is None else type(params).__name__
+    return f"{len(params)} ({', '.join(type(valor).__name__ for valor in params)})"
+
+
+@dataclasses.dataclass
+class EstadisticasSentencia:
+    """
+    Métricas acumuladas de una sentencia o de una clase DAO.
+
+    Attributes:
+        clave (str): Sentencia normalizada o nombre de la clase DAO.
+        llamadas (int): Ejecuciones registradas.
+        total_ms (float): Tiempo total en milisegundos.
+        p50_ms (float): Mediana de las últimas TELEMETRIA_MUESTRAS ejecuciones.
+        p95_ms (float): Percentil 95 de las últimas TELEMETRIA_MUESTRAS ejecuciones.
+        max_ms (float): Ejecución más lenta.
+        filas (int): Filas leídas o afectadas en total.
+        lentas (int): Ejecuciones que superaron el umbral de consulta lenta.
+    """
+
+    clave: str
+    llamadas: int = 0
+    total_ms: float = 0.0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    max_ms: float = 0.0
+    filas: int = 0
+    lentas: int = 0
+
+    @property
+    def promedio_ms(self) -> float:
+        return self.total_ms / self.llamadas if self.llamadas else 0.0
+
+
+class _Acumulado:
+    """Contadores de una (clase DAO, sentencia) y un ejemplo de ejecución."""
+
+    __slots__ = ("llamadas", "total_ms", "max_ms", "filas", "lentas", "muestras", "sql", "params")
+
+    def __init__(self, max_muestras: int, sql: str = "", params: Any = ()):
+        # Primera ejecución registrada, para reproducirla (ver auditor_consultas).
+        # Los parámetros quedan solo en memoria; `volcar` no los escribe.
+        self.sql = sql
+        self.params = params
+        self.llamadas = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.filas = 0
+        self.lentas = 0
+        self.muestras: Deque[float] = deque(maxlen=max_muestras)
+
+
+def _percentil(ordenadas: Sequence[float], fraccion: float) -> float:
+    """Percentil por rango más cercano de una lista ya ordenada."""
+    if not ordenadas:
+        return 0.0
+    return ordenadas[max(0, math.ceil(fraccion * len(ordenadas)) - 1)]
+
+
+class TelemetriaConsultas:
+    """
+    Acumula la duración y las filas de las sentencias ejecutadas por los DAOs.
+
+    Es thread-safe; registrar una ejecución cuesta una búsqueda en un
+    diccionario y unas sumas bajo un lock.
+    """
+
+    def __init__(self, umbral_lenta_ms: float = TELEMETRIA_UMBRAL_LENTA_MS, max_muestras: int = TELEMETRIA_MUESTRAS):
+        """
+        Args:
+            umbral_lenta_ms (float): Duración a partir de la cual una ejecución
+                se escribe en el log de consultas lentas. 0 o negativo lo desactiva.
+            max_muestras (int): Duraciones guardadas por sentencia para los percentiles.
+        """
+        self.umbral_lenta_ms = umbral_lenta_ms
+        self.max_muestras = max_muestras
+        self.activa = True
+        self._acumulados: Dict[Tuple[str, str], _Acumulado] = {}
+        self._lock = threading.Lock()
+
+    def registrar(
+        self, clase: str, sql: str, params: Any, duracion_ms: float, filas: int = 0,
+        tamano_lote: Optional[int] = None,
+    ) -> None:
+        """
+        Registra una ejecución de `sql` hecha por la clase DAO `clase`.
+
+        Args:
+            clase (str): Nombre de la clase DAO.
+            sql (str): Sentencia tal como se ejecutó.
+            params (Any): Parámetros. El log de consultas lentas solo muestra
+                su cantidad y sus tipos (ver `firma_params`).
+            duracion_ms (float): Duración en milisegundos.
+            filas (int): Filas leídas o afectadas.
+            tamano_lote (Optional[int]): Filas del lote si la sentencia se
+                ejecutó una vez por fila en una transacción (`params` son
+                entonces los de la primera fila).
+        """
+        if not self.activa:
+            return
+        sentencia = normalizar_sentencia(sql)
+        lenta = 0 < self.umbral_lenta_ms <= duracion_ms
+        with self._lock:
+            acumulado = self._acumulados.get((clase, sentencia))
+            if acumulado is None:
+                acumulado = self._acumulados[(clase, sentencia)] = _Acumulado(self.max_muestras, sql, params)
+            acumulado.llamadas += 1
+            acumulado.total_ms += duracion_ms
+            # cursor.rowcount es -1 en las sentencias DDL
+            acumulado.filas += max(filas, 0)
+            acumulado.muestras.append(duracion_ms)
+            if duracion_ms > acumulado.max_ms:
+                acumulado.max_ms = duracion_ms
+            if lenta:
+                acumulado.lentas += 1
+        if lenta:
+            lote = f", lote de {tamano_lote}" if tamano_lote is not None else ""
+            logger_lentas.warning(
+                "Consulta lenta (%.1f ms, %s filas%s) en %s: %s | Parámetros: %s",
+                duracion_ms, filas, lote, clase, sentencia, firma_params(params),
+            )
+
+    def resumen(
+        self, agrupar: str = "sentencia", ordenar: str = "total_ms", limite: Optional[int] = None
+    ) -> List[EstadisticasSentencia]:
+        """
+        Retorna las métricas acumuladas, de mayor a menor según `ordenar`.
+
+        Args:
+            agrupar (str): "sentencia" (sumando todas las clases DAO) o "clase".
+            ordenar (str): Campo de EstadisticasSentencia: "total_ms", "p95_ms",
+                "max_ms", "llamadas" o "filas".
+            limite (Optional[int]): Cantidad máxima de filas a retornar.
+
+        Returns:
+            List[EstadisticasSentencia]: Una entrada por sentencia o por clase.
+        """
+        if agrupar not in AGRUPACIONES:
+            raise ValueError(f"agrupar debe ser uno de {AGRUPACIONES}: {agrupar!r}")
+        if ordenar not in ORDENES:
+            raise ValueError(f"ordenar debe ser uno de {ORDENES}: {ordenar!r}")
+
+        grupos: Dict[str, Tuple[EstadisticasSentencia, List[float]]] = {}
+        with self._lock:
+            for (clase, sentencia), acumulado in self._acumulados.items():
+                clave = sentencia if agrupar == "sentencia" else clase
+                if clave not in grupos:
+                    grupos[clave] = (EstadisticasSentencia(clave=clave), [])
+                estadisticas, muestras = grupos[clave]
+                estadisticas.llamadas += acumulado.llamadas
+                estadisticas.total_ms += acumulado.total_ms
+                estadisticas.max_ms = max(estadisticas.max_ms, acumulado.max_ms)
+                estadisticas.filas += acumulado.filas
+                estadisticas.lentas += acumulado.lentas
+                muestras.extend(acumulado.muestras)
+
+        resultado = []
+        for estadisticas, muestras in grupos.values():
+            muestras.sort()
+            estadisticas.p50_ms = _percentil(muestras, 0.50)
+            estadisticas.p95_ms = _percentil(muestras, 0.95)
+            resultado.append(estadisticas)
+        resultado.sort(key=lambda e: getattr(e, ordenar), reverse=True)
+        return resultado[:limite] if limite is not None else resultado
+
+    def ejemplos(self) -> List[Tuple[str, str, Any]]:
+        """
+        Una ejecución de ejemplo por (clase DAO, sentencia): (clase, sql, params),
+        con la SQL y los parámetros tal como se ejecutaron por primera vez.
+        En una telemetría cargada con `cargar` los parámetros son () porque
+        el archivo no guarda sus valores.
+        """
+        with self._lock:
+            return [(clase, a.sql, a.params) for (clase, _), a in self._acumulados.items()]
+
+    def reiniciar(self) -> None:
+        """Descarta todo lo acumulado."""
+        with self._lock:
+            self._acumulados.clear()
+
+    # ┌────────────────────────────────────────────────────────────┐
+    # │ Volcado a archivo
+    # └────────────────────────────────────────────────────────────┘
+
+    def volcar(self, ruta: str) -> bool:
+        """
+        Guarda lo acumulado en un archivo JSON (ver `cargar`). De los
+        parámetros de ejemplo solo se guarda la firma (ver `firma_params`).
+
+        Returns:
+            bool: True si se escribió el archivo.
+        """
+        with self._lock:
+            entradas = [
+                {
+                    "clase": clase,
+                    "sentencia": sentencia,
+                    "llamadas": acumulado.llamadas,
+                    "total_ms": acumulado.total_ms,
+                    "max_ms": acumulado.max_ms,
+                    "filas": acumulado.filas,
+                    "lentas": acumulado.lentas,
+                    "muestras": list(acumulado.muestras),
+                    "sql_ejemplo": acumulado.sql,
+                    "params_ejemplo": firma_params(acumulado.params),
+                }
+                for (clase, sentencia), acumulado in self._acumulados.items()
+            ]
+        try:
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                json.dump({"umbral_lenta_ms": self.umbral_lenta_ms, "entradas": entradas}, archivo)
+            logger.info("Telemetría de consultas guardada en %s (%s sentencias)", ruta, len(entradas))
+            return True
+        except OSError as ex:
+            logger.error("Error al guardar la telemetría de consultas: %s", ex)
+            return False
+
+    @classmethod
+    def cargar(cls, ruta: str) -> 'TelemetriaConsultas':
+        """
+        Crea una TelemetriaConsultas con lo guardado por `volcar`.
+
+        Raises:
+            OSError: Si no se puede leer el archivo.
+            ValueError: Si el archivo no tiene el formato esperado.
+        """
+        with open(ruta, encoding="utf-8") as archivo:
+            datos = json.load(archivo)
+        telemetria = cls(umbral_lenta_ms=datos.get("umbral_lenta_ms", TELEMETRIA_UMBRAL_LENTA_MS))
+        try:
+            for entrada in datos["entradas"]:
+                acumulado = _Acumulado(telemetria.max_muestras, entrada.get("sql_ejemplo", entrada["sentencia"]))
+                acumulado.llamadas = entrada["llamadas"]
+                acumulado.total_ms = entrada["total_ms"]
+                acumulado.max_ms = entrada["max_ms"]
+                acumulado.filas = entrada["filas"]
+                acumulado.lentas = entrada["lentas"]
+                acumulado.muestras.extend(entrada["muestras"])
+                telemetria._acumulados[(entrada["clase"], entrada["sentencia"])] = acumulado
+        except (KeyError, TypeError) as ex:
+            raise ValueError(f"Archivo de telemetría inválido: {ex}") from ex
+        return telemetria
+
+    @staticmethod
+    def formatear(estadisticas: Sequence[EstadisticasSentencia], ancho_clave: int = 70) -> str:
+        """Tabla de texto con las métricas (una fila por entrada)."""
+        encabezado = (
+            f"{'Llamadas':>9} {'Total ms':>10} {'Prom ms':>8} {'p50 ms':>8} "
+            f"{'p95 ms':>8} {'Máx ms':>8} {'Filas':>9} {'Lentas':>6}  Sentencia / clase"
+        )
+        lineas = [encabezado, "-" * len(encabezado)]
+        for e in estadisticas:
+            clave = e.clave if len(e.clave) <= ancho_clave else e.clave[: ancho_clave - 3] + "..."
+            lineas.append(
+                f"{e.llamadas:>9} {e.total_ms:>10.1f} {e.promedio_ms:>8.2f} {e.p50_ms:>8.2f} "
+                f"{e.p95_ms:>8.2f} {e.max_ms:>8.2f} {e.filas:>9} {e.lentas:>6}  {clave}"
+            )
+        return "\n".join(lineas)
+
+
+_telemetria = TelemetriaConsultas()
+_telemetria.activa = TELEMETRIA_CONSULTAS
+
+
+def obtener_telemetria() -> TelemetriaConsultas:
+    """Telemetría compartida por todos los DAOs del proceso."""
+    return _telemetria
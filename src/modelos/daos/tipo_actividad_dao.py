@@ -1,5 +1,6 @@
 from modelos.dtos.tipo_actividad_dto import TipoActividadDTO
 from modelos.daos.base_dao import DAO
+from modelos.daos.esquema import inicializar_esquema
 from typing import Optional, List, Dict, Any
 from sqlite3 import Error
 from scripts.logging_config import obtener_logger_modulo
@@ -8,11 +9,21 @@ logger = obtener_logger_modulo(__name__)
 
 
 class TipoActividadDAO(DAO):
+    _TABLA = "tipo_actividad"
+    _CLAVE = ("id_tipo_actividad",)
+    _CLASE_DTO = TipoActividadDTO
+    _SQL_INSERTAR = """INSERT INTO tipo_actividad (nombre, siglas, descripcion, prioridad)
+                 VALUES (?, ?, ?, ?)"""
+    _SQL_ACTUALIZAR = """UPDATE tipo_actividad 
+                 SET nombre = ?, siglas = ?, descripcion = ?, prioridad = ?
+                 WHERE id_tipo_actividad = ?"""
+    _SQL_ELIMINAR = "DELETE FROM tipo_actividad WHERE id_tipo_actividad = ?"
+
     def __init__(self, ruta_db=None):
         super().__init__(ruta_db)
 
-        # creamos la tabla
-        self.crear_tabla()
+        # las tablas se crean una sola vez por base de datos
+        inicializar_esquema(ruta_db)
 
     def crear_tabla(self, sql: Optional[str] = None) -> bool:
         """
@@ -46,11 +57,7 @@ class TipoActividadDAO(DAO):
         Returns:
             Optional[int]: ID del registro insertado o None si hay error.
         """
-        sql = """INSERT INTO tipo_actividad (nombre, siglas, descripcion, prioridad)
-                 VALUES (?, ?, ?, ?)"""
-        params = (dto.nombre, dto.siglas, dto.descripcion, dto.prioridad)
-
-        return self.ejecutar_insertar(sql, params)
+        return self.ejecutar_insertar(self._SQL_INSERTAR, self._params_insertar(dto))
 
     def eliminar(self, dto: TipoActividadDTO) -> bool:
         """
@@ -62,10 +69,7 @@ class TipoActividadDAO(DAO):
         Returns:
             bool: True si se eliminó correctamente, False en caso contrario.
         """
-        sql = "DELETE FROM tipo_actividad WHERE id_tipo_actividad = ?"
-        params = (dto.id_tipo_actividad,)
-
-        return self.ejecutar_actualizacion(sql, params)
+        return self.ejecutar_actualizacion(self._SQL_ELIMINAR, self._params_eliminar(dto))
 
     def actualizar(self, dto: TipoActividadDTO) -> bool:
         """
@@ -77,12 +81,16 @@ class TipoActividadDAO(DAO):
         Returns:
             bool: True si se actualizó correctamente, False en caso contrario.
         """
-        sql = """UPDATE tipo_actividad 
-                 SET nombre = ?, siglas = ?, descripcion = ?, prioridad = ?
-                 WHERE id_tipo_actividad = ?"""
-        params = (dto.nombre, dto.siglas, dto.descripcion, dto.prioridad, dto.id_tipo_actividad)
+        return self.ejecutar_actualizacion(self._SQL_ACTUALIZAR, self._params_actualizar(dto))
 
-        return self.ejecutar_actualizacion(sql, params)
+    def _params_insertar(self, dto: TipoActividadDTO) -> tuple:
+        return (dto.nombre, dto.siglas, dto.descripcion, dto.prioridad)
+
+    def _params_actualizar(self, dto: TipoActividadDTO) -> tuple:
+        return (dto.nombre, dto.siglas, dto.descripcion, dto.prioridad, dto.id_tipo_actividad)
+
+    def _params_eliminar(self, dto: TipoActividadDTO) -> tuple:
+        return (dto.id_tipo_actividad,)
 
     def instanciar(self, dto: TipoActividadDTO) -> bool:
         """
@@ -97,12 +105,7 @@ class TipoActividadDAO(DAO):
         if dto.id_tipo_actividad != 0 and dto.id_tipo_actividad is not None:
             sql = "SELECT * FROM tipo_actividad WHERE id_tipo_actividad = ?"
             params = (dto.id_tipo_actividad,)
-            lista_data = self.ejecutar_consulta(sql, params)
-            if lista_data:
-                data = lista_data[0]
-                dto.set_data(data=data)
-                return True
-            return False
+            return self.consultar_en_dto(sql, params, dto)
         else:
             logger.warning("ID de tipo de actividad no válido para instanciar")
             return False
@@ -0,0 +1,50 @@
+import dataclasses
+from typing import Optional
+
+
+@dataclasses.dataclass(slots=True)
+class ResumenCohorteDTO:
+    """
+    Estadísticas de las notas finales de una cohorte (una asignatura o una carrera).
+
+    Atributos:
+        total (int): Estudiantes con nota en la cohorte
+        media (float): Promedio de las notas
+        mediana (float): Percentil 50
+        percentil_25 (float): Primer cuartil
+        percentil_75 (float): Tercer cuartil
+        percentil_90 (float): Percentil 90
+        minimo (float): Nota más baja
+        maximo (float): Nota más alta
+    """
+
+    total: int = 0
+    media: float = 0.0
+    mediana: float = 0.0
+    percentil_25: float = 0.0
+    percentil_75: float = 0.0
+    percentil_90: float = 0.0
+    minimo: float = 0.0
+    maximo: float = 0.0
+
+
+@dataclasses.dataclass(slots=True)
+class PosicionCohorteDTO:
+    """
+    Posición de una nota dentro de una cohorte.
+
+    Atributos:
+        nota (float): Nota evaluada (la del estudiante o una cualquiera)
+        puesto (int): 1 para la nota más alta; las notas iguales comparten puesto
+        total (int): Estudiantes con nota en la cohorte
+        percentil (float): Porcentaje de la cohorte con nota menor o igual
+        media (float): Promedio de la cohorte
+        id_estudiante (Optional[int]): Estudiante evaluado, si corresponde
+    """
+
+    nota: float = 0.0
+    puesto: int = 0
+    total: int = 0
+    percentil: float = 0.0
+    media: float = 0.0
+    id_estudiante: Optional[int] = None
@@ -3,14 +3,14 @@ from typing import Optional, Dict, Any, List
 from datetime import date
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ConsultasDTO:
     """DTO para consultas generales."""
 
     pass
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EventosUnificadosDTO:
     """
     DTO que representa un evento unificado (Actividad o Evento de Calendario).
@@ -60,8 +60,13 @@ class EventosUnificadosDTO:
         return self.asignatura if self.asignatura else 'Sin asignatura'
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convierte el DTO a diccionario."""
-        return dataclasses.asdict(self)
+        """
+        Convierte el DTO a diccionario.
+
+        Copia superficial: todos los campos son escalares, por lo que no hace
+        falta el recorrido recursivo de `dataclasses.asdict`.
+        """
+        return {campo: getattr(self, campo) for campo in self.__slots__}
 
     @classmethod
     def from_row(cls, row: tuple) -> 'EventosUnificadosDTO':
@@ -91,3 +96,108 @@ class EventosUnificadosDTO:
             asignatura=row[10] if len(row) > 10 else None,
             id_asignatura=row[11] if len(row) > 11 else None,
         )
+
+
+@dataclasses.dataclass(slots=True)
+class ActividadDetalladaDTO:
+    """
+    DTO que representa una fila de la vista vw_estudiante_actividades_detalladas.
+
+    Atributos:
+        id_estudiante (int): ID del estudiante
+        carrera_id (int): ID de la carrera de la asignatura
+        id_asignatura (int): ID de la asignatura
+        actividad_id (int): ID de la actividad
+        eje_id (int): ID del eje temático
+        tipo_actividad_id (int): ID del tipo de actividad
+        eje_nombre (str): Nombre del eje temático
+        eje_orden (int): Orden del eje dentro de la asignatura
+        nombre_asignatura (str): Nombre de la asignatura
+        titulo (str): Título de la actividad
+        descripcion (Optional[str]): Descripción de la actividad
+        fecha_inicio (str): Fecha de inicio (YYYY-MM-DD)
+        fecha_fin (str): Fecha de fin (YYYY-MM-DD)
+        actividad_nombre (str): Nombre del tipo de actividad
+        siglas (str): Siglas del tipo de actividad
+        prioridad (int): Prioridad del tipo de actividad
+        actividad_estado (str): Estado de la actividad para el estudiante
+        fecha_entrega (Optional[str]): Fecha de entrega del estudiante
+        dias_duracion (int): Días entre inicio y fin
+        dias_desde_fin (int): Días transcurridos desde la fecha de fin hasta la
+            fecha de referencia de la consulta (no es columna de la vista:
+            lo calcula ConsultaDAO)
+    """
+
+    id_estudiante: Optional[int] = None
+    carrera_id: Optional[int] = None
+    id_asignatura: Optional[int] = None
+    actividad_id: Optional[int] = None
+    eje_id: Optional[int] = None
+    tipo_actividad_id: Optional[int] = None
+    eje_nombre: Optional[str] = None
+    eje_orden: Optional[int] = None
+    nombre_asignatura: Optional[str] = None
+    titulo: Optional[str] = None
+    descripcion: Optional[str] = None
+    fecha_inicio: Optional[str] = None
+    fecha_fin: Optional[str] = None
+    actividad_nombre: Optional[str] = None
+    siglas: Optional[str] = None
+    prioridad: Optional[int] = None
+    actividad_estado: Optional[str] = None
+    fecha_entrega: Optional[str] = None
+    dias_duracion: Optional[int] = None
+    dias_desde_fin: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convierte el DTO a diccionario.
+
+        Copia superficial: todos los campos son escalares, por lo que no hace
+        falta el recorrido recursivo de `dataclasses.asdict`.
+        """
+        return {campo: getattr(self, campo) for campo in self.__slots__}
+
+
+@dataclasses.dataclass(slots=True)
+class EstadisticasActividadesDTO:
+    """
+    Métricas agregadas de las actividades de un estudiante (con los mismos
+    filtros que vw_estudiante_actividades_detalladas en el panel de actividades).
+
+    Atributos:
+        total (int): Actividades que cumplen el filtro
+        entregadas (int): Actividades en estado 'entregada'
+        pendientes (int): Actividades en estado 'pendiente' (o sin estado)
+        en_progreso (int): Actividades en estado 'en_progreso'
+        vencidas (int): Actividades en estado 'vencida'
+        prioridad_alta (int): Actividades de prioridad 2
+        prioridad_media (int): Actividades de prioridad 1
+        prioridad_baja (int): Actividades de cualquier otra prioridad
+        promedio_nota (float): Promedio de las notas no nulas
+        velocidad_promedio (float): Promedio de dias_desde_fin de las entregadas
+        duracion_promedio (float): Promedio de dias_duracion distintos de cero
+        proximas_vencer (int): Actividades con dias_desde_fin entre 0 y el límite
+        proximas (List[ActividadDetalladaDTO]): Las primeras de ellas, por dias_desde_fin
+    """
+
+    total: int = 0
+    entregadas: int = 0
+    pendientes: int = 0
+    en_progreso: int = 0
+    vencidas: int = 0
+    prioridad_alta: int = 0
+    prioridad_media: int = 0
+    prioridad_baja: int = 0
+    promedio_nota: float = 0.0
+    velocidad_promedio: float = 0.0
+    duracion_promedio: float = 0.0
+    proximas_vencer: int = 0
+    proximas: List[ActividadDetalladaDTO] = dataclasses.field(default_factory=list)
+
+    @property
+    def tasa_entrega(self) -> float:
+        """Porcentaje de actividades entregadas, con un decimal."""
+        if not self.total:
+            return 0.0
+        return round((self.entregadas / self.total) * 100, 1)
@@ -2,7 +2,7 @@ import dataclasses
 from typing import Optional, Dict, Any
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TipoActividadDTO:
     """
     Data Transfer Object para Tipo de Actividad.
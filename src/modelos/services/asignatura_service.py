@@ -2,6 +2,8 @@ import logging
 from typing import Optional
 from modelos.dtos.asignatura_dto import AsignaturaDTO
 from modelos.daos.asignatura_dao import AsignaturaDAO
+from modelos.services.catalogo_service import ASIGNATURA, invalidar_catalogo
+from modelos.services.cohorte_service import invalidar_cohortes
 
 
 logger = logging.getLogger(__name__)
@@ -30,6 +32,7 @@ class AsignaturaService(AsignaturaDTO):
             id_asignatura = self.dao.insertar(dto=self)
             if id_asignatura:
                 self.id_asignatura = id_asignatura
+                invalidar_catalogo(ASIGNATURA, self.dao.ruta_db)
                 logger.info(f"Asignatura insertada con ID: {id_asignatura}")
             return id_asignatura
         except Exception as e:
@@ -44,6 +47,8 @@ class AsignaturaService(AsignaturaDTO):
         try:
             resultado = self.dao.actualizar(dto=self)
             if resultado:
+                invalidar_catalogo(ASIGNATURA, self.dao.ruta_db)
+                invalidar_cohortes(self.dao.ruta_db)
                 logger.info(f"Asignatura {self.id_asignatura} actualizada exitosamente")
             return resultado
         except Exception as e:
@@ -58,6 +63,8 @@ class AsignaturaService(AsignaturaDTO):
         try:
             resultado = self.dao.eliminar(dto=self)
             if resultado:
+                invalidar_catalogo(ASIGNATURA, self.dao.ruta_db)
+                invalidar_cohortes(self.dao.ruta_db)
                 logger.info(f"Asignatura {self.id_asignatura} eliminada exitosamente")
             return resultado
         except Exception as e:
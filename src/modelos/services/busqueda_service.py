@@ -0,0 +1,56 @@
+import logging
+from typing import List, Optional
+from modelos.daos.busqueda_dao import BusquedaDAO, ACTIVIDAD, ASIGNATURA, ESTUDIANTE
+
+logger = logging.getLogger(__name__)
+
+
+class BusquedaService:
+    """
+    Búsqueda de texto completo para las cajas de búsqueda de las pantallas.
+
+    Cada palabra escrita se busca como prefijo (sin distinguir mayúsculas ni
+    tildes) y los resultados se devuelven como IDs ordenados por relevancia,
+    para que la pantalla filtre las filas que ya tiene cargadas. Si el texto
+    no tiene palabras (vacío o solo signos) devuelven None: no se filtra.
+    """
+
+    def __init__(self, ruta_db: Optional[str] = None):
+        self.__dao = BusquedaDAO(ruta_db=ruta_db)
+
+    def buscar_asignaturas(self, texto: str, limite: Optional[int] = None) -> Optional[List[int]]:
+        """IDs de las asignaturas cuyo código o nombre coincide con `texto`."""
+        return self.__dao.buscar(ASIGNATURA, texto, limite)
+
+    def buscar_estudiantes(self, texto: str, limite: Optional[int] = None) -> Optional[List[int]]:
+        """IDs de los estudiantes cuyo nombre o correo coincide con `texto`."""
+        return self.__dao.buscar(ESTUDIANTE, texto, limite)
+
+    def buscar_actividades(self, texto: str, incluir_asignatura: bool = True) -> Optional[List[int]]:
+        """
+        IDs de las actividades cuyo título o descripción coincide con `texto`.
+
+        Args:
+            texto (str): Texto escrito por el usuario.
+            incluir_asignatura (bool): Agrega, a continuación, las actividades
+                de las asignaturas que coinciden con `texto`.
+
+        Returns:
+            Optional[List[int]]: IDs sin repetir, los de coincidencia directa
+                primero, o None si `texto` no tiene palabras.
+        """
+        ids = self.__dao.buscar(ACTIVIDAD, texto)
+        if ids is None:
+            return None
+        if incluir_asignatura:
+            vistos = set(ids)
+            for id_actividad in self.__dao.buscar_actividades_por_asignatura(texto):
+                if id_actividad not in vistos:
+                    vistos.add(id_actividad)
+                    ids.append(id_actividad)
+        logger.debug(f"Búsqueda de actividades '{texto}': {len(ids)} resultados")
+        return ids
+
+    def reconstruir(self) -> bool:
+        """Vuelve a indexar todas las filas de origen."""
+        return self.__dao.reconstruir()
@@ -2,6 +2,8 @@ import logging
 from typing import Optional
 from modelos.dtos.carrera_dto import CarreraDTO
 from modelos.daos.carrera_dao import CarreraDAO
+from modelos.services.catalogo_service import CARRERA, invalidar_catalogo
+from modelos.services.cohorte_service import invalidar_cohortes
 
 
 logger = logging.getLogger(__name__)
@@ -45,6 +47,7 @@ class CarreraService(CarreraDTO):
             id_carrera = self.dao.insertar(dto=self)
             if id_carrera:
                 self.id_carrera = id_carrera
+                invalidar_catalogo(CARRERA, self.dao.ruta_db)
                 logger.info(f"Carrera insertada con ID: {id_carrera}")
             return id_carrera
         except Exception as e:
@@ -54,6 +57,8 @@ class CarreraService(CarreraDTO):
     def actualizar(self) -> bool:
         try:
             valor = self.dao.actualizar(dto=self)
+            if valor:
+                invalidar_catalogo(CARRERA, self.dao.ruta_db)
             logger.info("Carrera carrera actulizadad correctamente")
             return valor
         except Exception as e:
@@ -74,6 +79,8 @@ class CarreraService(CarreraDTO):
         try:
             resultado = self.dao.eliminar(dto=self)
             if resultado:
+                invalidar_catalogo(CARRERA, self.dao.ruta_db)
+                invalidar_cohortes(self.dao.ruta_db)
                 logger.info(f"Carrera {self.id_carrera} eliminada exitosamente")
             return resultado
         except Exception as e:
@@ -0,0 +1,253 @@
+import dataclasses
+import logging
+import threading
+import weakref
+from typing import Any, Dict, List, Optional
+from modelos.daos.conexion_sqlite import ConexionSQLite
+from modelos.daos.carrera_dao import CarreraDAO
+from modelos.daos.asignatura_dao import AsignaturaDAO
+from modelos.daos.tipo_actividad_dao import TipoActividadDAO
+from modelos.daos.eje_tematico_dao import EjeTematicoDAO
+from modelos.dtos.carrera_dto import CarreraDTO
+from modelos.dtos.asignatura_dto import AsignaturaDTO
+from modelos.dtos.tipo_actividad_dto import TipoActividadDTO
+from modelos.dtos.eje_tematico_dto import EjeTematicoDTO
+
+logger = logging.getLogger(__name__)
+
+CARRERA = 'carrera'
+ASIGNATURA = 'asignatura'
+TIPO_ACTIVIDAD = 'tipo_actividad'
+EJE_TEMATICO = 'eje_tematico'
+
+
+@dataclasses.dataclass(frozen=True)
+class _DefinicionCatalogo:
+    """Cómo se carga e indexa una entidad de referencia."""
+
+    clase_dao: type
+    clase_dto: type
+    sql: str
+    campo_id: str
+    campo_codigo: Optional[str] = None
+    campo_padre: Optional[str] = None
+
+
+_DEFINICIONES: Dict[str, _DefinicionCatalogo] = {
+    CARRERA: _DefinicionCatalogo(
+        CarreraDAO, CarreraDTO, "SELECT * FROM carrera ORDER BY nombre", 'id_carrera', 'codigo'
+    ),
+    ASIGNATURA: _DefinicionCatalogo(
+        AsignaturaDAO,
+        AsignaturaDTO,
+        "SELECT * FROM asignatura ORDER BY nombre",
+        'id_asignatura',
+        'codigo',
+        'id_carrera',
+    ),
+    TIPO_ACTIVIDAD: _DefinicionCatalogo(
+        TipoActividadDAO,
+        TipoActividadDTO,
+        "SELECT * FROM tipo_actividad ORDER BY nombre",
+        'id_tipo_actividad',
+        'siglas',
+    ),
+    EJE_TEMATICO: _DefinicionCatalogo(
+        EjeTematicoDAO,
+        EjeTematicoDTO,
+        "SELECT * FROM eje_tematico ORDER BY orden, nombre",
+        'id_eje',
+        None,
+        'id_asignatura',
+    ),
+}
+
+# Al borrar un padre, las claves foráneas pueden borrar o dejar huérfanos a sus hijos
+_DEPENDIENTES: Dict[str, tuple] = {
+    CARRERA: (ASIGNATURA, EJE_TEMATICO),
+    ASIGNATURA: (EJE_TEMATICO,),
+}
+
+
+@dataclasses.dataclass
+class IndiceCatalogo:
+    """Filas de una entidad de referencia con sus índices en memoria."""
+
+    lista: List[Any]
+    por_id: Dict[int, Any]
+    por_codigo: Dict[str, Any]
+    por_padre: Dict[int, List[Any]]
+
+    @classmethod
+    def construir(cls, filas: List[Any], definicion: _DefinicionCatalogo) -> 'IndiceCatalogo':
+        por_id = {getattr(fila, definicion.campo_id): fila for fila in filas}
+        por_codigo = {}
+        if definicion.campo_codigo:
+            por_codigo = {
+                getattr(fila, definicion.campo_codigo): fila
+                for fila in filas
+                if getattr(fila, definicion.campo_codigo)
+            }
+        por_padre: Dict[int, List[Any]] = {}
+        if definicion.campo_padre:
+            for fila in filas:
+                por_padre.setdefault(getattr(fila, definicion.campo_padre), []).append(fila)
+        return cls(lista=filas, por_id=por_id, por_codigo=por_codigo, por_padre=por_padre)
+
+
+class _EstadoCatalogo:
+    """Índices cargados de una base de datos (compartidos por todo el proceso)."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.indices: Dict[str, IndiceCatalogo] = {}
+        self.cargas = 0
+
+
+# Un estado por instancia de ConexionSQLite (una por base de datos). Al resetear
+# las conexiones las instancias se descartan y con ellas su catálogo.
+_estados: 'weakref.WeakKeyDictionary[ConexionSQLite, _EstadoCatalogo]' = weakref.WeakKeyDictionary()
+_lock_estados = threading.Lock()
+
+
+def _estado(ruta_db: Optional[str]) -> _EstadoCatalogo:
+    db = ConexionSQLite(ruta_db)
+    with _lock_estados:
+        estado = _estados.get(db)
+        if estado is None:
+            estado = _estados[db] = _EstadoCatalogo()
+        return estado
+
+
+def invalidar_catalogo(entidad: Optional[str] = None, ruta_db: Optional[str] = None) -> None:
+    """
+    Descarta los datos en memoria de `entidad` (y de sus dependientes) o de
+    todo el catálogo si `entidad` es None. La próxima lectura recarga desde la BD.
+
+    Los servicios de carrera, asignatura, tipo de actividad y eje temático la
+    llaman tras insertar, actualizar o eliminar. Quien escriba esas tablas
+    directamente con un DAO debe llamarla también.
+
+    Dentro de `transaccion()` el descarte ocurre al confirmar (y no ocurre si
+    se revierte): antes, otro thread podría volver a cargar las filas viejas.
+    """
+    ConexionSQLite(ruta_db).al_confirmar(lambda: _descartar(entidad, ruta_db))
+
+
+def _descartar(entidad: Optional[str], ruta_db: Optional[str]) -> None:
+    estado = _estado(ruta_db)
+    with estado.lock:
+        if entidad is None:
+            estado.indices.clear()
+            return
+        for nombre in (entidad, *_DEPENDIENTES.get(entidad, ())):
+            estado.indices.pop(nombre, None)
+    logger.debug(f"Catálogo invalidado: {entidad}")
+
+
+class CatalogoService:
+    """
+    Catálogo en memoria de los datos de referencia (carreras, asignaturas,
+    tipos de actividad y ejes temáticos), compartido por todo el proceso.
+
+    Cada entidad se carga con una consulta la primera vez que se pide y se
+    indexa por id, por código (o siglas) y por id del padre. Los DTOs
+    retornados son compartidos: no deben modificarse; para editar se usa
+    el servicio de la entidad, que invalida el catálogo.
+    """
+
+    def __init__(self, ruta_db: Optional[str] = None):
+        """
+        Args:
+            ruta_db (Optional[str]): Ruta a la base de datos SQLite.
+                Si es None, usa la ruta por defecto.
+        """
+        self.ruta_db = ruta_db
+        self._estado = _estado(ruta_db)
+
+    def indice(self, entidad: str) -> IndiceCatalogo:
+        """
+        Retorna los índices de `entidad`, cargándolos si hace falta.
+
+        Args:
+            entidad (str): CARRERA, ASIGNATURA, TIPO_ACTIVIDAD o EJE_TEMATICO.
+
+        Returns:
+            IndiceCatalogo: Lista ordenada e índices por id, código y padre.
+        """
+        indice = self._estado.indices.get(entidad)
+        if indice is not None:
+            return indice
+
+        definicion = _DEFINICIONES[entidad]
+        with self._estado.lock:
+            indice = self._estado.indices.get(entidad)
+            if indice is None:
+                dao = definicion.clase_dao(ruta_db=self.ruta_db)
+                filas = dao.consultar_dtos(definicion.sql, (), definicion.clase_dto)
+                indice = IndiceCatalogo.construir(filas, definicion)
+                self._estado.indices[entidad] = indice
+                self._estado.cargas += 1
+                logger.debug(f"Catálogo '{entidad}' cargado: {len(filas)} filas")
+        return indice
+
+    def invalidar(self, entidad: Optional[str] = None) -> None:
+        """Atajo de `invalidar_catalogo` para esta base de datos."""
+        invalidar_catalogo(entidad, self.ruta_db)
+
+    @property
+    def cargas(self) -> int:
+        """Cantidad de consultas de carga ejecutadas (útil para medir aciertos)."""
+        return self._estado.cargas
+
+    # ┌────────────────────────────────────────────────────────────┐
+    # │ Consultas por entidad
+    # └────────────────────────────────────────────────────────────┘
+
+    def _hijos(self, entidad: str, id_padre: Optional[int]) -> List[Any]:
+        indice = self.indice(entidad)
+        if id_padre:
+            return list(indice.por_padre.get(id_padre, ()))
+        return list(indice.lista)
+
+    def carreras(self) -> List[CarreraDTO]:
+        """Todas las carreras ordenadas por nombre."""
+        return list(self.indice(CARRERA).lista)
+
+    def carrera(self, id_carrera: int) -> Optional[CarreraDTO]:
+        return self.indice(CARRERA).por_id.get(id_carrera)
+
+    def asignaturas(self, id_carrera: Optional[int] = None) -> List[AsignaturaDTO]:
+        """Asignaturas ordenadas por nombre; solo las de `id_carrera` si se indica."""
+        return self._hijos(ASIGNATURA, id_carrera)
+
+    def asignatura(self, id_asignatura: int) -> Optional[AsignaturaDTO]:
+        return self.indice(ASIGNATURA).por_id.get(id_asignatura)
+
+    def asignatura_por_codigo(self, codigo: str) -> Optional[AsignaturaDTO]:
+        return self.indice(ASIGNATURA).por_codigo.get(codigo)
+
+    def tipos_actividad(self) -> List[TipoActividadDTO]:
+        """Todos los tipos de actividad ordenados por nombre."""
+        return list(self.indice(TIPO_ACTIVIDAD).lista)
+
+    def tipo_actividad(self, id_tipo_actividad: int) -> Optional[TipoActividadDTO]:
+        return self.indice(TIPO_ACTIVIDAD).por_id.get(id_tipo_actividad)
+
+    def tipo_actividad_por_siglas(self, siglas: str) -> Optional[TipoActividadDTO]:
+        return self.indice(TIPO_ACTIVIDAD).por_codigo.get(siglas)
+
+    def ejes_tematicos(self, id_asignatura: Optional[int] = None) -> List[EjeTematicoDTO]:
+        """Ejes ordenados por orden y nombre; solo los de `id_asignatura` si se indica."""
+        return self._hijos(EJE_TEMATICO, id_asignatura)
+
+    def eje_tematico(self, id_eje: int) -> Optional[EjeTematicoDTO]:
+        return self.indice(EJE_TEMATICO).por_id.get(id_eje)
+
+    def ejes_por_carrera(self, id_carrera: int) -> List[EjeTematicoDTO]:
+        """Ejes de todas las asignaturas de una carrera."""
+        return [
+            eje
+            for asignatura in self.asignaturas(id_carrera)
+            for eje in self.ejes_tematicos(asignatura.id_asignatura)
+        ]
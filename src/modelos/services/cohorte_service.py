@@ -0,0 +1,324 @@
+import bisect
+import logging
+import threading
+import weakref
+from typing import Dict, List, Optional, Tuple
+from modelos.daos.conexion_sqlite import ConexionSQLite
+from modelos.daos.estudiante_asignatura_dao import EstudianteAsignaturaDAO
+from modelos.dtos.cohorte_dto import PosicionCohorteDTO, ResumenCohorteDTO
+from modelos.services.catalogo_service import CatalogoService
+
+logger = logging.getLogger(__name__)
+
+
+class DistribucionNotas:
+    """
+    Notas de una cohorte en una lista ordenada, con su suma acumulada.
+
+    Agregar o quitar una nota cuesta una búsqueda binaria más el corrimiento
+    de la lista; la media es O(1) y los percentiles y el puesto de una nota
+    son búsquedas binarias, sin recorrer la cohorte.
+    """
+
+    __slots__ = ('notas', 'suma')
+
+    def __init__(self, notas: Optional[List[float]] = None):
+        self.notas: List[float] = sorted(notas or [])
+        self.suma = sum(self.notas)
+
+    def __len__(self) -> int:
+        return len(self.notas)
+
+    def agregar(self, nota: float) -> None:
+        bisect.insort(self.notas, nota)
+        self.suma += nota
+
+    def quitar(self, nota: float) -> bool:
+        """Quita una aparición de `nota`; retorna False si no estaba."""
+        i = bisect.bisect_left(self.notas, nota)
+        if i == len(self.notas) or self.notas[i] != nota:
+            return False
+        del self.notas[i]
+        self.suma -= nota
+        return True
+
+    def media(self) -> float:
+        return self.suma / len(self.notas) if self.notas else 0.0
+
+    def percentil(self, p: float) -> float:
+        """
+        Valor en el percentil `p` (0-100), interpolando entre las dos notas
+        más cercanas (el mismo criterio que `statistics.quantiles(method='inclusive')`).
+        """
+        if not self.notas:
+            return 0.0
+        posicion = (len(self.notas) - 1) * min(max(p, 0.0), 100.0) / 100
+        inferior = int(posicion)
+        superior = min(inferior + 1, len(self.notas) - 1)
+        fraccion = posicion - inferior
+        return self.notas[inferior] + (self.notas[superior] - self.notas[inferior]) * fraccion
+
+    def puesto(self, nota: float) -> int:
+        """1 + cantidad de notas estrictamente mayores que `nota`."""
+        return len(self.notas) - bisect.bisect_right(self.notas, nota) + 1
+
+    def percentil_de(self, nota: float) -> float:
+        """Porcentaje de la cohorte con nota menor o igual a `nota`."""
+        if not self.notas:
+            return 0.0
+        return bisect.bisect_right(self.notas, nota) * 100 / len(self.notas)
+
+
+class _Cohorte:
+    """Valor de cada estudiante de una cohorte y su distribución ordenada."""
+
+    __slots__ = ('valores', 'distribucion')
+
+    def __init__(self):
+        self.valores: Dict[int, float] = {}
+        self.distribucion = DistribucionNotas()
+
+    def fijar(self, id_estudiante: int, valor: Optional[float]) -> None:
+        """Reemplaza (o quita, si `valor` es None) el valor del estudiante."""
+        anterior = self.valores.pop(id_estudiante, None)
+        if anterior is not None:
+            self.distribucion.quitar(anterior)
+        if valor is not None:
+            self.valores[id_estudiante] = valor
+            self.distribucion.agregar(valor)
+
+
+class _EstadoCohortes:
+    """Cohortes cargadas de una base de datos (compartidas por todo el proceso)."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.cargado = False
+        self.cargas = 0
+        self.notas: Dict[Tuple[int, int], float] = {}
+        self.carrera_de: Dict[int, int] = {}
+        self.por_asignatura: Dict[int, _Cohorte] = {}
+        self.por_carrera: Dict[int, _Cohorte] = {}
+        # (id_estudiante, id_carrera) -> [suma de notas, cantidad de asignaturas]
+        self.acumulado_carrera: Dict[Tuple[int, int], List[float]] = {}
+
+    def vaciar(self) -> None:
+        self.cargado = False
+        self.notas.clear()
+        self.carrera_de.clear()
+        self.por_asignatura.clear()
+        self.por_carrera.clear()
+        self.acumulado_carrera.clear()
+
+    def aplicar(self, id_estudiante: int, id_asignatura: int, id_carrera: int, nota: Optional[float]) -> None:
+        """Registra la nota final de un estudiante en su asignatura y su carrera."""
+        clave = (id_estudiante, id_asignatura)
+        anterior = self.notas.pop(clave, None)
+        if nota is not None:
+            self.notas[clave] = nota
+        self.carrera_de[id_asignatura] = id_carrera
+
+        self.por_asignatura.setdefault(id_asignatura, _Cohorte()).fijar(id_estudiante, nota)
+
+        # En la carrera cada estudiante aporta el promedio de sus asignaturas
+        clave_carrera = (id_estudiante, id_carrera)
+        acumulado = self.acumulado_carrera.get(clave_carrera, [0.0, 0])
+        if anterior is not None:
+            acumulado[0] -= anterior
+            acumulado[1] -= 1
+        if nota is not None:
+            acumulado[0] += nota
+            acumulado[1] += 1
+
+        cohorte_carrera = self.por_carrera.setdefault(id_carrera, _Cohorte())
+        if acumulado[1] > 0:
+            self.acumulado_carrera[clave_carrera] = acumulado
+            cohorte_carrera.fijar(id_estudiante, acumulado[0] / acumulado[1])
+        else:
+            self.acumulado_carrera.pop(clave_carrera, None)
+            cohorte_carrera.fijar(id_estudiante, None)
+
+
+# Un estado por instancia de ConexionSQLite, igual que el catálogo de referencia
+_estados: 'weakref.WeakKeyDictionary[ConexionSQLite, _EstadoCohortes]' = weakref.WeakKeyDictionary()
+_lock_estados = threading.Lock()
+
+
+def _estado(ruta_db: Optional[str]) -> _EstadoCohortes:
+    db = ConexionSQLite(ruta_db)
+    with _lock_estados:
+        estado = _estados.get(db)
+        if estado is None:
+            estado = _estados[db] = _EstadoCohortes()
+        return estado
+
+
+def registrar_nota_final(
+    id_estudiante: int, id_asignatura: int, nota_final: Optional[float], ruta_db: Optional[str] = None
+) -> None:
+    """
+    Actualiza las cohortes en memoria con la nota final de un estudiante
+    (None si la quitó o si se eliminó la inscripción). Si las cohortes no
+    están cargadas no hace nada: la próxima lectura las carga desde la BD.
+
+    EstudianteAsignaturaService la llama tras insertar, actualizar o eliminar.
+    Dentro de `transaccion()` la nota se aplica al confirmar y se descarta si
+    se revierte, igual que `invalidar_catalogo`.
+    """
+    ConexionSQLite(ruta_db).al_confirmar(
+        lambda: _aplicar_nota(id_estudiante, id_asignatura, nota_final, ruta_db)
+    )
+
+
+def _aplicar_nota(
+    id_estudiante: int, id_asignatura: int, nota_final: Optional[float], ruta_db: Optional[str]
+) -> None:
+    estado = _estado(ruta_db)
+    with estado.lock:
+        if not estado.cargado:
+            return
+        id_carrera = estado.carrera_de.get(id_asignatura)
+        if id_carrera is None:
+            asignatura = CatalogoService(ruta_db).asignatura(id_asignatura)
+            if asignatura is None:
+                estado.vaciar()
+                return
+            id_carrera = asignatura.id_carrera
+        nota = float(nota_final) if nota_final is not None else None
+        estado.aplicar(id_estudiante, id_asignatura, id_carrera, nota)
+
+
+def invalidar_cohortes(ruta_db: Optional[str] = None) -> None:
+    """
+    Descarta las cohortes en memoria; la próxima lectura las recarga.
+
+    Los servicios de asignatura, carrera y estudiante la llaman cuando un
+    cambio puede mover o borrar (en cascada) notas finales. Quien escriba
+    `estudiante_asignatura` directamente con un DAO debe llamarla también.
+    Dentro de `transaccion()` el descarte ocurre al confirmar.
+    """
+    ConexionSQLite(ruta_db).al_confirmar(lambda: _vaciar(ruta_db))
+
+
+def _vaciar(ruta_db: Optional[str]) -> None:
+    estado = _estado(ruta_db)
+    with estado.lock:
+        estado.vaciar()
+    logger.debug("Cohortes invalidadas")
+
+
+class CohorteService:
+    """
+    Estadísticas de notas finales por cohorte, compartidas por todo el proceso.
+
+    La cohorte de una asignatura son las notas finales de sus estudiantes;
+    la de una carrera, el promedio de notas finales de cada estudiante en
+    las asignaturas de esa carrera. Todo se carga con una consulta la
+    primera vez y luego se mantiene con `registrar_nota_final`, de modo que
+    media, percentiles y el puesto de un estudiante no vuelven a recorrer
+    la cohorte ni a consultar la base de datos.
+    """
+
+    def __init__(self, ruta_db: Optional[str] = None):
+        """
+        Args:
+            ruta_db (Optional[str]): Ruta a la base de datos SQLite.
+                Si es None, usa la ruta por defecto.
+        """
+        self.ruta_db = ruta_db
+        self._estado = _estado(ruta_db)
+
+    @property
+    def cargas(self) -> int:
+        """Cantidad de consultas de carga ejecutadas (útil para medir aciertos)."""
+        return self._estado.cargas
+
+    def resumen(
+        self, id_asignatura: Optional[int] = None, id_carrera: Optional[int] = None
+    ) -> ResumenCohorteDTO:
+        """
+        Retorna media, mediana, cuartiles, percentil 90 y extremos de la cohorte
+        de una asignatura o de una carrera (se indica exactamente una).
+        """
+        with self._estado.lock:
+            distribucion = self._cohorte(id_asignatura, id_carrera).distribucion
+            if not distribucion:
+                return ResumenCohorteDTO()
+            return ResumenCohorteDTO(
+                total=len(distribucion),
+                media=round(distribucion.media(), 2),
+                mediana=round(distribucion.percentil(50), 2),
+                percentil_25=round(distribucion.percentil(25), 2),
+                percentil_75=round(distribucion.percentil(75), 2),
+                percentil_90=round(distribucion.percentil(90), 2),
+                minimo=distribucion.notas[0],
+                maximo=distribucion.notas[-1],
+            )
+
+    def posicion(
+        self,
+        id_estudiante: int,
+        id_asignatura: Optional[int] = None,
+        id_carrera: Optional[int] = None,
+    ) -> Optional[PosicionCohorteDTO]:
+        """
+        Retorna el puesto y el percentil del estudiante en la cohorte, o None
+        si no tiene nota en ella.
+        """
+        with self._estado.lock:
+            cohorte = self._cohorte(id_asignatura, id_carrera)
+            nota = cohorte.valores.get(id_estudiante)
+            if nota is None:
+                return None
+            posicion = self._ubicar(cohorte.distribucion, nota)
+            posicion.id_estudiante = id_estudiante
+            return posicion
+
+    def ubicar(
+        self, nota: float, id_asignatura: Optional[int] = None, id_carrera: Optional[int] = None
+    ) -> PosicionCohorteDTO:
+        """Retorna el puesto y el percentil que tendría `nota` en la cohorte."""
+        with self._estado.lock:
+            return self._ubicar(self._cohorte(id_asignatura, id_carrera).distribucion, nota)
+
+    # ┌────────────────────────────────────────────────────────────┐
+    # │ Métodos Privados
+    # └────────────────────────────────────────────────────────────┘
+
+    def _cohorte(self, id_asignatura: Optional[int], id_carrera: Optional[int]) -> _Cohorte:
+        if (id_asignatura is None) == (id_carrera is None):
+            raise ValueError("Se debe indicar id_asignatura o id_carrera (solo uno)")
+        self._cargar()
+        if id_asignatura is not None:
+            return self._estado.por_asignatura.get(id_asignatura) or _Cohorte()
+        return self._estado.por_carrera.get(id_carrera) or _Cohorte()
+
+    @staticmethod
+    def _ubicar(distribucion: DistribucionNotas, nota: float) -> PosicionCohorteDTO:
+        return PosicionCohorteDTO(
+            nota=round(nota, 2),
+            puesto=distribucion.puesto(nota),
+            total=len(distribucion),
+            percentil=round(distribucion.percentil_de(nota), 1),
+            media=round(distribucion.media(), 2),
+        )
+
+    def _cargar(self) -> None:
+        """Carga todas las notas finales si las cohortes no están en memoria."""
+        if self._estado.cargado:
+            return
+        with self._estado.lock:
+            if self._estado.cargado:
+                return
+            self._estado.vaciar()
+            filas = EstudianteAsignaturaDAO(ruta_db=self.ruta_db).obtener_notas_finales()
+            for fila in filas:
+                self._estado.aplicar(
+                    fila['id_estudiante'],
+                    fila['id_asignatura'],
+                    fila['id_carrera'],
+                    float(fila['nota_final']),
+                )
+            self._estado.cargado = True
+            self._estado.cargas += 1
+            logger.debug(f"Cohortes cargadas: {len(filas)} notas finales")
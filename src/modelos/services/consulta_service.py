@@ -1,5 +1,7 @@
+import csv
 import logging
-from typing import Optional, List, Dict, Any
+import os
+from typing import Optional, List, Dict, Any, Iterable, Iterator
 from datetime import datetime, timedelta
 from modelos.daos.consulta_dao import (
     ConsultaDAO,
@@ -118,7 +120,7 @@ class EventosUnificadosService:
         return self.dao.obtener_eventos_calendario()
 
     def obtener_por_rango_fechas(
-        self, fecha_inicio: str, fecha_fin: str
+        self, fecha_inicio: str, fecha_fin: str, solapamiento: bool = False
     ) -> List[EventosUnificadosDTO]:
         """
         Obtiene eventos dentro de un rango de fechas.
@@ -126,12 +128,40 @@ class EventosUnificadosService:
         Args:
             fecha_inicio (str): Fecha inicial en formato YYYY-MM-DD
             fecha_fin (str): Fecha final en formato YYYY-MM-DD
+            solapamiento (bool): Incluir también los eventos que solo se solapan con el rango.
 
         Returns:
             List[EventosUnificadosDTO]: Lista de eventos en el rango.
         """
         logger.info(f"Obteniendo eventos entre {fecha_inicio} y {fecha_fin}")
-        return self.dao.obtener_por_rango_fechas(fecha_inicio, fecha_fin)
+        return self.dao.obtener_por_rango_fechas(fecha_inicio, fecha_fin, solapamiento)
+
+    def iterar_todos(self) -> Iterator[EventosUnificadosDTO]:
+        """
+        Recorre todos los eventos unificados sin cargarlos todos en memoria.
+
+        Returns:
+            Iterator[EventosUnificadosDTO]: Iterador de eventos ordenados por fecha.
+        """
+        logger.info("Iterando todos los eventos unificados")
+        return self.dao.iterar_todos()
+
+    def iterar_por_rango_fechas(
+        self, fecha_inicio: str, fecha_fin: str, solapamiento: bool = False
+    ) -> Iterator[EventosUnificadosDTO]:
+        """
+        Recorre los eventos de un rango de fechas sin cargarlos todos en memoria.
+
+        Args:
+            fecha_inicio (str): Fecha inicial en formato YYYY-MM-DD
+            fecha_fin (str): Fecha final en formato YYYY-MM-DD
+            solapamiento (bool): Incluir también los eventos que solo se solapan con el rango.
+
+        Returns:
+            Iterator[EventosUnificadosDTO]: Iterador de eventos en el rango.
+        """
+        logger.info(f"Iterando eventos entre {fecha_inicio} y {fecha_fin}")
+        return self.dao.iterar_por_rango_fechas(fecha_inicio, fecha_fin, solapamiento=solapamiento)
 
     def obtener_por_tipo_actividad(self, tipo_actividad: str) -> List[EventosUnificadosDTO]:
         """
@@ -395,3 +425,75 @@ class EventosUnificadosService:
         proximos = [e for e in eventos if hoy.isoformat() <= e.fecha_fin <= fecha_limite]
         logger.debug(f"Encontrados {len(proximos)} eventos próximos a vencer en {dias} días")
         return proximos
+
+    # ┌────────────────────────────────────────────────────────────┐
+    # │ Exportación
+    # └────────────────────────────────────────────────────────────┘
+
+    ENCABEZADOS_CSV = [
+        'Título',
+        'Tipo Evento',
+        'Carrera',
+        'Asignatura',
+        'Tipo Actividad',
+        'Fecha Inicio',
+        'Fecha Fin',
+        'Descripción',
+    ]
+
+    def exportar_csv(
+        self, ruta_archivo: str, eventos: Optional[Iterable[EventosUnificadosDTO]] = None
+    ) -> int:
+        """
+        Escribe eventos en un archivo CSV fila por fila.
+
+        Se escribe primero `<ruta_archivo>.tmp` y se renombra al terminar: si la
+        lectura falla a mitad, no queda un CSV truncado (ni se pisa uno anterior).
+
+        Args:
+            ruta_archivo (str): Ruta del archivo CSV a crear.
+            eventos (Optional[Iterable[EventosUnificadosDTO]]): Eventos a exportar.
+                Si es None se exporta el historial completo leyéndolo por bloques,
+                sin cargarlo entero en memoria.
+
+        Returns:
+            int: Cantidad de eventos exportados.
+
+        Raises:
+            sqlite3.Error: Si falla la lectura de los eventos.
+            OSError: Si no se puede escribir el archivo.
+        """
+        if eventos is None:
+            eventos = self.iterar_todos()
+
+        total = 0
+        ruta_temporal = f"{ruta_archivo}.tmp"
+        try:
+            with open(ruta_temporal, 'w', newline='', encoding='utf-8') as archivo:
+                writer = csv.writer(archivo, quoting=csv.QUOTE_ALL)
+                writer.writerow(self.ENCABEZADOS_CSV)
+                for evento in eventos:
+                    writer.writerow(
+                        [
+                            evento.titulo,
+                            evento.tipo_evento,
+                            evento.carrera or '-',
+                            evento.asignatura or '-',
+                            evento.tipo_actividad or '-',
+                            evento.fecha_inicio,
+                            evento.fecha_fin,
+                            evento.descripcion or '-',
+                        ]
+                    )
+                    total += 1
+            os.replace(ruta_temporal, ruta_archivo)
+        except BaseException:
+            logger.error(f"Exportación a CSV cancelada tras {total} eventos: {ruta_archivo}")
+            try:
+                os.remove(ruta_temporal)
+            except OSError:
+                pass
+            raise
+
+        logger.info(f"Exportados {total} eventos a CSV: {ruta_archivo}")
+        return total
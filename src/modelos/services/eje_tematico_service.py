@@ -2,6 +2,7 @@ import logging
 from typing import Optional
 from modelos.dtos.eje_tematico_dto import EjeTematicoDTO
 from modelos.daos.eje_tematico_dao import EjeTematicoDAO
+from modelos.services.catalogo_service import EJE_TEMATICO, invalidar_catalogo
 
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,7 @@ class EjeTematicoService(EjeTematicoDTO):
             id_eje = self.dao.insertar(dto=self)
             if id_eje:
                 self.id_eje = id_eje
+                invalidar_catalogo(EJE_TEMATICO, self.dao.ruta_db)
                 logger.info(f"Eje temático insertado con ID: {id_eje}")
             return id_eje
         except Exception as e:
@@ -44,6 +46,7 @@ class EjeTematicoService(EjeTematicoDTO):
         try:
             resultado = self.dao.actualizar(dto=self)
             if resultado:
+                invalidar_catalogo(EJE_TEMATICO, self.dao.ruta_db)
                 logger.info(f"Eje temático {self.id_eje} actualizado exitosamente")
             return resultado
         except Exception as e:
@@ -58,6 +61,7 @@ class EjeTematicoService(EjeTematicoDTO):
         try:
             resultado = self.dao.eliminar(dto=self)
             if resultado:
+                invalidar_catalogo(EJE_TEMATICO, self.dao.ruta_db)
                 logger.info(f"Eje temático {self.id_eje} eliminado exitosamente")
             return resultado
         except Exception as e:
@@ -2,6 +2,7 @@ import logging
 from typing import Optional
 from modelos.dtos.estudiante_asignatura_dto import EstudianteAsignaturaDTO
 from modelos.daos.estudiante_asignatura_dao import EstudianteAsignaturaDAO
+from modelos.services.cohorte_service import registrar_nota_final
 
 
 logger = logging.getLogger(__name__)
@@ -33,6 +34,9 @@ class EstudianteAsignaturaService(EstudianteAsignaturaDTO):
                     f"Estudiante asignatura insertado: Estudiante={self.id_estudiante}, "
                     f"Asignatura={self.id_asignatura}"
                 )
+                registrar_nota_final(
+                    self.id_estudiante, self.id_asignatura, self.nota_final, self.dao.ruta_db
+                )
             return resultado
         except Exception as e:
             logger.error(f"Error al insertar estudiante asignatura: {e}")
@@ -50,6 +54,9 @@ class EstudianteAsignaturaService(EstudianteAsignaturaDTO):
                     f"Estudiante asignatura actualizado: Estudiante={self.id_estudiante}, "
                     f"Asignatura={self.id_asignatura}"
                 )
+                registrar_nota_final(
+                    self.id_estudiante, self.id_asignatura, self.nota_final, self.dao.ruta_db
+                )
             return resultado
         except Exception as e:
             logger.error(f"Error al actualizar estudiante asignatura: {e}")
@@ -67,6 +74,9 @@ class EstudianteAsignaturaService(EstudianteAsignaturaDTO):
                     f"Estudiante asignatura eliminado: Estudiante={self.id_estudiante}, "
                     f"Asignatura={self.id_asignatura}"
                 )
+                registrar_nota_final(
+                    self.id_estudiante, self.id_asignatura, None, self.dao.ruta_db
+                )
             return resultado
         except Exception as e:
             logger.error(f"Error al eliminar estudiante asignatura: {e}")
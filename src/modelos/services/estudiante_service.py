@@ -2,6 +2,7 @@ import logging
 from typing import Optional
 from modelos.dtos.estudiante_dto import EstudianteDTO
 from modelos.daos.estudiante_dao import EstudianteDAO
+from modelos.services.cohorte_service import invalidar_cohortes
 
 
 logger = logging.getLogger(__name__)
@@ -58,6 +59,7 @@ class EstudianteService(EstudianteDTO):
         try:
             resultado = self.dao.eliminar(dto=self)
             if resultado:
+                invalidar_cohortes(self.dao.ruta_db)
                 logger.info(f"Estudiante {self.id_estudiante} eliminado exitosamente")
             return resultado
         except Exception as e:
@@ -0,0 +1,198 @@
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Hashable, Iterable, List, Optional, Set, Tuple
+from modelos.daos.conexion_sqlite import ConexionSQLite
+from modelos.daos.consulta_dao import EventosUnificadosDAO
+from modelos.dtos.consulta_dto import EventosUnificadosDTO
+from utilidades.config import CACHE_EVENTOS_MESES
+
+logger = logging.getLogger(__name__)
+
+
+def desplazar_mes(ano: int, mes: int, desplazamiento: int) -> Tuple[int, int]:
+    """Retorna (año, mes) desplazado `desplazamiento` meses."""
+    indice = ano * 12 + (mes - 1) + desplazamiento
+    return indice // 12, indice % 12 + 1
+
+
+def _clave_mes(ano: int, mes: int) -> str:
+    """Prefijo YYYY-MM de las fechas del mes."""
+    return f"{ano:04d}-{mes:02d}"
+
+
+class _EstadoEventosMes:
+    """Meses cargados de una base de datos (compartidos por todo el proceso)."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.meses: 'OrderedDict[str, List[EventosUnificadosDTO]]' = OrderedDict()
+        self.version: Optional[Hashable] = None
+        self.en_curso: Set[str] = set()
+        self.consultas = 0
+
+
+# Un estado por instancia de ConexionSQLite, igual que el catálogo de referencia
+_estados: 'weakref.WeakKeyDictionary[ConexionSQLite, _EstadoEventosMes]' = weakref.WeakKeyDictionary()
+_lock_estados = threading.Lock()
+
+
+def _estado(db: ConexionSQLite) -> _EstadoEventosMes:
+    with _lock_estados:
+        estado = _estados.get(db)
+        if estado is None:
+            estado = _estados[db] = _EstadoEventosMes()
+        return estado
+
+
+class EventosMesService:
+    """
+    Eventos unificados agrupados por mes para el calendario.
+
+    Cada mes se guarda en memoria la primera vez que se pide, junto con sus
+    vecinos (una sola consulta por rango de fechas). `precargar_en_segundo_plano`
+    completa los meses vecinos en un thread para que la navegación entre
+    meses no espere a la base de datos.
+
+    Los meses guardados pertenecen a una versión de los datos
+    (`ConexionSQLite.version_datos`): cualquier cambio confirmado, por ejemplo
+    al editar una actividad o un evento de calendario, los descarta.
+    Los DTOs retornados son compartidos y no deben modificarse.
+    """
+
+    def __init__(self, ruta_db: Optional[str] = None, radio: int = 1):
+        """
+        Args:
+            ruta_db (Optional[str]): Ruta a la base de datos SQLite.
+                Si es None, usa la ruta por defecto.
+            radio (int): Meses vecinos (antes y después) que se cargan junto a cada mes.
+        """
+        self.dao = EventosUnificadosDAO(ruta_db=ruta_db)
+        self.radio = radio
+        self._db = ConexionSQLite(ruta_db)
+        self._estado = _estado(self._db)
+
+    def _version_actual(self) -> Hashable:
+        """Lee la versión de los datos y descarta los meses si cambió."""
+        version = self._db.version_datos()
+        with self._estado.lock:
+            if version != self._estado.version:
+                if self._estado.meses:
+                    logger.debug(f"Eventos por mes invalidados ({len(self._estado.meses)} meses)")
+                self._estado.meses.clear()
+                self._estado.version = version
+        return version
+
+    def obtener_mes(self, ano: int, mes: int) -> List[EventosUnificadosDTO]:
+        """
+        Retorna los eventos que comienzan en el mes indicado, ordenados por fecha.
+
+        Equivale a `EventosUnificadosService.obtener_por_mes`. Si el mes no
+        está en memoria se carga junto con sus vecinos en una consulta.
+
+        Args:
+            ano (int): Año (ej: 2026)
+            mes (int): Mes (1-12)
+
+        Returns:
+            List[EventosUnificadosDTO]: Eventos del mes.
+        """
+        version = self._version_actual()
+        clave = _clave_mes(ano, mes)
+        with self._estado.lock:
+            eventos = self._estado.meses.get(clave)
+            if eventos is not None:
+                self._estado.meses.move_to_end(clave)
+                return list(eventos)
+
+        meses = self._ventana(ano, mes)
+        cargados = self._cargar(meses, version)
+        return list(cargados.get(clave, []))
+
+    def precargar(self, ano: int, mes: int) -> int:
+        """
+        Carga el mes y sus vecinos que falten en memoria.
+
+        Returns:
+            int: Cantidad de meses cargados.
+        """
+        version = self._version_actual()
+        with self._estado.lock:
+            faltantes = [
+                (a, m)
+                for a, m in self._ventana(ano, mes)
+                if _clave_mes(a, m) not in self._estado.meses
+                and _clave_mes(a, m) not in self._estado.en_curso
+            ]
+        if not faltantes:
+            return 0
+        return len(self._cargar(faltantes, version))
+
+    def precargar_en_segundo_plano(self, ano: int, mes: int) -> threading.Thread:
+        """
+        Ejecuta `precargar` en un thread daemon y lo retorna.
+
+        El thread solo consulta la base de datos; no toca widgets.
+        """
+        hilo = threading.Thread(
+            target=self._precargar_seguro,
+            args=(ano, mes),
+            name=f"precarga-eventos-{_clave_mes(ano, mes)}",
+            daemon=True,
+        )
+        hilo.start()
+        return hilo
+
+    def _precargar_seguro(self, ano: int, mes: int) -> None:
+        try:
+            cargados = self.precargar(ano, mes)
+            logger.debug(f"Precargados {cargados} meses alrededor de {_clave_mes(ano, mes)}")
+        except Exception as ex:
+            logger.error(f"Error al precargar eventos de {_clave_mes(ano, mes)}: {ex}", exc_info=True)
+
+    @property
+    def consultas(self) -> int:
+        """Cantidad de consultas por rango ejecutadas (útil para medir aciertos)."""
+        return self._estado.consultas
+
+    # ┌────────────────────────────────────────────────────────────┐
+    # │ Métodos Privados
+    # └────────────────────────────────────────────────────────────┘
+
+    def _ventana(self, ano: int, mes: int) -> List[Tuple[int, int]]:
+        return [desplazar_mes(ano, mes, d) for d in range(-self.radio, self.radio + 1)]
+
+    def _cargar(self, meses: Iterable[Tuple[int, int]], version: Hashable) -> dict:
+        """
+        Carga `meses` con una consulta sobre el rango que los cubre y los guarda
+        si la versión de los datos no cambió mientras tanto.
+        """
+        meses = sorted(meses)
+        claves = [_clave_mes(a, m) for a, m in meses]
+        with self._estado.lock:
+            self._estado.en_curso.update(claves)
+        try:
+            desde = f"{claves[0]}-01"
+            hasta = f"{_clave_mes(*desplazar_mes(*meses[-1], 1))}-01"
+            eventos = self.dao.obtener_por_inicio_entre(desde, hasta)
+
+            cargados = {clave: [] for clave in claves}
+            for evento in eventos:
+                # Misma comparación de texto que la consulta: el prefijo YYYY-MM
+                lista = cargados.get(evento.fecha_inicio[:7])
+                if lista is not None:
+                    lista.append(evento)
+
+            with self._estado.lock:
+                self._estado.consultas += 1
+                if self._estado.version == version:
+                    for clave, lista in cargados.items():
+                        self._estado.meses[clave] = lista
+                        self._estado.meses.move_to_end(clave)
+                    while len(self._estado.meses) > CACHE_EVENTOS_MESES:
+                        self._estado.meses.popitem(last=False)
+            return cargados
+        finally:
+            with self._estado.lock:
+                self._estado.en_curso.difference_update(claves)
@@ -2,6 +2,7 @@ import logging
 from typing import Optional
 from modelos.dtos.tipo_actividad_dto import TipoActividadDTO
 from modelos.daos.tipo_actividad_dao import TipoActividadDAO
+from modelos.services.catalogo_service import TIPO_ACTIVIDAD, invalidar_catalogo
 
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,7 @@ class TipoActividadService(TipoActividadDTO):
             id_tipo_actividad = self.dao.insertar(dto=self)
             if id_tipo_actividad:
                 self.id_tipo_actividad = id_tipo_actividad
+                invalidar_catalogo(TIPO_ACTIVIDAD, self.dao.ruta_db)
                 logger.info(f"Tipo de actividad insertado con ID: {id_tipo_actividad}")
             return id_tipo_actividad
         except Exception as e:
@@ -44,6 +46,7 @@ class TipoActividadService(TipoActividadDTO):
         try:
             resultado = self.dao.actualizar(dto=self)
             if resultado:
+                invalidar_catalogo(TIPO_ACTIVIDAD, self.dao.ruta_db)
                 logger.info(f"Tipo de actividad {self.id_tipo_actividad} actualizado exitosamente")
             return resultado
         except Exception as e:
@@ -58,6 +61,7 @@ class TipoActividadService(TipoActividadDTO):
         try:
             resultado = self.dao.eliminar(dto=self)
             if resultado:
+                invalidar_catalogo(TIPO_ACTIVIDAD, self.dao.ruta_db)
                 logger.info(f"Tipo de actividad {self.id_tipo_actividad} eliminado exitosamente")
             return resultado
         except Exception as e:
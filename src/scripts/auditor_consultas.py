@@ -0,0 +1,482 @@
+"""
+Auditoría de planes de consulta (EXPLAIN QUERY PLAN) e índices sugeridos.
+
+Recibe sentencias tal como las ejecutó la aplicación (ver
+TelemetriaConsultas.ejemplos) y, sobre una base de datos con datos
+representativos:
+
+1. Obtiene el plan de cada sentencia y marca los recorridos completos de
+   tablas (`SCAN tabla`) y los ordenamientos en B-tree temporales
+   (`USE TEMP B-TREE FOR ORDER BY / GROUP BY / DISTINCT`).
+2. Propone un índice por tabla problemática a partir de la propia sentencia:
+   columnas comparadas por igualdad, luego una de rango (o las del ORDER BY);
+   parcial si la sentencia filtra por un literal (`estado = 'pendiente'`) y
+   cubriente si la sentencia usa pocas columnas de la tabla.
+3. Mide la sentencia antes y después de crear cada índice sugerido (que se
+   borra al terminar) y verifica que el planificador lo use.
+
+También informa qué índices de crear_indices.INDICES no aparecen en ningún plan.
+
+Las sugerencias son heurísticas: solo las que el planificador usa y mejoran
+el tiempo medido merecen pasar a crear_indices.py. Ver
+scripts/auditar_consultas.py para ejecutarla desde la línea de comandos.
+"""
+
+import dataclasses
+import re
+import sqlite3
+import statistics
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from scripts.logging_config import obtener_logger_modulo
+
+logger = obtener_logger_modulo(__name__)
+
+# Sentencias con plan de consulta interesante (las de DDL, PRAGMA o INSERT ... VALUES no lo tienen)
+_PATRON_AUDITABLE = re.compile(r"^\s*(?:SELECT|WITH|UPDATE|DELETE)\b|^\s*INSERT\b.*\bSELECT\b", re.I | re.S)
+_PATRON_LECTURA = re.compile(r"^\s*(?:SELECT|WITH)\b", re.I)
+
+_PATRON_SCAN = re.compile(r"^SCAN (\w+)(?: USING (COVERING )?INDEX (\w+))?$")
+_PATRON_SUBCONSULTA = re.compile(r"^(?:CO-ROUTINE|MATERIALIZE) (\w+)")
+_PATRON_INDICE_USADO = re.compile(r"USING (?:COVERING )?INDEX (\w+)")
+_PATRON_TEMP_BTREE = re.compile(r"USE TEMP B-TREE FOR (.+)$")
+
+_PATRON_LITERAL_TEXTO = re.compile(r"'(?:[^']|'')*'")
+_PATRON_TABLA = re.compile(r"\b(?:FROM|JOIN|UPDATE)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?", re.I)
+_PATRON_COLUMNA = r"(?:(\w+)\.)?(\w+)"
+_PATRON_PREDICADO = re.compile(
+    _PATRON_COLUMNA
+    + r"\s*(=|==|<=|>=|<>|!=|<|>|\bIN\b|\bIS\s+NOT\b|\bIS\b|\bBETWEEN\b|\bLIKE\b)\s*"
+    + r"('(?:[^']|'')*'|-?\d+(?:\.\d+)?|\?|NULL\b|\(|" + _PATRON_COLUMNA + r")",
+    re.I,
+)
+# Asignaciones de un UPDATE (`SET estado = ?` no es un filtro)
+_PATRON_ASIGNACIONES = re.compile(r"\bSET\b.*?(?=\bWHERE\b|$)", re.I | re.S)
+_PATRON_ORDER_BY = re.compile(r"\bORDER\s+BY\s+(.+?)(?:\bLIMIT\b|\bOFFSET\b|\)|$)", re.I | re.S)
+
+# Palabras que pueden seguir a la tabla en FROM/JOIN y no son un alias
+_PALABRAS_RESERVADAS = {
+    "where", "join", "inner", "left", "right", "full", "outer", "cross", "natural", "on", "using",
+    "group", "order", "limit", "union", "except", "intersect", "as", "set", "values", "having", "window",
+}
+_OPERADORES_IGUALDAD = {"=", "==", "in", "is"}
+_OPERADORES_RANGO = {"<", ">", "<=", ">=", "between", "like"}
+
+# Columnas extra que se agregan para que un índice sea cubriente
+MAX_COLUMNAS_CUBRIENTES = 4
+
+
+@dataclasses.dataclass
+class PlanConsulta:
+    """
+    Plan de ejecución de una sentencia.
+
+    Attributes:
+        detalles (List[str]): Columna `detail` de cada fila de EXPLAIN QUERY PLAN.
+        escaneos (List[str]): Tablas (o alias) recorridas completas sin índice.
+        ordenamientos_temporales (List[str]): Usos de B-tree temporales (ORDER BY, GROUP BY, DISTINCT).
+        indices_usados (Set[str]): Índices que aparecen en el plan.
+        filas_marcadas (Set[int]): Posiciones en `detalles` de los recorridos y ordenamientos marcados.
+    """
+
+    detalles: List[str]
+    escaneos: List[str] = dataclasses.field(default_factory=list)
+    ordenamientos_temporales: List[str] = dataclasses.field(default_factory=list)
+    indices_usados: Set[str] = dataclasses.field(default_factory=set)
+    filas_marcadas: Set[int] = dataclasses.field(default_factory=set)
+
+    @property
+    def tiene_problemas(self) -> bool:
+        return bool(self.escaneos or self.ordenamientos_temporales)
+
+
+@dataclasses.dataclass
+class SugerenciaIndice:
+    """
+    Índice propuesto para una tabla de una sentencia.
+
+    Attributes:
+        tabla (str): Tabla a indexar.
+        columnas (List[str]): Columnas de la clave, en orden.
+        condicion (Optional[str]): Cláusula WHERE del índice parcial, si corresponde.
+        cubriente (bool): Si incluye todas las columnas que la sentencia usa de la tabla.
+        motivo (str): Problema del plan que la originó.
+    """
+
+    tabla: str
+    columnas: List[str]
+    condicion: Optional[str] = None
+    cubriente: bool = False
+    motivo: str = ""
+
+    @property
+    def nombre(self) -> str:
+        nombre = f"idx_sug_{self.tabla}_{'_'.join(self.columnas)}"
+        return nombre[:60] + ("_p" if self.condicion else "")
+
+    @property
+    def sql(self) -> str:
+        sql = f"CREATE INDEX IF NOT EXISTS {self.nombre} ON {self.tabla} ({', '.join(self.columnas)})"
+        return sql + (f" WHERE {self.condicion}" if self.condicion else "")
+
+
+@dataclasses.dataclass
+class EvaluacionSugerencia:
+    """
+    Resultado de probar una SugerenciaIndice.
+
+    Attributes:
+        sugerencia (SugerenciaIndice): Índice probado.
+        usado (bool): Si el planificador lo usó con el índice creado.
+        plan_despues (PlanConsulta): Plan con el índice creado.
+        antes_ms (Optional[float]): Mediana sin el índice (None en sentencias de escritura).
+        despues_ms (Optional[float]): Mediana con el índice.
+    """
+
+    sugerencia: SugerenciaIndice
+    usado: bool
+    plan_despues: PlanConsulta
+    antes_ms: Optional[float] = None
+    despues_ms: Optional[float] = None
+
+    @property
+    def mejora(self) -> Optional[float]:
+        """Cuántas veces más rápida es la sentencia con el índice."""
+        if not self.antes_ms or not self.despues_ms:
+            return None
+        return self.antes_ms / self.despues_ms
+
+
+@dataclasses.dataclass
+class ResultadoAuditoria:
+    """
+    Auditoría de una sentencia.
+
+    Attributes:
+        origen (str): Quién la ejecutó (clase DAO o descripción).
+        sql (str): Sentencia auditada.
+        params (tuple): Parámetros usados para explicarla y medirla.
+        plan (PlanConsulta): Plan con los índices actuales.
+        sugerencias (List[EvaluacionSugerencia]): Índices propuestos y su efecto.
+        error (Optional[str]): Mensaje si la sentencia no se pudo explicar.
+    """
+
+    origen: str
+    sql: str
+    params: tuple
+    plan: Optional[PlanConsulta] = None
+    sugerencias: List[EvaluacionSugerencia] = dataclasses.field(default_factory=list)
+    error: Optional[str] = None
+
+
+# ┌────────────────────────────────────────────────────────────┐
+# │ Planes
+# └────────────────────────────────────────────────────────────┘
+
+def es_auditable(sql: str) -> bool:
+    """Indica si la sentencia tiene un plan de consulta que auditar."""
+    return bool(_PATRON_AUDITABLE.match(sql))
+
+
+def completar_params(sql: str, params: Sequence[Any]) -> tuple:
+    """
+    Retorna `params` si alcanzan para la sentencia; si no (por ejemplo, una
+    entrada de telemetría sin ejemplo) usa NULL en cada marcador `?`.
+    """
+    marcadores = _PATRON_LITERAL_TEXTO.sub("", sql).count("?")
+    params = tuple(params or ())
+    return params if len(params) == marcadores else (None,) * marcadores
+
+
+def explicar(con: sqlite3.Connection, sql: str, params: Sequence[Any] = ()) -> PlanConsulta:
+    """
+    Ejecuta EXPLAIN QUERY PLAN sobre `sql` y clasifica las filas del plan.
+
+    Raises:
+        sqlite3.Error: Si la sentencia no es válida para la base de datos.
+    """
+    detalles = [fila[3] for fila in con.execute(f"EXPLAIN QUERY PLAN {sql}", tuple(params))]
+    plan = PlanConsulta(detalles=detalles)
+    # Recorrer el resultado de una subconsulta o vista ya calculada no es un recorrido de tabla
+    subconsultas = {m.group(1) for m in map(_PATRON_SUBCONSULTA.match, detalles) if m}
+    for posicion, detalle in enumerate(detalles):
+        plan.indices_usados.update(_PATRON_INDICE_USADO.findall(detalle))
+        escaneo = _PATRON_SCAN.match(detalle)
+        if (
+            escaneo
+            and escaneo.group(3) is None
+            and escaneo.group(1) not in subconsultas
+            and not escaneo.group(1).startswith("sqlite_")
+        ):
+            plan.escaneos.append(escaneo.group(1))
+            plan.filas_marcadas.add(posicion)
+        temporal = _PATRON_TEMP_BTREE.search(detalle)
+        if temporal:
+            plan.ordenamientos_temporales.append(temporal.group(1))
+            plan.filas_marcadas.add(posicion)
+    return plan
+
+
+def medir(con: sqlite3.Connection, sql: str, params: Sequence[Any], repeticiones: int = 5) -> float:
+    """Mediana en milisegundos de ejecutar `sql` y leer todas sus filas."""
+    tiempos = []
+    for _ in range(max(1, repeticiones)):
+        inicio = time.perf_counter()
+        con.execute(sql, tuple(params)).fetchall()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tiempos)
+
+
+# ┌────────────────────────────────────────────────────────────┐
+# │ Sugerencias de índices
+# └────────────────────────────────────────────────────────────┘
+
+def _columnas_tabla(con: sqlite3.Connection, tabla: str) -> List[str]:
+    return [fila[1] for fila in con.execute(f"PRAGMA table_info({tabla})")]
+
+
+def _tablas_y_alias(con: sqlite3.Connection, texto: str) -> Dict[str, str]:
+    """Alias (o nombre) -> tabla, para las tablas reales nombradas en `texto`."""
+    tablas = {fila[0].lower() for fila in con.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    alias: Dict[str, str] = {}
+    for tabla, nombre in _PATRON_TABLA.findall(texto):
+        if tabla.lower() not in tablas:
+            continue
+        alias.setdefault(tabla.lower(), tabla.lower())
+        if nombre and nombre.lower() not in _PALABRAS_RESERVADAS:
+            alias.setdefault(nombre.lower(), tabla.lower())
+    return alias
+
+
+def _texto_con_vistas(con: sqlite3.Connection, sql: str) -> str:
+    """`sql` seguido de la definición de las vistas que usa (el plan las expande)."""
+    textos = [sql]
+    pendientes = [sql]
+    vistas = {fila[0].lower(): fila[1] for fila in con.execute("SELECT name, sql FROM sqlite_master WHERE type = 'view'")}
+    vistos: Set[str] = set()
+    while pendientes:
+        texto = pendientes.pop()
+        for tabla, _ in _PATRON_TABLA.findall(texto):
+            nombre = tabla.lower()
+            if nombre in vistas and nombre not in vistos:
+                vistos.add(nombre)
+                textos.append(vistas[nombre])
+                pendientes.append(vistas[nombre])
+    return "\n".join(textos)
+
+
+def _columnas_ordenamiento(clausula: str) -> List[Tuple[Optional[str], str]]:
+    columnas = []
+    for termino in clausula.split(","):
+        coincidencia = re.match(r"\s*" + _PATRON_COLUMNA + r"\s*(?:ASC|DESC)?\s*$", termino, re.I)
+        if coincidencia is None:
+            # Expresiones (CASE, funciones...) no se pueden indexar por columna
+            return []
+        columnas.append((coincidencia.group(1), coincidencia.group(2)))
+    return columnas
+
+
+def _indice_existente(con: sqlite3.Connection, tabla: str, columnas: List[str]) -> Optional[str]:
+    """Nombre de un índice no parcial de `tabla` cuya clave empieza con `columnas`."""
+    for fila in con.execute(f"PRAGMA index_list({tabla})"):
+        nombre, parcial = fila[1], fila[4]
+        if parcial:
+            continue
+        clave = [info[2] for info in con.execute(f"PRAGMA index_info({nombre})")]
+        if [c.lower() for c in clave[: len(columnas)]] == [c.lower() for c in columnas]:
+            return nombre
+    return None
+
+
+def sugerir_indices(con: sqlite3.Connection, sql: str, plan: PlanConsulta) -> List[SugerenciaIndice]:
+    """
+    Propone un índice por cada tabla recorrida completa o cuyo ORDER BY
+    necesita un B-tree temporal.
+
+    Las columnas se toman de la sentencia (y de las vistas que usa): primero
+    las comparadas por igualdad, luego una comparada por rango o, si no hay,
+    las del ORDER BY. Las comparaciones con literales (`estado = 'activa'`)
+    pasan a la condición de un índice parcial. No se proponen índices que
+    ya existen.
+    """
+    texto = _texto_con_vistas(con, sql)
+    alias = _tablas_y_alias(con, texto)
+    predicados = _PATRON_ASIGNACIONES.sub(" ", texto)
+    ordenamiento = _PATRON_ORDER_BY.search(sql)
+    columnas_orden = _columnas_ordenamiento(ordenamiento.group(1)) if ordenamiento else []
+    ordena_en_temporal = any("ORDER BY" in uso for uso in plan.ordenamientos_temporales)
+
+    # Tablas candidatas: las recorridas completas y, si el ORDER BY usa un
+    # B-tree temporal, la tabla de sus columnas
+    columnas_por_tabla = {tabla: {c.lower() for c in _columnas_tabla(con, tabla)} for tabla in set(alias.values())}
+
+    def tabla_de(calificador: Optional[str], columna: str) -> Optional[str]:
+        if calificador:
+            return alias.get(calificador.lower())
+        # Sin calificar: la única tabla de la sentencia que tiene esa columna
+        tablas = [t for t, columnas in columnas_por_tabla.items() if columna.lower() in columnas]
+        return tablas[0] if len(tablas) == 1 else None
+
+    candidatas: Dict[str, str] = {}
+    for nombre in plan.escaneos:
+        if nombre.lower() in alias:
+            candidatas.setdefault(alias[nombre.lower()], f"SCAN {nombre}")
+    if ordena_en_temporal and columnas_orden:
+        tablas_orden = {tabla_de(calif, col) for calif, col in columnas_orden}
+        if len(tablas_orden) == 1 and None not in tablas_orden:
+            candidatas.setdefault(tablas_orden.pop(), "USE TEMP B-TREE FOR ORDER BY")
+
+    sugerencias = []
+    for tabla, motivo in candidatas.items():
+        columnas_validas = {c.lower(): c for c in _columnas_tabla(con, tabla)}
+        # Para ordenar con el índice, las columnas del ORDER BY deben ser de esta tabla
+        ordena_esta_tabla = all(tabla_de(calif, col) == tabla for calif, col in columnas_orden)
+        alias_tabla = {a for a, t in alias.items() if t == tabla}
+
+        def columna_de_tabla(calificador: Optional[str], columna: str) -> Optional[str]:
+            if calificador and calificador.lower() not in alias_tabla:
+                return None
+            return columnas_validas.get(columna.lower())
+
+        igualdad: List[str] = []
+        rango: List[str] = []
+        condiciones: List[str] = []
+        for calif, col, operador, valor, calif_der, col_der in _PATRON_PREDICADO.findall(predicados):
+            operador = " ".join(operador.lower().split())
+            columna = columna_de_tabla(calif, col)
+            # `b.id_a = a.id` también es una igualdad sobre la columna derecha
+            if columna is None and operador in ("=", "==") and col_der:
+                columna, valor = columna_de_tabla(calif_der, col_der), "?"
+            if columna is None:
+                continue
+            literal = valor.startswith("'") or re.match(r"-?\d", valor) or valor.upper() == "NULL"
+            if literal and operador in ("=", "==", "is", "is not"):
+                valor_sql = "NULL" if valor.upper() == "NULL" else valor
+                operador_sql = operador.upper() if operador.startswith("is") else "="
+                condicion = f"{columna} {operador_sql} {valor_sql}"
+                if condicion not in condiciones:
+                    condiciones.append(condicion)
+            elif operador in _OPERADORES_IGUALDAD:
+                if columna not in igualdad:
+                    igualdad.append(columna)
+            elif operador in _OPERADORES_RANGO and columna not in rango:
+                rango.append(columna)
+
+        orden = [columna_de_tabla(calif, col) for calif, col in columnas_orden] if ordena_esta_tabla else []
+        clave = list(igualdad)
+        clave += [c for c in rango[:1] if c not in clave] or [c for c in orden if c not in clave]
+        if not clave:
+            continue
+
+        # Cubriente: se agregan las demás columnas que la sentencia usa de la tabla
+        cubriente = False
+        usa_todas = re.search(r"\bSELECT\s+\*|\b(?:" + "|".join(alias_tabla) + r")\.\*", texto, re.I)
+        if not usa_todas:
+            referidas = {
+                columna_de_tabla(calif, col)
+                for calif, col in re.findall(_PATRON_COLUMNA, _PATRON_LITERAL_TEXTO.sub("", sql))
+            }
+            extra = [c for c in columnas_validas.values() if c in referidas and c not in clave]
+            if 0 < len(extra) <= MAX_COLUMNAS_CUBRIENTES:
+                clave += extra
+                cubriente = True
+
+        sugerencia = SugerenciaIndice(
+            tabla=tabla,
+            columnas=clave,
+            condicion=" AND ".join(condiciones) or None,
+            cubriente=cubriente,
+            motivo=motivo,
+        )
+        existente = None if sugerencia.condicion else _indice_existente(con, tabla, clave)
+        if existente:
+            logger.debug("Sugerencia para %s omitida: ya existe %s", tabla, existente)
+            continue
+        sugerencias.append(sugerencia)
+    return sugerencias
+
+
+def evaluar_sugerencia(
+    con: sqlite3.Connection, sql: str, params: Sequence[Any], sugerencia: SugerenciaIndice, repeticiones: int = 5
+) -> EvaluacionSugerencia:
+    """
+    Crea el índice sugerido, actualiza sus estadísticas, vuelve a explicar
+    (y a medir, si es una lectura) la sentencia y borra el índice.
+    """
+    lectura = bool(_PATRON_LECTURA.match(sql))
+    antes_ms = medir(con, sql, params, repeticiones) if lectura else None
+    con.execute(sugerencia.sql)
+    try:
+        con.execute(f"ANALYZE {sugerencia.nombre}")
+        plan_despues = explicar(con, sql, params)
+        despues_ms = medir(con, sql, params, repeticiones) if lectura else None
+    finally:
+        con.execute(f"DROP INDEX IF EXISTS {sugerencia.nombre}")
+        con.commit()
+    return EvaluacionSugerencia(
+        sugerencia=sugerencia,
+        usado=sugerencia.nombre in plan_despues.indices_usados,
+        plan_despues=plan_despues,
+        antes_ms=antes_ms,
+        despues_ms=despues_ms,
+    )
+
+
+# ┌────────────────────────────────────────────────────────────┐
+# │ Auditoría
+# └────────────────────────────────────────────────────────────┘
+
+def auditar(
+    ruta_db: str,
+    sentencias: Iterable[Tuple[str, str, Sequence[Any]]],
+    evaluar: bool = True,
+    repeticiones: int = 5,
+) -> List[ResultadoAuditoria]:
+    """
+    Audita cada sentencia (origen, sql, params) sobre la base `ruta_db`.
+
+    Las sentencias repetidas (misma SQL) se auditan una vez. Con `evaluar`,
+    los índices sugeridos se crean y se borran en la propia base, por lo que
+    conviene usar una copia.
+
+    Returns:
+        List[ResultadoAuditoria]: Un resultado por sentencia auditable.
+    """
+    resultados: List[ResultadoAuditoria] = []
+    vistas: Set[str] = set()
+    con = sqlite3.connect(ruta_db)
+    try:
+        for origen, sql, params in sentencias:
+            clave = " ".join(sql.split())
+            if clave in vistas or not es_auditable(sql):
+                continue
+            vistas.add(clave)
+            resultado = ResultadoAuditoria(origen=origen, sql=sql, params=completar_params(sql, params))
+            try:
+                resultado.plan = explicar(con, sql, resultado.params)
+                if resultado.plan.tiene_problemas:
+                    for sugerencia in sugerir_indices(con, sql, resultado.plan):
+                        if evaluar:
+                            resultado.sugerencias.append(
+                                evaluar_sugerencia(con, sql, resultado.params, sugerencia, repeticiones)
+                            )
+                        else:
+                            resultado.sugerencias.append(
+                                EvaluacionSugerencia(sugerencia, usado=False, plan_despues=PlanConsulta([]))
+                            )
+            except sqlite3.Error as ex:
+                logger.warning("No se pudo auditar la sentencia de %s: %s", origen, ex)
+                resultado.error = str(ex)
+            resultados.append(resultado)
+    finally:
+        con.close()
+    return resultados
+
+
+def indices_sin_uso(resultados: Iterable[ResultadoAuditoria], declarados: Iterable[str]) -> List[str]:
+    """Índices de `declarados` que no aparecen en el plan de ninguna sentencia auditada."""
+    usados: Set[str] = set()
+    for resultado in resultados:
+        if resultado.plan is not None:
+            usados |= resultado.plan.indices_usados
+    return [nombre for nombre in declarados if nombre not in usados]
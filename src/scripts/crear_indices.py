@@ -4,12 +4,15 @@ Script para crear los índices recomendados en la base de datos SQLite.
 Este módulo crea de forma idempotente todos los índices necesarios para optimizar
 el rendimiento de las consultas del MVP sin sobre-optimizar.
 
-Primero crea todas las tablas necesarias, luego los índices.
+Primero crea todas las tablas necesarias, luego los índices. Si la huella de
+INDICES guardada en la base de datos coincide (ver scripts.huella_esquema), no
+ejecuta ningún DDL.
 
 Uso:
     python -m src.scripts.crear_indices
 """
 
+import re
 import sys
 import os
 
@@ -19,6 +22,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from utilidades.config import RUTA_DB, inicializar_directorios
 from modelos.daos.conexion_sqlite import ConexionSQLite
 from scripts.logging_config import obtener_logger_modulo
+from scripts.huella_esquema import calcular_huella, esta_al_dia, guardar_huella
 from sqlite3 import Error
 
 logger = obtener_logger_modulo(__name__)
@@ -57,15 +61,31 @@ INDICES = [
 ]
 
 
-def crear_todos_los_indices(ruta_db: str = RUTA_DB) -> bool:
+COMPONENTE_HUELLA = "indices"
+
+
+def nombres_indices() -> list:
+    """Nombres de los índices definidos en INDICES."""
+    return [re.search(r"EXISTS\s+(\w+)", sql).group(1) for sql in INDICES]
+
+
+def huella_indices() -> str:
+    """Huella del conjunto de sentencias de INDICES."""
+    return calcular_huella(INDICES)
+
+
+def crear_todos_los_indices(ruta_db: str = RUTA_DB, forzar: bool = False) -> bool:
     """
     Crea todos los índices recomendados en la base de datos.
 
     Los índices se crean de forma idempotente usando IF NOT EXISTS,
-    por lo que es seguro llamar a esta función múltiples veces.
+    por lo que es seguro llamar a esta función múltiples veces. Si la huella
+    de INDICES guardada coincide y los índices existen, no se ejecuta DDL
+    (ni ANALYZE).
 
     Args:
         ruta_db (str): Ruta a la base de datos SQLite. Por defecto usa RUTA_DB.
+        forzar (bool): Crea los índices aunque la huella esté al día.
 
     Returns:
         bool: True si todos los índices se crearon exitosamente, False en caso de error.
@@ -78,6 +98,11 @@ def crear_todos_los_indices(ruta_db: str = RUTA_DB) -> bool:
     con = db.obtener_conexion()
 
     try:
+        huella = huella_indices()
+        if not forzar and esta_al_dia(con, COMPONENTE_HUELLA, huella, 'index', nombres_indices()):
+            logger.info("✓ Índices al día (huella sin cambios)")
+            return True
+
         cursor = con.cursor()
         indices_creados = 0
 
@@ -94,6 +119,7 @@ def crear_todos_los_indices(ruta_db: str = RUTA_DB) -> bool:
         logger.info("Analizando estadísticas de la base de datos...")
         cursor.execute("ANALYZE;")
 
+        guardar_huella(con, COMPONENTE_HUELLA, huella)
         con.commit()
         logger.info(f"✅ {indices_creados} índices creados exitosamente")
         return True
@@ -103,46 +129,20 @@ def crear_todos_los_indices(ruta_db: str = RUTA_DB) -> bool:
         con.rollback()
         return False
     finally:
-        con.close()
+        db.cerrar()
 
 
 def _crear_todas_las_tablas(ruta_db: str = RUTA_DB) -> None:
     """
-    Importa y ejecuta la creación de todas las tablas necesarias.
-    Esto usa los DAOs existentes que ya tienen la lógica de creación.
+    Crea todas las tablas necesarias mediante el bootstrap del esquema.
+    Si la base de datos ya está en la versión actual no se ejecuta ningún DDL.
     """
-    try:
-        # Importar todos los DAOs para que creen sus tablas
-        from modelos.daos.carrera_dao import CarreraDAO
-        from modelos.daos.asignatura_dao import AsignaturaDAO
-        from modelos.daos.prerequisito_dao import PrerrequisitoDAO
-        from modelos.daos.eje_tematico_dao import EjeTematicoDAO
-        from modelos.daos.tipo_actividad_dao import TipoActividadDAO
-        from modelos.daos.actividad_dao import ActividadDAO
-        from modelos.daos.calendario_evento_dao import CalendarioEventoDAO
-        from modelos.daos.estudiante_dao import EstudianteDAO
-        from modelos.daos.estudiante_asignatura_dao import EstudianteAsignaturaDAO
-        from modelos.daos.estudiante_actividad_dao import EstudianteActividadDAO
-        from modelos.daos.tipo_actividad_dao import TipoActividadDAO
-
-        # Instanciar cada DAO (el constructor automáticamente crea la tabla)
-        logger.info("  ✓ Tablas creadas/verificadas")
-
-        CarreraDAO(ruta_db=ruta_db)
-        AsignaturaDAO(ruta_db=ruta_db)
-        PrerrequisitoDAO(ruta_db=ruta_db)
-        EjeTematicoDAO(ruta_db=ruta_db)
-        TipoActividadDAO(ruta_db=ruta_db)
-        ActividadDAO(ruta_db=ruta_db)
-        CalendarioEventoDAO(ruta_db=ruta_db)
-        EstudianteDAO(ruta_db=ruta_db)
-        EstudianteAsignaturaDAO(ruta_db=ruta_db)
-        EstudianteActividadDAO(ruta_db=ruta_db)
-
-        logger.info("  ✓ Todas las tablas creadas correctamente")
+    from modelos.daos.esquema import inicializar_esquema
 
-    except Exception as ex:
-        logger.warning(f"⚠️  No se pudieron crear todas las tablas automáticamente: {ex}")
+    if inicializar_esquema(ruta_db):
+        logger.info("  ✓ Tablas creadas/verificadas")
+    else:
+        logger.warning("⚠️  No se pudieron crear todas las tablas automáticamente")
         logger.info("  → Los índices se crearán sobre las tablas existentes")
 
 
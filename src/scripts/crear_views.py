@@ -2,7 +2,9 @@
 Script para crear las VIEWS recomendadas en la base de datos SQLite.
 
 Este módulo crea de forma idempotente todas las vistas necesarias para optimizar
-las consultas del MVP sin duplicar lógica SQL en la aplicación.
+las consultas del MVP sin duplicar lógica SQL en la aplicación. Si la huella de
+VIEWS guardada en la base de datos coincide (ver scripts.huella_esquema), no
+ejecuta ningún DDL.
 
 Uso:
     python -m src.scripts.crear_views
@@ -16,7 +18,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from utilidades.config import RUTA_DB, inicializar_directorios
 from modelos.daos.conexion_sqlite import ConexionSQLite
+from modelos.daos.consulta_dao import SQL_EVENTOS_ACTIVIDAD, SQL_EVENTOS_CALENDARIO
 from scripts.logging_config import obtener_logger_modulo
+from scripts.huella_esquema import calcular_huella, esta_al_dia, guardar_huella
 from sqlite3 import Error
 
 logger = obtener_logger_modulo(__name__)
@@ -42,45 +46,14 @@ def agregar_view(nombre: str, sql: str) -> None:
 # └────────────────────────────────────────────────────────────┘
 
 # VISTA 1: Eventos Unificados (Actividades + Calendario) CON CARRERA Y ASIGNATURA
+# Las ramas se comparten con la consulta por solapamiento de EventosUnificadosDAO
 agregar_view(
     "vw_eventos_unificados",
-    """
+    f"""
     CREATE VIEW IF NOT EXISTS vw_eventos_unificados AS
-    SELECT 
-        'Actividad' AS tipo_evento,
-        a.id_actividad AS id_evento,
-        a.titulo,
-        a.descripcion,
-        a.fecha_inicio,
-        a.fecha_fin,
-        ta.nombre AS tipo_actividad,
-        NULL AS observaciones,
-        car.nombre AS carrera,
-        car.id_carrera,
-        asig.nombre AS asignatura,
-        asig.id_asignatura
-    FROM actividad a
-    LEFT JOIN tipo_actividad ta ON a.id_tipo_actividad = ta.id_tipo_actividad
-    LEFT JOIN eje_tematico et ON a.id_eje = et.id_eje
-    LEFT JOIN asignatura asig ON et.id_asignatura = asig.id_asignatura
-    LEFT JOIN carrera car ON asig.id_carrera = car.id_carrera
-
+    {SQL_EVENTOS_ACTIVIDAD}
     UNION ALL
-
-    SELECT 
-        'Evento Calendario' AS tipo_evento,
-        c.id_evento AS id_evento,
-        c.titulo,
-        NULL AS descripcion,
-        c.fecha_inicio,
-        c.fecha_fin,
-        c.tipo AS tipo_actividad,
-        CASE WHEN c.afecta_actividades = 1 THEN 'Afecta actividades' ELSE NULL END AS observaciones,
-        NULL AS carrera,
-        NULL AS id_carrera,
-        NULL AS asignatura,
-        NULL AS id_asignatura
-    FROM calendario_evento c;
+    {SQL_EVENTOS_CALENDARIO};
     """,
 )
 
@@ -106,53 +79,60 @@ agregar_view(
 )
 
 # VISTA 4: Estudiante - Actividades con Detalles Completos
+# Lee la tabla materializada estudiante_actividad_detallada (ver
+# ActividadDetalladaDAO), que los triggers mantienen con las columnas del JOIN
+# de siete tablas. No incluye columnas que dependan de la fecha actual:
+# dias_desde_fin lo calcula ConsultaDAO con la fecha de referencia como parámetro.
 agregar_view(
     "vw_estudiante_actividades_detalladas",
     """
     CREATE VIEW IF NOT EXISTS vw_estudiante_actividades_detalladas AS
     SELECT 
-        estudiante.id_estudiante AS id_estudiante,
-        carrera.id_carrera AS carrera_id,
-        asignatura.id_asignatura AS id_asignatura,
-        actividad.id_actividad AS actividad_id,
-        actividad.id_eje AS eje_id,
-        tipo_actividad.id_tipo_actividad AS tipo_actividad_id,
-        eje_tematico.nombre AS eje_nombre,
-        eje_tematico.orden AS eje_orden,
-        asignatura.nombre AS nombre_asignatura,
-        actividad.titulo AS titulo,
-        actividad.descripcion AS descripcion,
-        actividad.fecha_inicio AS fecha_inicio,
-        actividad.fecha_fin AS fecha_fin,
-        tipo_actividad.nombre AS actividad_nombre,
-        tipo_actividad.siglas AS siglas,
-        tipo_actividad.prioridad AS prioridad,
-        estudiante_actividad.estado AS actividad_estado,
-        estudiante_actividad.fecha_entrega AS fecha_entrega,
-        CAST((julianday(actividad.fecha_fin) - julianday(actividad.fecha_inicio)) AS INTEGER) AS dias_duracion,
-        CAST((julianday(date('now')) - julianday(actividad.fecha_fin)) AS INTEGER) AS dias_desde_fin
+        id_estudiante,
+        carrera_id,
+        id_asignatura,
+        actividad_id,
+        eje_id,
+        tipo_actividad_id,
+        eje_nombre,
+        eje_orden,
+        nombre_asignatura,
+        titulo,
+        descripcion,
+        fecha_inicio,
+        fecha_fin,
+        actividad_nombre,
+        siglas,
+        prioridad,
+        actividad_estado,
+        fecha_entrega,
+        dias_duracion
     FROM
-        actividad
-        INNER JOIN eje_tematico ON actividad.id_eje = eje_tematico.id_eje
-        INNER JOIN asignatura ON asignatura.id_asignatura = eje_tematico.id_asignatura
-        INNER JOIN carrera ON asignatura.id_carrera = carrera.id_carrera
-        INNER JOIN tipo_actividad ON actividad.id_tipo_actividad = tipo_actividad.id_tipo_actividad
-        INNER JOIN estudiante_actividad ON actividad.id_actividad = estudiante_actividad.id_actividad
-        INNER JOIN estudiante ON estudiante_actividad.id_estudiante = estudiante.id_estudiante
-    ORDER BY actividad.fecha_fin;
+        estudiante_actividad_detallada
+    ORDER BY fecha_fin;
     """,
 )
 
 
-def crear_todas_las_views(ruta_db: str = RUTA_DB) -> bool:
+COMPONENTE_HUELLA = "views"
+
+
+def huella_views() -> str:
+    """Huella del conjunto de sentencias de VIEWS."""
+    return calcular_huella(sql for _, sql in VIEWS)
+
+
+def crear_todas_las_views(ruta_db: str = RUTA_DB, forzar: bool = False) -> bool:
     """
     Crea todas las VIEWS recomendadas en la base de datos.
 
     Las VIEWS se crean de forma idempotente usando IF NOT EXISTS,
-    por lo que es seguro llamar a esta función múltiples veces.
+    por lo que es seguro llamar a esta función múltiples veces. Si la huella
+    de VIEWS guardada coincide y las vistas existen, no se ejecuta DDL.
 
     Args:
         ruta_db (str): Ruta a la base de datos SQLite. Por defecto usa RUTA_DB.
+        forzar (bool): Vuelve a crear las VIEWS aunque la huella esté al día.
 
     Returns:
         bool: True si todas las VIEWS se crearon exitosamente, False en caso de error.
@@ -163,6 +143,13 @@ def crear_todas_las_views(ruta_db: str = RUTA_DB) -> bool:
     try:
         con = sqlite3.connect(ruta_db)
         con.row_factory = sqlite3.Row
+
+        huella = huella_views()
+        nombres = [nombre for nombre, _ in VIEWS]
+        if not forzar and esta_al_dia(con, COMPONENTE_HUELLA, huella, 'view', nombres):
+            logger.info("✓ VIEWS al día (huella sin cambios)")
+            return True
+
         cursor = con.cursor()
         views_creadas = 0
 
@@ -182,6 +169,7 @@ def crear_todas_las_views(ruta_db: str = RUTA_DB) -> bool:
                 logger.error(f"Error en VIEW {nombre_view}: {ex}")
                 raise
 
+        guardar_huella(con, COMPONENTE_HUELLA, huella)
         con.commit()
         logger.info(f"✅ {views_creadas} VIEWS creadas exitosamente")
         return True
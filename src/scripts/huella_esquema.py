@@ -0,0 +1,83 @@
+"""
+Huellas (hash) de los conjuntos de DDL aplicados a la base de datos.
+
+crear_indices y crear_views guardan, tras aplicar su DDL, un hash de las
+sentencias en la tabla `esquema_huella`. En el siguiente arranque, si el hash
+coincide y los objetos siguen existiendo, no se vuelve a ejecutar ningún DDL:
+comprobarlo cuesta dos consultas.
+
+Al cambiar una sentencia de INDICES o VIEWS cambia su huella y el DDL se
+vuelve a aplicar automáticamente.
+"""
+
+import hashlib
+import sqlite3
+from typing import Iterable, Optional
+from scripts.logging_config import obtener_logger_modulo
+
+logger = obtener_logger_modulo(__name__)
+
+TABLA_HUELLAS = "esquema_huella"
+
+
+def calcular_huella(sentencias: Iterable[str]) -> str:
+    """
+    Hash SHA-256 de un conjunto de sentencias SQL.
+
+    Los espacios se normalizan, así que reindentar el SQL no cambia la huella.
+    """
+    # Importación diferida: esquema importa los DAOs
+    from modelos.daos.esquema import VERSION_ESQUEMA
+
+    # Las tablas sobre las que se crean los objetos forman parte de la huella
+    contenido = [f"esquema:{VERSION_ESQUEMA}"]
+    contenido.extend(" ".join(sentencia.split()) for sentencia in sentencias)
+    return hashlib.sha256("\n".join(contenido).encode("utf-8")).hexdigest()
+
+
+def leer_huella(con: sqlite3.Connection, componente: str) -> Optional[str]:
+    """Huella guardada para `componente`, o None si nunca se guardó."""
+    try:
+        fila = con.execute(
+            f"SELECT huella FROM {TABLA_HUELLAS} WHERE componente = ?", (componente,)
+        ).fetchone()
+    except sqlite3.OperationalError:
+        # La tabla todavía no existe
+        return None
+    return fila[0] if fila else None
+
+
+def guardar_huella(con: sqlite3.Connection, componente: str, huella: str) -> None:
+    """Registra la huella de `componente` (dentro de la transacción de `con`)."""
+    con.execute(
+        f"""CREATE TABLE IF NOT EXISTS {TABLA_HUELLAS} (
+            componente TEXT PRIMARY KEY,
+            huella TEXT NOT NULL
+        )"""
+    )
+    con.execute(
+        f"INSERT OR REPLACE INTO {TABLA_HUELLAS} (componente, huella) VALUES (?, ?)",
+        (componente, huella),
+    )
+
+
+def esta_al_dia(
+    con: sqlite3.Connection, componente: str, huella: str, tipo: str, nombres: Iterable[str]
+) -> bool:
+    """
+    Indica si el DDL de `componente` ya está aplicado: la huella guardada
+    coincide y existen todos los objetos `nombres` del `tipo` dado
+    ('index' o 'view'), por si alguno se borró a mano.
+    """
+    if leer_huella(con, componente) != huella:
+        return False
+    nombres = list(nombres)
+    marcadores = ", ".join("?" for _ in nombres)
+    existentes = con.execute(
+        f"SELECT COUNT(*) FROM sqlite_master WHERE type = ? AND name IN ({marcadores})",
+        (tipo, *nombres),
+    ).fetchone()[0]
+    if existentes != len(nombres):
+        logger.info(f"Faltan objetos de '{componente}' ({existentes}/{len(nombres)}); se vuelven a crear")
+        return False
+    return True
@@ -2,20 +2,36 @@
 Módulo de configuración de logging para la aplicación.
 Proporciona funciones para registrar eventos con diferentes niveles de severidad.
 Soporta logging en archivos con rotación automática y en consola.
+
+Todos los loggers de la aplicación comparten un único QueueHandler: el thread
+que registra solo encola el registro, y un QueueListener en segundo plano lo
+escribe en los archivos y la consola. Así hay un solo juego de handlers (un
+único descriptor por archivo) y la escritura a disco no bloquea la interfaz.
+
+Los niveles se leen de settings.conf: `[Logging] nivel` es el nivel por
+defecto y la sección `[Logging.modulos]` permite fijar uno por módulo.
 """
 
+import atexit
+import configparser
 import logging
 import logging.handlers
 import os
+import queue
 import sys
+import threading
 from os.path import join
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, Optional
 
 # Agregar src al path para las importaciones
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from utilidades.config import LOGS_DIR
+from utilidades.config import LOGS_DIR, CONFIG_CONF_DEFECTO, CONFIG_CONF
+
+# Logger de las consultas que superan TELEMETRIA_UMBRAL_LENTA_MS
+LOGGER_CONSULTAS_LENTAS = "consultas_lentas"
 
 
 class LoggerConfig:
@@ -33,6 +49,9 @@ class LoggerConfig:
     # Nombre del archivo de log de errores
     ERROR_LOG_FILE = str(LOGS_DIR_PATH / "errors.log")
 
+    # Nombre del archivo de log de consultas lentas (ver telemetria_consultas)
+    CONSULTAS_LENTAS_LOG_FILE = str(LOGS_DIR_PATH / "consultas_lentas.log")
+
     # Formato de logs
     FORMATTER = logging.Formatter(
         fmt='%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
@@ -53,35 +72,89 @@ class LoggerConfig:
     # Número de backups a mantener
     BACKUP_COUNT = 5
 
+    # Archivos de configuración leídos en orden (el último tiene prioridad)
+    ARCHIVOS_CONFIGURACION = (CONFIG_CONF_DEFECTO, CONFIG_CONF)
 
-def obtener_logger(nombre: str, nivel: int = None) -> logging.Logger:
+
+# ┌────────────────────────────────────────────────────────────┐
+# │ Niveles desde settings.conf
+# └────────────────────────────────────────────────────────────┘
+
+_niveles_modulos: Optional[Dict[str, int]] = None
+_nivel_defecto: Optional[int] = None
+
+
+def _convertir_nivel(texto: str) -> Optional[int]:
+    """Nivel numérico de 'DEBUG', 'info', '20'... o None si no es válido."""
+    texto = texto.strip().upper()
+    if texto.isdigit():
+        return int(texto)
+    nivel = logging.getLevelName(texto)
+    return nivel if isinstance(nivel, int) else None
+
+
+def cargar_niveles(*archivos: str) -> None:
     """
-    Obtiene un logger configurado para la aplicación.
+    Lee el nivel por defecto y los niveles por módulo de los archivos de
+    configuración (por defecto LoggerConfig.ARCHIVOS_CONFIGURACION).
 
-    Args:
-        nombre: Nombre del logger (generalmente __name__)
-        nivel: Nivel de logging (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-               Si es None, usa el nivel por defecto (INFO)
+    Solo afecta a los loggers creados después de la llamada.
 
-    Returns:
-        logging.Logger: Logger configurado
+    Ejemplo de settings.conf:
+        [Logging]
+        nivel = INFO
 
-    Ejemplo:
-        >>> logger = obtener_logger(__name__)
-        >>> logger.info("Mensaje informativo")
-        >>> logger.error("Error en la aplicación")
+        [Logging.modulos]
+        modelos.daos = WARNING
+        modelos.daos.base_dao = DEBUG
     """
-    logger = logging.getLogger(nombre)
+    global _niveles_modulos, _nivel_defecto
+
+    # Sin interpolación: `formato` contiene %(asctime)s
+    parser = configparser.ConfigParser(interpolation=None)
+    # Los nombres de los módulos distinguen mayúsculas
+    parser.optionxform = str
+    parser.read(archivos or LoggerConfig.ARCHIVOS_CONFIGURACION, encoding='utf-8')
+
+    _nivel_defecto = _convertir_nivel(parser.get('Logging', 'nivel', fallback='')) or LoggerConfig.DEFAULT_LEVEL
+    _niveles_modulos = {}
+    if parser.has_section('Logging.modulos'):
+        for modulo, texto in parser.items('Logging.modulos'):
+            nivel = _convertir_nivel(texto)
+            if nivel is None:
+                print(f"Nivel de logging inválido para '{modulo}': {texto}", file=sys.stderr)
+                continue
+            _niveles_modulos[modulo] = nivel
+
+
+def nivel_para(nombre: str) -> int:
+    """
+    Nivel configurado para el logger `nombre`: el de la entrada de
+    `[Logging.modulos]` que sea el prefijo más largo del nombre (por paquetes),
+    o el nivel por defecto.
+    """
+    if _niveles_modulos is None:
+        cargar_niveles()
+    partes = nombre.split('.')
+    for i in range(len(partes), 0, -1):
+        nivel = _niveles_modulos.get('.'.join(partes[:i]))
+        if nivel is not None:
+            return nivel
+    return _nivel_defecto
 
-    # No agregar handlers si ya fueron agregados (evitar duplicados)
-    if logger.handlers:
-        return logger
 
-    # Establecer nivel
-    if nivel is None:
-        nivel = LoggerConfig.DEFAULT_LEVEL
-    logger.setLevel(nivel)
+# ┌────────────────────────────────────────────────────────────┐
+# │ Pipeline asíncrono
+# └────────────────────────────────────────────────────────────┘
+
+_cola_handler: Optional[logging.handlers.QueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_activo = False
+_lock_pipeline = threading.Lock()
 
+
+def _crear_handlers() -> list:
+    """Handlers reales (archivos y consola); solo los usa el QueueListener."""
     # Handler para archivo general (con rotación)
     archivo_handler = logging.handlers.RotatingFileHandler(
         LoggerConfig.LOG_FILE,
@@ -91,7 +164,6 @@ def obtener_logger(nombre: str, nivel: int = None) -> logging.Logger:
     )
     archivo_handler.setLevel(logging.DEBUG)
     archivo_handler.setFormatter(LoggerConfig.FORMATTER)
-    logger.addHandler(archivo_handler)
 
     # Handler para archivo de errores (solo ERROR y CRITICAL)
     error_handler = logging.handlers.RotatingFileHandler(
@@ -102,13 +174,90 @@ def obtener_logger(nombre: str, nivel: int = None) -> logging.Logger:
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(LoggerConfig.FORMATTER)
-    logger.addHandler(error_handler)
 
     # Handler para consola
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(LoggerConfig.CONSOLE_FORMATTER)
-    logger.addHandler(console_handler)
+
+    # Handler para consultas lentas (solo el logger LOGGER_CONSULTAS_LENTAS)
+    lentas_handler = logging.handlers.RotatingFileHandler(
+        LoggerConfig.CONSULTAS_LENTAS_LOG_FILE,
+        maxBytes=LoggerConfig.MAX_FILE_SIZE,
+        backupCount=LoggerConfig.BACKUP_COUNT,
+        encoding='utf-8',
+    )
+    lentas_handler.setLevel(logging.DEBUG)
+    lentas_handler.addFilter(logging.Filter(LOGGER_CONSULTAS_LENTAS))
+    lentas_handler.setFormatter(LoggerConfig.FORMATTER)
+
+    return [archivo_handler, error_handler, console_handler, lentas_handler]
+
+
+def obtener_cola_handler() -> logging.handlers.QueueHandler:
+    """
+    QueueHandler compartido por todos los loggers de la aplicación. La primera
+    llamada crea los handlers de archivo y consola e inicia el QueueListener.
+    """
+    global _cola_handler, _listener, _listener_activo
+    with _lock_pipeline:
+        if _cola_handler is None:
+            cola = queue.SimpleQueue()
+            _cola_handler = logging.handlers.QueueHandler(cola)
+            _listener = logging.handlers.QueueListener(cola, *_crear_handlers(), respect_handler_level=True)
+        if not _listener_activo:
+            _listener.start()
+            _listener_activo = True
+        return _cola_handler
+
+
+def detener_logging() -> None:
+    """
+    Escribe los registros pendientes y detiene el QueueListener. Se llama
+    automáticamente al salir; obtener un logger después lo vuelve a iniciar.
+    """
+    global _listener_activo
+    with _lock_pipeline:
+        if _listener_activo:
+            _listener.stop()
+            _listener_activo = False
+
+
+atexit.register(detener_logging)
+
+
+def obtener_logger(nombre: str, nivel: int = None) -> logging.Logger:
+    """
+    Obtiene un logger configurado para la aplicación.
+
+    Args:
+        nombre: Nombre del logger (generalmente __name__)
+        nivel: Nivel de logging (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+               Si es None, usa el nivel configurado en settings.conf para
+               el módulo (ver `nivel_para`)
+
+    Returns:
+        logging.Logger: Logger configurado
+
+    Ejemplo:
+        >>> logger = obtener_logger(__name__)
+        >>> logger.info("Mensaje informativo")
+        >>> logger.error("Error en la aplicación")
+    """
+    logger = logging.getLogger(nombre)
+    cola_handler = obtener_cola_handler()
+
+    # No agregar handlers si ya fueron agregados (evitar duplicados)
+    if cola_handler in logger.handlers:
+        return logger
+
+    # Establecer nivel
+    if nivel is None:
+        nivel = nivel_para(nombre)
+    logger.setLevel(nivel)
+
+    # Un único handler compartido: la escritura ocurre en el thread del listener
+    logger.addHandler(cola_handler)
 
     return logger
 
@@ -183,9 +332,9 @@ def registrar_error_critico(error: Exception, contexto: str = ""):
     """
     logger = obtener_logger("errores_criticos")
     if contexto:
-        logger.exception(f"Error crítico en {contexto}: {str(error)}")
+        logger.exception("Error crítico en %s: %s", contexto, error)
     else:
-        logger.exception(f"Error crítico: {str(error)}")
+        logger.exception("Error crítico: %s", error)
 
 
 # Alias para facilitar el uso
@@ -0,0 +1,77 @@
+"""
+Script para verificar y reconstruir la tabla materializada estudiante_actividad_detallada.
+
+La tabla la mantienen los triggers de ActividadDetalladaDAO; este script compara
+su contenido con el JOIN de origen y, si difiere (o se pide --forzar), la vuelve
+a generar.
+
+Uso:
+    python -m src.scripts.reconstruir_actividades_detalladas [--verificar] [--forzar]
+"""
+
+import argparse
+import sys
+import os
+
+# Agregar src al path para las importaciones
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utilidades.config import RUTA_DB, inicializar_directorios
+from modelos.daos.actividad_detallada_dao import ActividadDetalladaDAO, TABLA
+from scripts.logging_config import obtener_logger_modulo
+
+logger = obtener_logger_modulo(__name__)
+
+
+def reconstruir_actividades_detalladas(
+    ruta_db: str = RUTA_DB, solo_verificar: bool = False, forzar: bool = False
+) -> bool:
+    """
+    Verifica la tabla materializada y la reconstruye si está desincronizada.
+
+    Args:
+        ruta_db (str): Ruta a la base de datos SQLite. Por defecto usa RUTA_DB.
+        solo_verificar (bool): Solo informa las diferencias, sin reconstruir.
+        forzar (bool): Reconstruye aunque la tabla esté al día.
+
+    Returns:
+        bool: True si al terminar la tabla está al día.
+    """
+    dao = ActividadDetalladaDAO(ruta_db=ruta_db)
+    diferencias = dao.verificar_consistencia()
+    al_dia = diferencias['faltantes'] == 0 and diferencias['sobrantes'] == 0
+    print(
+        f"  {TABLA}: {diferencias['faltantes']} filas faltantes, "
+        f"{diferencias['sobrantes']} sobrantes"
+    )
+
+    if solo_verificar or (al_dia and not forzar):
+        return al_dia
+
+    total = dao.reconstruir()
+    if total is None:
+        return False
+    print(f"  ✓ {total} filas materializadas")
+    diferencias = dao.verificar_consistencia()
+    return diferencias['faltantes'] == 0 and diferencias['sobrantes'] == 0
+
+
+if __name__ == "__main__":
+    """Ejecutable: python -m src.scripts.reconstruir_actividades_detalladas"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--verificar", action="store_true", help="Solo verifica, no reconstruye")
+    parser.add_argument("--forzar", action="store_true", help="Reconstruye aunque esté al día")
+    parser.add_argument("--db", default=RUTA_DB, help="Ruta a la base de datos")
+    args = parser.parse_args()
+
+    inicializar_directorios()
+
+    print("\n" + "=" * 70)
+    print("🔁 ACTIVIDADES DETALLADAS MATERIALIZADAS")
+    print("=" * 70 + "\n")
+
+    if reconstruir_actividades_detalladas(args.db, args.verificar, args.forzar):
+        print("\n✅ La tabla está al día\n")
+    else:
+        print("\n❌ La tabla no está al día\n")
+        sys.exit(1)
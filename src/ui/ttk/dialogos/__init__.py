@@ -2,26 +2,30 @@
 Diálogos de la aplicación CronosFacen
 
 Este paquete contiene todos los diálogos modales de la interfaz gráfica.
+
+Los diálogos se importan bajo demanda (PEP 562), al usarse por primera vez.
 """
 
-from .dialogo_administrar_carrera import DialogoAdministrarCarrera
-from .dialogo_administrar_estudiante import DialogoAdministrarEstudiante
-from .dialogo_administrar_estudiante_carrera import DialogoAdministrarEstudianteCarrera
-from .dialogo_administrar_asignatura import DialogoAdministrarAsignatura
-from .dialogo_administrar_eje_tematico import DialogoAdministrarEjeTemático
-from .dialogo_administrar_tipo_actividad import DialogoAdministrarTipoActividad
-from .dialogo_administrar_actividad import DialogoAdministrarActividad
-from .dialogo_administrar_calendario import DialogoAdministrarCalendario
-from .dialogo_acerca_de import DialogoAcercaDe
+import importlib
+
+_MODULOS = {
+    "DialogoAdministrarCarrera": ".dialogo_administrar_carrera",
+    "DialogoAdministrarEstudiante": ".dialogo_administrar_estudiante",
+    "DialogoAdministrarEstudianteCarrera": ".dialogo_administrar_estudiante_carrera",
+    "DialogoAdministrarAsignatura": ".dialogo_administrar_asignatura",
+    "DialogoAdministrarEjeTemático": ".dialogo_administrar_eje_tematico",
+    "DialogoAdministrarTipoActividad": ".dialogo_administrar_tipo_actividad",
+    "DialogoAdministrarActividad": ".dialogo_administrar_actividad",
+    "DialogoAdministrarCalendario": ".dialogo_administrar_calendario",
+    "DialogoAcercaDe": ".dialogo_acerca_de",
+}
+
+__all__ = list(_MODULOS)
+
 
-__all__ = [
-    "DialogoAdministrarCarrera",
-    "DialogoAdministrarEstudiante",
-    "DialogoAdministrarEstudianteCarrera",
-    "DialogoAdministrarAsignatura",
-    "DialogoAdministrarEjeTemático",
-    "DialogoAdministrarTipoActividad",
-    "DialogoAdministrarActividad",
-    "DialogoAdministrarCalendario",
-    "DialogoAcercaDe",
-]
+def __getattr__(nombre):
+    if nombre not in _MODULOS:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    clase = getattr(importlib.import_module(_MODULOS[nombre], __name__), nombre)
+    globals()[nombre] = clase
+    return clase
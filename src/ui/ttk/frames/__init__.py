@@ -3,29 +3,32 @@ Frames de la aplicación CronosFacen
 
 Este paquete contiene todos los frames (paneles) principales de la interfaz
 gráfica de la aplicación.
+
+Los frames se importan bajo demanda (PEP 562): importar un módulo del paquete,
+como `frame_principal`, no carga el resto de frames ni sus controladores.
 """
 
-from .frame_principal import FramePrincipal
-from .frame_administrar_carrera import FrameAdministrarCarrera
-from .frame_administrar_estudiante import FrameAdministrarEstudiante
-from .frame_administrar_asignatura import FrameAdministrarAsignatura
-from .frame_administrar_eje_tematico import FrameAdministrarEjeTematico
-from .frame_administrar_tipo_actividad import FrameAdministrarTipoActividad
-from .frame_administrar_actividad import FrameAdministrarActividad
-from .frame_administrar_calendario import FrameAdministrarCalendario
-from .frame_acerca_de import FrameAcercaDe
-from .frame_bienvenidad import FrameBienvenidad
+import importlib
+
+_MODULOS = {
+    "FramePrincipal": ".frame_principal",
+    "FrameAdministrarCarrera": ".frame_administrar_carrera",
+    "FrameAdministrarEstudiante": ".frame_administrar_estudiante",
+    "FrameAdministrarAsignatura": ".frame_administrar_asignatura",
+    "FrameAdministrarEjeTematico": ".frame_administrar_eje_tematico",
+    "FrameAdministrarTipoActividad": ".frame_administrar_tipo_actividad",
+    "FrameAdministrarActividad": ".frame_administrar_actividad",
+    "FrameAdministrarCalendario": ".frame_administrar_calendario",
+    "FrameAcercaDe": ".frame_acerca_de",
+    "FrameBienvenidad": ".frame_bienvenidad",
+}
+
+__all__ = list(_MODULOS)
+
 
-__all__ = [
-    "FramePrincipal",
-    "FrameAdministrarCarrera",
-    "FrameAdministrarEstudiante",
-    "FrameAdministrarAsignatura",
-    "FrameAdministrarEjeTematico",
-    "FrameAdministrarTipoActividad",
-    "FrameAdministrarActividad",
-    "FrameAdministrarCalendario",
-    "FrameAcercaDe",
-    "FrameAlertas",
-    "FrameBienvenidad",
-]
+def __getattr__(nombre):
+    if nombre not in _MODULOS:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    clase = getattr(importlib.import_module(_MODULOS[nombre], __name__), nombre)
+    globals()[nombre] = clase
+    return clase
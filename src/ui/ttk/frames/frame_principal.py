@@ -3,12 +3,18 @@ Frame Principal - Contenedor principal de la aplicación CronosFacen
 
 Este módulo contiene la estructura principal de la interfaz gráfica,
 incluyendo menú superior, panel lateral con tabs y área central de contenido.
+
+Las pestañas del área central (y sus controladores, DAOs y cargas de datos)
+se importan y construyen la primera vez que se seleccionan; con
+PRECARGA_EN_REPOSO, las restantes se construyen cuando la ventana queda inactiva.
 """
 
+import importlib
+import time
 from ttkbootstrap import Frame, Button, Separator, Panedwindow, Notebook, Label, Style
 from ttkbootstrap.constants import *
 from ttkbootstrap.tooltip import ToolTip
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from ui.ttk.styles.icons import (
     ICON_MENU,
@@ -29,14 +35,20 @@ from ui.ttk.styles.icons import (
     ICON_CASA,
     ICON_ESTADISTICAS,
 )
-from ui.ttk.frames.frame_bienvenidad import FrameBienvenidad
-from ui.ttk.frames.frame_calendario import FrameCalendario
-from ui.ttk.frames.frame_actividades import FrameActividades
 from scripts.logging_config import obtener_logger_modulo
-from controladores.controlar_frame_principal import ControlarFramePrincipal
+from utilidades.config import PRECARGA_EN_REPOSO, PRECARGA_INTERVALO_MS
+from controladores.controlar_frame_principal import ControlarFramePrincipal, MODULOS_DIALOGOS
 
 logger = obtener_logger_modulo(__name__)
 
+# Pestañas del Notebook central: (atributo, módulo, clase, texto), en orden.
+# La primera se construye al iniciar; las demás al seleccionarlas.
+PESTANAS = (
+    ('frame_bienvenidad', 'ui.ttk.frames.frame_bienvenidad', 'FrameBienvenidad', f"{ICON_CASA} Bienvenida"),
+    ('frame_calendario', 'ui.ttk.frames.frame_calendario', 'FrameCalendario', f"{ICON_CALENDARIO} Calendario"),
+    ('frame_actividades', 'ui.ttk.frames.frame_actividades', 'FrameActividades', f"{ICON_ACTIVIDAD} Actividades"),
+)
+
 
 class FramePrincipal(Frame):
     """
@@ -86,14 +98,17 @@ class FramePrincipal(Frame):
             'btn_estudiante_carrera': self.btn_estudiante_carrera,
             # Botones del panel lateral - Configuraciones
             'btn_tema': self.btn_tema,
-            # Frames del Notebook central
-            'frame_bienvenidad': self.frame_bienvenidad,
-            'frame_calendario': self.frame_calendario,
+            # Notebook central (sus frames se construyen al seleccionar cada pestaña)
+            'notebook_central': self.notebook_central,
         }
 
         # Controlador del Frame Principal
         ControlarFramePrincipal(master=self, map_widgets=self.map_widgets)
 
+        # Precarga de pestañas y diálogos cuando la ventana queda inactiva
+        if PRECARGA_EN_REPOSO:
+            self.after_idle(self._programar_precarga)
+
     def _crear_widgets(self):
         """Crea la estructura principal de widgets"""
 
@@ -403,14 +418,76 @@ class FramePrincipal(Frame):
         self.notebook_central = Notebook(frame, bootstyle="primary")
         self.notebook_central.pack(side=TOP, fill=BOTH, padx=1, pady=1, expand=True)
 
-        # Tab Bienvenida
-        self.frame_bienvenidad = FrameBienvenidad(master=self.notebook_central)
-        self.notebook_central.add(self.frame_bienvenidad, text=f"{ICON_CASA} Bienvenida")
+        # Cada tab es un contenedor vacío hasta que se selecciona por primera vez
+        self.contenedores_pestanas: Dict[str, Frame] = {}
+        for atributo, _, _, texto in PESTANAS:
+            setattr(self, atributo, None)
+            contenedor = Frame(self.notebook_central)
+            self.notebook_central.add(contenedor, text=texto)
+            self.contenedores_pestanas[atributo] = contenedor
+
+        self.notebook_central.bind("<<NotebookTabChanged>>", self._on_cambio_pestana)
+        self.construir_pestana(PESTANAS[0][0])
+
+    # ┌────────────────────────────────────────────────────────────┐
+    # │ Carga diferida de pestañas
+    # └────────────────────────────────────────────────────────────┘
 
-        # Tab Calendario
-        self.frame_calendario = FrameCalendario(master=self.notebook_central)
-        self.notebook_central.add(self.frame_calendario, text=f"{ICON_CALENDARIO} Calendario")
+    def _on_cambio_pestana(self, event=None):
+        """Construye la pestaña seleccionada si todavía no existe."""
+        indice = self.notebook_central.index("current")
+        self.construir_pestana(PESTANAS[indice][0])
 
-        # Tab Actividades
-        self.frame_actividades = FrameActividades(master=self.notebook_central)
-        self.notebook_central.add(self.frame_actividades, text=f"{ICON_ACTIVIDAD} Actividades")
+    def construir_pestana(self, atributo: str) -> Optional[Frame]:
+        """
+        Importa y construye el frame de una pestaña del Notebook central
+        (solo la primera vez).
+
+        Args:
+            atributo (str): Nombre del atributo de la pestaña (ej. 'frame_calendario').
+
+        Returns:
+            Optional[Frame]: El frame de la pestaña, o None si no se pudo construir.
+        """
+        frame = getattr(self, atributo, None)
+        if frame is not None:
+            return frame
+
+        _, modulo, clase, _ = next(p for p in PESTANAS if p[0] == atributo)
+        inicio = time.perf_counter()
+        try:
+            clase_frame = getattr(importlib.import_module(modulo), clase)
+            frame = clase_frame(master=self.contenedores_pestanas[atributo])
+            frame.pack(side=TOP, fill=BOTH, expand=TRUE)
+        except Exception as e:
+            logger.error(f"Error al construir la pestaña {clase}: {e}", exc_info=True)
+            return None
+
+        setattr(self, atributo, frame)
+        logger.debug(f"Pestaña {clase} construida en {(time.perf_counter() - inicio) * 1000:.1f} ms")
+        return frame
+
+    def _programar_precarga(self):
+        """Encola las pestañas sin construir y los módulos de diálogos para la precarga."""
+        self._pendientes_precarga = [('pestana', atributo) for atributo, *_ in PESTANAS]
+        self._pendientes_precarga.extend(('modulo', modulo) for modulo in MODULOS_DIALOGOS)
+        self.after(PRECARGA_INTERVALO_MS, self._precargar_siguiente)
+
+    def _precargar_siguiente(self):
+        """
+        Precarga un elemento pendiente y reprograma el siguiente, para que la
+        interfaz siga respondiendo entre paso y paso.
+        """
+        if not self._pendientes_precarga:
+            logger.debug("Precarga de pestañas y diálogos completa")
+            return
+
+        tipo, nombre = self._pendientes_precarga.pop(0)
+        if tipo == 'pestana':
+            self.construir_pestana(nombre)
+        else:
+            try:
+                importlib.import_module(nombre)
+            except Exception as e:
+                logger.error(f"Error al precargar {nombre}: {e}")
+        self.after(PRECARGA_INTERVALO_MS, self._precargar_siguiente)
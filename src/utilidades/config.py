@@ -28,10 +28,65 @@ RUTA_DATA = join(RUTA_USUARIO, ".local", "share", NAME_APP)
 # Archivo de configuración, para los datos de configuracion de la aplicacion
 CONFIG_INI = join(RUTA_CONFIG, "settings.ini")
 
+# Configuración general (niveles de logging, etc.): la del repositorio con los
+# valores por defecto y, encima, la del usuario si existe
+RUTA_PROYECTO = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CONFIG_CONF_DEFECTO = join(RUTA_PROYECTO, "config", "settings.conf")
+CONFIG_CONF = join(RUTA_CONFIG, "settings.conf")
+
 # Archivo de configuracion para la base de datos
 RUTA_DB = join(RUTA_DATA, "cronosFacen.sqlite")
 RUTA_DB_TEST = join(RUTA_DATA, "cronosFacen_test.sqlite")
 
+# --- Pool de conexiones SQLite ---#
+
+# Número máximo de conexiones abiertas por archivo de base de datos
+POOL_TAMANO_MAXIMO = 5
+# Segundos que se espera por una conexión libre antes de fallar
+POOL_TIEMPO_ESPERA = 10.0
+# Segundos de inactividad tras los cuales una conexión libre se cierra
+POOL_TIEMPO_INACTIVIDAD = 300.0
+# Política de verificación de conexiones: "siempre", "nunca", "intervalo" o "tras_error"
+POOL_POLITICA_VERIFICACION = "tras_error"
+# Segundos entre verificaciones cuando la política es "intervalo"
+POOL_INTERVALO_VERIFICACION = 30.0
+
+# --- Operaciones por lotes ---#
+
+# Filas escritas por transacción en insertar_lote / actualizar_lote / eliminar_lote
+LOTE_TAMANO = 500
+# Filas leídas por fetchmany en iterar_consulta
+CONSULTA_TAMANO_BLOQUE = 500
+# Parámetros por sentencia en obtener_por_ids (SQLite < 3.32 admite hasta 999)
+CONSULTA_MAX_VARIABLES = 900
+
+# --- Caché de resultados de consultas ---#
+
+# Resultados guardados por base de datos en DAO.consultar_cacheado
+CACHE_CONSULTAS_MAX_ENTRADAS = 128
+# Tamaño estimado máximo de los resultados guardados por base de datos
+CACHE_CONSULTAS_MAX_BYTES = 32 * 1024 * 1024
+# Meses de eventos unificados guardados por el calendario (EventosMesService)
+CACHE_EVENTOS_MESES = 24
+
+# --- Telemetría de consultas ---#
+
+# Registrar duración y filas de cada sentencia ejecutada por los DAOs
+TELEMETRIA_CONSULTAS = True
+# Milisegundos a partir de los cuales una sentencia se escribe en consultas_lentas.log (0 desactiva)
+TELEMETRIA_UMBRAL_LENTA_MS = 100.0
+# Duraciones guardadas por sentencia para calcular p50/p95
+TELEMETRIA_MUESTRAS = 1000
+# Archivo donde se vuelca la telemetría al cerrar la aplicación
+TELEMETRIA_ARCHIVO = join(LOGS_DIR, "logs", "telemetria_consultas.json")
+
+# --- Arranque ---#
+
+# Construir las pestañas y cargar los diálogos no abiertos cuando la ventana queda inactiva
+PRECARGA_EN_REPOSO = True
+# Milisegundos entre cada paso de la precarga
+PRECARGA_INTERVALO_MS = 200
+
 # Obtenemos el nombre del sistema operativo
 SISTEMA_OPERATIVO = os.name
 
@@ -0,0 +1,41 @@
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+
+class TiemposArranque:
+    """
+    Mide la duración de cada fase del arranque de la aplicación.
+
+    Example:
+        >>> tiempos = TiemposArranque()
+        >>> with tiempos.fase("índices"):
+        ...     crear_todos_los_indices()
+        >>> print(tiempos.reporte())
+    """
+
+    def __init__(self):
+        self._inicio = time.perf_counter()
+        self.fases: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def fase(self, nombre: str):
+        """Registra en milisegundos lo que tarda el bloque `with`."""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.fases.append((nombre, (time.perf_counter() - inicio) * 1000))
+
+    @property
+    def total_ms(self) -> float:
+        """Milisegundos desde que se creó el medidor."""
+        return (time.perf_counter() - self._inicio) * 1000
+
+    def reporte(self) -> str:
+        """Tabla de texto con cada fase y el total, en milisegundos."""
+        ancho = max([len(nombre) for nombre, _ in self.fases] + [len("Total")])
+        lineas = ["Tiempos de arranque (ms):"]
+        lineas.extend(f"  {nombre:<{ancho}}  {ms:>9.1f}" for nombre, ms in self.fases)
+        lineas.append(f"  {'Total':<{ancho}}  {self.total_ms:>9.1f}")
+        return "\n".join(lineas)
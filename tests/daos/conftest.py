@@ -0,0 +1,60 @@
+import pytest
+from src.modelos.daos import esquema
+from src.modelos.daos.asignatura_dao import AsignaturaDAO
+from src.modelos.daos.carrera_dao import CarreraDAO
+from src.modelos.daos.eje_tematico_dao import EjeTematicoDAO
+from src.modelos.daos.tipo_actividad_dao import TipoActividadDAO
+from src.modelos.dtos.asignatura_dto import AsignaturaDTO
+from src.modelos.dtos.carrera_dto import CarreraDTO
+from src.modelos.dtos.eje_tematico_dto import EjeTematicoDTO
+from src.modelos.dtos.tipo_actividad_dto import TipoActividadDTO
+from src.scripts.crear_indices import crear_todos_los_indices
+from src.scripts.crear_views import crear_todas_las_views
+
+
+@pytest.fixture
+def ruta_db(tmp_path):
+    """Ruta de una base de datos temporal; al terminar se cierran sus conexiones."""
+    yield str(tmp_path / "test.db")
+    # Los DAOs usan la ConexionSQLite importada como `modelos...`, la misma que esquema
+    esquema.ConexionSQLite.resetear()
+
+
+@pytest.fixture
+def poblar_catalogo(ruta_db):
+    """
+    Retorna una función que crea índices y VIEWS en `ruta_db` y el catálogo
+    carrera → asignatura → un eje por asignatura, más los tipos de actividad.
+
+    La función recibe las asignaturas como pares (codigo, nombre), repartidas
+    entre las carreras por turnos, y los tipos como (nombre, siglas, prioridad).
+    Retorna (ids_asignaturas, ids_ejes, ids_tipos).
+    """
+
+    def poblar(asignaturas, tipos=(("Tarea", "T", 1),), carreras=("Sistemas",), vistas=True):
+        if vistas:
+            crear_todos_los_indices(ruta_db)
+            crear_todas_las_views(ruta_db)
+        ids_carreras = CarreraDAO(ruta_db).insertar_lote(
+            CarreraDTO(nombre=nombre, plan="2024", modalidad="Presencial") for nombre in carreras
+        )
+        ids_asignaturas = AsignaturaDAO(ruta_db).insertar_lote(
+            AsignaturaDTO(
+                codigo=codigo,
+                nombre=nombre,
+                creditos=4,
+                tipo="obligatoria",
+                id_carrera=ids_carreras[i % len(ids_carreras)],
+            )
+            for i, (codigo, nombre) in enumerate(asignaturas)
+        )
+        ids_ejes = EjeTematicoDAO(ruta_db).insertar_lote(
+            EjeTematicoDTO(nombre=f"Eje {i}", orden=1, id_asignatura=i) for i in ids_asignaturas
+        )
+        ids_tipos = TipoActividadDAO(ruta_db).insertar_lote(
+            TipoActividadDTO(nombre=nombre, siglas=siglas, prioridad=prioridad)
+            for nombre, siglas, prioridad in tipos
+        )
+        return ids_asignaturas, ids_ejes, ids_tipos
+
+    return poblar
@@ -0,0 +1,150 @@
+import pytest
+from src.modelos.daos.actividad_dao import ActividadDAO
+from src.modelos.daos.actividad_detallada_dao import ActividadDetalladaDAO, TABLA
+from src.modelos.daos.consulta_dao import ConsultaDAO
+from src.modelos.daos.estudiante_actividad_dao import EstudianteActividadDAO
+from src.modelos.daos.estudiante_dao import EstudianteDAO
+from src.modelos.dtos.actividad_dto import ActividadDTO
+from src.modelos.dtos.estudiante_actividad_dto import EstudianteActividadDTO
+from src.modelos.dtos.estudiante_dto import EstudianteDTO
+
+
+@pytest.fixture
+def datos(ruta_db, poblar_catalogo):
+    """Dos carreras con dos asignaturas cada una, 24 actividades y tres estudiantes."""
+    ids_asignaturas, ids_ejes, ids_tipos = poblar_catalogo(
+        [(f"A{i}", f"Asig {i}") for i in range(4)],
+        [(f"Tipo {p}", f"T{p}", p) for p in (0, 1, 2)],
+        carreras=[f"Carrera {c}" for c in range(2)],
+    )
+    ids_actividades = ActividadDAO(ruta_db).insertar_lote(
+        ActividadDTO(
+            titulo=f"Actividad {i}",
+            fecha_inicio=f"2025-{i % 12 + 1:02d}-01",
+            fecha_fin=f"2025-{i % 12 + 1:02d}-{i % 20 + 5:02d}",
+            id_eje=ids_ejes[i % 4],
+            id_tipo_actividad=ids_tipos[i % 3],
+        )
+        for i in range(24)
+    )
+    ids_estudiantes = EstudianteDAO(ruta_db).insertar_lote(
+        EstudianteDTO(nombre=f"E{e}", correo=f"e{e}@x.edu") for e in range(3)
+    )
+    EstudianteActividadDAO(ruta_db).insertar_lote(
+        EstudianteActividadDTO(id_estudiante=e, id_actividad=a, estado='pendiente')
+        for e in ids_estudiantes
+        for a in ids_actividades[: 8 * (ids_estudiantes.index(e) + 1)]
+    )
+    return ruta_db, ids_estudiantes, ids_asignaturas, ids_actividades, ids_ejes, ids_tipos
+
+
+def al_dia(ruta):
+    return ActividadDetalladaDAO(ruta).verificar_consistencia() == {'faltantes': 0, 'sobrantes': 0}
+
+
+def contar(ruta, where="1", params=()):
+    filas = ActividadDAO(ruta).ejecutar_consulta(f"SELECT COUNT(*) AS n FROM {TABLA} WHERE {where}", params)
+    return filas[0]['n']
+
+
+class TestActividadDetalladaDAO:
+    """Tests para la tabla materializada de actividades por estudiante."""
+
+    def test_inserciones_se_materializan(self, datos):
+        ruta, ids_estudiantes, *_ = datos
+
+        assert contar(ruta) == 8 + 16 + 24
+        assert al_dia(ruta)
+        detalladas = ConsultaDAO(ruta).obtener_actividades_detalladas(ids_estudiantes[1])
+        assert len(detalladas) == 16
+        assert all(d.dias_desde_fin is not None for d in detalladas)
+
+    def test_actualizaciones_de_origen(self, datos):
+        ruta, ids_estudiantes, ids_asignaturas, ids_actividades, ids_ejes, ids_tipos = datos
+
+        EstudianteActividadDAO(ruta).actualizar(
+            EstudianteActividadDTO(
+                id_estudiante=ids_estudiantes[0],
+                id_actividad=ids_actividades[0],
+                estado='entregada',
+                fecha_entrega='2025-01-03',
+            )
+        )
+        actividad = ActividadDTO(id_actividad=ids_actividades[1])
+        assert ActividadDAO(ruta).instanciar(actividad)
+        actividad.titulo = "Renombrada"
+        actividad.id_eje = ids_ejes[3]
+        actividad.fecha_fin = "2025-12-31"
+        ActividadDAO(ruta).actualizar(actividad)
+        dao = ActividadDAO(ruta)
+        dao.ejecutar_actualizacion("UPDATE eje_tematico SET nombre = 'Eje nuevo' WHERE id_eje = ?", (ids_ejes[0],))
+        dao.ejecutar_actualizacion(
+            "UPDATE asignatura SET nombre = 'Otra', id_carrera = 1 WHERE id_asignatura = ?",
+            (ids_asignaturas[1],),
+        )
+        dao.ejecutar_actualizacion(
+            "UPDATE tipo_actividad SET prioridad = 5 WHERE id_tipo_actividad = ?", (ids_tipos[2],)
+        )
+
+        assert al_dia(ruta)
+        assert contar(ruta, "actividad_estado = 'entregada'") == 1
+        assert contar(ruta, "titulo = 'Renombrada' AND eje_id = ?", (ids_ejes[3],)) == 3
+        assert contar(ruta, "nombre_asignatura = 'Otra' AND carrera_id = 1") > 0
+        assert contar(ruta, "prioridad = 5") == contar(ruta, "tipo_actividad_id = ?", (ids_tipos[2],))
+
+    def test_borrados_en_cascada(self, datos):
+        ruta, ids_estudiantes, ids_asignaturas, ids_actividades, *_ = datos
+
+        EstudianteDAO(ruta).ejecutar_actualizacion(
+            "DELETE FROM estudiante WHERE id_estudiante = ?", (ids_estudiantes[2],)
+        )
+        ActividadDAO(ruta).ejecutar_actualizacion(
+            "DELETE FROM asignatura WHERE id_asignatura = ?", (ids_asignaturas[0],)
+        )
+        ActividadDAO(ruta).ejecutar_actualizacion(
+            "DELETE FROM actividad WHERE id_actividad = ?", (ids_actividades[1],)
+        )
+
+        assert al_dia(ruta)
+        assert contar(ruta, "id_estudiante = ?", (ids_estudiantes[2],)) == 0
+        assert contar(ruta, "id_asignatura = ?", (ids_asignaturas[0],)) == 0
+
+    def test_verificar_y_reconstruir(self, datos):
+        ruta, *_ = datos
+        dao = ActividadDetalladaDAO(ruta)
+        dao.ejecutar_actualizacion(f"DELETE FROM {TABLA} WHERE actividad_id <= 3")
+        dao.ejecutar_actualizacion(f"UPDATE {TABLA} SET titulo = 'X' WHERE actividad_id = 10")
+
+        diferencias = dao.verificar_consistencia()
+        assert diferencias['faltantes'] > 0
+        assert diferencias['sobrantes'] == 2
+
+        assert dao.reconstruir() == 8 + 16 + 24
+        assert al_dia(ruta)
+
+    def test_no_admite_escrituras_directas(self, datos):
+        ruta, *_ = datos
+        dao = ActividadDetalladaDAO(ruta)
+        assert dao.insertar() is None
+        assert not dao.eliminar()
+        assert not dao.instanciar()
+        assert not dao.existe()
+        assert al_dia(ruta)
+
+    def test_filtros_usan_indices(self, datos):
+        ruta, ids_estudiantes, *_ = datos
+        filtros = {
+            "carrera_id": "idx_ead_estudiante_carrera",
+            "id_asignatura": "idx_ead_estudiante_asignatura",
+            "tipo_actividad_id": "idx_ead_estudiante_tipo",
+        }
+        dao = ActividadDAO(ruta)
+        for columna, indice in filtros.items():
+            plan = dao.ejecutar_consulta(
+                "EXPLAIN QUERY PLAN SELECT * FROM vw_estudiante_actividades_detalladas "
+                f"WHERE id_estudiante = ? AND {columna} = ? ORDER BY fecha_fin DESC",
+                (ids_estudiantes[0], 1),
+            )
+            detalle = " ".join(fila['detail'] for fila in plan)
+            assert indice in detalle
+            assert "SCAN" not in detalle.replace(f"SCAN {TABLA} USING INDEX", "")
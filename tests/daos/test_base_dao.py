@@ -1,10 +1,12 @@
+import dataclasses
 import pytest
 import sqlite3
 import tempfile
 from pathlib import Path
+from typing import Optional
 from unittest.mock import Mock, MagicMock, patch
 from src.modelos.daos.base_dao import DAO
-from src.modelos.daos.conexion_sqlite import ConexionSQLite
+from src.modelos.daos.conexion_sqlite import ConexionSQLite, TransaccionRevertida, transaccion
 
 
 @pytest.fixture
@@ -232,6 +234,38 @@ class TestDAOGetConexion:
         assert con1_id is not None
         assert con2_id is not None
 
+    def test_get_conexion_no_sondea_conexiones_sanas(self, db_temporal):
+        """Con la política por defecto get_conexion no ejecuta SELECT 1."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+        for _ in range(3):
+            dao.ejecutar_consulta("SELECT * FROM test_table")
+
+        assert ConexionSQLite(db_temporal).obtener_estadisticas().sondeos == 0
+
+    def test_get_conexion_sondea_tras_error(self, db_temporal):
+        """Tras un error la conexión se verifica en el siguiente préstamo."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.ejecutar_consulta("SELECT * FROM tabla_inexistente")
+        dao.ejecutar_consulta("SELECT 1")
+
+        assert ConexionSQLite(db_temporal).obtener_estadisticas().sondeos == 1
+
+    def test_consulta_reconecta_si_la_conexion_fue_cerrada(self, db_temporal):
+        """Una conexión cerrada fuera del pool se reemplaza sin perder la consulta."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+        dao.ejecutar_insertar("INSERT INTO test_table (nombre) VALUES (?)", ("a",))
+        conexion_sqlite = ConexionSQLite(db_temporal)
+        with dao.get_conexion() as con:
+            pass
+        con.close()
+
+        resultado = dao.ejecutar_consulta("SELECT nombre FROM test_table")
+
+        assert resultado == [{"nombre": "a"}]
+        assert conexion_sqlite.obtener_estadisticas().reconexiones == 1
+
 
 class TestDAOAbstractMethods:
     """Tests para métodos abstractos."""
@@ -316,3 +350,432 @@ class TestDAOIntegracion:
         # Registro existe
         existe = dao.existe("SELECT * FROM test_table WHERE nombre = ?", ("existente",))
         assert existe is True
+
+
+class TestDAOLotes:
+    """Tests para las operaciones por lotes."""
+
+    def test_insertar_lote_retorna_ids_en_orden(self, db_temporal):
+        """Verifica que se retornan los IDs generados de todos los lotes."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+        dao.ejecutar_insertar("INSERT INTO test_table (nombre) VALUES (?)", ("previo",))
+
+        filas = [(f"fila{i}", i) for i in range(7)]
+        ids = dao.ejecutar_insertar_lote(
+            "INSERT INTO test_table (nombre, valor) VALUES (?, ?)", filas, tamano_lote=3
+        )
+
+        assert len(ids) == 7
+        for id_generado, (nombre, _) in zip(ids, filas):
+            registro = dao.instanciar("SELECT nombre FROM test_table WHERE id = ?", (id_generado,))
+            assert registro[0]["nombre"] == nombre
+
+    def test_insertar_lote_confirma_lotes_previos_al_error(self, db_temporal):
+        """Un lote con error se revierte sin afectar los lotes ya confirmados."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+
+        filas = [("a", 1), ("b", 2), ("c", 3), (None, 4)]
+        ids = dao.ejecutar_insertar_lote(
+            "INSERT INTO test_table (nombre, valor) VALUES (?, ?)", filas, tamano_lote=2
+        )
+
+        # El fallo se informa aunque el primer lote quedó confirmado
+        assert ids is None
+        assert len(dao.instanciar("SELECT * FROM test_table")) == 2
+
+    def test_insertar_lote_con_rowid_no_consecutivos(self, db_temporal):
+        """Los IDs son los de cada fila aunque no sean consecutivos."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+        dao.ejecutar_actualizacion("CREATE UNIQUE INDEX ux_nombre ON test_table (nombre)")
+        id_previo = dao.ejecutar_insertar("INSERT INTO test_table (nombre) VALUES (?)", ("b",))
+        # Cada inserción genera otra fila en la misma tabla
+        dao.ejecutar_actualizacion(
+            """
+            CREATE TRIGGER tr_duplicar AFTER INSERT ON test_table WHEN NEW.valor = 1
+            BEGIN
+                INSERT INTO test_table (nombre, valor) VALUES (NEW.nombre || '_copia', 2);
+            END
+            """
+        )
+
+        ids = dao.ejecutar_insertar_lote(
+            "INSERT OR IGNORE INTO test_table (nombre, valor) VALUES (?, ?)",
+            [("a", 1), ("b", 1), ("c", 1)],
+        )
+
+        assert ids[1] is None
+        for id_generado, nombre in ((ids[0], "a"), (ids[2], "c")):
+            registro = dao.instanciar("SELECT nombre FROM test_table WHERE id = ?", (id_generado,))
+            assert registro[0]["nombre"] == nombre
+        assert id_previo not in ids
+
+    def test_actualizacion_lote_cuenta_filas(self, db_temporal):
+        """Verifica que se suman las filas afectadas de todos los lotes."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+        ids = dao.ejecutar_insertar_lote(
+            "INSERT INTO test_table (nombre, valor) VALUES (?, ?)",
+            [(f"fila{i}", i) for i in range(5)],
+        )
+
+        actualizadas = dao.ejecutar_actualizacion_lote(
+            "UPDATE test_table SET valor = ? WHERE id = ?",
+            [(100, id_fila) for id_fila in ids] + [(100, 9999)],
+            tamano_lote=2,
+        )
+
+        assert actualizadas == 5
+
+    def test_actualizacion_lote_confirma_lotes_previos_al_error(self, db_temporal):
+        """Un lote con error se informa con None aunque los anteriores quedaron confirmados."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+        ids = dao.ejecutar_insertar_lote(
+            "INSERT INTO test_table (nombre, valor) VALUES (?, ?)",
+            [(f"fila{i}", i) for i in range(4)],
+        )
+
+        actualizadas = dao.ejecutar_actualizacion_lote(
+            "UPDATE test_table SET nombre = ? WHERE id = ?",
+            [("nuevo", ids[0]), ("nuevo", ids[1]), ("nuevo", ids[2]), (None, ids[3])],
+            tamano_lote=2,
+        )
+
+        assert actualizadas is None
+        nombres = [f["nombre"] for f in dao.instanciar("SELECT nombre FROM test_table ORDER BY id")]
+        assert nombres == ["nuevo", "nuevo", "fila2", "fila3"]
+
+    def test_lote_sin_sql_definido(self, db_temporal):
+        """Un DAO sin sentencias de lote no escribe nada."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+
+        assert dao.insertar_lote([object()]) == []
+        assert dao.actualizar_lote([object()]) == 0
+        assert dao.eliminar_lote([object()]) == 0
+
+
+class TestDAOTransaccion:
+    """Tests para transaccion()."""
+
+    INSERT = "INSERT INTO test_table (nombre, valor) VALUES (?, ?)"
+
+    def _contar(self, dao):
+        return len(dao.instanciar("SELECT * FROM test_table"))
+
+    def test_comparte_conexion_y_confirma_al_final(self, db_temporal):
+        """Todas las operaciones usan la conexión de la transacción."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        otro_dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+
+        with transaccion(db_temporal) as con:
+            dao.ejecutar_insertar(self.INSERT, ("a", 1))
+            otro_dao.ejecutar_insertar(self.INSERT, ("b", 2))
+            with dao.get_conexion() as con_dao:
+                assert con_dao is con
+            assert con.in_transaction
+
+        assert self._contar(dao) == 2
+
+    def test_excepcion_revierte_todo(self, db_temporal):
+        """Una excepción dentro del bloque revierte todas las operaciones."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+
+        with pytest.raises(RuntimeError):
+            with transaccion(db_temporal):
+                dao.ejecutar_insertar(self.INSERT, ("a", 1))
+                dao.ejecutar_insertar(self.INSERT, ("b", 2))
+                raise RuntimeError("fallo")
+
+        assert self._contar(dao) == 0
+
+    def test_error_capturado_por_dao_revierte(self, db_temporal):
+        """Un error que el DAO captura igualmente revierte la transacción."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+
+        with pytest.raises(TransaccionRevertida):
+            with transaccion(db_temporal):
+                dao.ejecutar_insertar(self.INSERT, ("a", 1))
+                assert dao.ejecutar_insertar(self.INSERT, (None, 2)) is None
+
+        assert self._contar(dao) == 0
+
+    def test_savepoint_anidado_revierte_solo_su_nivel(self, db_temporal):
+        """Un bloque anidado que falla no afecta al bloque externo."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+
+        with transaccion(db_temporal):
+            dao.ejecutar_insertar(self.INSERT, ("externo", 1))
+            with pytest.raises(TransaccionRevertida):
+                with transaccion(db_temporal):
+                    dao.ejecutar_insertar(self.INSERT, ("interno", 2))
+                    dao.ejecutar_insertar(self.INSERT, (None, 3))
+            with transaccion(db_temporal):
+                dao.ejecutar_insertar(self.INSERT, ("interno_ok", 4))
+
+        nombres = {fila["nombre"] for fila in dao.instanciar("SELECT nombre FROM test_table")}
+        assert nombres == {"externo", "interno_ok"}
+
+    def test_lotes_dentro_de_transaccion_son_atomicos(self, db_temporal):
+        """Los lotes no confirman por separado dentro de una transacción."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+
+        with pytest.raises(TransaccionRevertida):
+            with transaccion(db_temporal):
+                dao.ejecutar_insertar_lote(
+                    self.INSERT, [("a", 1), ("b", 2), ("c", 3), (None, 4)], tamano_lote=2
+                )
+
+        assert self._contar(dao) == 0
+
+    def test_conexion_vuelve_al_pool(self, db_temporal):
+        """Al terminar la transacción su conexión queda libre en el pool."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+
+        with transaccion(db_temporal):
+            dao.ejecutar_insertar(self.INSERT, ("a", 1))
+
+        estadisticas = ConexionSQLite(db_temporal).obtener_estadisticas()
+        assert estadisticas.en_uso == 0
+
+
+class TestDAOIterarConsulta:
+    """Tests para iterar_consulta."""
+
+    def test_itera_todas_las_filas_por_bloques(self, db_temporal):
+        """Entrega todas las filas aunque superen el tamaño de bloque."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+        dao.ejecutar_insertar_lote(
+            "INSERT INTO test_table (nombre, valor) VALUES (?, ?)",
+            [(f"fila{i}", i) for i in range(25)],
+        )
+
+        filas = list(
+            dao.iterar_consulta("SELECT * FROM test_table ORDER BY id", tamano_bloque=4)
+        )
+
+        assert len(filas) == 25
+        assert filas[0]["nombre"] == "fila0"
+        assert isinstance(filas[0], dict)
+
+    def test_fabrica_convierte_filas(self, db_temporal):
+        """Cada fila se transforma con la fábrica indicada."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+        dao.ejecutar_insertar("INSERT INTO test_table (nombre, valor) VALUES (?, ?)", ("a", 7))
+
+        valores = list(
+            dao.iterar_consulta("SELECT valor FROM test_table", fabrica=lambda row: row["valor"])
+        )
+
+        assert valores == [7]
+
+    def test_cerrar_iterador_devuelve_conexion(self, db_temporal):
+        """Abandonar el iterador a medias libera la conexión del pool."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+        dao.ejecutar_insertar_lote(
+            "INSERT INTO test_table (nombre, valor) VALUES (?, ?)",
+            [(f"fila{i}", i) for i in range(10)],
+        )
+        estadisticas = ConexionSQLite(db_temporal).obtener_estadisticas
+
+        iterador = dao.iterar_consulta("SELECT * FROM test_table", tamano_bloque=2)
+        next(iterador)
+        assert estadisticas().en_uso == 1
+        iterador.close()
+
+        assert estadisticas().en_uso == 0
+
+    def test_error_se_propaga(self, db_temporal):
+        """Una consulta inválida lanza la excepción en lugar de no entregar filas."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+
+        with pytest.raises(sqlite3.Error):
+            list(dao.iterar_consulta("SELECT * FROM tabla_inexistente"))
+        assert ConexionSQLite(db_temporal).obtener_estadisticas().en_uso == 0
+
+    def test_error_a_mitad_se_propaga(self, db_temporal):
+        """Un error en fetchmany no se confunde con el final del resultado."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+        dao.ejecutar_insertar_lote(
+            "INSERT INTO test_table (nombre, valor) VALUES (?, ?)",
+            [(f"fila{i}", i) for i in range(20)],
+        )
+        # abs() del menor entero desborda al llegar a la fila 7
+        sql = "SELECT CASE WHEN valor < 7 THEN valor ELSE abs(-9223372036854775807 - 1) END AS v FROM test_table ORDER BY id"
+
+        entregadas = []
+        with pytest.raises(sqlite3.Error):
+            for fila in dao.iterar_consulta(sql, tamano_bloque=4):
+                entregadas.append(fila["v"])
+        assert entregadas == [0, 1, 2, 3]
+
+
+class TestDAOConsultarDTOs:
+    """Tests para consultar_dtos y consultar_en_dto."""
+
+    @dataclasses.dataclass
+    class FilaDTO:
+        id: Optional[int] = None
+        nombre: Optional[str] = None
+        valor: Optional[int] = None
+
+    def test_consultar_dtos(self, db_temporal):
+        """Cada fila se convierte en un DTO."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+        dao.ejecutar_insertar_lote(
+            "INSERT INTO test_table (nombre, valor) VALUES (?, ?)", [("a", 1), ("b", 2)]
+        )
+
+        filas = dao.consultar_dtos("SELECT * FROM test_table ORDER BY id", (), self.FilaDTO)
+
+        assert filas == [self.FilaDTO(1, "a", 1), self.FilaDTO(2, "b", 2)]
+
+    def test_consultar_en_dto(self, db_temporal):
+        """La primera fila se carga en el DTO recibido."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+        dao.ejecutar_insertar("INSERT INTO test_table (nombre, valor) VALUES (?, ?)", ("a", 5))
+        dto = self.FilaDTO(id=1)
+
+        assert dao.consultar_en_dto("SELECT * FROM test_table WHERE id = ?", (1,), dto) is True
+        assert dto == self.FilaDTO(1, "a", 5)
+        assert dao.consultar_en_dto("SELECT * FROM test_table WHERE id = ?", (9,), dto) is False
+
+    def test_iterar_consulta_con_clase_dto(self, db_temporal):
+        """iterar_consulta también puede entregar DTOs."""
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+        dao.ejecutar_insertar("INSERT INTO test_table (nombre, valor) VALUES (?, ?)", ("a", 5))
+
+        filas = list(dao.iterar_consulta("SELECT * FROM test_table", clase_dto=self.FilaDTO))
+
+        assert filas == [self.FilaDTO(1, "a", 5)]
+
+
+class TestDAOObtenerPorIds:
+    """Tests para obtener_por_ids."""
+
+    @dataclasses.dataclass
+    class ParDTO:
+        a: Optional[int] = None
+        b: Optional[int] = None
+        valor: Optional[str] = None
+
+    class ParDAO(ConcreteDAO):
+        _TABLA = "par"
+        _CLAVE = ("a", "b")
+
+        def crear_tabla(self):
+            self.ejecutar_actualizacion(
+                "CREATE TABLE IF NOT EXISTS par (a INTEGER, b INTEGER, valor TEXT, PRIMARY KEY (a, b))"
+            )
+
+    def test_sin_configuracion_retorna_vacio(self, db_temporal):
+        """Un DAO sin _TABLA/_CLAVE no admite la búsqueda."""
+        assert ConcreteDAO(ruta_db=db_temporal).obtener_por_ids([1, 2]) == {}
+
+    def test_clave_compuesta(self, db_temporal):
+        """Con clave compuesta los ids son tuplas y se consulta por bloques."""
+        dao = self.ParDAO(ruta_db=db_temporal)
+        dao._CLASE_DTO = self.ParDTO
+        dao.crear_tabla()
+        dao.ejecutar_actualizacion_lote(
+            "INSERT INTO par (a, b, valor) VALUES (?, ?, ?)",
+            [(a, b, f"{a}-{b}") for a in range(4) for b in range(4)],
+        )
+
+        pares = dao.obtener_por_ids([(0, 1), (3, 3), (0, 1), (9, 9), (2, 0)], tamano_bloque=2)
+
+        assert set(pares) == {(0, 1), (3, 3), (2, 0)}
+        assert pares[(3, 3)].valor == "3-3"
+
+
+class TestDAOConsultarCacheado:
+    """Tests para consultar_cacheado."""
+
+    SQL = "SELECT * FROM test_table ORDER BY id"
+
+    def crear_dao(self, db_temporal):
+        dao = ConcreteDAO(ruta_db=db_temporal)
+        dao.crear_tabla()
+        dao.ejecutar_insertar("INSERT INTO test_table (nombre, valor) VALUES (?, ?)", ("a", 1))
+        return dao
+
+    def estadisticas(self, db_temporal):
+        return ConexionSQLite(db_temporal).cache_consultas().obtener_estadisticas()
+
+    def test_segunda_consulta_se_sirve_desde_cache(self, db_temporal):
+        """La misma SQL (con otra indentación) y parámetros no vuelve a consultar."""
+        dao = self.crear_dao(db_temporal)
+
+        primera = dao.consultar_cacheado(self.SQL)
+        segunda = dao.consultar_cacheado("SELECT *\n   FROM test_table\n ORDER BY id;")
+
+        assert primera == segunda == [{"id": 1, "nombre": "a", "valor": 1}]
+        estadisticas = self.estadisticas(db_temporal)
+        assert (estadisticas.aciertos, estadisticas.fallos) == (1, 1)
+
+    def test_escritura_del_proceso_invalida(self, db_temporal):
+        """Una escritura confirmada por un DAO invalida los resultados guardados."""
+        dao = self.crear_dao(db_temporal)
+        dao.consultar_cacheado(self.SQL)
+
+        dao.ejecutar_insertar("INSERT INTO test_table (nombre, valor) VALUES (?, ?)", ("b", 2))
+
+        assert len(dao.consultar_cacheado(self.SQL)) == 2
+        assert self.estadisticas(db_temporal).invalidaciones == 1
+
+    def test_escritura_externa_invalida(self, db_temporal):
+        """Los cambios de otra conexión se detectan con PRAGMA data_version."""
+        dao = self.crear_dao(db_temporal)
+        dao.consultar_cacheado(self.SQL)
+
+        externa = sqlite3.connect(db_temporal)
+        externa.execute("INSERT INTO test_table (nombre, valor) VALUES ('x', 9)")
+        externa.commit()
+        externa.close()
+
+        assert [fila["nombre"] for fila in dao.consultar_cacheado(self.SQL)] == ["a", "x"]
+
+    def test_dtos_y_parametros_son_parte_de_la_clave(self, db_temporal):
+        """Cada combinación de parámetros y clase DTO tiene su propia entrada."""
+        dao = self.crear_dao(db_temporal)
+        sql = "SELECT * FROM test_table WHERE valor >= ?"
+
+        assert dao.consultar_cacheado(sql, (1,), TestDAOConsultarDTOs.FilaDTO) == [
+            TestDAOConsultarDTOs.FilaDTO(1, "a", 1)
+        ]
+        assert dao.consultar_cacheado(sql, (2,), TestDAOConsultarDTOs.FilaDTO) == []
+        assert dao.consultar_cacheado(sql, (1,)) == [{"id": 1, "nombre": "a", "valor": 1}]
+        assert self.estadisticas(db_temporal).entradas == 3
+
+    def test_dentro_de_transaccion_no_usa_cache(self, db_temporal):
+        """Dentro de transaccion() se ven los cambios no confirmados."""
+        dao = self.crear_dao(db_temporal)
+        dao.consultar_cacheado(self.SQL)
+
+        with transaccion(db_temporal):
+            dao.ejecutar_insertar("INSERT INTO test_table (nombre, valor) VALUES (?, ?)", ("b", 2))
+            assert len(dao.consultar_cacheado(self.SQL)) == 2
+
+        assert len(dao.consultar_cacheado(self.SQL)) == 2
+
+    def test_error_no_se_guarda(self, db_temporal):
+        """Una consulta fallida retorna lista vacía y no queda en caché."""
+        dao = self.crear_dao(db_temporal)
+
+        assert dao.consultar_cacheado("SELECT * FROM tabla_inexistente") == []
+        assert self.estadisticas(db_temporal).entradas == 0
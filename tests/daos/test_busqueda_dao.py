@@ -0,0 +1,141 @@
+import pytest
+from src.modelos.daos.actividad_dao import ActividadDAO
+from src.modelos.daos.busqueda_dao import (
+    BusquedaDAO,
+    ACTIVIDAD,
+    ASIGNATURA,
+    ESTUDIANTE,
+    expresion_busqueda,
+)
+from src.modelos.daos.estudiante_dao import EstudianteDAO
+from src.modelos.dtos.actividad_dto import ActividadDTO
+from src.modelos.dtos.estudiante_dto import EstudianteDTO
+
+
+@pytest.fixture
+def datos(ruta_db, poblar_catalogo):
+    """Tres asignaturas con una actividad cada una y dos estudiantes."""
+    ids_asignaturas, ids_ejes, (id_tipo,) = poblar_catalogo(
+        [("SIS-101", "Programación I"), ("MAT-201", "Cálculo Diferencial"), ("SIS-202", "Bases de Datos")],
+        vistas=False,
+    )
+    ids_actividades = ActividadDAO(ruta_db).insertar_lote(
+        ActividadDTO(
+            titulo=titulo,
+            descripcion=descripcion,
+            fecha_inicio="2025-03-01",
+            fecha_fin="2025-03-15",
+            id_eje=eje,
+            id_tipo_actividad=id_tipo,
+        )
+        for titulo, descripcion, eje in zip(
+            ("Práctica de punteros", "Examen parcial", "Diseño de un modelo relacional"),
+            ("Listas enlazadas", "Derivadas y límites", "Normalización y práctica en SQL"),
+            ids_ejes,
+        )
+    )
+    ids_estudiantes = EstudianteDAO(ruta_db).insertar_lote(
+        [
+            EstudianteDTO(nombre="José Pérez", correo="jperez@uni.edu"),
+            EstudianteDTO(nombre="Ana Ruiz", correo="ana@uni.edu"),
+        ]
+    )
+    return ruta_db, ids_asignaturas, ids_actividades, ids_estudiantes
+
+
+class TestExpresionBusqueda:
+    """Tests para la conversión del texto de búsqueda a una expresión MATCH."""
+
+    def test_palabras_como_prefijos(self):
+        assert expresion_busqueda("SIS-1 progra") == '"SIS"* "1"* "progra"*'
+        assert expresion_busqueda("  ") is None
+        assert expresion_busqueda(None) is None
+
+    def test_operadores_se_buscan_como_texto(self, datos):
+        ruta, *_ = datos
+        dao = BusquedaDAO(ruta)
+        for texto in ('"a', 'NEAR(a b)', 'OR', 'titulo:*', 'a AND -b'):
+            assert isinstance(dao.buscar(ACTIVIDAD, texto), list)
+
+
+class TestBusquedaDAO:
+    """Tests para los índices de texto completo."""
+
+    def test_prefijos_sin_tildes_ni_mayusculas(self, datos):
+        ruta, ids_asignaturas, ids_actividades, ids_estudiantes = datos
+        dao = BusquedaDAO(ruta)
+
+        assert dao.fts_disponible()
+        assert dao.buscar(ASIGNATURA, "progra") == [ids_asignaturas[0]]
+        assert dao.buscar(ASIGNATURA, "calculo dif") == [ids_asignaturas[1]]
+        assert sorted(dao.buscar(ASIGNATURA, "sis")) == [ids_asignaturas[0], ids_asignaturas[2]]
+        assert dao.buscar(ESTUDIANTE, "jose") == [ids_estudiantes[0]]
+        assert dao.buscar(ESTUDIANTE, "ana@uni") == [ids_estudiantes[1]]
+        assert dao.buscar(ACTIVIDAD, "normaliz") == [ids_actividades[2]]
+        assert dao.buscar(ACTIVIDAD, "zzz") == []
+
+    def test_columna_principal_pesa_mas(self, datos):
+        ruta, _, ids_actividades, _ = datos
+        dao = BusquedaDAO(ruta)
+
+        # "práctica" está en el título de la primera y en la descripción de la tercera
+        assert dao.buscar(ACTIVIDAD, "practica") == [ids_actividades[0], ids_actividades[2]]
+        assert dao.buscar(ACTIVIDAD, "practica", limite=1) == [ids_actividades[0]]
+
+    def test_triggers_mantienen_el_indice(self, datos):
+        ruta, ids_asignaturas, ids_actividades, _ = datos
+        dao = BusquedaDAO(ruta)
+
+        actividad = ActividadDTO(id_actividad=ids_actividades[1])
+        assert ActividadDAO(ruta).instanciar(actividad)
+        actividad.titulo = "Examen final"
+        assert ActividadDAO(ruta).actualizar(actividad)
+        actividad.id_actividad = None
+        actividad.titulo = "Quiz de integrales"
+        nueva = ActividadDAO(ruta).insertar(actividad)
+        dao.ejecutar_actualizacion("DELETE FROM asignatura WHERE id_asignatura = ?", (ids_asignaturas[2],))
+
+        assert dao.buscar(ACTIVIDAD, "parcial") == []
+        assert dao.buscar(ACTIVIDAD, "final") == [ids_actividades[1]]
+        assert dao.buscar(ACTIVIDAD, "integ") == [nueva]
+        assert dao.buscar(ASIGNATURA, "bases") == []
+        # El borrado en cascada de la actividad también sale del índice
+        assert dao.buscar(ACTIVIDAD, "relacional") == []
+
+    def test_actividades_por_asignatura(self, datos):
+        ruta, _, ids_actividades, _ = datos
+        dao = BusquedaDAO(ruta)
+
+        assert dao.buscar_actividades_por_asignatura("mat") == [ids_actividades[1]]
+        assert dao.buscar_actividades_por_asignatura("sis 202") == [ids_actividades[2]]
+        assert dao.buscar_actividades_por_asignatura("zzz") == []
+        assert dao.buscar_actividades_por_asignatura("") is None
+
+    def test_texto_sin_palabras_no_filtra(self, datos):
+        ruta, *_ = datos
+        dao = BusquedaDAO(ruta)
+
+        # Vacío o solo signos: no hay nada que buscar, a diferencia de "sin resultados"
+        for texto in ("", "  ", "-", "¿?", '"*'):
+            assert dao.buscar(ACTIVIDAD, texto) is None
+            assert dao.buscar_actividades_por_asignatura(texto) is None
+
+    def test_reconstruir(self, datos):
+        ruta, ids_asignaturas, *_ = datos
+        dao = BusquedaDAO(ruta)
+        dao.ejecutar_actualizacion("INSERT INTO asignatura_fts (asignatura_fts) VALUES ('delete-all')")
+        assert dao.buscar(ASIGNATURA, "progra") == []
+
+        assert dao.reconstruir()
+        assert dao.buscar(ASIGNATURA, "progra") == [ids_asignaturas[0]]
+
+    def test_like_sin_fts(self, datos):
+        ruta, ids_asignaturas, ids_actividades, ids_estudiantes = datos
+        dao = BusquedaDAO(ruta)
+        dao._fts_disponible = False
+
+        assert dao.buscar(ASIGNATURA, "sis 202") == [ids_asignaturas[2]]
+        assert dao.buscar(ESTUDIANTE, "100%") == []
+        assert dao.buscar(ESTUDIANTE, "ruiz") == [ids_estudiantes[1]]
+        assert dao.buscar_actividades_por_asignatura("bases") == [ids_actividades[2]]
+        assert dao.buscar(ASIGNATURA, "-") is None
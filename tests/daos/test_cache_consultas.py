@@ -0,0 +1,71 @@
+from src.modelos.daos.cache_consultas import CacheConsultas, estimar_bytes, normalizar_sql
+
+
+class TestNormalizarSQL:
+    """Tests para normalizar_sql."""
+
+    def test_colapsa_espacios_y_quita_punto_y_coma(self):
+        assert normalizar_sql("\n  SELECT *\n\tFROM  t\n  WHERE a = ?;\n") == "SELECT * FROM t WHERE a = ?"
+
+    def test_respeta_literales(self):
+        sql = "SELECT * FROM t WHERE nombre = 'a   b' AND \"col  x\" = 1"
+        assert normalizar_sql(sql) == sql
+        assert normalizar_sql("SELECT 'a  b'") != normalizar_sql("SELECT 'a b'")
+
+
+class TestCacheConsultas:
+    """Tests para CacheConsultas."""
+
+    def test_acierto_retorna_copia(self):
+        cache = CacheConsultas(max_entradas=4, max_bytes=10_000)
+        clave = CacheConsultas.clave("SELECT 1", ())
+        assert cache.obtener(clave, 1) is None
+        cache.guardar(clave, 1, [1, 2], 10)
+
+        resultado = cache.obtener(clave, 1)
+        resultado.append(3)
+
+        assert cache.obtener(clave, 1) == [1, 2]
+        estadisticas = cache.obtener_estadisticas()
+        assert (estadisticas.aciertos, estadisticas.fallos) == (2, 1)
+
+    def test_desaloja_la_menos_usada(self):
+        cache = CacheConsultas(max_entradas=2, max_bytes=10_000)
+        for nombre in ("a", "b"):
+            cache.obtener(nombre, 1)
+            cache.guardar(nombre, 1, [nombre], 10)
+        cache.obtener("a", 1)  # "b" pasa a ser la menos usada
+        cache.guardar("c", 1, ["c"], 10)
+
+        assert cache.obtener("b", 1) is None
+        assert cache.obtener("a", 1) == ["a"]
+        assert cache.obtener_estadisticas().desalojos == 1
+
+    def test_limite_de_bytes(self):
+        cache = CacheConsultas(max_entradas=10, max_bytes=100)
+        cache.obtener("a", 1)
+        cache.guardar("a", 1, ["a"], 60)
+        cache.guardar("b", 1, ["b"], 60)
+        cache.guardar("grande", 1, ["x"], 500)
+
+        estadisticas = cache.obtener_estadisticas()
+        assert (estadisticas.entradas, estadisticas.bytes) == (1, 60)
+        assert estadisticas.rechazadas == 1
+        assert cache.obtener("b", 1) == ["b"]
+
+    def test_cambio_de_version_vacia_la_cache(self):
+        cache = CacheConsultas(max_entradas=10, max_bytes=10_000)
+        cache.obtener("a", 1)
+        cache.guardar("a", 1, ["a"], 10)
+
+        assert cache.obtener("a", 2) is None
+        # Un resultado calculado con la versión anterior ya no se guarda
+        cache.guardar("a", 1, ["viejo"], 10)
+        assert cache.obtener("a", 2) is None
+        assert cache.obtener_estadisticas().invalidaciones == 1
+
+    def test_parametros_no_hashables(self):
+        assert CacheConsultas.clave("SELECT ?", ([1],)) is None
+
+    def test_estimar_bytes_crece_con_las_filas(self):
+        assert estimar_bytes([(1, "a")] * 10) > estimar_bytes([(1, "a")])
@@ -221,3 +221,40 @@ class TestCarreraDAO:
         # VERIFY NOT EXISTS
         carrera_verificar_final = CarreraDTO(id_carrera=id_creado)
         assert carrera_dao.existe(carrera_verificar_final) is False
+
+    def test_operaciones_por_lote(self, carrera_dao):
+        """Inserta, actualiza y elimina varias carreras en lotes."""
+        carreras = [
+            CarreraDTO(nombre=f"Carrera {i}", plan="Plan 2024", modalidad="Presencial")
+            for i in range(5)
+        ]
+
+        ids = carrera_dao.insertar_lote(carreras, tamano_lote=2)
+        assert len(ids) == 5
+
+        for id_carrera, carrera in zip(ids, carreras):
+            carrera.id_carrera = id_carrera
+            carrera.modalidad = "Virtual"
+        assert carrera_dao.actualizar_lote(carreras) == 5
+
+        carrera_leida = CarreraDTO(id_carrera=ids[-1])
+        carrera_dao.instanciar(carrera_leida)
+        assert carrera_leida.nombre == "Carrera 4"
+        assert carrera_leida.modalidad == "Virtual"
+
+        assert carrera_dao.eliminar_lote(carreras[:3]) == 3
+        assert carrera_dao.existe(CarreraDTO(id_carrera=ids[0])) is False
+        assert carrera_dao.existe(CarreraDTO(id_carrera=ids[4])) is True
+
+    def test_obtener_por_ids(self, carrera_dao):
+        """Busca varias carreras por id, en bloques y sin repetir ids."""
+        ids = carrera_dao.insertar_lote(
+            CarreraDTO(nombre=f"Carrera {i}", plan="Plan 2024", modalidad="Presencial")
+            for i in range(7)
+        )
+
+        carreras = carrera_dao.obtener_por_ids(ids + ids[:2] + [None, 9999], tamano_bloque=3)
+
+        assert set(carreras) == set(ids)
+        assert carreras[ids[3]].nombre == "Carrera 3"
+        assert carrera_dao.obtener_por_ids([]) == {}
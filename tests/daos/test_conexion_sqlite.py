@@ -134,3 +134,124 @@ class TestConexionSQLite:
         with pytest.raises(sqlite3.Error):
             conexion_sqlite = ConexionSQLite("/ruta/invalida/test.db")
             conexion_sqlite.obtener_conexion()
+
+    def test_instancia_por_ruta(self, tmp_path):
+        """Cada ruta de base de datos tiene su propia instancia y sus conexiones."""
+        conexion_a = ConexionSQLite(str(tmp_path / "a.db"))
+        conexion_b = ConexionSQLite(str(tmp_path / "b.db"))
+
+        assert conexion_a is not conexion_b
+        with conexion_b.conexion_prestada() as con:
+            con.execute("CREATE TABLE solo_b (id INTEGER)")
+            con.commit()
+
+        with conexion_a.conexion_prestada() as con:
+            tablas = con.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+        assert tablas == []
+
+    def test_adquirir_y_devolver_reutiliza(self, db_temporal):
+        """Una conexión devuelta al pool se reutiliza en el siguiente préstamo."""
+        conexion_sqlite = ConexionSQLite(db_temporal)
+
+        con1 = conexion_sqlite.adquirir_conexion()
+        conexion_sqlite.devolver_conexion(con1)
+        con2 = conexion_sqlite.adquirir_conexion()
+        conexion_sqlite.devolver_conexion(con2)
+
+        assert con1 is con2
+        estadisticas = conexion_sqlite.obtener_estadisticas()
+        assert estadisticas.creadas == 1
+        assert estadisticas.reutilizadas == 1
+
+    def test_configurar_pool_tamano_maximo(self, db_temporal):
+        """El tamaño máximo configurado limita las conexiones abiertas."""
+        conexion_sqlite = ConexionSQLite(db_temporal)
+        conexion_sqlite.configurar_pool(tamano_maximo=1, tiempo_espera=0.1)
+
+        conexion_sqlite.adquirir_conexion()
+        with pytest.raises(sqlite3.OperationalError):
+            conexion_sqlite.adquirir_conexion()
+
+    def test_configurar_pool_politica_verificacion(self, db_temporal):
+        """La política 'siempre' verifica también la conexión del thread."""
+        conexion_sqlite = ConexionSQLite(db_temporal)
+        conexion_sqlite.configurar_pool(politica_verificacion="siempre")
+
+        conexion_sqlite.obtener_conexion()
+        conexion_sqlite.obtener_conexion()
+
+        assert conexion_sqlite.obtener_estadisticas().sondeos == 1
+        with pytest.raises(ValueError):
+            conexion_sqlite.configurar_pool(politica_verificacion="a_veces")
+
+    def test_cerrar_todas_cierra_conexiones_de_todos_los_threads(self, db_temporal):
+        """cerrar_todas cierra también las conexiones retenidas por otros threads."""
+        conexion_sqlite = ConexionSQLite(db_temporal)
+        conexiones = []
+
+        def retener():
+            conexiones.append(conexion_sqlite.obtener_conexion())
+
+        hilo = threading.Thread(target=retener)
+        hilo.start()
+        hilo.join()
+
+        ConexionSQLite.cerrar_todas()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conexiones[0].execute("SELECT 1")
+
+    def test_ruta_uri(self, tmp_path):
+        """Las rutas `file:` se abren como URI y no como nombre de archivo."""
+        ruta = tmp_path / "uri.db"
+        conexion_sqlite = ConexionSQLite(f"file:{ruta}?mode=rwc")
+
+        with conexion_sqlite.conexion_prestada() as con:
+            con.execute("CREATE TABLE t (id INTEGER)")
+            con.commit()
+
+        assert ruta.exists()
+        assert not (Path.cwd() / f"file:{ruta}?mode=rwc").exists()
+        assert conexion_sqlite.version_datos() is not None
+
+    def test_al_confirmar_espera_al_commit(self, db_temporal):
+        """Las acciones registradas dentro de una transacción corren tras el commit."""
+        conexion_sqlite = ConexionSQLite(db_temporal)
+        ejecutadas = []
+
+        with conexion_sqlite.transaccion():
+            conexion_sqlite.al_confirmar(lambda: ejecutadas.append("externa"))
+            with conexion_sqlite.transaccion():
+                conexion_sqlite.al_confirmar(lambda: ejecutadas.append("anidada"))
+            assert ejecutadas == []
+        assert ejecutadas == ["externa", "anidada"]
+
+        conexion_sqlite.al_confirmar(lambda: ejecutadas.append("inmediata"))
+        assert ejecutadas[-1] == "inmediata"
+
+    def test_al_confirmar_descarta_al_revertir(self, db_temporal):
+        """Un rollback descarta las acciones de su nivel."""
+        conexion_sqlite = ConexionSQLite(db_temporal)
+        ejecutadas = []
+
+        with conexion_sqlite.transaccion():
+            conexion_sqlite.al_confirmar(lambda: ejecutadas.append("externa"))
+            with pytest.raises(ValueError):
+                with conexion_sqlite.transaccion():
+                    conexion_sqlite.al_confirmar(lambda: ejecutadas.append("revertida"))
+                    raise ValueError
+        assert ejecutadas == ["externa"]
+
+        with pytest.raises(ValueError):
+            with conexion_sqlite.transaccion():
+                conexion_sqlite.al_confirmar(lambda: ejecutadas.append("otra"))
+                raise ValueError
+        assert ejecutadas == ["externa"]
+
+
+def test_exporta_los_daos():
+    """Todos los nombres de __all__ se pueden importar desde el paquete."""
+    import src.modelos.daos as daos
+
+    for nombre in daos.__all__:
+        assert getattr(daos, nombre) is not None
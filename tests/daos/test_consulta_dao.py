@@ -0,0 +1,147 @@
+import importlib
+import pytest
+from datetime import date, timedelta
+from src.modelos.daos import esquema
+from src.modelos.daos.actividad_dao import ActividadDAO
+from src.modelos.daos.consulta_dao import ConsultaDAO, EventosUnificadosDAO
+from src.modelos.daos.estudiante_actividad_dao import EstudianteActividadDAO
+from src.modelos.daos.estudiante_dao import EstudianteDAO
+from src.modelos.dtos.actividad_dto import ActividadDTO
+from src.modelos.dtos.estudiante_actividad_dto import EstudianteActividadDTO
+from src.modelos.dtos.estudiante_dto import EstudianteDTO
+
+ESTADOS = ['entregada', 'pendiente', 'en_progreso', 'vencida', None]
+
+
+@pytest.fixture
+def datos(ruta_db, poblar_catalogo):
+    """Un estudiante con 30 actividades en dos asignaturas y tres tipos."""
+    ids_asignaturas, ids_ejes, ids_tipos = poblar_catalogo(
+        [(f"A{i}", f"Asig {i}") for i in range(2)],
+        [(f"Tipo {p}", f"T{p}", p) for p in (0, 1, 2)],
+    )
+    hoy = date.today()
+    ids_actividades = ActividadDAO(ruta_db).insertar_lote(
+        ActividadDTO(
+            titulo=f"Actividad {i}",
+            fecha_inicio=str(hoy - timedelta(days=i + (i % 4) * 3)),
+            fecha_fin=str(hoy - timedelta(days=i - 10)),
+            id_eje=ids_ejes[i % 2],
+            id_tipo_actividad=ids_tipos[i % 3],
+            nota=i % 11,
+        )
+        for i in range(30)
+    )
+    id_estudiante = EstudianteDAO(ruta_db).insertar(EstudianteDTO(nombre="Ana", correo="ana@x.edu"))
+    EstudianteActividadDAO(ruta_db).insertar_lote(
+        EstudianteActividadDTO(id_estudiante=id_estudiante, id_actividad=id_act, estado=ESTADOS[i % 5])
+        for i, id_act in enumerate(ids_actividades)
+    )
+    return ruta_db, id_estudiante, ids_asignaturas, ids_tipos
+
+
+def esperado(ruta, filas, limite_dias=7):
+    """Cálculo de referencia en Python, como lo hacía el controlador."""
+    notas = {a.id_actividad: a.nota for a in ActividadDAO(ruta).obtener_todos()}
+    estados = [f.actividad_estado or 'pendiente' for f in filas]
+    entregadas = [f for f in filas if f.actividad_estado == 'entregada']
+    duraciones = [f.dias_duracion for f in filas if f.dias_duracion]
+    valores_nota = [notas[f.actividad_id] for f in filas]
+    return {
+        'total': len(filas),
+        'entregadas': estados.count('entregada'),
+        'pendientes': estados.count('pendiente'),
+        'en_progreso': estados.count('en_progreso'),
+        'vencidas': estados.count('vencida'),
+        'prioridad_alta': sum(f.prioridad == 2 for f in filas),
+        'prioridad_media': sum(f.prioridad == 1 for f in filas),
+        'prioridad_baja': sum(f.prioridad not in (1, 2) for f in filas),
+        'promedio_nota': round(sum(valores_nota) / len(valores_nota), 2),
+        'velocidad_promedio': round(sum(f.dias_desde_fin for f in entregadas) / len(entregadas), 1),
+        'duracion_promedio': round(sum(duraciones) / len(duraciones), 1),
+        'proximas_vencer': sum(0 <= f.dias_desde_fin <= limite_dias for f in filas),
+    }
+
+
+class TestEstadisticasActividades:
+    """Tests para ConsultaDAO.obtener_estadisticas_actividades."""
+
+    def test_coincide_con_el_calculo_en_python(self, datos):
+        ruta, id_estudiante, ids_asignaturas, ids_tipos = datos
+        dao = ConsultaDAO(ruta)
+
+        for filtros in [(), (None, ids_asignaturas[0]), (None, None, ids_tipos[2])]:
+            filas = dao.obtener_actividades_detalladas(id_estudiante, *filtros)
+            estadisticas = dao.obtener_estadisticas_actividades(id_estudiante, *filtros)
+
+            calculado = {campo: getattr(estadisticas, campo) for campo in esperado(ruta, filas)}
+            assert calculado == esperado(ruta, filas)
+
+    def test_proximas_ordenadas_y_limitadas(self, datos):
+        ruta, id_estudiante, _, _ = datos
+
+        estadisticas = ConsultaDAO(ruta).obtener_estadisticas_actividades(id_estudiante, max_proximas=3)
+
+        assert estadisticas.proximas_vencer > 3
+        dias = [a.dias_desde_fin for a in estadisticas.proximas]
+        assert len(dias) == 3 and dias == sorted(dias) and dias[0] >= 0
+
+    def test_sin_actividades(self, datos):
+        ruta, _, _, _ = datos
+
+        estadisticas = ConsultaDAO(ruta).obtener_estadisticas_actividades(9999)
+
+        assert estadisticas.total == 0
+        assert estadisticas.tasa_entrega == 0.0
+        assert estadisticas.proximas == []
+
+    def test_fecha_referencia_determinista(self, datos):
+        ruta, id_estudiante, _, _ = datos
+        dao = ConsultaDAO(ruta)
+        referencia = date.today() + timedelta(days=30)
+
+        filas = dao.obtener_actividades_detalladas(id_estudiante, fecha_referencia=referencia)
+        assert all(
+            f.dias_desde_fin == (referencia - date.fromisoformat(f.fecha_fin)).days for f in filas
+        )
+
+        # La misma fecha se sirve desde la caché; otra fecha es otra entrada
+        cache = esquema.ConexionSQLite(ruta).cache_consultas()
+        antes = cache.obtener_estadisticas()
+        a_futuro = dao.obtener_estadisticas_actividades(id_estudiante, fecha_referencia=referencia)
+        assert dao.obtener_estadisticas_actividades(id_estudiante, fecha_referencia=referencia) == a_futuro
+        assert cache.obtener_estadisticas().aciertos > antes.aciertos
+        hoy = dao.obtener_estadisticas_actividades(id_estudiante)
+        assert hoy.proximas_vencer != a_futuro.proximas_vencer
+
+    def test_vista_sin_columnas_dependientes_de_la_fecha(self, datos):
+        ruta, _, _, _ = datos
+
+        filas = ConsultaDAO(ruta).ejecutar_consulta(
+            "SELECT sql FROM sqlite_master WHERE name = 'vw_estudiante_actividades_detalladas'"
+        )
+        assert "'now'" not in filas[0]['sql']
+
+
+class TestEventosUnificadosTelemetria:
+    """Tests de cobertura de telemetría en EventosUnificadosDAO."""
+
+    def test_lecturas_registran_su_sentencia(self, datos, monkeypatch):
+        ruta, _, _, _ = datos
+        # La telemetría que consulta el DAO es la de su propio módulo base
+        base_dao = importlib.import_module(EventosUnificadosDAO.__mro__[1].__module__)
+        telemetria = base_dao.obtener_telemetria()
+        monkeypatch.setattr(telemetria, 'activa', True)
+        telemetria.reiniciar()
+        dao = EventosUnificadosDAO(ruta)
+
+        hoy = date.today()
+        dao.obtener_por_rango_fechas(str(hoy - timedelta(days=30)), str(hoy + timedelta(days=30)))
+        dao.obtener_por_tipo('actividad')
+        dao.obtener_por_tipo_actividad('Tipo 1')
+        dao.obtener_por_id(1, 'actividad')
+
+        sentencias = [sql for _, sql, _ in telemetria.ejemplos()]
+        telemetria.reiniciar()
+        assert len(sentencias) == 4
+        assert all('vw_eventos_unificados' in sql for sql in sentencias)
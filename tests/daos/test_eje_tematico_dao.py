@@ -216,3 +216,28 @@ class TestEjeTematicoDAO:
         # 4. Eliminar
         assert eje_tematico_dao.eliminar(eje_recuperado) is True
         assert eje_tematico_dao.existe(eje_recuperado) is False
+
+    def test_obtener_nombres_carrera(self, eje_tematico_dao, asignatura_para_ejes):
+        """Resuelve eje -> asignatura -> carrera para todos los ejes en una consulta."""
+        ids = eje_tematico_dao.insertar_lote(
+            EjeTematicoDTO(nombre=f"Tema {i}", orden=i, id_asignatura=asignatura_para_ejes)
+            for i in range(3)
+        )
+
+        nombres = eje_tematico_dao.obtener_nombres_carrera()
+
+        assert nombres == {id_eje: "Ingeniería" for id_eje in ids}
+
+    def test_obtener_nombres_carrera_usa_ejecutar_consulta(self, eje_tematico_dao, monkeypatch):
+        """La consulta pasa por ejecutar_consulta (registro de errores y telemetría)."""
+        llamadas = []
+        original = eje_tematico_dao.ejecutar_consulta
+
+        def espia(sql, params=()):
+            llamadas.append(sql)
+            return original(sql, params)
+
+        monkeypatch.setattr(eje_tematico_dao, "ejecutar_consulta", espia)
+
+        assert eje_tematico_dao.obtener_nombres_carrera() == {}
+        assert len(llamadas) == 1
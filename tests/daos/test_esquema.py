@@ -0,0 +1,60 @@
+import sqlite3
+from src.modelos.daos import esquema
+from src.modelos.daos.esquema import VERSION_ESQUEMA, inicializar_esquema, version_esquema
+from src.modelos.daos.actividad_dao import ActividadDAO
+from src.modelos.services.actividad_service import ActividadService
+
+ConexionSQLite = esquema.ConexionSQLite
+
+TABLAS = {
+    'carrera', 'asignatura', 'prerrequisito', 'eje_tematico', 'tipo_actividad',
+    'actividad', 'calendario_evento', 'estudiante', 'estudiante_carrera',
+    'estudiante_asignatura', 'estudiante_actividad',
+}
+
+
+def tablas_en(ruta_db):
+    con = sqlite3.connect(ruta_db)
+    try:
+        filas = con.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+        return {fila[0] for fila in filas}
+    finally:
+        con.close()
+
+
+class TestEsquema:
+    """Tests para el bootstrap del esquema."""
+
+    def test_primer_dao_crea_todas_las_tablas(self, ruta_db):
+        """Construir un DAO sobre una base vacía crea el esquema completo."""
+        ActividadDAO(ruta_db=ruta_db)
+
+        assert TABLAS <= tablas_en(ruta_db)
+        assert version_esquema(ruta_db) == VERSION_ESQUEMA
+
+    def test_construir_servicios_no_ejecuta_sql(self, ruta_db):
+        """Tras el bootstrap, crear DAOs y servicios no toma conexiones del pool."""
+        ActividadDAO(ruta_db=ruta_db)
+        antes = ConexionSQLite(ruta_db).obtener_estadisticas()
+
+        for _ in range(50):
+            ActividadService(ruta_db=ruta_db)
+
+        despues = ConexionSQLite(ruta_db).obtener_estadisticas()
+        assert despues.creadas == antes.creadas
+        assert despues.reutilizadas == antes.reutilizadas
+
+    def test_base_en_version_actual_no_ejecuta_ddl(self, ruta_db):
+        """Si user_version está al día no se vuelve a ejecutar CREATE TABLE."""
+        inicializar_esquema(ruta_db)
+        ConexionSQLite.resetear()
+        con = sqlite3.connect(ruta_db)
+        con.execute("DROP TABLE estudiante_actividad")
+        con.commit()
+        con.close()
+
+        ActividadDAO(ruta_db=ruta_db)
+        assert 'estudiante_actividad' not in tablas_en(ruta_db)
+
+        assert inicializar_esquema(ruta_db, forzar=True) is True
+        assert 'estudiante_actividad' in tablas_en(ruta_db)
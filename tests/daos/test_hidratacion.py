@@ -0,0 +1,64 @@
+import dataclasses
+import sqlite3
+from typing import Optional
+from src.modelos.daos.hidratacion import (
+    compilar_cargador,
+    compilar_hidratador,
+    hidratador_para,
+)
+from src.modelos.dtos.actividad_dto import ActividadDTO
+
+
+@dataclasses.dataclass
+class PersonaDTO:
+    id_persona: Optional[int] = None
+    nombre: Optional[str] = None
+    edad: Optional[int] = 18
+
+
+class TestHidratacion:
+    """Tests para la hidratación directa de DTOs."""
+
+    def test_hidratador_lee_por_posicion(self):
+        """Cada campo se toma de la columna con el mismo nombre."""
+        hidratar = compilar_hidratador(PersonaDTO, ("nombre", "id_persona", "edad"))
+
+        persona = hidratar(("Ana", 7, 30))
+
+        assert persona == PersonaDTO(id_persona=7, nombre="Ana", edad=30)
+
+    def test_campos_sin_columna_conservan_default(self):
+        """Las columnas ausentes dejan el valor por defecto y las sobrantes se ignoran."""
+        hidratar = compilar_hidratador(PersonaDTO, ("id_persona", "extra"))
+
+        persona = hidratar((1, "ignorado"))
+
+        assert persona == PersonaDTO(id_persona=1, nombre=None, edad=18)
+
+    def test_hidratador_se_compila_una_vez(self):
+        """La misma combinación de clase y columnas reutiliza la función."""
+        columnas = ("id_persona", "nombre")
+
+        assert compilar_hidratador(PersonaDTO, columnas) is compilar_hidratador(
+            PersonaDTO, columnas
+        )
+
+    def test_cargador_equivale_a_set_data(self):
+        """Cargar una fila da el mismo resultado que set_data con el dict."""
+        con = sqlite3.connect(":memory:")
+        con.row_factory = sqlite3.Row
+        cursor = con.execute(
+            "SELECT 1 AS id_actividad, 'Tarea' AS titulo, NULL AS descripcion, "
+            "'2025-01-01' AS fecha_inicio, '2025-01-02' AS fecha_fin, 2 AS id_eje, "
+            "3 AS id_tipo_actividad, 9 AS nota"
+        )
+        fila = cursor.fetchone()
+
+        esperado = ActividadDTO()
+        esperado.set_data(dict(fila))
+        cargado = ActividadDTO(titulo="anterior")
+        compilar_cargador(ActividadDTO, tuple(d[0] for d in cursor.description))(cargado, fila)
+
+        assert cargado == esperado
+        assert hidratador_para(ActividadDTO, cursor.description)(fila) == esperado
+        con.close()
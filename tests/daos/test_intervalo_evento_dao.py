@@ -0,0 +1,122 @@
+import random
+import pytest
+from datetime import date, timedelta
+from src.modelos.daos.actividad_dao import ActividadDAO
+from src.modelos.daos.calendario_evento_dao import CalendarioEventoDAO
+from src.modelos.daos.consulta_dao import EventosUnificadosDAO, _SQL_SOLAPAMIENTO
+from src.modelos.daos.intervalo_evento_dao import IntervaloEventoDAO
+from src.modelos.dtos.actividad_dto import ActividadDTO
+from src.modelos.dtos.calendario_evento_dto import CalendarioEventoDTO
+
+INICIO = date(2025, 1, 1)
+
+
+def intervalo_aleatorio(generador):
+    inicio = INICIO + timedelta(days=generador.randrange(365))
+    return str(inicio), str(inicio + timedelta(days=generador.randrange(40)))
+
+
+@pytest.fixture
+def datos(ruta_db, poblar_catalogo):
+    """150 actividades y 150 eventos de calendario con intervalos aleatorios."""
+    generador = random.Random(11)
+    _, (id_eje,), (id_tipo,) = poblar_catalogo([("A1", "Asig")])
+    ActividadDAO(ruta_db).insertar_lote(
+        ActividadDTO(
+            titulo=f"Actividad {i}",
+            fecha_inicio=inicio,
+            fecha_fin=fin,
+            id_eje=id_eje,
+            id_tipo_actividad=id_tipo,
+        )
+        for i, (inicio, fin) in enumerate(intervalo_aleatorio(generador) for _ in range(150))
+    )
+    CalendarioEventoDAO(ruta_db).insertar_lote(
+        CalendarioEventoDTO(titulo=f"Evento {i}", tipo="Feriado", fecha_inicio=inicio, fecha_fin=fin)
+        for i, (inicio, fin) in enumerate(intervalo_aleatorio(generador) for _ in range(150))
+    )
+    return ruta_db, generador
+
+
+def claves(eventos):
+    return sorted((e.tipo_evento, e.id_evento) for e in eventos)
+
+
+def solapados_por_recorrido(dao, desde, hasta):
+    """Resultado esperado: todos los eventos de la vista filtrados en Python."""
+    return [e for e in dao.obtener_todos() if e.fecha_inicio <= hasta and e.fecha_fin >= desde]
+
+
+class TestIntervaloEventoDAO:
+    """Tests para las consultas por solapamiento con los R*Tree de intervalos."""
+
+    def test_coincide_con_recorrido_completo(self, datos):
+        ruta, generador = datos
+        dao = EventosUnificadosDAO(ruta)
+
+        for _ in range(25):
+            desde, hasta = intervalo_aleatorio(generador)
+            solapados = dao.obtener_por_solapamiento(desde, hasta)
+            assert claves(solapados) == claves(solapados_por_recorrido(dao, desde, hasta))
+            assert [e.fecha_inicio for e in solapados] == sorted(e.fecha_inicio for e in solapados)
+
+    def test_incluye_eventos_que_solo_se_solapan(self, datos):
+        ruta, _ = datos
+        dao = EventosUnificadosDAO(ruta)
+
+        contenidos = dao.obtener_por_rango_fechas("2025-06-01", "2025-06-10")
+        solapados = dao.obtener_por_rango_fechas("2025-06-01", "2025-06-10", solapamiento=True)
+        assert set(claves(contenidos)) < set(claves(solapados))
+        iterados = dao.iterar_por_rango_fechas("2025-06-01", "2025-06-10", solapamiento=True)
+        assert claves(list(iterados)) == claves(solapados)
+        # Extremos incluidos y por día completo, aunque la fecha tenga hora
+        evento = solapados[0]
+        ultimo_dia = evento.fecha_fin + " 23:59"
+        assert (evento.tipo_evento, evento.id_evento) in claves(dao.obtener_por_solapamiento(ultimo_dia, ultimo_dia))
+
+    def test_triggers_mantienen_los_intervalos(self, datos):
+        ruta, _ = datos
+        dao = EventosUnificadosDAO(ruta)
+        calendario = CalendarioEventoDAO(ruta)
+
+        id_evento = calendario.insertar(
+            CalendarioEventoDTO(titulo="Receso", tipo="Receso", fecha_inicio="2030-01-10", fecha_fin="2030-01-20")
+        )
+        assert claves(dao.obtener_por_solapamiento("2030-01-15", "2030-01-15")) == [("Evento Calendario", id_evento)]
+
+        dao.ejecutar_actualizacion(
+            "UPDATE calendario_evento SET fecha_inicio = '2031-01-10', fecha_fin = '2031-01-20' WHERE id_evento = ?",
+            (id_evento,),
+        )
+        assert dao.obtener_por_solapamiento("2030-01-01", "2030-12-31") == []
+        assert len(dao.obtener_por_solapamiento("2031-01-20", "2031-02-01")) == 1
+
+        # Un intervalo invertido se indexa con los extremos ordenados
+        dao.ejecutar_actualizacion(
+            "UPDATE calendario_evento SET fecha_inicio = '2031-03-10', fecha_fin = '2031-03-01' WHERE id_evento = ?",
+            (id_evento,),
+        )
+        assert len(dao.obtener_por_solapamiento("2031-03-05", "2031-03-05")) == 1
+
+        dao.ejecutar_actualizacion("DELETE FROM calendario_evento WHERE id_evento = ?", (id_evento,))
+        assert dao.obtener_por_solapamiento("2031-01-01", "2031-12-31") == []
+
+    def test_reconstruir(self, datos):
+        ruta, _ = datos
+        dao = IntervaloEventoDAO(ruta)
+        dao.ejecutar_actualizacion("DELETE FROM actividad_intervalo")
+
+        assert dao.reconstruir() == {'actividad': 150, 'calendario_evento': 150}
+        eventos = EventosUnificadosDAO(ruta)
+        assert claves(eventos.obtener_por_solapamiento("2025-01-01", "2026-12-31")) == claves(eventos.obtener_todos())
+
+    def test_consulta_usa_los_rtree(self, datos):
+        ruta, _ = datos
+        dao = EventosUnificadosDAO(ruta)
+
+        plan = dao.ejecutar_consulta(
+            "EXPLAIN QUERY PLAN " + _SQL_SOLAPAMIENTO, ("2025-06-10", "2025-06-01") * 2
+        )
+        detalle = [fila['detail'] for fila in plan]
+        assert sum("VIRTUAL TABLE INDEX 2:" in d for d in detalle) == 2
+        assert not any(d.startswith("SCAN a") or d.startswith("SCAN c") for d in detalle)
@@ -0,0 +1,236 @@
+import pytest
+import sqlite3
+import threading
+import time
+from src.modelos.daos.pool_conexiones import (
+    PoolConexiones,
+    VERIFICAR_INTERVALO,
+    VERIFICAR_NUNCA,
+    VERIFICAR_SIEMPRE,
+    conexion_cerrada,
+    es_error_de_conexion,
+)
+
+
+@pytest.fixture
+def ruta_db(tmp_path):
+    """Ruta de una base de datos temporal."""
+    return str(tmp_path / "pool.db")
+
+
+@pytest.fixture
+def pool(ruta_db):
+    """Pool pequeño para poder agotarlo en los tests."""
+    pool = PoolConexiones(
+        fabrica=lambda: sqlite3.connect(ruta_db, check_same_thread=False),
+        tamano_maximo=2,
+        tiempo_espera=0.2,
+        tiempo_inactividad=60.0,
+    )
+    yield pool
+    pool.cerrar_todas()
+
+
+class TestPoolConexiones:
+    """Tests para PoolConexiones."""
+
+    def test_reutiliza_conexion_devuelta(self, pool):
+        """Una conexión devuelta se vuelve a prestar sin crear otra."""
+        con1 = pool.obtener()
+        pool.devolver(con1)
+        con2 = pool.obtener()
+
+        assert con1 is con2
+        estadisticas = pool.obtener_estadisticas()
+        assert estadisticas.creadas == 1
+        assert estadisticas.reutilizadas == 1
+
+    def test_respeta_tamano_maximo(self, pool):
+        """Con el pool lleno, obtener() espera y luego falla."""
+        pool.obtener()
+        pool.obtener()
+
+        with pytest.raises(sqlite3.OperationalError):
+            pool.obtener()
+
+        estadisticas = pool.obtener_estadisticas()
+        assert estadisticas.creadas == 2
+        assert estadisticas.esperas == 1
+        assert estadisticas.agotamientos == 1
+
+    def test_espera_hasta_devolucion(self, pool):
+        """Un préstamo bloqueado se atiende cuando otro thread devuelve su conexión."""
+        pool.tiempo_espera = 2.0
+        con1 = pool.obtener()
+        pool.obtener()
+
+        temporizador = threading.Timer(0.05, pool.devolver, args=(con1,))
+        temporizador.start()
+        con3 = pool.obtener()
+        temporizador.join()
+
+        assert con3 is con1
+        assert pool.obtener_estadisticas().esperas == 1
+
+    def test_descartar_cierra_conexion(self, pool):
+        """devolver(descartar=True) cierra la conexión y libera su lugar."""
+        con = pool.obtener()
+        pool.devolver(con, descartar=True)
+
+        assert conexion_cerrada(con)
+        estadisticas = pool.obtener_estadisticas()
+        assert estadisticas.descartadas == 1
+        assert estadisticas.disponibles == 0
+
+    def test_conexion_cerrada_externamente_no_se_reutiliza(self, pool):
+        """Una conexión cerrada por el usuario se descarta al devolverla."""
+        con = pool.obtener()
+        con.close()
+        pool.devolver(con)
+
+        nueva = pool.obtener()
+        assert nueva is not con
+        assert not conexion_cerrada(nueva)
+
+    def test_desaloja_conexiones_inactivas(self, pool):
+        """Las conexiones libres que superan el tiempo de inactividad se cierran."""
+        pool.tiempo_inactividad = 0.01
+        con = pool.obtener()
+        pool.devolver(con)
+        time.sleep(0.05)
+
+        assert pool.desalojar_inactivas() == 1
+        assert conexion_cerrada(con)
+        assert pool.obtener_estadisticas().desalojadas == 1
+
+    def test_recupera_conexiones_de_threads_finalizados(self, pool):
+        """Las conexiones retenidas por threads muertos vuelven al pool."""
+
+        def retener():
+            pool.obtener(propietario=threading.current_thread())
+
+        for _ in range(2):
+            hilo = threading.Thread(target=retener)
+            hilo.start()
+            hilo.join()
+
+        con = pool.obtener()
+        assert con is not None
+        assert pool.obtener_estadisticas().recuperadas == 2
+
+    def test_devolver_revierte_transaccion_abierta(self, pool):
+        """Una conexión con transacción pendiente se devuelve limpia."""
+        con = pool.obtener()
+        con.execute("CREATE TABLE t (x INTEGER)")
+        con.commit()
+        con.execute("INSERT INTO t VALUES (1)")
+        assert con.in_transaction
+        pool.devolver(con)
+
+        con = pool.obtener()
+        assert not con.in_transaction
+        assert con.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    def test_cerrar_todas(self, pool):
+        """cerrar_todas cierra conexiones libres y prestadas."""
+        prestada = pool.obtener()
+        libre = pool.obtener()
+        pool.devolver(libre)
+
+        pool.cerrar_todas()
+
+        assert conexion_cerrada(prestada)
+        assert conexion_cerrada(libre)
+        estadisticas = pool.obtener_estadisticas()
+        assert estadisticas.en_uso == 0
+        assert estadisticas.disponibles == 0
+
+    def test_tras_error_no_sondea_conexiones_sanas(self, pool):
+        """Con la política por defecto no se ejecuta SELECT 1 en cada préstamo."""
+        for _ in range(5):
+            pool.devolver(pool.obtener())
+
+        assert pool.obtener_estadisticas().sondeos == 0
+
+    def test_tras_error_sondea_conexion_sospechosa(self, pool):
+        """Una conexión devuelta con error se verifica una sola vez."""
+        con = pool.obtener()
+        pool.devolver(con, con_error=True)
+
+        assert pool.obtener() is con
+        pool.devolver(con)
+        pool.devolver(pool.obtener())
+        assert pool.obtener_estadisticas().sondeos == 1
+
+    def test_siempre_sondea_cada_prestamo(self, pool):
+        """La política 'siempre' verifica cada conexión reutilizada."""
+        pool.politica_verificacion = VERIFICAR_SIEMPRE
+        pool.devolver(pool.obtener())
+        for _ in range(3):
+            pool.devolver(pool.obtener())
+
+        assert pool.obtener_estadisticas().sondeos == 3
+
+    def test_nunca_no_sondea(self, pool):
+        """La política 'nunca' no ejecuta SQL aunque la conexión haya fallado."""
+        pool.politica_verificacion = VERIFICAR_NUNCA
+        con = pool.obtener()
+        pool.devolver(con, con_error=True)
+
+        assert pool.obtener() is con
+        assert pool.obtener_estadisticas().sondeos == 0
+
+    def test_intervalo_sondea_tras_el_periodo(self, pool):
+        """La política 'intervalo' solo verifica si pasó el intervalo configurado."""
+        pool.politica_verificacion = VERIFICAR_INTERVALO
+        pool.intervalo_verificacion = 0.05
+        pool.devolver(pool.obtener())
+        pool.devolver(pool.obtener())
+        assert pool.obtener_estadisticas().sondeos == 0
+
+        time.sleep(0.1)
+        pool.devolver(pool.obtener())
+        assert pool.obtener_estadisticas().sondeos == 1
+
+    def test_reconecta_si_la_verificacion_falla(self, ruta_db):
+        """Una conexión que no responde se reemplaza por una nueva."""
+        pool = PoolConexiones(
+            fabrica=lambda: sqlite3.connect(ruta_db, check_same_thread=False),
+            tamano_maximo=2,
+            tiempo_espera=0.2,
+            tiempo_inactividad=60.0,
+            politica_verificacion=VERIFICAR_SIEMPRE,
+        )
+        con = pool.obtener()
+        pool.devolver(con)
+        con.close()
+
+        nueva = pool.obtener()
+        assert nueva is not con
+        estadisticas = pool.obtener_estadisticas()
+        assert estadisticas.reconexiones == 1
+        assert estadisticas.creadas == 2
+        pool.cerrar_todas()
+
+    def test_politica_desconocida(self, ruta_db):
+        """Una política inválida se rechaza al crear el pool."""
+        with pytest.raises(ValueError):
+            PoolConexiones(
+                fabrica=lambda: sqlite3.connect(ruta_db),
+                tamano_maximo=1,
+                tiempo_espera=0.1,
+                tiempo_inactividad=1.0,
+                politica_verificacion="a_veces",
+            )
+
+    def test_es_error_de_conexion(self):
+        """Solo los errores que invalidan la conexión provocan reconexión."""
+        con = sqlite3.connect(":memory:")
+        con.close()
+        with pytest.raises(sqlite3.ProgrammingError) as error_cerrada:
+            con.execute("SELECT 1")
+
+        assert es_error_de_conexion(error_cerrada.value)
+        assert es_error_de_conexion(sqlite3.OperationalError("disk I/O error"))
+        assert not es_error_de_conexion(sqlite3.OperationalError("no such table: x"))
+        assert not es_error_de_conexion(sqlite3.IntegrityError("UNIQUE constraint failed"))
@@ -0,0 +1,174 @@
+import logging
+import pytest
+from src.modelos.daos.base_dao import DAO
+from src.modelos.daos.conexion_sqlite import ConexionSQLite
+from src.modelos.daos.telemetria_consultas import (
+    TelemetriaConsultas,
+    firma_params,
+    normalizar_sentencia,
+    obtener_telemetria,
+)
+
+
+class DAOTelemetria(DAO):
+    """DAO mínimo para verificar lo que registran los métodos de DAO."""
+
+    _SQL_INSERTAR = "INSERT INTO item (nombre) VALUES (?)"
+
+    def crear_tabla(self):
+        self.ejecutar_actualizacion("CREATE TABLE IF NOT EXISTS item (id INTEGER PRIMARY KEY, nombre TEXT)")
+
+    def insertar(self, nombre):
+        return self.ejecutar_insertar(self._SQL_INSERTAR, (nombre,))
+
+    def _params_insertar(self, nombre):
+        return (nombre,)
+
+    def eliminar(self, sql, params=()):
+        return False
+
+    def instanciar(self, sql, params=()):
+        return []
+
+    def existe(self, sql, params=()):
+        return False
+
+
+@pytest.fixture
+def telemetria():
+    telemetria = obtener_telemetria()
+    activa = telemetria.activa
+    telemetria.activa = True
+    telemetria.reiniciar()
+    yield telemetria
+    telemetria.reiniciar()
+    telemetria.activa = activa
+
+
+@pytest.fixture
+def dao(tmp_path):
+    dao = DAOTelemetria(ruta_db=str(tmp_path / "telemetria.db"))
+    dao.crear_tabla()
+    yield dao
+    ConexionSQLite.resetear()
+
+
+class TestNormalizarSentencia:
+    """Tests para normalizar_sentencia."""
+
+    def test_reemplaza_literales(self):
+        assert normalizar_sentencia("SELECT * FROM t WHERE a = 12 AND b = 'x  y' AND c2 = ?") == (
+            "SELECT * FROM t WHERE a = ? AND b = ? AND c2 = ?"
+        )
+
+    def test_listas_de_distinto_largo(self):
+        assert normalizar_sentencia("SELECT * FROM t WHERE id IN (?, ?)") == normalizar_sentencia(
+            "SELECT * FROM t\n WHERE id IN (?,?,?,?)"
+        )
+        assert normalizar_sentencia("INSERT INTO t VALUES (?, ?), (?, ?), (?, ?)") == "INSERT INTO t VALUES (?, ...)"
+
+
+class TestTelemetriaConsultas:
+    """Tests para TelemetriaConsultas."""
+
+    def test_resumen_por_sentencia(self):
+        telemetria = TelemetriaConsultas(umbral_lenta_ms=0)
+        for ms in range(1, 101):
+            telemetria.registrar("ADAO", "SELECT * FROM a WHERE id = ?", (ms,), float(ms), filas=1)
+        telemetria.registrar("BDAO", "SELECT 1", (), 500.0)
+
+        a, b = telemetria.resumen(ordenar="total_ms")
+
+        assert a.clave == "SELECT * FROM a WHERE id = ?"
+        assert (a.llamadas, a.total_ms, a.filas) == (100, 5050.0, 100)
+        assert (a.p50_ms, a.p95_ms, a.max_ms) == (50.0, 95.0, 100.0)
+        assert b.clave == "SELECT ?"
+        assert telemetria.resumen(ordenar="max_ms")[0].clave == "SELECT ?"
+
+    def test_resumen_por_clase(self):
+        telemetria = TelemetriaConsultas(umbral_lenta_ms=0)
+        telemetria.registrar("ADAO", "SELECT 1", (), 1.0)
+        telemetria.registrar("ADAO", "SELECT 2", (), 3.0)
+        telemetria.registrar("BDAO", "SELECT 1", (), 1.0)
+
+        resumen = {e.clave: e for e in telemetria.resumen(agrupar="clase")}
+
+        assert resumen["ADAO"].llamadas == 2 and resumen["ADAO"].total_ms == 4.0
+        assert resumen["BDAO"].llamadas == 1
+        with pytest.raises(ValueError):
+            telemetria.resumen(agrupar="tabla")
+
+    def test_consulta_lenta(self, caplog):
+        telemetria = TelemetriaConsultas(umbral_lenta_ms=10)
+        with caplog.at_level(logging.WARNING, logger="consultas_lentas"):
+            telemetria.registrar("ADAO", "SELECT * FROM a", (), 5.0)
+            telemetria.registrar("ADAO", "SELECT * FROM a", ("ana@uni.edu", 7), 25.0)
+
+        registros = [r for r in caplog.records if r.name == "consultas_lentas"]
+        assert len(registros) == 1
+        assert "25.0 ms" in registros[0].getMessage() and "ADAO" in registros[0].getMessage()
+        # Solo la cantidad y los tipos de los parámetros, no sus valores
+        assert "2 (str, int)" in registros[0].getMessage()
+        assert "ana@uni.edu" not in registros[0].getMessage()
+        assert telemetria.resumen()[0].lentas == 1
+
+    def test_firma_params(self):
+        assert firma_params(("Ana", 3, None)) == "3 (str, int, NoneType)"
+        assert firma_params({"correo": "ana@uni.edu"}) == "1 (str)"
+        assert firma_params(()) == "0 ()"
+        assert firma_params(None) == "0"
+
+    def test_consulta_lenta_en_lote(self, caplog):
+        telemetria = TelemetriaConsultas(umbral_lenta_ms=10)
+        with caplog.at_level(logging.WARNING, logger="consultas_lentas"):
+            telemetria.registrar("ADAO", "INSERT INTO a VALUES (?)", (1,), 25.0, filas=50, tamano_lote=50)
+
+        mensaje = [r for r in caplog.records if r.name == "consultas_lentas"][0].getMessage()
+        assert "50 filas, lote de 50" in mensaje
+        assert telemetria.ejemplos() == [("ADAO", "INSERT INTO a VALUES (?)", (1,))]
+
+    def test_volcar_y_cargar(self, tmp_path):
+        telemetria = TelemetriaConsultas(umbral_lenta_ms=0)
+        telemetria.registrar("ADAO", "SELECT 1", (), 2.0, filas=3)
+        telemetria.registrar("ADAO", "SELECT * FROM a WHERE correo = ?", ("ana@uni.edu",), 1.0)
+        ruta = str(tmp_path / "telemetria.json")
+
+        assert telemetria.volcar(ruta)
+        assert "ana@uni.edu" not in (tmp_path / "telemetria.json").read_text(encoding="utf-8")
+        cargada = TelemetriaConsultas.cargar(ruta)
+
+        assert cargada.resumen() == telemetria.resumen()
+        assert "SELECT ?" in TelemetriaConsultas.formatear(cargada.resumen())
+
+    def test_cargar_archivo_invalido(self, tmp_path):
+        ruta = tmp_path / "invalido.json"
+        ruta.write_text('{"entradas": [{"clase": "ADAO"}]}', encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            TelemetriaConsultas.cargar(str(ruta))
+
+
+class TestTelemetriaEnDAO:
+    """Tests de los registros hechos por los métodos de DAO."""
+
+    def test_registra_consultas_y_escrituras(self, dao, telemetria):
+        dao.insertar("a")
+        dao.insertar_lote(["b", "c"])
+        dao.ejecutar_consulta("SELECT * FROM item")
+        list(dao.iterar_consulta("SELECT * FROM item WHERE id > ?", (0,)))
+        dao.ejecutar_actualizacion("UPDATE item SET nombre = ? WHERE id = ?", ("z", 1))
+
+        resumen = {e.clave: e for e in telemetria.resumen()}
+
+        assert resumen["INSERT INTO item (nombre) VALUES (?)"].llamadas == 2
+        assert resumen["INSERT INTO item (nombre) VALUES (?)"].filas == 3
+        assert resumen["SELECT * FROM item"].filas == 3
+        assert resumen["SELECT * FROM item WHERE id > ?"].filas == 3
+        assert resumen["UPDATE item SET nombre = ? WHERE id = ?"].filas == 1
+        assert [e.clave for e in telemetria.resumen(agrupar="clase")] == ["DAOTelemetria"]
+
+    def test_desactivada_no_registra(self, dao, telemetria):
+        telemetria.activa = False
+        dao.ejecutar_consulta("SELECT * FROM item")
+
+        assert telemetria.resumen() == []
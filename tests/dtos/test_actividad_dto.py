@@ -113,3 +113,11 @@ class TestActividadDTO:
         actividad_nueva.set_data(datos)
 
         assert actividad_nueva.get_data() == actividad_original.get_data()
+
+    def test_usa_slots(self):
+        """Test que el DTO no reserva __dict__ por instancia"""
+        actividad = ActividadDTO(id_actividad=1)
+
+        assert not hasattr(actividad, '__dict__')
+        with pytest.raises(AttributeError):
+            actividad.campo_inexistente = 1
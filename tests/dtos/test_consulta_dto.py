@@ -0,0 +1,46 @@
+import dataclasses
+from src.modelos.dtos.consulta_dto import ActividadDetalladaDTO, EventosUnificadosDTO
+
+
+class TestEventosUnificadosDTO:
+    """Tests para EventosUnificadosDTO"""
+
+    def test_to_dict_equivale_a_asdict(self):
+        """Test que to_dict retorna los mismos datos que dataclasses.asdict"""
+        evento = EventosUnificadosDTO(
+            tipo_evento='Actividad',
+            id_evento=1,
+            titulo='Tarea 1',
+            fecha_inicio='2025-01-15',
+            fecha_fin='2025-01-22',
+            tipo_actividad='Tarea',
+            carrera='Ingeniería',
+            id_carrera=1,
+        )
+
+        assert evento.to_dict() == dataclasses.asdict(evento)
+        assert list(evento.to_dict()) == [campo.name for campo in dataclasses.fields(evento)]
+
+    def test_from_row(self):
+        """Test crear el DTO desde una fila de vw_eventos_unificados"""
+        fila = ('Evento Calendario', 5, 'Feriado', None, '2025-05-01', '2025-05-01',
+                'Feriado', 'Afecta actividades', None, None, None, None)
+
+        evento = EventosUnificadosDTO.from_row(fila)
+
+        assert evento.es_evento_calendario()
+        assert evento.obtener_carrera_display() == 'Sin carrera'
+        assert not hasattr(evento, '__dict__')
+
+
+class TestActividadDetalladaDTO:
+    """Tests para ActividadDetalladaDTO"""
+
+    def test_to_dict(self):
+        """Test que to_dict incluye todos los campos de la vista"""
+        detalle = ActividadDetalladaDTO(id_estudiante=1, titulo='Tarea 1')
+
+        datos = detalle.to_dict()
+
+        assert datos == dataclasses.asdict(detalle)
+        assert datos['titulo'] == 'Tarea 1'
@@ -0,0 +1,49 @@
+import importlib.util
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+import pytest
+
+RUTA_SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "auditar_consultas.py"
+
+
+@pytest.fixture(scope="module")
+def auditar_consultas():
+    spec = importlib.util.spec_from_file_location("auditar_consultas", RUTA_SCRIPT)
+    modulo = importlib.util.module_from_spec(spec)
+    with pytest.MonkeyPatch.context() as mp:
+        # pytest puede haber registrado tests/scripts como `scripts`; el script importa src/scripts
+        if Path(getattr(sys.modules.get("scripts"), "__file__", "")).parent == Path(__file__).parent:
+            mp.delitem(sys.modules, "scripts")
+        spec.loader.exec_module(modulo)
+    return modulo
+
+
+@pytest.fixture
+def ruta_db(tmp_path, auditar_consultas):
+    ruta = str(tmp_path / "carga.db")
+    auditar_consultas.poblar_base_datos(ruta, 300, random.Random(1))
+    telemetria = auditar_consultas.obtener_telemetria()
+    activa = telemetria.activa
+    yield ruta
+    telemetria.reiniciar()
+    telemetria.activa = activa
+    auditar_consultas.ConexionSQLite.resetear()
+
+
+class TestEjecutarCarga:
+    """Tests para ejecutar_carga."""
+
+    def test_cada_llamada_llega_al_auditor(self, auditar_consultas, ruta_db):
+        sentencias = auditar_consultas.ejecutar_carga(ruta_db)
+
+        por_origen = Counter(origen for origen, _, _ in sentencias)
+        # Mes, rango, solapamiento, tipo de actividad e id: una sentencia cada uno
+        assert por_origen["EventosUnificadosDAO"] == 5
+        assert por_origen["ConsultaDAO"] == 3
+        for clase in ("EjeTematicoDAO", "EstudianteAsignaturaDAO", "EstudianteCarreraDAO", "ActividadDAO"):
+            assert por_origen[clase] == 1
+        assert por_origen["BusquedaDAO"] >= 1
+        controladores = {" ".join(sql.split()) for _, sql, _ in auditar_consultas.SQL_CONTROLADORES}
+        assert controladores <= {" ".join(sql.split()) for _, sql, _ in sentencias}
@@ -0,0 +1,201 @@
+import sqlite3
+import pytest
+from src.modelos.daos.telemetria_consultas import TelemetriaConsultas
+from src.scripts.auditor_consultas import (
+    PlanConsulta,
+    auditar,
+    completar_params,
+    es_auditable,
+    evaluar_sugerencia,
+    explicar,
+    indices_sin_uso,
+    sugerir_indices,
+)
+
+_SQL_POR_ESTUDIANTE = "SELECT titulo FROM tarea WHERE id_estudiante = ? AND fecha >= ? ORDER BY fecha"
+
+
+@pytest.fixture
+def ruta_db(tmp_path):
+    ruta = str(tmp_path / "auditoria.db")
+    con = sqlite3.connect(ruta)
+    con.executescript(
+        """
+        CREATE TABLE tarea (
+            id_tarea INTEGER PRIMARY KEY,
+            titulo TEXT,
+            fecha TEXT,
+            estado TEXT,
+            id_estudiante INTEGER
+        );
+        CREATE INDEX idx_tarea_estado ON tarea (estado);
+        CREATE VIEW vw_tareas AS SELECT * FROM tarea;
+        """
+    )
+    con.executemany(
+        "INSERT INTO tarea (titulo, fecha, estado, id_estudiante) VALUES (?, ?, ?, ?)",
+        (
+            (f"Tarea {i}", f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}", ("pendiente", "entregada")[i % 2], i % 50)
+            for i in range(2000)
+        ),
+    )
+    con.execute("ANALYZE")
+    con.commit()
+    con.close()
+    return ruta
+
+
+@pytest.fixture
+def con(ruta_db):
+    con = sqlite3.connect(ruta_db)
+    yield con
+    con.close()
+
+
+def test_es_auditable():
+    assert es_auditable("SELECT * FROM tarea")
+    assert es_auditable("  with t AS (SELECT 1) SELECT * FROM t")
+    assert es_auditable("UPDATE tarea SET estado = ? WHERE id_tarea = ?")
+    assert es_auditable("INSERT INTO copia SELECT * FROM tarea")
+    assert not es_auditable("INSERT INTO tarea (titulo) VALUES (?)")
+    assert not es_auditable("CREATE INDEX ix ON tarea (fecha)")
+    assert not es_auditable("PRAGMA foreign_keys = ON")
+
+
+def test_completar_params():
+    assert completar_params("SELECT * FROM t WHERE a = ? AND b = ?", (1, 2)) == (1, 2)
+    # Los '?' dentro de literales no son marcadores
+    assert completar_params("SELECT * FROM t WHERE a = '?' AND b = ?", None) == (None,)
+    assert completar_params("SELECT * FROM t WHERE a = ?", (1, 2)) == (None,)
+
+
+def test_explicar_marca_recorridos_y_ordenamientos(con):
+    plan = explicar(con, "SELECT * FROM tarea ORDER BY fecha")
+    assert plan.escaneos == ["tarea"]
+    assert plan.ordenamientos_temporales == ["ORDER BY"]
+    assert plan.tiene_problemas
+    assert len(plan.filas_marcadas) == 2
+
+    plan = explicar(con, "SELECT * FROM tarea WHERE estado = ?", ("pendiente",))
+    assert not plan.tiene_problemas
+    assert plan.indices_usados == {"idx_tarea_estado"}
+
+
+def test_explicar_no_marca_tablas_internas(con):
+    plan = explicar(con, "SELECT name FROM sqlite_master WHERE type = 'view'")
+    assert plan.escaneos == []
+
+
+def test_sugerir_igualdad_y_rango(con):
+    plan = explicar(con, _SQL_POR_ESTUDIANTE, (1, "2024-06-01"))
+    sugerencias = sugerir_indices(con, _SQL_POR_ESTUDIANTE, plan)
+    assert len(sugerencias) == 1
+    sugerencia = sugerencias[0]
+    assert sugerencia.tabla == "tarea"
+    # Igualdad, rango y luego la columna leída para que sea cubriente
+    assert sugerencia.columnas == ["id_estudiante", "fecha", "titulo"]
+    assert sugerencia.cubriente
+    assert sugerencia.condicion is None
+
+
+def test_sugerir_indice_parcial_por_literal(con):
+    sql = "SELECT * FROM tarea WHERE estado = 'pendiente' AND id_estudiante = ? ORDER BY fecha"
+    con.execute("DROP INDEX idx_tarea_estado")
+    plan = explicar(con, sql, (1,))
+    sugerencia = sugerir_indices(con, sql, plan)[0]
+    assert sugerencia.columnas == ["id_estudiante", "fecha"]
+    assert sugerencia.condicion == "estado = 'pendiente'"
+    assert not sugerencia.cubriente
+    assert sugerencia.nombre.endswith("_p")
+    assert sugerencia.sql.endswith("WHERE estado = 'pendiente'")
+
+
+def test_sugerir_a_traves_de_vistas(con):
+    sql = "SELECT * FROM vw_tareas WHERE id_estudiante = ?"
+    plan = explicar(con, sql, (1,))
+    assert [s.columnas for s in sugerir_indices(con, sql, plan)] == [["id_estudiante"]]
+
+
+def test_sugerir_omite_indices_existentes(con):
+    con.execute("CREATE INDEX idx_tarea_estudiante_fecha_titulo ON tarea (id_estudiante, fecha, titulo)")
+    plan = PlanConsulta(detalles=["SCAN tarea"], escaneos=["tarea"])
+    assert sugerir_indices(con, _SQL_POR_ESTUDIANTE, plan) == []
+
+
+def test_evaluar_sugerencia_crea_y_borra_el_indice(con):
+    plan = explicar(con, _SQL_POR_ESTUDIANTE, (1, "2024-06-01"))
+    sugerencia = sugerir_indices(con, _SQL_POR_ESTUDIANTE, plan)[0]
+
+    evaluacion = evaluar_sugerencia(con, _SQL_POR_ESTUDIANTE, (1, "2024-06-01"), sugerencia, repeticiones=1)
+
+    assert evaluacion.usado
+    assert not evaluacion.plan_despues.tiene_problemas
+    assert evaluacion.antes_ms is not None and evaluacion.despues_ms is not None
+    assert evaluacion.mejora is not None
+    indices = {fila[1] for fila in con.execute("PRAGMA index_list(tarea)")}
+    assert sugerencia.nombre not in indices
+
+
+def test_evaluar_sugerencia_de_escritura_no_mide(con):
+    sql = "UPDATE tarea SET estado = ? WHERE id_estudiante = ?"
+    plan = explicar(con, sql, ("vencida", 1))
+    sugerencia = sugerir_indices(con, sql, plan)[0]
+    evaluacion = evaluar_sugerencia(con, sql, ("vencida", 1), sugerencia, repeticiones=1)
+    assert evaluacion.usado
+    assert evaluacion.antes_ms is None and evaluacion.mejora is None
+    # El UPDATE solo se explicó
+    assert con.execute("SELECT COUNT(*) FROM tarea WHERE estado = 'vencida'").fetchone()[0] == 0
+
+
+def test_auditar(ruta_db):
+    resultados = auditar(
+        ruta_db,
+        [
+            ("TareaDAO", _SQL_POR_ESTUDIANTE, (1, "2024-06-01")),
+            ("TareaDAO", "  " + _SQL_POR_ESTUDIANTE.replace(" ", "\n", 1), (2, "2024-01-01")),
+            ("TareaDAO", "SELECT * FROM tarea WHERE estado = ?", None),
+            ("TareaDAO", "CREATE INDEX ix ON tarea (fecha)", ()),
+            ("TareaDAO", "SELECT * FROM no_existe", ()),
+        ],
+        repeticiones=1,
+    )
+
+    # La sentencia repetida y el DDL no se auditan
+    assert len(resultados) == 3
+    por_estudiante, por_estado, invalida = resultados
+    assert por_estudiante.plan.tiene_problemas
+    assert [e.usado for e in por_estudiante.sugerencias] == [True]
+    assert por_estado.params == (None,)
+    assert por_estado.sugerencias == []
+    assert invalida.plan is None and "no_existe" in invalida.error
+
+    assert indices_sin_uso(resultados, ["idx_tarea_estado", "idx_otro"]) == ["idx_otro"]
+    # Los índices sugeridos no quedan en la base
+    con = sqlite3.connect(ruta_db)
+    try:
+        assert con.execute("SELECT COUNT(*) FROM sqlite_master WHERE name LIKE 'idx_sug_%'").fetchone()[0] == 0
+    finally:
+        con.close()
+
+
+def test_auditar_sin_evaluar(ruta_db):
+    resultado = auditar(ruta_db, [("TareaDAO", _SQL_POR_ESTUDIANTE, (1, "2024-06-01"))], evaluar=False)[0]
+    assert len(resultado.sugerencias) == 1
+    assert resultado.sugerencias[0].antes_ms is None
+
+
+def test_ejemplos_de_telemetria(tmp_path):
+    telemetria = TelemetriaConsultas()
+    telemetria.registrar("TareaDAO", "SELECT * FROM tarea WHERE id_tarea = ?", (1,), 0.5, 1)
+    telemetria.registrar("TareaDAO", "SELECT * FROM tarea WHERE id_tarea = ?", (2,), 0.7, 1)
+    telemetria.registrar("TareaDAO", "SELECT * FROM tarea WHERE estado = 'x'", None, 0.1, 0)
+
+    ejemplos = telemetria.ejemplos()
+    assert ("TareaDAO", "SELECT * FROM tarea WHERE id_tarea = ?", (1,)) in ejemplos
+    assert len(ejemplos) == 2
+
+    ruta = str(tmp_path / "telemetria.json")
+    assert telemetria.volcar(ruta)
+    cargada = TelemetriaConsultas.cargar(ruta)
+    # El archivo no guarda los valores de los parámetros: el auditor usa NULL
+    assert sorted(cargada.ejemplos(), key=str) == sorted([(clase, sql, ()) for clase, sql, _ in ejemplos], key=str)
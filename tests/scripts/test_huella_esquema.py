@@ -0,0 +1,82 @@
+import sqlite3
+import pytest
+from src.modelos.daos import esquema
+from src.scripts import crear_views
+from src.scripts.crear_indices import crear_todos_los_indices, huella_indices
+from src.scripts.crear_views import crear_todas_las_views, huella_views
+from src.scripts.huella_esquema import TABLA_HUELLAS, calcular_huella
+
+VISTA_MODIFICADA = "CREATE VIEW vw_eventos_unificados AS SELECT 1 AS marca"
+
+
+@pytest.fixture
+def ruta_db(tmp_path):
+    """Base de datos con tablas, índices y VIEWS ya creados."""
+    ruta = str(tmp_path / "huella.db")
+    assert crear_todos_los_indices(ruta)
+    assert crear_todas_las_views(ruta)
+    yield ruta
+    esquema.ConexionSQLite.resetear()
+
+
+def ejecutar(ruta, *sentencias):
+    con = sqlite3.connect(ruta)
+    try:
+        resultado = [con.execute(sql).fetchall() for sql in sentencias]
+        con.commit()
+        return resultado[-1]
+    finally:
+        con.close()
+
+
+def sql_vista(ruta):
+    return ejecutar(ruta, "SELECT sql FROM sqlite_master WHERE name = 'vw_eventos_unificados'")[0][0]
+
+
+class TestHuellaEsquema:
+    """Tests para omitir el DDL de índices y VIEWS cuando no cambió."""
+
+    def test_guarda_las_huellas(self, ruta_db):
+        huellas = dict(ejecutar(ruta_db, f"SELECT componente, huella FROM {TABLA_HUELLAS}"))
+
+        assert huellas == {'indices': huella_indices(), 'views': huella_views()}
+
+    def test_calcular_huella_ignora_espacios(self):
+        assert calcular_huella(["CREATE  VIEW v\n  AS SELECT 1"]) == calcular_huella(["CREATE VIEW v AS SELECT 1"])
+        assert calcular_huella(["CREATE VIEW v AS SELECT 1"]) != calcular_huella(["CREATE VIEW v AS SELECT 2"])
+
+    def test_sin_cambios_no_ejecuta_ddl(self, ruta_db):
+        ejecutar(ruta_db, "DROP VIEW vw_eventos_unificados", VISTA_MODIFICADA, "DELETE FROM sqlite_stat1")
+
+        assert crear_todos_los_indices(ruta_db)
+        assert crear_todas_las_views(ruta_db)
+
+        # Ni las VIEWS se recrearon ni se volvió a ejecutar ANALYZE
+        assert sql_vista(ruta_db) == VISTA_MODIFICADA
+        assert ejecutar(ruta_db, "SELECT COUNT(*) FROM sqlite_stat1")[0][0] == 0
+
+    def test_forzar(self, ruta_db):
+        ejecutar(ruta_db, "DROP VIEW vw_eventos_unificados", VISTA_MODIFICADA)
+
+        assert crear_todas_las_views(ruta_db, forzar=True)
+        assert sql_vista(ruta_db) != VISTA_MODIFICADA
+
+    def test_objeto_borrado_se_vuelve_a_crear(self, ruta_db):
+        ejecutar(ruta_db, "DROP INDEX idx_actividad_fechas", "DROP VIEW vw_estudiante_asignatura_carrera")
+
+        assert crear_todos_los_indices(ruta_db)
+        assert crear_todas_las_views(ruta_db)
+
+        nombres = {fila[0] for fila in ejecutar(ruta_db, "SELECT name FROM sqlite_master")}
+        assert {'idx_actividad_fechas', 'vw_estudiante_asignatura_carrera'} <= nombres
+
+    def test_cambio_de_ddl_se_aplica(self, ruta_db, monkeypatch):
+        ejecutar(ruta_db, "DROP VIEW vw_eventos_unificados", VISTA_MODIFICADA)
+        monkeypatch.setattr(
+            crear_views, "VIEWS", crear_views.VIEWS + [("vw_nueva", "CREATE VIEW IF NOT EXISTS vw_nueva AS SELECT 1")]
+        )
+
+        assert crear_todas_las_views(ruta_db)
+
+        assert sql_vista(ruta_db) != VISTA_MODIFICADA
+        assert ejecutar(ruta_db, "SELECT * FROM vw_nueva") == [(1,)]
@@ -8,6 +8,8 @@ import logging
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
+import logging.handlers
+import uuid
 from src.scripts.logging_config import (
     obtener_logger,
     obtener_logger_modulo,
@@ -15,6 +17,9 @@ from src.scripts.logging_config import (
     registrar_error_critico,
     LoggerConfig,
     configurar_logging_global,
+    cargar_niveles,
+    nivel_para,
+    detener_logging,
 )
 
 
@@ -49,10 +54,13 @@ class TestObtenerLogger:
         assert logger1 is logger2
 
     def test_obtener_logger_agrega_handlers(self):
-        """Verifica que se agregan los handlers correctamente."""
+        """Verifica que cada logger tiene solo el QueueHandler compartido."""
         logger = obtener_logger("logger_con_handlers")
-        # Debe tener al menos 3 handlers: archivo, error y consola
-        assert len(logger.handlers) >= 2  # Archivo y consola al mínimo
+        otro = obtener_logger("otro_logger_con_handlers")
+
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+        assert logger.handlers[0] is otro.handlers[0]
 
 
 class TestObtenerLoggerModulo:
@@ -237,3 +245,74 @@ class TestNivelesLogging:
         with caplog.at_level(logging.CRITICAL):
             logger.critical("Mensaje crítico")
         assert "Mensaje crítico" in caplog.text
+
+
+class TestPipelineAsincrono:
+    """Tests para el QueueHandler/QueueListener compartido."""
+
+    def test_listener_escribe_en_archivo(self):
+        """Verifica que los registros encolados llegan al archivo de log."""
+        mensaje = f"Mensaje encolado {uuid.uuid4().hex}"
+        obtener_logger("test_pipeline").info("%s", mensaje)
+
+        # Detener el listener vacía la cola
+        detener_logging()
+
+        assert mensaje in Path(LoggerConfig.LOG_FILE).read_text(encoding="utf-8")
+
+    def test_listener_se_reinicia(self):
+        """Verifica que obtener un logger tras detener_logging reanuda la escritura."""
+        detener_logging()
+        mensaje = f"Mensaje tras reinicio {uuid.uuid4().hex}"
+        obtener_logger("test_pipeline_reinicio").warning(mensaje)
+        detener_logging()
+
+        assert mensaje in Path(LoggerConfig.LOG_FILE).read_text(encoding="utf-8")
+
+
+class TestNivelesPorModulo:
+    """Tests para los niveles leídos de settings.conf."""
+
+    @pytest.fixture
+    def settings(self, tmp_path):
+        ruta = tmp_path / "settings.conf"
+        ruta.write_text(
+            "[Logging]\n"
+            "nivel = WARNING\n"
+            "formato = %(asctime)s - %(message)s\n"
+            "\n"
+            "[Logging.modulos]\n"
+            "modelos.daos = ERROR\n"
+            "modelos.daos.base_dao = DEBUG\n"
+            "controladores.Mayusculas = INFO\n"
+            "otro = NO_ES_NIVEL\n",
+            encoding="utf-8",
+        )
+        cargar_niveles(str(ruta))
+        yield ruta
+        # Volver a la configuración real
+        cargar_niveles()
+
+    def test_nivel_por_defecto(self, settings):
+        assert nivel_para("ui.ttk.frames.frame_principal") == logging.WARNING
+
+    def test_gana_el_prefijo_mas_largo(self, settings):
+        assert nivel_para("modelos.daos.actividad_dao") == logging.ERROR
+        assert nivel_para("modelos.daos.base_dao") == logging.DEBUG
+        # Los prefijos se comparan por paquete completo
+        assert nivel_para("modelos.daos_extra") == logging.WARNING
+
+    def test_respeta_mayusculas_e_ignora_invalidos(self, settings):
+        assert nivel_para("controladores.Mayusculas") == logging.INFO
+        assert nivel_para("otro") == logging.WARNING
+
+    def test_obtener_logger_usa_nivel_configurado(self, settings):
+        logger = obtener_logger(f"modelos.daos.nuevo_{uuid.uuid4().hex}")
+        assert logger.level == logging.ERROR
+
+    def test_archivo_inexistente_usa_info(self, tmp_path):
+        cargar_niveles(str(tmp_path / "no_existe.conf"))
+        try:
+            assert nivel_para("cualquier.modulo") == logging.INFO
+        finally:
+            cargar_niveles()
@@ -0,0 +1,52 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+
+RUTA_SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "src")
+
+# Presupuesto holgado en milisegundos: detecta que vuelva a importarse la
+# interfaz entera al arrancar, no variaciones normales entre máquinas
+PRESUPUESTO_MS = 1500
+
+CODIGO_MEDICION = """
+import json, sys, time
+inicio = time.perf_counter()
+for modulo in sys.argv[1:]:
+    __import__(modulo)
+print(json.dumps({
+    "ms": (time.perf_counter() - inicio) * 1000,
+    "modulos": sorted(sys.modules),
+}))
+"""
+
+
+def medir_importacion(*modulos):
+    """Importa `modulos` en un intérprete nuevo; retorna (ms, módulos cargados)."""
+    entorno = dict(os.environ, PYTHONPATH=RUTA_SRC)
+    salida = subprocess.run(
+        [sys.executable, "-c", CODIGO_MEDICION, *modulos],
+        capture_output=True, text=True, cwd=RUTA_SRC, env=entorno, check=True,
+    )
+    resultado = json.loads(salida.stdout.strip().splitlines()[-1])
+    return resultado["ms"], set(resultado["modulos"])
+
+
+class TestTiempoImportacion:
+    """Tests del coste de importación en el arranque."""
+
+    def test_scripts_de_arranque(self):
+        ms, modulos = medir_importacion("scripts.crear_indices", "scripts.crear_views")
+
+        assert ms < PRESUPUESTO_MS
+        assert not any(m.startswith("ui.") for m in modulos)
+
+    def test_frame_principal_no_carga_pestanas_ni_dialogos(self):
+        pytest.importorskip("ttkbootstrap")
+        ms, modulos = medir_importacion("ui.ttk.frames.frame_principal")
+
+        assert ms < PRESUPUESTO_MS
+        assert "ui.ttk.frames.frame_calendario" not in modulos
+        assert "controladores.controlador_calendario" not in modulos
+        assert not any(m.startswith("ui.ttk.dialogos.dialogo_") for m in modulos)
@@ -0,0 +1,149 @@
+import importlib
+import pytest
+from src.modelos.services.carrera_service import CarreraService, invalidar_catalogo
+from src.modelos.services.asignatura_service import AsignaturaService
+from src.modelos.services.eje_tematico_service import EjeTematicoService
+from src.modelos.services.tipo_actividad_service import TipoActividadService
+
+# Los servicios invalidan el catálogo importado como `modelos...`; se usa esa misma copia
+catalogo_service = importlib.import_module(invalidar_catalogo.__module__)
+CatalogoService = catalogo_service.CatalogoService
+ConexionSQLite = catalogo_service.ConexionSQLite
+transaccion = importlib.import_module(ConexionSQLite.__module__).transaccion
+
+
+@pytest.fixture
+def ruta_db(tmp_path):
+    """Base de datos temporal con dos carreras, tres asignaturas, ejes y un tipo."""
+    ruta = str(tmp_path / "catalogo.db")
+
+    ids_carreras = []
+    for nombre in ("Sistemas", "Civil"):
+        carrera = CarreraService(ruta_db=ruta)
+        carrera.nombre = nombre
+        carrera.plan = "2024"
+        carrera.modalidad = "Presencial"
+        ids_carreras.append(carrera.insertar())
+
+    for codigo, nombre, id_carrera in (
+        ("SIS-2", "Programación", ids_carreras[0]),
+        ("SIS-1", "Algoritmos", ids_carreras[0]),
+        ("CIV-1", "Estática", ids_carreras[1]),
+    ):
+        asignatura = AsignaturaService(ruta_db=ruta)
+        asignatura.codigo = codigo
+        asignatura.nombre = nombre
+        asignatura.creditos = 4
+        asignatura.tipo = "obligatoria"
+        asignatura.id_carrera = id_carrera
+        id_asignatura = asignatura.insertar()
+
+        for orden in (2, 1):
+            eje = EjeTematicoService(ruta_db=ruta)
+            eje.nombre = f"{codigo} eje {orden}"
+            eje.orden = orden
+            eje.id_asignatura = id_asignatura
+            eje.insertar()
+
+    tipo = TipoActividadService(ruta_db=ruta)
+    tipo.nombre = "Tarea"
+    tipo.siglas = "TAR"
+    tipo.prioridad = 1
+    tipo.insertar()
+
+    yield ruta
+    ConexionSQLite.resetear()
+
+
+class TestCatalogoService:
+    """Tests para el catálogo de datos de referencia."""
+
+    def test_indices_por_id_codigo_y_padre(self, ruta_db):
+        catalogo = CatalogoService(ruta_db=ruta_db)
+
+        assert [c.nombre for c in catalogo.carreras()] == ["Civil", "Sistemas"]
+        sistemas = catalogo.carreras()[1]
+        assert catalogo.carrera(sistemas.id_carrera) is sistemas
+
+        asignaturas = catalogo.asignaturas(sistemas.id_carrera)
+        assert [a.nombre for a in asignaturas] == ["Algoritmos", "Programación"]
+        assert catalogo.asignatura_por_codigo("SIS-1") is asignaturas[0]
+        assert len(catalogo.asignaturas()) == 3
+
+        ejes = catalogo.ejes_tematicos(asignaturas[0].id_asignatura)
+        assert [e.orden for e in ejes] == [1, 2]
+        assert len(catalogo.ejes_por_carrera(sistemas.id_carrera)) == 4
+        assert catalogo.tipo_actividad_por_siglas("TAR").nombre == "Tarea"
+
+    def test_lecturas_repetidas_no_recargan(self, ruta_db):
+        catalogo = CatalogoService(ruta_db=ruta_db)
+        catalogo.carreras()
+        catalogo.asignaturas()
+        cargas = catalogo.cargas
+
+        for _ in range(10):
+            CatalogoService(ruta_db=ruta_db).carreras()
+            catalogo.asignaturas(1)
+            catalogo.asignatura(1)
+
+        assert catalogo.cargas == cargas
+
+    def test_servicio_invalida_al_escribir(self, ruta_db):
+        catalogo = CatalogoService(ruta_db=ruta_db)
+        assert len(catalogo.carreras()) == 2
+
+        carrera = CarreraService(ruta_db=ruta_db)
+        carrera.nombre = "Química"
+        carrera.plan = "2024"
+        carrera.modalidad = "Virtual"
+        id_carrera = carrera.insertar()
+        assert len(catalogo.carreras()) == 3
+
+        carrera.nombre = "Química Industrial"
+        assert carrera.actualizar()
+        assert catalogo.carrera(id_carrera).nombre == "Química Industrial"
+
+        assert carrera.eliminar()
+        assert catalogo.carrera(id_carrera) is None
+
+    def test_invalidar_padre_invalida_dependientes(self, ruta_db):
+        catalogo = CatalogoService(ruta_db=ruta_db)
+        catalogo.asignaturas()
+        catalogo.ejes_tematicos()
+        catalogo.tipos_actividad()
+        cargas = catalogo.cargas
+
+        invalidar_catalogo(catalogo_service.CARRERA, ruta_db)
+        catalogo.tipos_actividad()
+        assert catalogo.cargas == cargas
+
+        catalogo.asignaturas()
+        catalogo.ejes_tematicos()
+        assert catalogo.cargas == cargas + 2
+
+    def test_invalida_tras_confirmar_la_transaccion(self, ruta_db):
+        catalogo = CatalogoService(ruta_db=ruta_db)
+        assert len(catalogo.carreras()) == 2
+
+        with transaccion(ruta_db):
+            carrera = CarreraService(ruta_db=ruta_db)
+            carrera.nombre = "Química"
+            carrera.plan = "2024"
+            carrera.modalidad = "Virtual"
+            carrera.insertar()
+            # Hasta el commit los demás threads no ven la fila: el catálogo sigue vigente
+            assert len(catalogo.carreras()) == 2
+        assert len(catalogo.carreras()) == 3
+
+    def test_rollback_no_invalida(self, ruta_db):
+        catalogo = CatalogoService(ruta_db=ruta_db)
+        catalogo.carreras()
+        cargas = catalogo.cargas
+
+        with pytest.raises(ValueError):
+            with transaccion(ruta_db):
+                invalidar_catalogo(catalogo_service.CARRERA, ruta_db)
+                raise ValueError
+
+        catalogo.carreras()
+        assert catalogo.cargas == cargas
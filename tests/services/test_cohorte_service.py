@@ -0,0 +1,209 @@
+import importlib
+import random
+import statistics
+import pytest
+from src.modelos.services.carrera_service import CarreraService
+from src.modelos.services.asignatura_service import AsignaturaService
+from src.modelos.services.estudiante_service import EstudianteService
+from src.modelos.services.estudiante_asignatura_service import (
+    EstudianteAsignaturaService,
+    registrar_nota_final,
+)
+
+# Los servicios actualizan las cohortes importadas como `modelos...`; se usa esa misma copia
+cohorte_service = importlib.import_module(registrar_nota_final.__module__)
+CohorteService = cohorte_service.CohorteService
+DistribucionNotas = cohorte_service.DistribucionNotas
+invalidar_cohortes = cohorte_service.invalidar_cohortes
+transaccion = importlib.import_module(cohorte_service.ConexionSQLite.__module__).transaccion
+
+
+@pytest.fixture
+def ruta_db(tmp_path):
+    """Base de datos temporal con una carrera, dos asignaturas y cinco estudiantes con nota."""
+    ruta = str(tmp_path / "cohortes.db")
+
+    carrera = CarreraService(ruta_db=ruta)
+    carrera.nombre = "Sistemas"
+    carrera.plan = "2024"
+    carrera.modalidad = "Presencial"
+    id_carrera = carrera.insertar()
+
+    ids_asignaturas = []
+    for codigo in ("SIS-1", "SIS-2"):
+        asignatura = AsignaturaService(ruta_db=ruta)
+        asignatura.codigo = codigo
+        asignatura.nombre = codigo
+        asignatura.creditos = 4
+        asignatura.tipo = "obligatoria"
+        asignatura.id_carrera = id_carrera
+        ids_asignaturas.append(asignatura.insertar())
+
+    notas = {
+        ids_asignaturas[0]: [6.0, 8.5, 7.0, 9.5, 7.0],
+        ids_asignaturas[1]: [5.0, 9.0, None, 8.0, 6.5],
+    }
+    for i in range(5):
+        estudiante = EstudianteService(ruta_db=ruta)
+        estudiante.nombre = f"Estudiante {i}"
+        estudiante.correo = f"e{i}@uni.edu"
+        id_estudiante = estudiante.insertar()
+        for id_asignatura, lista in notas.items():
+            inscripcion = EstudianteAsignaturaService(ruta_db=ruta)
+            inscripcion.id_estudiante = id_estudiante
+            inscripcion.id_asignatura = id_asignatura
+            inscripcion.estado = "aprobada" if lista[i] is not None else "cursando"
+            inscripcion.nota_final = lista[i]
+            inscripcion.insertar()
+
+    yield ruta, id_carrera, ids_asignaturas
+    cohorte_service.ConexionSQLite.resetear()
+
+
+class TestDistribucionNotas:
+    """Tests para la lista ordenada de notas."""
+
+    def test_coincide_con_statistics(self):
+        generador = random.Random(7)
+        notas = [round(generador.uniform(1, 10), 1) for _ in range(200)]
+        distribucion = DistribucionNotas()
+        for nota in notas:
+            distribucion.agregar(nota)
+        for nota in notas[:50]:
+            assert distribucion.quitar(nota)
+        restantes = notas[50:]
+
+        assert distribucion.media() == pytest.approx(statistics.mean(restantes))
+        assert distribucion.percentil(50) == pytest.approx(statistics.median(restantes))
+        cuartiles = statistics.quantiles(restantes, n=4, method='inclusive')
+        assert distribucion.percentil(25) == pytest.approx(cuartiles[0])
+        assert distribucion.percentil(75) == pytest.approx(cuartiles[2])
+        assert not distribucion.quitar(11.0)
+
+    def test_puesto_y_percentil_de(self):
+        distribucion = DistribucionNotas([6.0, 7.0, 7.0, 9.0])
+
+        assert distribucion.puesto(9.0) == 1
+        assert distribucion.puesto(7.0) == 2
+        assert distribucion.puesto(6.0) == 4
+        assert distribucion.percentil_de(7.0) == 75.0
+        assert distribucion.percentil_de(5.0) == 0.0
+
+
+class TestCohorteService:
+    """Tests para las estadísticas de notas finales por cohorte."""
+
+    def test_resumen_por_asignatura_y_carrera(self, ruta_db):
+        ruta, id_carrera, (sis1, sis2) = ruta_db
+        cohortes = CohorteService(ruta_db=ruta)
+
+        resumen = cohortes.resumen(id_asignatura=sis1)
+        assert resumen.total == 5
+        assert resumen.media == pytest.approx(7.6)
+        assert resumen.mediana == 7.0
+        assert (resumen.minimo, resumen.maximo) == (6.0, 9.5)
+        assert cohortes.resumen(id_asignatura=sis2).total == 4
+
+        # Cada estudiante aporta el promedio de sus notas en la carrera
+        promedios = [5.5, 8.75, 7.0, 8.75, 6.75]
+        resumen_carrera = cohortes.resumen(id_carrera=id_carrera)
+        assert resumen_carrera.total == 5
+        assert resumen_carrera.media == pytest.approx(round(statistics.mean(promedios), 2))
+        assert resumen_carrera.mediana == statistics.median(promedios)
+
+        with pytest.raises(ValueError):
+            cohortes.resumen()
+
+    def test_posicion_del_estudiante(self, ruta_db):
+        ruta, id_carrera, (sis1, _) = ruta_db
+        cohortes = CohorteService(ruta_db=ruta)
+
+        posicion = cohortes.posicion(4, id_asignatura=sis1)
+        assert (posicion.nota, posicion.puesto, posicion.total) == (9.5, 1, 5)
+        assert posicion.percentil == 100.0
+        # Notas iguales comparten puesto
+        assert cohortes.posicion(3, id_asignatura=sis1).puesto == 3
+        assert cohortes.posicion(5, id_asignatura=sis1).puesto == 3
+        assert cohortes.posicion(99, id_asignatura=sis1) is None
+        assert cohortes.ubicar(8.0, id_asignatura=sis1).puesto == 3
+
+    def test_cambios_de_nota_son_incrementales(self, ruta_db):
+        ruta, id_carrera, (sis1, sis2) = ruta_db
+        cohortes = CohorteService(ruta_db=ruta)
+        cohortes.resumen(id_asignatura=sis1)
+        cargas = cohortes.cargas
+
+        inscripcion = EstudianteAsignaturaService(ruta_db=ruta)
+        inscripcion.id_estudiante = 1
+        inscripcion.id_asignatura = sis1
+        assert inscripcion.instanciar()
+        inscripcion.nota_final = 10.0
+        assert inscripcion.actualizar()
+
+        inscripcion = EstudianteAsignaturaService(ruta_db=ruta)
+        inscripcion.id_estudiante = 3
+        inscripcion.id_asignatura = sis2
+        inscripcion.estado = "aprobada"
+        inscripcion.nota_final = 7.5
+        assert inscripcion.actualizar()
+
+        inscripcion = EstudianteAsignaturaService(ruta_db=ruta)
+        inscripcion.id_estudiante = 2
+        inscripcion.id_asignatura = sis2
+        assert inscripcion.eliminar()
+
+        assert cohortes.posicion(1, id_asignatura=sis1).puesto == 1
+        assert cohortes.cargas == cargas
+        incrementales = [
+            cohortes.resumen(id_asignatura=sis1),
+            cohortes.resumen(id_asignatura=sis2),
+            cohortes.resumen(id_carrera=id_carrera),
+        ]
+        posicion_carrera = cohortes.posicion(1, id_carrera=id_carrera)
+
+        # El resultado incremental es el mismo que cargar todo de nuevo
+        invalidar_cohortes(ruta)
+        assert [
+            cohortes.resumen(id_asignatura=sis1),
+            cohortes.resumen(id_asignatura=sis2),
+            cohortes.resumen(id_carrera=id_carrera),
+        ] == incrementales
+        assert cohortes.posicion(1, id_carrera=id_carrera) == posicion_carrera
+        assert cohortes.cargas == cargas + 1
+
+    def test_eliminar_estudiante_invalida(self, ruta_db):
+        ruta, id_carrera, (sis1, _) = ruta_db
+        cohortes = CohorteService(ruta_db=ruta)
+        assert cohortes.resumen(id_asignatura=sis1).total == 5
+
+        estudiante = EstudianteService(ruta_db=ruta)
+        estudiante.id_estudiante = 4
+        assert estudiante.eliminar()
+
+        assert cohortes.resumen(id_asignatura=sis1).total == 4
+        assert cohortes.resumen(id_carrera=id_carrera).total == 4
+
+    def test_nota_se_aplica_al_confirmar(self, ruta_db):
+        ruta, _, (sis1, _) = ruta_db
+        cohortes = CohorteService(ruta_db=ruta)
+        assert cohortes.posicion(1, id_asignatura=sis1).puesto == 5
+
+        def poner_diez():
+            inscripcion = EstudianteAsignaturaService(ruta_db=ruta)
+            inscripcion.id_estudiante = 1
+            inscripcion.id_asignatura = sis1
+            assert inscripcion.instanciar()
+            inscripcion.nota_final = 10.0
+            assert inscripcion.actualizar()
+
+        with pytest.raises(ValueError):
+            with transaccion(ruta):
+                poner_diez()
+                raise ValueError
+        # El rollback deshizo la nota en la BD y en memoria
+        assert cohortes.posicion(1, id_asignatura=sis1).puesto == 5
+
+        with transaccion(ruta):
+            poner_diez()
+            assert cohortes.posicion(1, id_asignatura=sis1).puesto == 5
+        assert cohortes.posicion(1, id_asignatura=sis1).puesto == 1
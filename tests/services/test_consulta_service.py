@@ -0,0 +1,89 @@
+import csv
+import sqlite3
+import pytest
+from src.modelos.daos.calendario_evento_dao import CalendarioEventoDAO
+from src.modelos.daos.conexion_sqlite import ConexionSQLite
+from src.modelos.dtos.calendario_evento_dto import CalendarioEventoDTO
+from src.modelos.services.consulta_service import EventosUnificadosService
+from src.scripts.crear_indices import crear_todos_los_indices
+from src.scripts.crear_views import crear_todas_las_views
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Base de datos temporal con tablas y vistas creadas."""
+    ruta = str(tmp_path / "test_consulta.db")
+    crear_todos_los_indices(ruta)
+    crear_todas_las_views(ruta)
+    yield ruta
+    ConexionSQLite.resetear()
+
+
+@pytest.fixture
+def eventos_service(db_path):
+    """Servicio de eventos unificados con algunos eventos de calendario."""
+    eventos = [
+        CalendarioEventoDTO(
+            titulo=f"Evento {i}",
+            tipo="Feriado",
+            fecha_inicio=f"2026-03-{i + 1:02d}",
+            fecha_fin=f"2026-03-{i + 1:02d}",
+            afecta_actividades=0,
+        )
+        for i in range(12)
+    ]
+    CalendarioEventoDAO(ruta_db=db_path).insertar_lote(eventos)
+    yield EventosUnificadosService(ruta_db=db_path)
+
+
+class TestEventosUnificadosService:
+    """Pruebas de iteración y exportación de eventos unificados."""
+
+    def test_iterar_todos(self, eventos_service):
+        """El iterador entrega los mismos eventos que obtener_todos."""
+        iterados = list(eventos_service.iterar_todos())
+
+        assert len(iterados) == 12
+        assert [e.titulo for e in iterados] == [e.titulo for e in eventos_service.obtener_todos()]
+
+    def test_iterar_por_rango_fechas(self, eventos_service):
+        """Solo se entregan los eventos del rango."""
+        iterados = list(eventos_service.iterar_por_rango_fechas("2026-03-01", "2026-03-05"))
+
+        assert len(iterados) == 5
+
+    def test_exportar_csv_historial_completo(self, eventos_service, tmp_path):
+        """Sin lista de eventos se exporta todo el historial."""
+        ruta_csv = tmp_path / "eventos.csv"
+
+        total = eventos_service.exportar_csv(str(ruta_csv))
+
+        with open(ruta_csv, newline='', encoding='utf-8') as archivo:
+            filas = list(csv.reader(archivo))
+        assert total == 12
+        assert filas[0] == EventosUnificadosService.ENCABEZADOS_CSV
+        assert len(filas) == 13
+        assert filas[1][0] == "Evento 0"
+
+    def test_exportar_csv_lista(self, eventos_service, tmp_path):
+        """Con una lista de eventos se exportan solo esos."""
+        ruta_csv = tmp_path / "eventos.csv"
+        eventos = eventos_service.obtener_por_rango_fechas("2026-03-01", "2026-03-02")
+
+        assert eventos_service.exportar_csv(str(ruta_csv), eventos) == 2
+
+    def test_exportar_csv_error_no_deja_archivo_parcial(self, eventos_service, tmp_path):
+        """Si la lectura falla a mitad, el CSV anterior queda intacto y no hay temporales."""
+        ruta_csv = tmp_path / "eventos.csv"
+        ruta_csv.write_text("anterior", encoding="utf-8")
+
+        def eventos_con_error():
+            yield from eventos_service.obtener_por_rango_fechas("2026-03-01", "2026-03-02")
+            raise sqlite3.OperationalError("disk I/O error")
+
+        with pytest.raises(sqlite3.Error):
+            eventos_service.exportar_csv(str(ruta_csv), eventos_con_error())
+
+        assert ruta_csv.read_text(encoding="utf-8") == "anterior"
+        assert [p.name for p in tmp_path.iterdir() if p.name.startswith("eventos")] == ["eventos.csv"]
+
@@ -0,0 +1,88 @@
+import pytest
+from src.modelos.daos.calendario_evento_dao import CalendarioEventoDAO
+from src.modelos.dtos.calendario_evento_dto import CalendarioEventoDTO
+from src.modelos.services import eventos_mes_service
+from src.modelos.services.calendario_evento_service import CalendarioEventoService
+from src.modelos.services.consulta_service import EventosUnificadosService
+from src.modelos.services.eventos_mes_service import EventosMesService, desplazar_mes
+from src.scripts.crear_indices import crear_todos_los_indices
+from src.scripts.crear_views import crear_todas_las_views
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Base de datos con eventos de calendario entre enero y diciembre de 2026."""
+    ruta = str(tmp_path / "test_eventos_mes.db")
+    crear_todos_los_indices(ruta)
+    crear_todas_las_views(ruta)
+    CalendarioEventoDAO(ruta_db=ruta).insertar_lote(
+        CalendarioEventoDTO(
+            titulo=f"Evento {mes}-{dia}",
+            tipo="Feriado",
+            fecha_inicio=f"2026-{mes:02d}-{dia:02d}",
+            fecha_fin=f"2026-{mes:02d}-{dia:02d}",
+            afecta_actividades=0,
+        )
+        for mes in range(1, 13)
+        for dia in range(1, mes + 1)
+    )
+    yield ruta
+    # El servicio usa la ConexionSQLite importada como `modelos...`
+    eventos_mes_service.ConexionSQLite.resetear()
+
+
+class TestEventosMesService:
+    """Pruebas de la caché de eventos por mes del calendario."""
+
+    def test_desplazar_mes(self):
+        assert desplazar_mes(2026, 1, -1) == (2025, 12)
+        assert desplazar_mes(2026, 12, 1) == (2027, 1)
+        assert desplazar_mes(2026, 5, 0) == (2026, 5)
+
+    def test_mismo_resultado_que_obtener_por_mes(self, db_path):
+        servicio = EventosMesService(ruta_db=db_path)
+        eventos_service = EventosUnificadosService(ruta_db=db_path)
+
+        for mes in (1, 6, 12):
+            esperado = [e.titulo for e in eventos_service.obtener_por_mes(ano=2026, mes=mes)]
+            assert [e.titulo for e in servicio.obtener_mes(2026, mes)] == esperado
+
+    def test_vecinos_se_cargan_con_una_consulta(self, db_path):
+        servicio = EventosMesService(ruta_db=db_path)
+
+        assert len(servicio.obtener_mes(2026, 5)) == 5
+        assert servicio.consultas == 1
+        assert len(servicio.obtener_mes(2026, 4)) == 4
+        assert len(servicio.obtener_mes(2026, 6)) == 6
+        assert servicio.consultas == 1
+
+    def test_precarga_en_segundo_plano(self, db_path):
+        servicio = EventosMesService(ruta_db=db_path)
+        servicio.obtener_mes(2026, 5)
+
+        servicio.precargar_en_segundo_plano(2026, 6).join(timeout=5)
+        consultas = servicio.consultas
+
+        assert len(servicio.obtener_mes(2026, 7)) == 7
+        assert servicio.consultas == consultas
+        # Con todo cargado la precarga no consulta
+        assert servicio.precargar(2026, 6) == 0
+
+    def test_editar_evento_invalida(self, db_path):
+        servicio = EventosMesService(ruta_db=db_path)
+        assert len(servicio.obtener_mes(2026, 3)) == 3
+
+        evento = CalendarioEventoService(ruta_db=db_path)
+        evento.titulo = "Nuevo"
+        evento.tipo = "Feriado"
+        evento.fecha_inicio = "2026-03-20"
+        evento.fecha_fin = "2026-03-20"
+        evento.afecta_actividades = 0
+        assert evento.insertar()
+
+        titulos = [e.titulo for e in servicio.obtener_mes(2026, 3)]
+        assert len(titulos) == 4 and titulos[-1] == "Nuevo"
+
+        evento.titulo = "Editado"
+        assert evento.actualizar()
+        assert servicio.obtener_mes(2026, 3)[-1].titulo == "Editado"